@@ -209,7 +209,13 @@ BITBUCKET_TOOL_CONFIG = {
     "username": get_env("BITBUCKET_USERNAME", "bitbucket_agent"),
     "password": get_env("BITBUCKET_PASSWORD", "bitbucket_password"),
     "verify_ssl": get_boolean_env("VERIFY_SSL", False),
-    "timeout": get_int_env("BITBUCKET_TIMEOUT", 30)  # 초 단위
+    "timeout": get_int_env("BITBUCKET_TIMEOUT", 30),  # 초 단위
+    "mock_page_limit": get_int_env("BITBUCKET_MOCK_PAGE_LIMIT", 25),  # 모크 목록 조회 페이지 크기
+    "mock_synthetic_repos": get_int_env("BITBUCKET_MOCK_SYNTHETIC_REPOS", 0),  # 대규모 벤치마크용 합성 저장소 수
+    "summary_chunk_tokens": get_int_env("BITBUCKET_SUMMARY_CHUNK_TOKENS", 3000),  # 커밋/diff 요약 청크당 토큰 예산
+    "summary_workers": get_int_env("BITBUCKET_SUMMARY_WORKERS", 4),  # 병렬 청크 요약 수
+    "summary_max_commits": get_int_env("BITBUCKET_SUMMARY_MAX_COMMITS", 200),  # 커밋 요약 기본 커밋 수
+    "commit_page_size": get_int_env("BITBUCKET_COMMIT_PAGE_SIZE", 100)  # 커밋 조회 페이지 크기
 }
 
 def get_bitbucket_tool_config() -> Dict[str, Any]:
@@ -229,7 +235,15 @@ POCKET_TOOL_CONFIG = {
     "password": get_env("POCKET_PASSWORD", "pocket_password"),
     "region_name": get_env("POCKET_REGION", "us-east-1"),
     "verify_ssl": get_boolean_env("VERIFY_SSL", False),
-    "timeout": get_int_env("POCKET_TIMEOUT", 30)  # 초 단위
+    "timeout": get_int_env("POCKET_TIMEOUT", 30),  # 초 단위
+    "list_page_size": get_int_env("POCKET_LIST_PAGE_SIZE", 1000),  # 객체 목록 조회 페이지 크기
+    "list_max_keys": get_int_env("POCKET_LIST_MAX_KEYS", 100),  # 응답 하나에 표시할 최대 목록 항목 수
+    "mock_mode": get_boolean_env("POCKET_MOCK_MODE", True),  # False면 api_url의 S3 호환 서버에 연결
+    "transfer_part_size": get_int_env("POCKET_TRANSFER_PART_SIZE", 8 * 1024 * 1024),  # 멀티파트/범위 전송 단위 (바이트)
+    "transfer_workers": get_int_env("POCKET_TRANSFER_WORKERS", 4),  # 병렬 파트 전송 수
+    "transfer_state_dir": get_env("POCKET_TRANSFER_STATE_DIR", "data/pocket_uploads"),  # 업로드 재개 상태 디렉토리
+    "upload_dir": get_env("POCKET_UPLOAD_DIR", "uploads"),  # 업로드 원본 디렉토리 (이 안의 상대 경로만 업로드)
+    "download_dir": get_env("POCKET_DOWNLOAD_DIR", "downloads")  # 다운로드 저장 디렉토리 (이 안의 상대 경로만 저장)
 }
 
 def get_pocket_tool_config() -> Dict[str, Any]:
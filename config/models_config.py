@@ -17,6 +17,13 @@ MODELS = {
         "apiKey": get_env("LLM_API_KEY", ""),
         "maxTokens": get_int_env("LLM_MAX_TOKENS", 4096),
         "temperature": get_float_env("LLM_TEMPERATURE", 0.7),
+        # 마이크로 배칭 (배치 추론을 지원하는 내부 서버 전용, 기본 비활성화)
+        "batching": {
+            "enabled": get_boolean_env("LLM_BATCHING_ENABLED", False),
+            "endpoint": get_env("LLM_BATCH_ENDPOINT", ""),
+            "maxBatchSize": get_int_env("LLM_BATCH_MAX_SIZE", 8),
+            "maxWaitMs": get_int_env("LLM_BATCH_MAX_WAIT_MS", 5)
+        },
         "requestTemplate": {
             "headers": {
                 "Authorization": "Bearer ${API_KEY}",
@@ -22,9 +22,11 @@ requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.
 
 # 설정 모듈 임포트
 from src.core.config import load_config, get_settings
+from src.core.config_snapshot import config_store
 from src.core.router import app
-from src.core.llm_service import LLMService
+from src.core.llm_service import LLMService, llm_service
 from src.core.network_manager import network_manager
+from src.core.warmup import warmup_manager
 
 # 로거 설정
 logging.basicConfig(
@@ -34,9 +36,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger("main")
 
-# LLM 서비스 초기화
-llm_service = LLMService()
-
 def init_system():
     """시스템 초기화"""
     logger.info("AI Agent 시스템 초기화")
@@ -45,9 +44,11 @@ def init_system():
     network_mode = os.environ.get("NETWORK_MODE", "external")
     logger.info(f"네트워크 모드: {network_mode.upper()}")
     
-    # 설정 로드
-    load_config()
-    settings = get_settings()
+    # 설정 로드 (불변 스냅샷, SIGHUP 또는 설정 파일 변경 시 다시 로드)
+    settings = load_config()
+    config_store.install_signal_handler()
+    if settings.get("config", {}).get("watch", False):
+        config_store.start_watching(float(settings.get("config", {}).get("watch_interval", 2.0)))
     
     # 데이터 디렉토리 생성
     os.makedirs("data/docs", exist_ok=True)
@@ -64,6 +65,10 @@ def init_system():
     network_status = network_manager.get_status()
     logger.info(f"사용 가능한 모델: {network_status['model_keys']}")
     
+    # 워밍업 (에이전트/DB 스키마/연결 풀 미리 준비, 완료 전까지 /ready는 503)
+    # settings.json의 warmup 섹션으로 단계와 백그라운드 실행 여부 설정
+    warmup_manager.start(settings)
+    
     logger.info("시스템 초기화 완료")
 
 def start_server():
@@ -7,11 +7,14 @@
 import uuid
 import time
 import logging
+import threading
 from typing import Dict, List, Any, Optional, Union, Generator
 
 from src.core.config import get_settings
 from src.core.llm_service import llm_service
-from src.agents.document_management_agent import DocumentManagementAgent
+from src.core.response_cache import response_cache
+from src.core.metrics import agent_run_seconds
+from src.core import tracing
 
 # 로깅 설정
 logger = logging.getLogger("agent_manager")
@@ -22,15 +25,17 @@ class AgentManager:
     def __init__(self):
         """에이전트 관리자 초기화"""
         self.agents: Dict[str, Any] = {}
-        self.settings = get_settings()
         
-        # 사용 가능한 에이전트 유형
-        self.available_agent_types = self.settings.get("agents", {}).get(
-            "available", ["document"]
-        )
+        # 워밍업 스레드와 첫 요청이 같은 유형 에이전트를 중복 생성하지 않도록 보호
+        self._create_lock = threading.RLock()
         
         logger.info(f"에이전트 관리자 초기화 완료 (사용 가능 에이전트: {', '.join(self.available_agent_types)})")
     
+    @property
+    def available_agent_types(self) -> List[str]:
+        """사용 가능한 에이전트 유형 (설정 다시 로드가 반영되도록 호출 시점의 설정 스냅샷에서 조회)"""
+        return list(get_settings().get("agents", {}).get("available", ["document"]))
+    
     def create_agent(self, agent_type: str, **kwargs) -> Optional[Any]:
         """
         에이전트 생성
@@ -51,6 +56,8 @@ class AgentManager:
             if agent_type == "document":
                 logger.info("문서 관리 에이전트 생성 시작")
                 try:
+                    # 문서 에이전트 모듈은 첫 생성 시점에 임포트
+                    from src.agents.document_management_agent import DocumentManagementAgent
                     agent = DocumentManagementAgent()
                     logger.info("문서 관리 에이전트 객체 생성 성공")
                 except Exception as e:
@@ -65,6 +72,7 @@ class AgentManager:
             # 에이전트 저장
             agent_id = agent.agent_id
             self.agents[agent_id] = agent
+            response_cache.invalidate(f"agent_created:{agent_type}")
             
             logger.info(f"에이전트 생성 완료: {agent_type} (ID: {agent_id})")
             return agent
@@ -100,13 +108,14 @@ class AgentManager:
         Returns:
             에이전트 인스턴스 또는 None (생성 실패 시)
         """
-        # 이미 존재하는 에이전트 유형 찾기
-        for agent in self.agents.values():
-            if agent.get_agent_type() == agent_type:
-                return agent
-        
-        # 없으면 새로 생성
-        return self.create_agent(agent_type)
+        with self._create_lock:
+            # 이미 존재하는 에이전트 유형 찾기
+            for agent in self.agents.values():
+                if agent.get_agent_type() == agent_type:
+                    return agent
+            
+            # 없으면 새로 생성
+            return self.create_agent(agent_type)
     
     def list_agents(self) -> List[Dict[str, Any]]:
         """
@@ -174,15 +183,21 @@ class AgentManager:
         logger.info(f"에이전트 실행: {agent_type}, 쿼리: {query[:50]}...")
         
         # 에이전트 실행
+        start_time = time.perf_counter()
         try:
-            start_time = time.time()
-            result = agent.run(query, metadata)
-            execution_time = time.time() - start_time
+            with tracing.span("agent.run", f"agent.{agent_type}", agent_type=agent_type, mode="sync") as current:
+                result = agent.run(query, metadata)
+                if current is not None and isinstance(result, dict) and "error" in result:
+                    current.set_error(result["error"])
+            execution_time = time.perf_counter() - start_time
             
+            status = "error" if isinstance(result, dict) and "error" in result else "success"
+            agent_run_seconds.observe(execution_time, agent_type, "sync", status)
             logger.info(f"에이전트 실행 완료: {agent_type} (소요 시간: {execution_time:.2f}초)")
             return result
             
         except Exception as e:
+            agent_run_seconds.observe(time.perf_counter() - start_time, agent_type, "sync", "error")
             logger.error(f"에이전트 실행 오류: {e}")
             raise
     
@@ -201,6 +216,12 @@ class AgentManager:
         Raises:
             Exception: 에이전트 실행 오류 시
         """
+        # 스트림이 끝날 때까지를 하나의 스팬으로 기록 (호출 시점의 현재 스팬이 부모)
+        current = tracing.start_span("agent.run", f"agent.{agent_type}", agent_type=agent_type, mode="stream")
+        return tracing.trace_stream(self._run_agent_stream(agent_type, query, metadata), current)
+    
+    def _run_agent_stream(self, agent_type: str, query: str, metadata: Optional[Dict[str, Any]] = None) -> Generator[str, None, None]:
+        """에이전트 스트리밍 실행 (run_agent_stream 본문)"""
         metadata = metadata or {}
         
         # 에이전트 조회 또는 생성
@@ -212,6 +233,8 @@ class AgentManager:
         logger.info(f"에이전트 스트리밍 실행: {agent_type}, 쿼리: {query[:50]}...")
         
         # 에이전트 스트리밍 실행
+        start_time = time.perf_counter()
+        status = "success"
         try:
             # 현재 스트리밍을 지원하지 않는 경우
             if not hasattr(agent, 'run_stream'):
@@ -227,10 +250,16 @@ class AgentManager:
             
             yield "data: [DONE]\n\n"
             
+        except GeneratorExit:
+            status = "cancelled"
+            raise
         except Exception as e:
+            status = "error"
             logger.error(f"에이전트 스트리밍 실행 오류: {e}")
             yield f"data: {{'error': '에이전트 실행 오류: {str(e)}'}}\n\n"
             yield "data: [DONE]\n\n"
+        finally:
+            agent_run_seconds.observe(time.perf_counter() - start_time, agent_type, "stream", status)
 
 # 싱글톤 인스턴스
 agent_manager = AgentManager()
\ No newline at end of file
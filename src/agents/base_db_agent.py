@@ -13,7 +13,10 @@ from typing import Dict, Any, List, Optional, Union
 # 코어 모듈 임포트
 import config
 from src.core.llm_service import llm_service
-from src.utils import extract_sql_query, format_query_result, format_agent_response
+from src.core.token_budget import estimate_messages_tokens
+from src.core.prompt_templates import prompt_registry
+from src.core.utils import format_response
+from src.utils import extract_sql_query, format_query_result, parse_result_options
 
 # 로깅 설정
 logger = logging.getLogger("base_db_agent")
@@ -25,6 +28,9 @@ class BaseDBAgent:
     DB 관련 에이전트의 공통 기능을 제공하는 기본 클래스입니다.
     """
     
+    # 프롬프트 템플릿 이름 (서브클래스에서 지정, 없으면 _build_prompt 사용)
+    prompt_template_name: Optional[str] = None
+    
     def __init__(self, agent_type: str):
         """
         기본 데이터베이스 에이전트 초기화
@@ -175,21 +181,29 @@ class BaseDBAgent:
         logger.info(f"{self.agent_type} 쿼리 실행 - 에이전트 ID: {agent_id}")
         logger.info(f"입력 쿼리: {query}")
         
+        # 결과 옵션 검증 (잘못된 값은 LLM 호출 전에 매개변수 오류로 반환)
+        try:
+            output_format, max_rows = parse_result_options(metadata.get("result_format"), metadata.get("max_rows"))
+        except ValueError as e:
+            logger.warning(f"{self.agent_type} 잘못된 결과 옵션: {e}")
+            agent_response = format_response(agent_id, f"요청 매개변수가 올바르지 않습니다: {e}", llm_service.model_id)
+            agent_response["error"] = str(e)
+            return agent_response
+        
         # 스키마 정보 조회 (연결 불가능한 경우 메시지 추가)
         if not hasattr(self, 'connection_ok') or self.connection_ok:
             schema_info = self._get_schema_info()
         else:
             schema_info = "내부망 데이터베이스에 연결할 수 없습니다. 현재 테스트 환경에서 실행 중입니다."
         
-        # 프롬프트 구성 - 서브클래스에서 구현해야 함
-        prompt = self._build_prompt(query, schema_info)
+        # 스키마 정보를 프롬프트 토큰 예산에 맞게 축소 후 메시지 구성
+        messages = self._build_messages(query, schema_info)
         
         # LLM 요청
-        logger.info(f"{self.agent_type} LLM 요청 - 프롬프트 길이: {len(prompt)}")
-        messages = [llm_service.format_user_message(prompt)]
+        logger.info(f"{self.agent_type} LLM 요청 - 메시지 수: {len(messages)}, 추정 토큰: {estimate_messages_tokens(messages)}")
         
         # 모델 응답 생성
-        response = llm_service.generate(messages)
+        response = llm_service.generate(messages, agent_type=self.id_prefix)
         logger.info(f"{self.agent_type} LLM 응답 생성 완료 - 길이: {len(response)}")
         
         # SQL 쿼리 추출
@@ -197,12 +211,12 @@ class BaseDBAgent:
         
         if not sql_query:
             logger.warning(f"{self.agent_type} SQL 쿼리 추출 실패")
-            return format_agent_response(
+            return format_response(
+                agent_id,
                 f"죄송합니다. 요청에서 유효한 SQL 쿼리를 생성할 수 없습니다. 다음과 같이 질문을 구체적으로 다시 작성해보세요:\n\n"
                 f"- 특정 테이블이나 데이터를 명시적으로 언급\n"
                 f"- 원하는 정보의 유형을 명확하게 지정\n"
                 f"- 조건이나 필터링 요구사항을 자세히 설명",
-                agent_id,
                 llm_service.model_id
             )
         
@@ -214,27 +228,53 @@ class BaseDBAgent:
             message = (f"내부망 데이터베이스에 연결할 수 없어 쿼리를 실행할 수 없습니다. "
                       f"다음 SQL 쿼리가 계획되었습니다:\n\n```sql\n{sql_query}\n```\n\n"
                       f"현재 테스트 환경에서는 실제 데이터를 조회할 수 없습니다.")
-            return format_agent_response(message, agent_id, llm_service.model_id)
+            return format_response(agent_id, message, llm_service.model_id)
             
         # SQL 쿼리 실행
         try:
             result = self._execute_query(sql_query)
             
-            # 결과 포맷팅
-            formatted_result = format_query_result(result, sql_query, response, self.agent_type)
+            # 결과 포맷팅 (메타데이터로 출력 형식과 최대 행 수 지정 가능)
+            formatted_result = format_query_result(result, sql_query, response, self.agent_type,
+                                                   output_format=output_format, max_rows=max_rows)
             
-            return format_agent_response(formatted_result, agent_id, llm_service.model_id)
+            agent_response = format_response(agent_id, formatted_result, llm_service.model_id)
+            agent_response["result_format"] = output_format
+            return agent_response
             
         except Exception as e:
             logger.error(f"{self.agent_type} 쿼리 실행 오류: {e}")
             error_message = f"SQL 쿼리 실행 중 오류가 발생했습니다:\n\n```sql\n{sql_query}\n```\n\n오류: {str(e)}"
-            return format_agent_response(error_message, agent_id, llm_service.model_id)
+            return format_response(agent_id, error_message, llm_service.model_id)
+    
+    def _build_messages(self, query: str, schema_info: str) -> List[Dict[str, Any]]:
+        """
+        LLM 요청 메시지 구성
+        
+        prompt_template_name이 지정되어 있으면 스키마를 포함한 고정 접두부(시스템 메시지)와
+        쿼리 접미부(사용자 메시지)로 분리하고, 없으면 _build_prompt 결과를 단일 사용자 메시지로 보냅니다.
+        스키마 정보는 프롬프트 토큰 예산에 맞게 축소됩니다.
+        
+        Args:
+            query: 사용자 쿼리
+            schema_info: 스키마 정보
+            
+        Returns:
+            메시지 목록
+        """
+        if self.prompt_template_name:
+            template = prompt_registry.get(self.prompt_template_name)
+            schema_info = llm_service.fit_context(schema_info, template.render_text(query=query, schema_info=""))
+            return template.build_messages(query=query, schema_info=schema_info)
+        
+        schema_info = llm_service.fit_context(schema_info, self._build_prompt(query, ""))
+        return [llm_service.format_user_message(self._build_prompt(query, schema_info))]
     
     def _build_prompt(self, query: str, schema_info: str) -> str:
         """
         LLM 프롬프트 구성
         
-        서브클래스에서 구현해야 함
+        prompt_template_name을 지정하지 않은 서브클래스에서 구현해야 함
         
         Args:
             query: 사용자 쿼리
@@ -11,14 +11,50 @@ import re
 import json
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple, Union
+from typing import Dict, Any, Optional, List, Tuple, Union, Generator
 
 import config
 from src.core.llm_service import llm_service
+from src.core.async_client import AsyncIntegrationClient, run_async
+from src.core.pagination import iter_cursor_pages
+from src.core.diff_summarizer import iter_token_chunks, split_diff, MapReduceSummarizer, DEFAULT_CHUNK_TOKENS, DEFAULT_MAX_WORKERS
+from src.core.prompt_templates import PromptTemplate, prompt_registry
+from src.agents.bitbucket_mock_store import BitbucketMockStore, generate_synthetic_data, synthetic_diff, DEFAULT_PAGE_LIMIT
 
 # 로깅 설정
 logger = logging.getLogger("bitbucket_agent")
 
+# 청크 요약 프롬프트 (map 단계)
+SUMMARY_MAP_PROMPT = prompt_registry.register(PromptTemplate(
+    name="bitbucket.summarize_chunk",
+    description="커밋 목록/diff 청크 요약",
+    prefix="""당신은 코드 리뷰어입니다. 사용자 메시지에는 커밋 목록 또는 unified diff의 일부(전체 중 한 조각)가 주어집니다.
+이 조각에서 확인되는 핵심 변경 사항만 3~5개의 글머리표로 간결하게 요약하세요.
+- 파일/모듈 이름과 변경 의도를 함께 적으세요.
+- 버그 수정, 동작 변경, 위험해 보이는 변경은 반드시 포함하세요.
+- 조각에 없는 내용은 추측하지 마세요.""",
+    suffix="""대상: $subject
+
+$content"""
+))
+
+# 부분 요약 병합 프롬프트 (reduce 단계)
+SUMMARY_REDUCE_PROMPT = prompt_registry.register(PromptTemplate(
+    name="bitbucket.summarize_reduce",
+    description="청크별 부분 요약을 하나의 요약으로 병합",
+    prefix="""당신은 코드 리뷰어입니다. 사용자 메시지에는 같은 변경 묶음을 여러 조각으로 나눠 요약한 부분 요약들이 주어집니다.
+중복을 합치고 주제별로 묶어 전체 변경 사항을 하나의 요약으로 작성하세요.
+1. 한두 문장의 개요
+2. 주요 변경 사항 (글머리표)
+3. 리뷰 시 주의할 점 (있는 경우)""",
+    suffix="""대상: $subject
+
+$content"""
+))
+
+# 요약 작업 (모크/실제 모드 공통 처리)
+SUMMARY_OPERATIONS = ("summarize_commits", "summarize_pull_request")
+
 class BitbucketAgent:
     """Bitbucket 저장소 관리 에이전트"""
     
@@ -34,6 +70,16 @@ class BitbucketAgent:
         self.password = bitbucket_config["password"]
         self.timeout = bitbucket_config["timeout"]
         
+        # 모크 목록 조회 페이지 크기 및 대규모 벤치마크용 합성 저장소 수
+        self.mock_page_limit = bitbucket_config.get("mock_page_limit", DEFAULT_PAGE_LIMIT)
+        self.mock_synthetic_repos = bitbucket_config.get("mock_synthetic_repos", 0)
+        
+        # 커밋/diff 요약 설정 (청크당 토큰 예산, 병렬 요약 수, 기본 커밋 수, 커밋 페이지 크기)
+        self.summary_chunk_tokens = bitbucket_config.get("summary_chunk_tokens", DEFAULT_CHUNK_TOKENS)
+        self.summary_workers = bitbucket_config.get("summary_workers", DEFAULT_MAX_WORKERS)
+        self.summary_max_commits = bitbucket_config.get("summary_max_commits", 200)
+        self.commit_page_size = bitbucket_config.get("commit_page_size", 100)
+        
         # 모크 모드 설정 (내부망 연결 불가능한 경우)
         self.mock_mode = True
         
@@ -43,6 +89,12 @@ class BitbucketAgent:
         # 모크 데이터 초기화
         if self.mock_mode:
             self._init_mock_data()
+        else:
+            # 커밋/diff 페이지 조회용 비동기 API 클라이언트
+            self.async_client = AsyncIntegrationClient(
+                "bitbucket", self.bitbucket_url, auth=(self.username, self.password),
+                verify_ssl=bitbucket_config.get("verify_ssl", False), timeout=self.timeout
+            )
         
         logger.info(f"Bitbucket 에이전트 초기화: {self.agent_id} (활성화: {self.enabled}, 모크 모드: {self.mock_mode})")
     
@@ -63,9 +115,13 @@ class BitbucketAgent:
         if not self.enabled:
             return self._format_response("오류: Bitbucket 도구가 비활성화되어 있습니다.")
         
+        # 커밋/PR 요약은 모크/실제 모드 모두 페이지 조회 + map-reduce 요약으로 처리
+        parsed_query = self._analyze_query(query, metadata)
+        if parsed_query["operation"] in SUMMARY_OPERATIONS:
+            return self._format_response("".join(self._stream_summary(parsed_query)))
+        
         # 모크 모드인 경우 모크 API 호출
         if self.mock_mode:
-            parsed_query = self._analyze_query(query, metadata)
             result = self._handle_mock_operation(parsed_query)
             
             # 모크 모드 안내 추가
@@ -81,10 +137,12 @@ class BitbucketAgent:
         # 저장소 정보 확인
         repo_info = metadata.get("repository", "")
         
+        repo_section = f"저장소 정보:\n{repo_info}" if repo_info else ""
+        
         # 프롬프트 구성
         prompt = f"""Bitbucket 어시스턴트로서 저장소, 프로젝트, PR 관리를 도와줍니다.
 
-{'저장소 정보:\n' + repo_info if repo_info else ''}
+{repo_section}
 
 작업: {query}
 
@@ -116,6 +174,29 @@ class BitbucketAgent:
         # 응답 반환
         return self._format_response(content)
     
+    def run_stream(self, query: str, metadata: Optional[Dict[str, Any]] = None) -> Generator[str, None, None]:
+        """
+        Bitbucket 작업 스트리밍 실행 (커밋/PR 요약은 부분 요약이 끝나는 대로 전송)
+        
+        Args:
+            query: 자연어 쿼리
+            metadata: 추가 메타데이터 (project_key, repo_slug, max_commits 등)
+            
+        Yields:
+            응답 조각
+        """
+        metadata = metadata or {}
+        
+        if not self.enabled:
+            yield "오류: Bitbucket 도구가 비활성화되어 있습니다."
+            return
+        
+        parsed_query = self._analyze_query(query, metadata)
+        if parsed_query["operation"] in SUMMARY_OPERATIONS:
+            yield from self._stream_summary(parsed_query)
+        else:
+            yield self.run(query, metadata)["content"]
+    
     def _format_response(self, content: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
         """응답 형식화"""
         if isinstance(content, dict) and "content" in content:
@@ -151,9 +232,9 @@ class BitbucketAgent:
             return {}
     
     def _init_mock_data(self) -> None:
-        """모크 데이터 초기화"""
+        """모크 데이터 초기화 (시드 데이터를 색인된 모크 저장소로 구성)"""
         # 프로젝트 데이터
-        self.mock_projects = {
+        projects = {
             "TEST": {
                 "key": "TEST",
                 "name": "Test Project",
@@ -197,7 +278,7 @@ class BitbucketAgent:
         }
         
         # 저장소 데이터
-        self.mock_repositories = {
+        repositories = {
             "TEST": {
                 "my-repo": {
                     "slug": "my-repo",
@@ -310,7 +391,7 @@ class BitbucketAgent:
         }
         
         # Pull Request 데이터
-        self.mock_pull_requests = {
+        pull_requests = {
             "MOBILE": {
                 "mobile-app": [
                     {
@@ -367,7 +448,7 @@ class BitbucketAgent:
         }
         
         # 브랜치 데이터
-        self.mock_branches = {
+        branches = {
             "TEST": {
                 "my-repo": [
                     {"id": "refs/heads/master", "displayId": "master", "isDefault": True},
@@ -407,7 +488,7 @@ class BitbucketAgent:
         }
         
         # 커밋 데이터
-        self.mock_commits = {
+        commits = {
             "BACKEND": {
                 "api": [
                     {
@@ -465,7 +546,7 @@ class BitbucketAgent:
         }
         
         # 파일 데이터
-        self.mock_files = {
+        files = {
             "DOCS": {
                 "documentation": {
                     "README.md": """# Company Documentation
@@ -491,6 +572,15 @@ This documentation is copyright © Company Name 2023.
                 }
             }
         }
+        
+        self.mock_store = BitbucketMockStore.from_seed(projects, repositories, pull_requests, branches, commits, files)
+        
+        # 대규모 벤치마크용 합성 저장소 추가 (프로젝트당 최대 100개)
+        if self.mock_synthetic_repos > 0:
+            repos_per_project = min(self.mock_synthetic_repos, 100)
+            generate_synthetic_data(self.mock_store,
+                                    project_count=-(-self.mock_synthetic_repos // repos_per_project),
+                                    repos_per_project=repos_per_project)
     
     def _analyze_query(self, query: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """쿼리 분석"""
@@ -536,8 +626,20 @@ This documentation is copyright © Company Name 2023.
         if commit_match:
             result["parameters"]["commit_id"] = commit_match.group(1)
         
+        # 요약 요청 ("what changed in PR 42", "summarize last 200 commits", "최근 커밋 50개 요약")
+        wants_summary = bool(re.search(r'summar|what changed|요약|변경\s*사항', query, re.IGNORECASE))
+        commit_count_match = re.search(r'(?:last|recent|최근)\s+(\d+)\s*commits|(?:최근\s*)?커밋\s*(\d+)\s*개|(\d+)\s*개?\s*(?:commits|커밋)', query, re.IGNORECASE)
+        
         # 작업 유형 결정
-        if 'list' in query.lower() and 'repositories' in query.lower():
+        if wants_summary and 'pull_request_id' in result["parameters"]:
+            result["operation"] = "summarize_pull_request"
+        elif wants_summary and ('commit' in query.lower() or '커밋' in query):
+            result["operation"] = "summarize_commits"
+            if commit_count_match:
+                result["parameters"]["limit"] = int(next(group for group in commit_count_match.groups() if group))
+            elif "max_commits" in metadata:
+                result["parameters"]["limit"] = int(metadata["max_commits"])
+        elif 'list' in query.lower() and 'repositories' in query.lower():
             result["operation"] = "get_repositories"
         elif 'list' in query.lower() and 'projects' in query.lower():
             result["operation"] = "get_projects"
@@ -701,9 +803,156 @@ This documentation is copyright © Company Name 2023.
         
         return f"지원되지 않는 작업입니다: {operation}"
     
+    def _summarize_chunk(self, subject: str, text: str, stage: str) -> Union[str, Dict[str, Any]]:
+        """청크/부분 요약 LLM 호출 (map-reduce 요약 함수)"""
+        template = SUMMARY_MAP_PROMPT if stage == "map" else SUMMARY_REDUCE_PROMPT
+        messages = template.build_messages(subject=subject, content=text)
+        return llm_service.generate(messages, agent_type="bitbucket")
+    
+    async def _fetch_commit_page(self, project_key: str, repo_slug: str, cursor: Optional[Any], limit: int) -> Dict[str, Any]:
+        """
+        최신순 커밋 페이지 조회
+        
+        Returns:
+            {"values": [...], "nextCursor": 다음 페이지 커서 또는 None} (실패 시 {"error": ...})
+        """
+        if self.mock_mode:
+            repository = self.mock_store.get_repository(project_key, repo_slug)
+            if not repository or not len(repository.commits):
+                return {"error": f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'에 커밋이 없습니다."}
+            return repository.commits.page(cursor, limit)
+        
+        response = await self.async_client.get(
+            f"/projects/{project_key}/repos/{repo_slug}/commits",
+            params={"start": cursor or 0, "limit": limit}
+        )
+        if "error" in response:
+            return response
+        
+        # Bitbucket Server는 nextPageStart를 다음 페이지 커서로 사용
+        return {
+            "values": response.get("values", []),
+            "nextCursor": None if response.get("isLastPage", True) else response.get("nextPageStart")
+        }
+    
+    def _format_commit_line(self, commit: Dict[str, Any]) -> str:
+        """요약 입력용 커밋 한 줄 (모크/실제 API 커밋 형식 공용)"""
+        commit_id = commit.get("displayId") or commit.get("id", "")[:11]
+        author = commit.get("author", {}).get("name", "알 수 없음")
+        date = commit.get("date")
+        if not date and commit.get("authorTimestamp"):
+            date = datetime.fromtimestamp(commit["authorTimestamp"] / 1000).strftime("%Y-%m-%d %H:%M")
+        message = (commit.get("message") or "").strip()
+        message = message.splitlines()[0] if message else ""
+        
+        line = f"- {commit_id} ({date or 'N/A'}, {author}): {message}"
+        if "files_changed" in commit:
+            line += f" [{commit['files_changed']}개 파일, +{commit.get('additions', 0)}/-{commit.get('deletions', 0)}]"
+        return line + "\n"
+    
+    def _iter_commit_chunks(self, project_key: str, repo_slug: str, limit: int, errors: List[str]) -> Generator[str, None, None]:
+        """
+        커밋 페이지를 받는 대로 토큰 예산 안의 청크로 묶어 넘겨줌 (다음 페이지는 미리 조회)
+        
+        Args:
+            project_key: 프로젝트 키
+            repo_slug: 저장소 슬러그
+            limit: 최대 커밋 수
+            errors: 페이지 조회 오류를 기록할 목록
+        """
+        def lines():
+            pages = iter_cursor_pages(
+                lambda cursor, size: self._fetch_commit_page(project_key, repo_slug, cursor, size),
+                limit=limit, page_size=self.commit_page_size, timeout=self.timeout * 2
+            )
+            for page in pages:
+                if "error" in page:
+                    errors.append(page["error"])
+                    return
+                for commit in page["items"]:
+                    yield self._format_commit_line(commit)
+        
+        yield from iter_token_chunks(lines(), self.summary_chunk_tokens)
+    
+    def _fetch_pull_request_diff(self, project_key: str, repo_slug: str, pull_request_id: int) -> Dict[str, Any]:
+        """
+        PR 전체 diff 조회
+        
+        Returns:
+            {"text": unified diff} (실패 시 {"error": ...})
+        """
+        if self.mock_mode:
+            repository = self.mock_store.get_repository(project_key, repo_slug)
+            pull_request = repository.get_pull_request(pull_request_id) if repository else None
+            if not pull_request:
+                return {"error": f"PR #{pull_request_id}을(를) 찾을 수 없습니다."}
+            # 모크 PR에는 diff가 없으므로 PR마다 고정된 합성 diff 사용
+            return {"text": synthetic_diff(f"{project_key}/{repo_slug}#{pull_request_id}",
+                                           files=4 + pull_request_id % 9, hunks_per_file=4, lines_per_hunk=30)}
+        
+        return run_async(
+            self.async_client.get(f"/projects/{project_key}/repos/{repo_slug}/pull-requests/{pull_request_id}.diff",
+                                  headers={"Accept": "text/plain"}),
+            timeout=self.timeout * 2
+        )
+    
+    def _stream_summary(self, parsed_query: Dict[str, Any]) -> Generator[str, None, None]:
+        """
+        커밋 범위/PR diff를 청크로 나눠 병렬 요약하고, 부분 요약이 끝나는 대로 전송
+        
+        Args:
+            parsed_query: 분석된 쿼리 (summarize_commits 또는 summarize_pull_request)
+            
+        Yields:
+            응답 조각 (부분 요약들, 마지막에 전체 요약)
+        """
+        project_key = parsed_query.get("project_key")
+        repo_slug = parsed_query.get("repo_slug")
+        parameters = parsed_query.get("parameters", {})
+        
+        if not project_key or not repo_slug:
+            yield "요약을 위해 프로젝트 키와 저장소 슬러그가 필요합니다."
+            return
+        
+        errors: List[str] = []
+        if parsed_query["operation"] == "summarize_pull_request":
+            pull_request_id = parameters["pull_request_id"]
+            diff = self._fetch_pull_request_diff(project_key, repo_slug, pull_request_id)
+            if "error" in diff:
+                yield f"PR diff 조회 오류: {diff['error']}"
+                return
+            chunks = split_diff(diff.get("text", ""), self.summary_chunk_tokens)
+            subject = f"{project_key}/{repo_slug} PR #{pull_request_id}"
+            yield f"## {subject} 변경 요약\n\ndiff를 {len(chunks)}개 조각으로 나눠 요약합니다.\n\n"
+        else:
+            limit = parameters.get("limit") or self.summary_max_commits
+            chunks = self._iter_commit_chunks(project_key, repo_slug, limit, errors)
+            subject = f"{project_key}/{repo_slug} 최근 커밋 {limit}개"
+            yield f"## {subject} 요약\n\n"
+        
+        summarizer = MapReduceSummarizer(
+            lambda text, stage: self._summarize_chunk(subject, text, stage),
+            max_workers=self.summary_workers, reduce_tokens=self.summary_chunk_tokens
+        )
+        for event in summarizer.iter_summaries(chunks):
+            if event["type"] == "partial":
+                yield f"### 부분 요약 {event['index'] + 1}\n{event['summary']}\n\n"
+            elif event["type"] == "error":
+                yield f"### 부분 요약 {event['index'] + 1} 실패: {event['error']}\n\n"
+            elif "error" in event:
+                yield f"## 전체 요약\n요약 실패: {event['error']}\n"
+            else:
+                yield f"## 전체 요약\n{event['summary']}\n"
+        
+        if errors:
+            yield f"\n**참고**: 커밋 조회 중 오류가 발생해 일부만 요약했습니다: {errors[0]}\n"
+        
+        if self.mock_mode:
+            yield "\n\n# 참고\n이 응답은 모크 모드로 생성되었으며, 실제 Bitbucket 인스턴스에 연결되지 않았습니다."
+    
     def _get_mock_projects(self) -> str:
         """모크 프로젝트 조회"""
-        projects = list(self.mock_projects.values())
+        projects = list(self.mock_store.projects.values())
         result = "프로젝트 목록:\n\n"
         
         for project in projects:
@@ -713,127 +962,131 @@ This documentation is copyright © Company Name 2023.
         
         return result
     
-    def _get_mock_repositories(self, project_key: str) -> str:
+    def _format_page_note(self, page: Dict[str, Any]) -> str:
+        """페이지 일부만 표시한 경우 안내 문구"""
+        if page["isLastPage"] and page["start"] == 0:
+            return ""
+        return f"\n(총 {page['total']}개 중 {page['start'] + 1}-{page['start'] + page['size']}번째 표시)\n"
+    
+    def _get_mock_repositories(self, project_key: str, start: int = 0) -> str:
         """모크 저장소 조회"""
-        if project_key not in self.mock_repositories:
+        if not self.mock_store.has_project(project_key):
             return f"프로젝트 '{project_key}'를 찾을 수 없습니다."
         
-        repositories = self.mock_repositories[project_key]
+        page = self.mock_store.list_repositories(project_key, start, self.mock_page_limit)
         result = f"{project_key} 프로젝트의 모든 저장소:\n\n"
         
-        for i, repo in enumerate(repositories.values(), 1):
+        for i, repo in enumerate(page["values"], start + 1):
             result += f"{i}. {repo['name']} ({repo['scmId']})\n"
             result += f"   - 설명: {repo['description']}\n"
             result += f"   - 마지막 업데이트: {repo['updated_date']}\n"
         
-        return result
+        return result + self._format_page_note(page)
     
     def _create_mock_repository(self, project_key: str, name: str) -> str:
         """모크 저장소 생성"""
-        if project_key not in self.mock_projects:
+        if project_key not in self.mock_store.projects:
             return f"프로젝트 '{project_key}'를 찾을 수 없습니다."
         
         slug = name.lower().replace(" ", "-")
         
-        if project_key in self.mock_repositories and slug in self.mock_repositories[project_key]:
+        if self.mock_store.get_repository(project_key, slug):
             return f"저장소 '{slug}'는 이미 {project_key} 프로젝트에 존재합니다."
         
-        if project_key not in self.mock_repositories:
-            self.mock_repositories[project_key] = {}
-        
-        self.mock_repositories[project_key][slug] = {
+        self.mock_store.add_repository(project_key, {
             "slug": slug,
             "name": name,
             "description": f"Repository for {name}",
             "scmId": "git",
             "public": False,
             "forkable": True,
-            "id": 3000 + len(self.mock_repositories[project_key]),
+            "id": 3000 + self.mock_store.repository_count(project_key) + 1,
             "project": {"key": project_key},
             "updated_date": datetime.now().strftime("%Y-%m-%d")
-        }
+        })
         
         return f"{project_key} 프로젝트에 '{name}' 저장소를 생성했습니다.\n\n저장소가 성공적으로 생성되었습니다! 다음을 사용하여 복제할 수 있습니다:\ngit clone https://bitbucket.org/company/{project_key}/{slug}.git"
     
-    def _get_mock_branches(self, project_key: str, repo_slug: str) -> str:
+    def _get_mock_branches(self, project_key: str, repo_slug: str, prefix: str = "", start: int = 0) -> str:
         """모크 브랜치 조회"""
-        if project_key not in self.mock_branches or repo_slug not in self.mock_branches.get(project_key, {}):
+        repository = self.mock_store.get_repository(project_key, repo_slug)
+        if not repository or not repository.branch_count():
             return f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'를 찾을 수 없거나 브랜치가 없습니다."
         
-        branches = self.mock_branches[project_key][repo_slug]
+        page = repository.list_branches(prefix, start, self.mock_page_limit)
         result = f"{project_key}/{repo_slug} 저장소의 브랜치:\n\n"
         
-        for i, branch in enumerate(branches, 1):
+        for i, branch in enumerate(page["values"], start + 1):
             result += f"{i}. {branch['displayId']}"
             if branch['isDefault']:
                 result += " (기본 브랜치)"
             result += "\n"
         
-        return result
+        return result + self._format_page_note(page)
     
     def _create_mock_branch(self, project_key: str, repo_slug: str, branch_name: str, start_point: str) -> str:
         """모크 브랜치 생성"""
-        if project_key not in self.mock_branches or repo_slug not in self.mock_branches.get(project_key, {}):
+        repository = self.mock_store.get_repository(project_key, repo_slug)
+        if not repository or not repository.branch_count():
             return f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'를 찾을 수 없습니다."
         
         # 시작점 브랜치 존재 여부 확인
-        start_point_exists = False
-        for branch in self.mock_branches[project_key][repo_slug]:
-            if branch["displayId"] == start_point:
-                start_point_exists = True
-                break
-        
-        if not start_point_exists:
+        if not repository.has_branch(start_point):
             return f"시작점 브랜치 '{start_point}'를 찾을 수 없습니다."
         
         # 이미 존재하는 브랜치인지 확인
-        for branch in self.mock_branches[project_key][repo_slug]:
-            if branch["displayId"] == branch_name:
-                return f"브랜치 '{branch_name}'은(는) 이미 존재합니다."
+        if repository.has_branch(branch_name):
+            return f"브랜치 '{branch_name}'은(는) 이미 존재합니다."
         
         # 새 브랜치 추가
-        self.mock_branches[project_key][repo_slug].append({
-            "id": f"refs/heads/{branch_name}",
-            "displayId": branch_name,
-            "isDefault": False
-        })
+        repository.add_branch(branch_name)
         
         return f"브랜치가 성공적으로 생성되었습니다! '{branch_name}' 브랜치가 '{start_point}' 브랜치에서 생성되었습니다. 다음을 사용하여 체크아웃할 수 있습니다:\ngit checkout {branch_name}"
     
-    def _get_mock_pull_requests(self, project_key: str, repo_slug: str, state: str = "OPEN") -> str:
+    def _get_mock_pull_requests(self, project_key: str, repo_slug: str, state: str = "OPEN", start: int = 0) -> str:
         """모크 PR 조회"""
-        if project_key not in self.mock_pull_requests or repo_slug not in self.mock_pull_requests.get(project_key, {}):
+        repository = self.mock_store.get_repository(project_key, repo_slug)
+        if not repository or not repository.pull_request_count():
             return f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'에 PR이 없습니다."
         
-        pull_requests = [pr for pr in self.mock_pull_requests[project_key][repo_slug] if state == "ALL" or pr["state"] == state]
+        page = repository.list_pull_requests(state, start, self.mock_page_limit)
         
-        if not pull_requests:
+        if not page["total"]:
             return f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'에 {state.lower()} 상태의 PR이 없습니다."
         
         result = f"{project_key}/{repo_slug} 저장소의 {state.lower()} PR:\n\n"
         
-        for pr in pull_requests:
+        for pr in page["values"]:
             result += f"1. PR #{pr['id']}: \"{pr['title']}\" by {pr['author']['name']}\n"
             result += f"   - 생성: {pr['created_date']}\n"
             result += f"   - From: {pr['fromRef']['id'].replace('refs/heads/', '')} -> {pr['toRef']['id'].replace('refs/heads/', '')}\n"
             reviewers = [f"{reviewer['user']['name']} ({'승인됨' if reviewer['status'] == 'APPROVED' else '보류 중'})" for reviewer in pr["reviewers"]]
             result += f"   - 리뷰어: {', '.join(reviewers)}\n\n"
         
-        return result
+        return result + self._format_page_note(page)
     
-    def _get_mock_pull_request(self, project_key: str, repo_slug: str, pull_request_id: int) -> str:
-        """모크 PR 상세 조회"""
-        if project_key not in self.mock_pull_requests or repo_slug not in self.mock_pull_requests.get(project_key, {}):
-            return f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'에 PR이 없습니다."
+    def _find_mock_pull_request(self, project_key: str, repo_slug: str, pull_request_id: int) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        PR 색인 조회
         
-        pull_request = None
-        for pr in self.mock_pull_requests[project_key][repo_slug]:
-            if pr["id"] == pull_request_id:
-                pull_request = pr
-                break
+        Returns:
+            (PR 정보, 오류 메시지)
+        """
+        repository = self.mock_store.get_repository(project_key, repo_slug)
+        if not repository or not repository.pull_request_count():
+            return None, f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'에 PR이 없습니다."
         
+        pull_request = repository.get_pull_request(pull_request_id)
         if not pull_request:
-            return f"PR #{pull_request_id}을(를) 찾을 수 없습니다."
+            return None, f"PR #{pull_request_id}을(를) 찾을 수 없습니다."
+        
+        return pull_request, None
+    
+    def _get_mock_pull_request(self, project_key: str, repo_slug: str, pull_request_id: int) -> str:
+        """모크 PR 상세 조회"""
+        pull_request, error = self._find_mock_pull_request(project_key, repo_slug, pull_request_id)
+        if error:
+            return error
         
         result = f"PR #{pull_request['id']}: {pull_request['title']}\n\n"
         result += f"설명: {pull_request['description']}\n\n"
@@ -851,26 +1104,21 @@ This documentation is copyright © Company Name 2023.
     
     def _create_mock_pull_request(self, project_key: str, repo_slug: str, parameters: Dict[str, Any]) -> str:
         """모크 PR 생성"""
-        if project_key not in self.mock_repositories or repo_slug not in self.mock_repositories.get(project_key, {}):
+        repository = self.mock_store.get_repository(project_key, repo_slug)
+        if not repository:
             return f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'를 찾을 수 없습니다."
         
         # 소스 브랜치와 대상 브랜치 존재 여부 확인은 생략 (모크 데이터임)
         
-        if project_key not in self.mock_pull_requests:
-            self.mock_pull_requests[project_key] = {}
-        
-        if repo_slug not in self.mock_pull_requests[project_key]:
-            self.mock_pull_requests[project_key][repo_slug] = []
-        
         title = parameters.get("title", "New pull request")
         description = parameters.get("description", "This is a new pull request")
         fromRef = parameters.get("fromRef", "refs/heads/feature/new-feature")
         toRef = parameters.get("toRef", "refs/heads/master")
         
-        pull_request_id = 100 + len(self.mock_pull_requests[project_key][repo_slug])
+        pull_request_id = repository.next_pull_request_id()
         
         # 새 PR 생성
-        self.mock_pull_requests[project_key][repo_slug].append({
+        repository.add_pull_request({
             "id": pull_request_id,
             "title": title,
             "description": description,
@@ -897,55 +1145,28 @@ This documentation is copyright © Company Name 2023.
     
     def _approve_mock_pull_request(self, project_key: str, repo_slug: str, pull_request_id: int) -> str:
         """모크 PR 승인"""
-        if project_key not in self.mock_pull_requests or repo_slug not in self.mock_pull_requests.get(project_key, {}):
-            return f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'에 PR이 없습니다."
-        
-        pull_request = None
-        pr_index = -1
-        for i, pr in enumerate(self.mock_pull_requests[project_key][repo_slug]):
-            if pr["id"] == pull_request_id:
-                pull_request = pr
-                pr_index = i
-                break
-        
-        if not pull_request:
-            return f"PR #{pull_request_id}을(를) 찾을 수 없습니다."
+        pull_request, error = self._find_mock_pull_request(project_key, repo_slug, pull_request_id)
+        if error:
+            return error
         
         if pull_request["state"] != "OPEN":
             return f"PR #{pull_request_id}은(는) OPEN 상태가 아니므로 승인할 수 없습니다."
         
         # 현재 사용자를 승인자로 설정
-        current_user = {"user": {"name": "Current User"}, "status": "APPROVED"}
-        reviewer_found = False
-        
-        for i, reviewer in enumerate(pull_request["reviewers"]):
+        for reviewer in pull_request["reviewers"]:
             if reviewer["user"]["name"] == "Current User":
-                pull_request["reviewers"][i]["status"] = "APPROVED"
-                reviewer_found = True
+                reviewer["status"] = "APPROVED"
                 break
-        
-        if not reviewer_found:
-            pull_request["reviewers"].append(current_user)
-        
-        self.mock_pull_requests[project_key][repo_slug][pr_index] = pull_request
+        else:
+            pull_request["reviewers"].append({"user": {"name": "Current User"}, "status": "APPROVED"})
         
         return f"PR #{pull_request_id} \"{pull_request['title']}\"가 성공적으로 승인되었습니다. 승인과 함께 다음 메시지를 남겼습니다: \"코드가 좋아 보이고 테스트가 통과되었습니다. 병합할 준비가 되었습니다.\""
     
     def _merge_mock_pull_request(self, project_key: str, repo_slug: str, pull_request_id: int, version: int, message: str) -> str:
         """모크 PR 병합"""
-        if project_key not in self.mock_pull_requests or repo_slug not in self.mock_pull_requests.get(project_key, {}):
-            return f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'에 PR이 없습니다."
-        
-        pull_request = None
-        pr_index = -1
-        for i, pr in enumerate(self.mock_pull_requests[project_key][repo_slug]):
-            if pr["id"] == pull_request_id:
-                pull_request = pr
-                pr_index = i
-                break
-        
-        if not pull_request:
-            return f"PR #{pull_request_id}을(를) 찾을 수 없습니다."
+        pull_request, error = self._find_mock_pull_request(project_key, repo_slug, pull_request_id)
+        if error:
+            return error
         
         if pull_request["state"] != "OPEN":
             return f"PR #{pull_request_id}은(는) 이미 {pull_request['state']} 상태입니다."
@@ -953,9 +1174,8 @@ This documentation is copyright © Company Name 2023.
         if pull_request["version"] != version:
             return f"PR #{pull_request_id}의 버전이 일치하지 않습니다. 현재 버전: {pull_request['version']}, 요청 버전: {version}"
         
-        # PR 상태 변경
-        pull_request["state"] = "MERGED"
-        self.mock_pull_requests[project_key][repo_slug][pr_index] = pull_request
+        # PR 상태 변경 (상태 색인 함께 갱신)
+        self.mock_store.get_repository(project_key, repo_slug).set_pull_request_state(pull_request_id, "MERGED")
         
         target_branch = pull_request["toRef"]["id"].replace("refs/heads/", "")
         commit_id = "".join([f"{i}{chr(97 + i)}" for i in range(8)])
@@ -965,34 +1185,41 @@ This documentation is copyright © Company Name 2023.
         
         return result
     
-    def _get_mock_commits(self, project_key: str, repo_slug: str, limit: int = 5) -> str:
+    def _get_mock_commits(self, project_key: str, repo_slug: str, limit: int = 5, cursor: Optional[str] = None) -> str:
         """모크 커밋 조회"""
-        if project_key not in self.mock_commits or repo_slug not in self.mock_commits.get(project_key, {}):
+        repository = self.mock_store.get_repository(project_key, repo_slug)
+        if not repository or not len(repository.commits):
             return f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'에 커밋이 없습니다."
         
-        commits = self.mock_commits[project_key][repo_slug][:limit]
+        page = repository.commits.page(cursor, limit)
+        if "error" in page:
+            return page["error"]
         
         result = f"{repo_slug} 저장소의 최근 커밋:\n\n"
         
-        for i, commit in enumerate(commits, 1):
+        for i, commit in enumerate(page["values"], 1):
             result += f"{i}. 커밋 {commit['id']}: \"{commit['message']}\" by {commit['author']['name']} ({commit['date']})\n"
             result += f"   - {commit['files_changed']}개 파일 변경, {commit['additions']}개 추가, {commit['deletions']}개 삭제\n\n"
         
+        if page["nextCursor"]:
+            result += f"(이전 커밋은 커밋 {page['nextCursor']}부터 이어서 조회할 수 있습니다.)\n"
+        
         return result
     
     def _get_mock_file_content(self, project_key: str, repo_slug: str, path: str) -> str:
         """모크 파일 내용 조회"""
-        if project_key not in self.mock_files or repo_slug not in self.mock_files.get(project_key, {}) or path not in self.mock_files[project_key][repo_slug]:
+        repository = self.mock_store.get_repository(project_key, repo_slug)
+        if not repository or path not in repository.files:
             if path == "README.md":
                 return f"{repo_slug} 저장소의 README.md 파일 내용:\n\n# {repo_slug.capitalize()}\n\n이 저장소는 모크 데이터로, README.md 파일 내용을 생성했습니다."
             return f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'에서 파일 '{path}'를 찾을 수 없습니다."
         
-        content = self.mock_files[project_key][repo_slug][path]
+        content = repository.files[path]
         return f"{repo_slug} 저장소의 {path} 파일 내용:\n\n{content}"
     
     def _create_mock_tag(self, project_key: str, repo_slug: str, tag_name: str, start_point: str, message: str) -> str:
         """모크 태그 생성"""
-        if project_key not in self.mock_repositories or repo_slug not in self.mock_repositories.get(project_key, {}):
+        if not self.mock_store.get_repository(project_key, repo_slug):
             return f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'를 찾을 수 없습니다."
         
         if not message:
@@ -1002,23 +1229,15 @@ This documentation is copyright © Company Name 2023.
     
     def _compare_mock_branches(self, project_key: str, repo_slug: str, from_branch: str, to_branch: str) -> str:
         """모크 브랜치 비교"""
-        if project_key not in self.mock_branches or repo_slug not in self.mock_branches.get(project_key, {}):
+        repository = self.mock_store.get_repository(project_key, repo_slug)
+        if not repository or not repository.branch_count():
             return f"프로젝트 '{project_key}'의 저장소 '{repo_slug}'를 찾을 수 없거나 브랜치가 없습니다."
         
         # 브랜치 존재 여부 확인
-        from_exists = False
-        to_exists = False
-        
-        for branch in self.mock_branches[project_key][repo_slug]:
-            if branch["displayId"] == from_branch:
-                from_exists = True
-            if branch["displayId"] == to_branch:
-                to_exists = True
-        
-        if not from_exists:
+        if not repository.has_branch(from_branch):
             return f"브랜치 '{from_branch}'를 찾을 수 없습니다."
         
-        if not to_exists:
+        if not repository.has_branch(to_branch):
             return f"브랜치 '{to_branch}'를 찾을 수 없습니다."
         
         # 모크 비교 데이터 생성
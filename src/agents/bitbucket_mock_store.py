@@ -0,0 +1,546 @@
+"""
+Bitbucket 모크 데이터 저장소
+
+BitbucketAgent 모크 모드에서 사용하는 색인된 저장소 모듈입니다.
+중첩 딕셔너리/리스트를 매번 선형 탐색하는 대신 저장소(프로젝트 키, 슬러그)별로 다음 색인을 유지합니다.
+
+- PR: ID → PR 딕셔너리, 상태 → PR ID 집합 (삽입 순서 유지)
+- 브랜치: 이름 정렬 목록(bisect) + 이름 → 브랜치 딕셔너리 (접두사 필터 조회 지원)
+- 커밋: 추가 전용 로그 + 커밋 ID → 로그 위치, 커밋 ID 커서 기반 페이지 조회 (최신순)
+
+대규모 환경 벤치마크를 위해 수천 개 저장소를 채우는 합성 데이터 생성기(generate_synthetic_data)를 제공합니다.
+"""
+
+import bisect
+import random
+import logging
+from itertools import islice
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Iterable
+
+# 로거 설정
+logger = logging.getLogger("bitbucket_mock_store")
+
+# 기본 페이지 크기
+DEFAULT_PAGE_LIMIT = 25
+
+
+def _page(values: List[Any], start: int, limit: int, total: int) -> Dict[str, Any]:
+    """Bitbucket Server 형식의 오프셋 페이지 구성"""
+    next_start = start + len(values)
+    return {
+        "values": values,
+        "size": len(values),
+        "start": start,
+        "limit": limit,
+        "total": total,
+        "isLastPage": next_start >= total,
+        "nextPageStart": next_start if next_start < total else None
+    }
+
+
+class CommitLog:
+    """추가 전용 커밋 로그 (커밋 ID 커서 기반 최신순 페이지 조회)"""
+
+    def __init__(self):
+        """커밋 로그 초기화"""
+        self._commits: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._commits)
+
+    def append(self, commit: Dict[str, Any]) -> None:
+        """
+        커밋 추가 (오래된 커밋부터 순서대로 추가)
+
+        Args:
+            commit: 커밋 정보 (id 필수)
+        """
+        if commit["id"] in self._positions:
+            raise ValueError(f"중복된 커밋 ID: {commit['id']}")
+        self._positions[commit["id"]] = len(self._commits)
+        self._commits.append(commit)
+
+    def get(self, commit_id: str) -> Optional[Dict[str, Any]]:
+        """커밋 ID로 커밋 조회"""
+        position = self._positions.get(commit_id)
+        return self._commits[position] if position is not None else None
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """가장 최근 커밋"""
+        return self._commits[-1] if self._commits else None
+
+    def page(self, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_LIMIT) -> Dict[str, Any]:
+        """
+        최신순 커밋 페이지 조회
+
+        로그는 추가만 되므로 커서(다음에 반환할 커밋 ID)의 위치는 새 커밋이 추가되어도 바뀌지 않습니다.
+
+        Args:
+            cursor: 이 커밋부터 더 오래된 방향으로 조회 (None이면 최신 커밋부터)
+            limit: 페이지 크기
+
+        Returns:
+            {"values": [...], "size": n, "isLastPage": bool, "nextCursor": 커밋 ID 또는 None}
+            (알 수 없는 커서면 {"error": ...})
+        """
+        limit = max(1, int(limit))
+        if cursor is None:
+            end = len(self._commits)
+        else:
+            position = self._positions.get(cursor)
+            if position is None:
+                return {"error": f"알 수 없는 커밋 커서: {cursor}"}
+            end = position + 1
+
+        start = max(0, end - limit)
+        values = self._commits[start:end][::-1]
+        return {
+            "values": values,
+            "size": len(values),
+            "limit": limit,
+            "isLastPage": start == 0,
+            "nextCursor": self._commits[start - 1]["id"] if start > 0 else None
+        }
+
+    def iter_pages(self, limit: int = DEFAULT_PAGE_LIMIT, max_commits: Optional[int] = None) -> Iterable[List[Dict[str, Any]]]:
+        """
+        최신순으로 커밋 페이지를 차례로 반환
+
+        Args:
+            limit: 페이지 크기
+            max_commits: 최대 커밋 수 (None이면 전체)
+        """
+        cursor, remaining = None, max_commits
+        while remaining is None or remaining > 0:
+            page = self.page(cursor, limit if remaining is None else min(limit, remaining))
+            if "error" in page or not page["values"]:
+                return
+            yield page["values"]
+            if remaining is not None:
+                remaining -= page["size"]
+            if page["isLastPage"]:
+                return
+            cursor = page["nextCursor"]
+
+
+class RepositoryStore:
+    """단일 저장소의 브랜치/PR/커밋/파일 색인"""
+
+    def __init__(self, repository: Dict[str, Any]):
+        """
+        저장소 색인 초기화
+
+        Args:
+            repository: 저장소 정보 (slug, name, project 등)
+        """
+        self.repository = repository
+        self.default_branch: Optional[str] = None
+        self._branch_names: List[str] = []
+        self._branches: Dict[str, Dict[str, Any]] = {}
+        self._pull_requests: Dict[int, Dict[str, Any]] = {}
+        self._pull_requests_by_state: Dict[str, Dict[int, None]] = {}
+        self._max_pull_request_id = 0
+        self.commits = CommitLog()
+        self.files: Dict[str, str] = {}
+
+    # 브랜치
+
+    def has_branch(self, name: str) -> bool:
+        """브랜치 존재 여부"""
+        return name in self._branches
+
+    def add_branch(self, name: str, is_default: bool = False, latest_commit: Optional[str] = None) -> Dict[str, Any]:
+        """
+        브랜치 추가
+
+        Args:
+            name: 브랜치 이름 (displayId)
+            is_default: 기본 브랜치 여부
+            latest_commit: 브랜치 최신 커밋 ID
+
+        Returns:
+            추가된 브랜치 정보 (이미 있으면 ValueError)
+        """
+        if name in self._branches:
+            raise ValueError(f"브랜치 '{name}'은(는) 이미 존재합니다.")
+
+        branch = {"id": f"refs/heads/{name}", "displayId": name, "isDefault": is_default}
+        if latest_commit:
+            branch["latestCommit"] = latest_commit
+        self._branches[name] = branch
+        bisect.insort(self._branch_names, name)
+        if is_default:
+            self.default_branch = name
+        return branch
+
+    def branch_count(self) -> int:
+        """브랜치 수"""
+        return len(self._branch_names)
+
+    def list_branches(self, prefix: str = "", start: int = 0, limit: int = DEFAULT_PAGE_LIMIT) -> Dict[str, Any]:
+        """
+        브랜치 페이지 조회 (기본 브랜치 먼저, 나머지는 이름순)
+
+        Args:
+            prefix: 브랜치 이름 접두사 필터
+            start: 시작 위치
+            limit: 페이지 크기
+
+        Returns:
+            브랜치 페이지
+        """
+        # 정렬 목록에서 접두사 범위를 이분 탐색으로 찾음
+        low = bisect.bisect_left(self._branch_names, prefix)
+        high = bisect.bisect_left(self._branch_names, prefix + "\uffff") if prefix else len(self._branch_names)
+        names = self._branch_names[low:high]
+
+        default = self.default_branch
+        if default is not None and default.startswith(prefix):
+            names = [default] + [name for name in names if name != default]
+
+        return _page([self._branches[name] for name in names[start:start + limit]], start, limit, len(names))
+
+    # Pull Request
+
+    def add_pull_request(self, pull_request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        PR 추가 (id와 state 필수)
+
+        Args:
+            pull_request: PR 정보
+
+        Returns:
+            추가된 PR 정보
+        """
+        pull_request_id = pull_request["id"]
+        if pull_request_id in self._pull_requests:
+            raise ValueError(f"중복된 PR ID: {pull_request_id}")
+        self._pull_requests[pull_request_id] = pull_request
+        self._pull_requests_by_state.setdefault(pull_request["state"], {})[pull_request_id] = None
+        self._max_pull_request_id = max(self._max_pull_request_id, pull_request_id)
+        return pull_request
+
+    def next_pull_request_id(self) -> int:
+        """새 PR ID (기존 최대 ID 다음 번호, 최소 100)"""
+        return max(self._max_pull_request_id, 99) + 1
+
+    def get_pull_request(self, pull_request_id: int) -> Optional[Dict[str, Any]]:
+        """PR ID로 조회"""
+        return self._pull_requests.get(pull_request_id)
+
+    def set_pull_request_state(self, pull_request_id: int, state: str) -> Optional[Dict[str, Any]]:
+        """
+        PR 상태 변경 (상태 색인 함께 갱신)
+
+        Args:
+            pull_request_id: PR ID
+            state: 새 상태 (OPEN, MERGED, DECLINED)
+
+        Returns:
+            변경된 PR 정보 (없으면 None)
+        """
+        pull_request = self._pull_requests.get(pull_request_id)
+        if pull_request is None:
+            return None
+        self._pull_requests_by_state.get(pull_request["state"], {}).pop(pull_request_id, None)
+        pull_request["state"] = state
+        self._pull_requests_by_state.setdefault(state, {})[pull_request_id] = None
+        return pull_request
+
+    def pull_request_count(self, state: str = "ALL") -> int:
+        """상태별 PR 수"""
+        if state == "ALL":
+            return len(self._pull_requests)
+        return len(self._pull_requests_by_state.get(state, {}))
+
+    def list_pull_requests(self, state: str = "OPEN", start: int = 0, limit: int = DEFAULT_PAGE_LIMIT) -> Dict[str, Any]:
+        """
+        상태별 PR 페이지 조회 (등록 순서)
+
+        Args:
+            state: PR 상태 (ALL이면 전체)
+            start: 시작 위치
+            limit: 페이지 크기
+
+        Returns:
+            PR 페이지
+        """
+        ids = self._pull_requests if state == "ALL" else self._pull_requests_by_state.get(state, {})
+        selected = islice(ids, start, start + limit)
+        return _page([self._pull_requests[pull_request_id] for pull_request_id in selected], start, limit, len(ids))
+
+
+class BitbucketMockStore:
+    """프로젝트/저장소 색인을 가진 Bitbucket 모크 데이터 저장소"""
+
+    def __init__(self):
+        """모크 저장소 초기화"""
+        self.projects: Dict[str, Dict[str, Any]] = {}
+        self._repositories: Dict[str, Dict[str, RepositoryStore]] = {}
+        self._next_repository_id = 2001
+
+    def add_project(self, project: Dict[str, Any]) -> Dict[str, Any]:
+        """프로젝트 추가"""
+        self.projects[project["key"]] = project
+        self._repositories.setdefault(project["key"], {})
+        return project
+
+    def add_repository(self, project_key: str, repository: Dict[str, Any]) -> RepositoryStore:
+        """
+        저장소 추가
+
+        Args:
+            project_key: 프로젝트 키
+            repository: 저장소 정보 (slug 필수, id가 없으면 자동 부여)
+
+        Returns:
+            저장소 색인
+        """
+        repositories = self._repositories.setdefault(project_key, {})
+        if repository["slug"] in repositories:
+            raise ValueError(f"저장소 '{repository['slug']}'는 이미 {project_key} 프로젝트에 존재합니다.")
+
+        repository.setdefault("id", self._next_repository_id)
+        self._next_repository_id = max(self._next_repository_id, repository["id"]) + 1
+        repository.setdefault("project", {"key": project_key})
+
+        store = RepositoryStore(repository)
+        repositories[repository["slug"]] = store
+        return store
+
+    def get_repository(self, project_key: str, repo_slug: str) -> Optional[RepositoryStore]:
+        """저장소 색인 조회"""
+        return self._repositories.get(project_key, {}).get(repo_slug)
+
+    def has_project(self, project_key: str) -> bool:
+        """저장소 목록이 있는 프로젝트인지 여부"""
+        return project_key in self._repositories
+
+    def repository_count(self, project_key: Optional[str] = None) -> int:
+        """저장소 수 (프로젝트 키가 없으면 전체)"""
+        if project_key is not None:
+            return len(self._repositories.get(project_key, {}))
+        return sum(len(repositories) for repositories in self._repositories.values())
+
+    def list_repositories(self, project_key: str, start: int = 0, limit: int = DEFAULT_PAGE_LIMIT) -> Dict[str, Any]:
+        """
+        프로젝트의 저장소 페이지 조회 (등록 순서)
+
+        Args:
+            project_key: 프로젝트 키
+            start: 시작 위치
+            limit: 페이지 크기
+
+        Returns:
+            저장소 페이지
+        """
+        repositories = self._repositories.get(project_key, {})
+        slugs = islice(repositories, start, start + limit)
+        return _page([repositories[slug].repository for slug in slugs], start, limit, len(repositories))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 규모 통계"""
+        stores = [store for repositories in self._repositories.values() for store in repositories.values()]
+        return {
+            "projects": len(self.projects),
+            "repositories": len(stores),
+            "branches": sum(store.branch_count() for store in stores),
+            "pull_requests": sum(store.pull_request_count() for store in stores),
+            "commits": sum(len(store.commits) for store in stores)
+        }
+
+    @classmethod
+    def from_seed(cls, projects: Dict[str, Dict[str, Any]],
+                  repositories: Dict[str, Dict[str, Dict[str, Any]]],
+                  pull_requests: Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]] = None,
+                  branches: Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]] = None,
+                  commits: Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]] = None,
+                  files: Optional[Dict[str, Dict[str, Dict[str, str]]]] = None) -> "BitbucketMockStore":
+        """
+        중첩 딕셔너리 형식의 시드 데이터로 저장소 구성
+
+        Args:
+            projects: {프로젝트 키: 프로젝트}
+            repositories: {프로젝트 키: {슬러그: 저장소}}
+            pull_requests: {프로젝트 키: {슬러그: [PR]}}
+            branches: {프로젝트 키: {슬러그: [브랜치]}}
+            commits: {프로젝트 키: {슬러그: [커밋 (최신순)]}}
+            files: {프로젝트 키: {슬러그: {경로: 내용}}}
+
+        Returns:
+            모크 저장소
+        """
+        store = cls()
+        for project in projects.values():
+            store.add_project(project)
+        for project_key, project_repositories in repositories.items():
+            for repository in project_repositories.values():
+                store.add_repository(project_key, repository)
+
+        def each(data):
+            for project_key, project_data in (data or {}).items():
+                for repo_slug, values in project_data.items():
+                    repository = store.get_repository(project_key, repo_slug)
+                    if repository is None:
+                        logger.warning(f"시드 데이터의 저장소를 찾을 수 없음: {project_key}/{repo_slug}")
+                        continue
+                    yield repository, values
+
+        for repository, values in each(branches):
+            for branch in values:
+                repository.add_branch(branch["displayId"], branch.get("isDefault", False))
+        for repository, values in each(pull_requests):
+            for pull_request in values:
+                repository.add_pull_request(pull_request)
+        for repository, values in each(commits):
+            for commit in reversed(values):
+                repository.commits.append(commit)
+        for repository, values in each(files):
+            repository.files.update(values)
+
+        return store
+
+
+# 합성 데이터 생성용 단어 목록
+_AUTHORS = ["Alice Johnson", "Bob Williams", "David Wilson", "Emily Chen", "John Smith",
+            "Michael Brown", "Sarah Davis", "Kim Minsu", "Lee Jiyeon", "Park Joon"]
+_VERBS = ["Add", "Fix", "Update", "Refactor", "Remove", "Improve", "Document", "Optimize"]
+_TOPICS = ["authentication", "pagination", "logging", "caching", "build pipeline", "error handling",
+           "user profile", "search API", "notifications", "database migration", "rate limiting", "UI layout"]
+_PR_STATES = ["OPEN", "OPEN", "MERGED", "MERGED", "MERGED", "DECLINED"]
+
+
+def synthetic_diff(seed: str, files: int = 5, hunks_per_file: int = 3, lines_per_hunk: int = 12) -> str:
+    """
+    모크 PR/커밋용 unified diff 생성 (같은 seed면 같은 diff)
+
+    Args:
+        seed: 난수 시드 문자열 (예: "BACKEND/api#42")
+        files: 변경 파일 수
+        hunks_per_file: 파일당 헝크 수
+        lines_per_hunk: 헝크당 변경 줄 수
+
+    Returns:
+        unified diff 텍스트
+    """
+    rng = random.Random(seed)
+    parts = []
+    for file_index in range(files):
+        topic = rng.choice(_TOPICS).replace(" ", "_")
+        path = f"src/{topic}/{topic}_{file_index}.py"
+        parts.append(f"diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}\n")
+        line = 1
+        for _ in range(hunks_per_file):
+            line += rng.randint(5, 40)
+            parts.append(f"@@ -{line},{lines_per_hunk} +{line},{lines_per_hunk} @@ def {topic}_{line}():\n")
+            for index in range(lines_per_hunk):
+                sign = rng.choice("+- ")
+                parts.append(f"{sign}    value_{index} = {rng.choice(_VERBS).lower()}_{topic}(value_{index - 1 if index else 0})\n")
+    return "".join(parts)
+
+
+def _synthetic_project_key(prefix: str, index: int) -> str:
+    """영문 대문자만 쓰는 합성 프로젝트 키 (쿼리 분석기가 [A-Z]+ 키만 인식)"""
+    letters = ""
+    for _ in range(3):
+        index, remainder = divmod(index, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return prefix + letters
+
+
+def generate_synthetic_data(store: BitbucketMockStore, project_count: int = 20, repos_per_project: int = 100,
+                            branches_per_repo: int = 20, pull_requests_per_repo: int = 30,
+                            commits_per_repo: int = 200, seed: int = 0, key_prefix: str = "SYN") -> BitbucketMockStore:
+    """
+    합성 프로젝트/저장소 데이터 생성 (대규모 벤치마크용, 같은 seed면 같은 데이터)
+
+    Args:
+        store: 데이터를 추가할 모크 저장소
+        project_count: 프로젝트 수
+        repos_per_project: 프로젝트당 저장소 수
+        branches_per_repo: 저장소당 브랜치 수 (기본 브랜치 포함)
+        pull_requests_per_repo: 저장소당 PR 수
+        commits_per_repo: 저장소당 커밋 수
+        seed: 난수 시드
+        key_prefix: 프로젝트 키 접두사 (예: SYN → SYNAAA, SYNAAB, ...)
+
+    Returns:
+        데이터가 추가된 모크 저장소
+    """
+    rng = random.Random(seed)
+    base_date = datetime(2023, 1, 1)
+
+    # 커밋 날짜와 작성자는 저장소마다 같은 값을 재사용 (생성 시간 대부분이 날짜 포맷팅)
+    commit_dates = [(base_date + timedelta(minutes=index * 97)).strftime("%Y-%m-%d %H:%M")
+                    for index in range(commits_per_repo)]
+    authors = [{"name": name, "email": f"{name.lower().replace(' ', '.')}@example.com"} for name in _AUTHORS]
+
+    for project_index in range(project_count):
+        project_key = _synthetic_project_key(key_prefix, project_index)
+        store.add_project({
+            "key": project_key,
+            "name": f"Synthetic Project {project_index}",
+            "description": f"Synthetic project {project_index} for load testing",
+            "public": False,
+            "type": "NORMAL",
+            "id": 10000 + project_index
+        })
+
+        for repo_index in range(repos_per_project):
+            slug = f"service-{repo_index:04d}"
+            repository = store.add_repository(project_key, {
+                "slug": slug,
+                "name": f"Service {repo_index}",
+                "description": f"Synthetic repository {slug}",
+                "scmId": "git",
+                "public": False,
+                "forkable": True,
+                "updated_date": (base_date + timedelta(days=rng.randint(0, 365))).strftime("%Y-%m-%d")
+            })
+
+            # 커밋: 오래된 순으로 추가 (ID는 저장소 안에서 유일한 16진수 문자열)
+            parent = None
+            for commit_index in range(commits_per_repo):
+                commit_id = f"{rng.getrandbits(40):010x}{commit_index:06x}"
+                files_changed = rng.randint(1, 12)
+                repository.commits.append({
+                    "id": commit_id,
+                    "message": f"{rng.choice(_VERBS)} {rng.choice(_TOPICS)}",
+                    "author": rng.choice(authors),
+                    "date": commit_dates[commit_index],
+                    "parents": [parent] if parent else [],
+                    "files_changed": files_changed,
+                    "additions": rng.randint(files_changed, files_changed * 60),
+                    "deletions": rng.randint(0, files_changed * 30)
+                })
+                parent = commit_id
+
+            latest = repository.commits.latest()
+            repository.add_branch("master", is_default=True, latest_commit=latest["id"] if latest else None)
+            feature_branches = []
+            for branch_index in range(max(0, branches_per_repo - 1)):
+                kind = "feature" if branch_index % 3 else "bugfix"
+                name = f"{kind}/{rng.choice(_TOPICS).replace(' ', '-')}-{branch_index}"
+                repository.add_branch(name)
+                feature_branches.append(name)
+
+            for pr_index in range(pull_requests_per_repo):
+                from_branch = feature_branches[pr_index % len(feature_branches)] if feature_branches else "master"
+                repository.add_pull_request({
+                    "id": pr_index + 1,
+                    "title": f"{rng.choice(_VERBS)} {rng.choice(_TOPICS)}",
+                    "description": f"Synthetic pull request {pr_index + 1} for {slug}",
+                    "state": rng.choice(_PR_STATES),
+                    "created_date": (base_date + timedelta(days=rng.randint(0, 365))).strftime("%Y-%m-%d"),
+                    "author": dict(rng.choice(authors)),
+                    "fromRef": {"id": f"refs/heads/{from_branch}"},
+                    "toRef": {"id": "refs/heads/master"},
+                    "reviewers": [{"user": {"name": rng.choice(_AUTHORS)},
+                                   "status": rng.choice(["APPROVED", "UNAPPROVED"])}],
+                    "version": rng.randint(0, 5)
+                })
+
+    logger.info(f"합성 Bitbucket 데이터 생성: 프로젝트 {project_count}개, 저장소 {project_count * repos_per_project}개")
+    return store
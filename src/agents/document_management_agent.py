@@ -12,7 +12,6 @@ import glob
 from typing import Dict, List, Any, Optional, Union, Generator
 import shutil
 
-from src.core.config import get_settings
 from src.core.llm_service import llm_service
 from src.agents.base_interface import BaseAgent
 
@@ -34,9 +33,6 @@ class DocumentManagementAgent(BaseAgent):
         self.agent_type = "document"
         self.enabled = True
         
-        # 설정 로드
-        self.settings = get_settings()
-        
         # 문서 디렉토리 설정
         current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.docs_dir = os.path.join(current_dir, "data", "docs")
@@ -256,8 +252,27 @@ class DocumentManagementAgent(BaseAgent):
         # 검색 결과 형식화
         context = self._format_search_results(results)
         
-        # 프롬프트 구성
-        prompt = f"""문서 관리 에이전트로서 아래 검색 결과를 바탕으로 쿼리에 답변하세요.
+        # 검색 결과를 프롬프트 토큰 예산에 맞게 축소
+        context = llm_service.fit_context(context, self._build_search_prompt(query, ""))
+        
+        # LLM 호출
+        messages = [llm_service.format_system_message(self._build_search_prompt(query, context))]
+        response = llm_service.generate(messages, agent_type="document")
+        
+        return response
+    
+    def _build_search_prompt(self, query: str, context: str) -> str:
+        """
+        검색 응답 생성 프롬프트 구성
+        
+        Args:
+            query: 검색 쿼리
+            context: 형식화된 검색 결과
+            
+        Returns:
+            프롬프트 문자열
+        """
+        return f"""문서 관리 에이전트로서 아래 검색 결과를 바탕으로 쿼리에 답변하세요.
 
 질문: {query}
 
@@ -267,12 +282,6 @@ class DocumentManagementAgent(BaseAgent):
 위 정보를 바탕으로 질문에 대한 정확하고 상세한 답변을 제공하세요.
 검색 결과를 종합하여 답변하되, 검색 결과에서 찾을 수 없는 내용은 추측하지 마세요.
 """
-        
-        # LLM 호출
-        messages = [llm_service.format_system_message(prompt)]
-        response = llm_service.generate(messages)
-        
-        return response
     
     def _format_search_results(self, results: List[Dict[str, Any]]) -> str:
         """
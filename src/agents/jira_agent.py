@@ -9,18 +9,65 @@ import uuid
 import logging
 import json
 import os
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Generator
 import re
 
 from src.core.llm_service import llm_service
+from src.core.prompt_templates import PromptTemplate, prompt_registry
 import config
-from src.core.requests_config import get_secure_http_session
+from src.core.requests_config import session_registry
+from src.core.async_client import AsyncIntegrationClient, run_async
+from src.core.fetch_planner import FetchPlan
+from src.core.pagination import iter_offset_pages, DEFAULT_PAGE_SIZE
+from src.core.jql_cache import jql_cache
+from src.core.mock_router import MockEndpointRouter
 from src.utils.response_utils import format_agent_response as format_response
 from src.agents.base_interface import BaseAgent
 
 # 로깅 설정
 logger = logging.getLogger("jira_agent")
 
+# JQL 작성 프롬프트 (고정 접두부 + 요청별 접미부)
+JQL_PROMPT = prompt_registry.register(PromptTemplate(
+    name="jira.search_jql",
+    description="자연어 쿼리를 Jira JQL로 변환",
+    prefix="""Jira 이슈를 검색하기 위한 JQL(Jira Query Language)을 작성해주세요.
+
+주요 JQL 예시:
+- project = "프로젝트키"
+- status = "상태" (예: "To Do", "In Progress", "Done")
+- assignee = "담당자"
+- reporter = "보고자"
+- priority = "우선순위"
+- created >= "2023-01-01"
+- labels = "라벨"
+- summary ~ "검색어" (제목에 포함)
+- description ~ "검색어" (설명에 포함)
+- ORDER BY 필드 ASC/DESC (정렬)
+
+사용자 메시지의 쿼리와 실행 계획을 분석하여 적절한 JQL을 작성해주세요.
+```jql
+여기에 JQL 작성
+```""",
+    suffix="""쿼리: $query
+실행 계획: $action_plan"""
+))
+
+# JQL을 추출하지 못했을 때 사용하는 기본 JQL
+DEFAULT_JQL = "project = AI AND status != Done ORDER BY priority DESC"
+
+# 검색 결과 목록에 필요한 이슈 필드
+ISSUE_LIST_FIELDS = ["summary", "status", "assignee", "priority"]
+
+# 이슈 상세 조회 시 함께 조회할 최대 연관 이슈 수
+MAX_RELATED_ISSUES = 10
+
+# 조회용 POST 엔드포인트 (같은 요청을 다시 보내도 안전하므로 비동기 클라이언트 재시도 허용)
+READ_ONLY_POST_ENDPOINTS = frozenset({"/search"})
+
+# JQL의 여러 프로젝트 조건 (project in (A, B, ...))
+PROJECT_IN_PATTERN = re.compile(r'project\s+in\s*\(([^)]*)\)', re.IGNORECASE)
+
 class JiraAgent(BaseAgent):
     """Jira 인터페이스 에이전트"""
     
@@ -43,20 +90,27 @@ class JiraAgent(BaseAgent):
         self.schema_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
                                         "src", "schema", "jira.json")
         self.schema_info = self._load_schema()
+        self.mock_router = MockEndpointRouter.from_schema(self.schema_info)
+        
+        # 이슈 검색 페이지 크기 및 최대 결과 수 (요청 metadata의 max_results로 조정 가능)
+        self.search_page_size = self.jira_config.get('search_page_size', DEFAULT_PAGE_SIZE)
+        self.search_max_results = self.jira_config.get('search_max_results', 200)
+        
+        # 동시에 진행할 수 있는 최대 API 호출 수 (실행 계획/비동기 클라이언트 공용)
+        self.max_concurrency = self.jira_config.get('max_concurrency', 8)
         
         # API 세션 초기화 (실제 연결 시 사용)
+        auth = (self.username, self.password) if self.username and self.password else None
         if not self.mock_mode:
-            self.session = get_secure_http_session(timeout=30, verify_ssl=False)
-            
-            # 기본 인증 설정
-            if self.username and self.password:
-                import base64
-                auth_str = f"{self.username}:{self.password}"
-                encoded_auth = base64.b64encode(auth_str.encode()).decode()
-                self.session.headers.update({
-                    "Authorization": f"Basic {encoded_auth}",
-                    "Content-Type": "application/json"
-                })
+            # 같은 서버/인증 정보의 공유 세션 재사용 (세션 헤더는 변경하지 않음)
+            self.session = session_registry.get_session(self.api_url, verify_ssl=False, auth=auth)
+        
+        # 비동기 API 클라이언트 (독립적인 여러 API 호출을 동시에 실행할 때 사용)
+        self.async_client = AsyncIntegrationClient(
+            "jira", self.api_url, auth=auth,
+            timeout=self.jira_config.get('timeout', 30),
+            max_concurrency=self.max_concurrency
+        )
         
         logger.info(f"Jira 에이전트 초기화: {self.agent_id} (Mock 모드: {self.mock_mode})")
     
@@ -89,33 +143,10 @@ class JiraAgent(BaseAgent):
         if not self.schema_info or "api_endpoints" not in self.schema_info:
             return {"error": "스키마 정보가 없습니다."}
         
-        # 경로 파라미터 처리 (예: /issue/{issueKey} -> /issue/*)
-        endpoint_pattern = endpoint_path
-        if "{" in endpoint_path:
-            endpoint_pattern = re.sub(r'\{[^}]+\}', '*', endpoint_path)
-        
-        # 엔드포인트 찾기
-        for endpoint in self.schema_info["api_endpoints"]:
-            schema_endpoint = endpoint.get("endpoint", "")
-            schema_method = endpoint.get("method", "GET")
-            
-            # 엔드포인트 패턴 매칭
-            if (schema_endpoint == endpoint_path or 
-                (schema_endpoint.replace("*", "") in endpoint_path and "*" in schema_endpoint)) and \
-               schema_method == method:
-                
-                # 경로 파라미터 처리
-                if "path_params" in endpoint and "{" in schema_endpoint:
-                    for param_name, param_value in endpoint["path_params"].items():
-                        if "{" + param_name + "}" in schema_endpoint:
-                            # 실제 엔드포인트에서 파라미터 값 추출
-                            param_pattern = schema_endpoint.replace("{" + param_name + "}", "([^/]+)")
-                            param_match = re.match(param_pattern, endpoint_path)
-                            if param_match and param_match.group(1) == param_value:
-                                return endpoint.get("response", {})
-                
-                # 일반 엔드포인트 매칭
-                return endpoint.get("response", {})
+        # 로드 시 컴파일한 라우터로 한 번에 매칭
+        response = self.mock_router.find_response(method, endpoint_path)
+        if response is not None:
+            return response
         
         return {"error": f"엔드포인트 찾을 수 없음: {endpoint_path} ({method})"}
     
@@ -142,10 +173,10 @@ class JiraAgent(BaseAgent):
                 return self._find_endpoint_response("/rest/api/2/myself", "GET")
             elif endpoint == "/project" and method == "GET":
                 return self._find_endpoint_response("/rest/api/2/project", "GET")
-            elif endpoint.startswith("/issue/") and method == "GET":
+            elif endpoint.startswith("/issue/") and endpoint.count("/") == 2 and method == "GET":
                 issue_key = endpoint.split("/")[-1]
-                # /rest/api/2/issue/{issueKey} 형식으로 변환
-                mock_endpoint = "/rest/api/2/issue/{issueKey}"
+                # 실제 키로 조회해 path_params가 일치하는 스키마 항목이 있으면 그 항목 사용
+                mock_endpoint = f"/rest/api/2/issue/{issue_key}"
                 response = self._find_endpoint_response(mock_endpoint, "GET")
                 # issueKey를 실제 값으로 대체
                 if isinstance(response, dict) and "key" in response:
@@ -192,6 +223,44 @@ class JiraAgent(BaseAgent):
             logger.error(f"API 호출 오류: {e}")
             return {"error": str(e)}
     
+    async def _call_api_async(self, endpoint: str, method: str = "GET",
+                              data: Dict[str, Any] = None, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Jira API 비동기 호출
+        
+        Mock 모드에서는 스키마 응답을 그대로 반환하고, 실제 연결에서는 비동기 클라이언트
+        (연결 풀, 재시도, 동시성 제한)를 사용합니다.
+        
+        Args:
+            endpoint: API 엔드포인트 경로
+            method: HTTP 메서드
+            data: 요청 데이터
+            params: URL 파라미터
+            
+        Returns:
+            API 응답 데이터
+        """
+        if self.mock_mode:
+            return self._call_api(endpoint, method, data, params)
+        
+        logger.info(f"Jira API 비동기 호출: {method} {endpoint}")
+        retry = True if method.upper() == "POST" and endpoint in READ_ONLY_POST_ENDPOINTS else None
+        return await self.async_client.request(method, endpoint, data=data, params=params, retry=retry)
+    
+    def _execute_plan(self, plan: FetchPlan) -> Dict[str, Any]:
+        """
+        API 호출 실행 계획 실행 (독립적인 호출은 동시에, 의존 호출은 선행 호출 이후에 실행)
+        
+        Args:
+            plan: API 호출 실행 계획
+            
+        Returns:
+            {단계 이름: API 응답 데이터}
+        """
+        results = run_async(plan.execute(self._call_api_async))
+        logger.debug(f"Jira 실행 계획 통계: {plan.get_stats()}")
+        return results
+    
     def run(self, query: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Jira 쿼리 실행
@@ -209,11 +278,63 @@ class JiraAgent(BaseAgent):
         if not self.enabled:
             return format_response(self.agent_id, "오류: Jira 에이전트가 비활성화되어 있습니다.", llm_service.model_id)
         
+        # 이전에 검증된 JQL이 있으면 작업 분석과 JQL 변환 LLM 호출을 모두 건너뜀
+        cached_jql = jql_cache.lookup(query)
+        if cached_jql:
+            logger.info(f"JQL 캐시 적중: {cached_jql}")
+            result = self._search_issues(query, "", metadata.get("max_results"), metadata.get("fields"), cached_jql)
+            return format_response(self.agent_id, result, llm_service.model_id)
+        
         # 작업 분석 (Jira 쿼리 의도 파악)
         action_plan = self._analyze_query(query)
         logger.info(f"Jira 작업 분석: {action_plan}")
         
-        # 작업 수행
+        result = self._run_action(query, action_plan, metadata)
+        
+        # 응답 반환
+        return format_response(self.agent_id, result, llm_service.model_id)
+    
+    def run_stream(self, query: str, metadata: Optional[Dict[str, Any]] = None) -> Generator[str, None, None]:
+        """
+        Jira 쿼리 스트리밍 실행 (이슈 검색은 페이지가 도착하는 대로 전송)
+        
+        Args:
+            query: 자연어 쿼리
+            metadata: 추가 메타데이터
+            
+        Yields:
+            응답 조각
+        """
+        metadata = metadata or {}
+        
+        if not self.enabled:
+            yield "오류: Jira 에이전트가 비활성화되어 있습니다."
+            return
+        
+        cached_jql = jql_cache.lookup(query)
+        if cached_jql:
+            logger.info(f"JQL 캐시 적중: {cached_jql}")
+            yield from self._stream_search_issues(query, "", metadata.get("max_results"), metadata.get("fields"), cached_jql)
+            return
+        
+        action_plan = self._analyze_query(query)
+        if "이슈 검색" in self._determine_action_type(action_plan):
+            yield from self._stream_search_issues(query, action_plan, metadata.get("max_results"), metadata.get("fields"))
+        else:
+            yield self._run_action(query, action_plan, metadata)
+    
+    def _run_action(self, query: str, action_plan: str, metadata: Dict[str, Any]) -> str:
+        """
+        실행 계획의 작업 수행
+        
+        Args:
+            query: 자연어 쿼리
+            action_plan: 실행 계획
+            metadata: 추가 메타데이터 (max_results, fields)
+            
+        Returns:
+            작업 결과
+        """
         action_type = self._determine_action_type(action_plan)
         
         # 작업 유형별 처리
@@ -224,15 +345,18 @@ class JiraAgent(BaseAgent):
         elif "이슈 생성" in action_type:
             result = self._create_issue(query, action_plan)
         elif "이슈 검색" in action_type:
-            result = self._search_issues(query, action_plan)
+            result = self._search_issues(query, action_plan, metadata.get("max_results"), metadata.get("fields"))
         elif "이슈 상세" in action_type:
-            issue_key = self._extract_issue_key(query, action_plan)
-            result = self._get_issue_details(issue_key)
+            issue_keys = self._extract_issue_keys(query)
+            if len(issue_keys) > 1:
+                result = self._get_issues_by_keys(issue_keys)
+            else:
+                issue_key = self._extract_issue_key(query, action_plan)
+                result = self._get_issue_details(issue_key)
         else:
             result = f"지원되지 않는 작업 유형입니다: {action_type}\n\n실행 계획:\n{action_plan}"
         
-        # 응답 반환
-        return format_response(self.agent_id, result, llm_service.model_id)
+        return result
     
     def _analyze_query(self, query: str) -> str:
         """
@@ -264,7 +388,7 @@ class JiraAgent(BaseAgent):
         messages = [llm_service.format_user_message(prompt)]
         
         # LLM 호출
-        action_plan = llm_service.generate(messages)
+        action_plan = llm_service.generate(messages, agent_type="jira")
         
         # 오류 처리
         if isinstance(action_plan, dict) and "error" in action_plan:
@@ -298,6 +422,10 @@ class JiraAgent(BaseAgent):
         # 기본값 반환
         return "AI-101"  # 기본 이슈 키
     
+    def _extract_issue_keys(self, text: str) -> List[str]:
+        """텍스트에 포함된 모든 이슈 키 추출 (중복 제거, 순서 유지)"""
+        return list(dict.fromkeys(re.findall(r'([A-Z]+-\d+)', text)))
+    
     def _get_myself(self) -> str:
         """현재 사용자 정보 조회"""
         response = self._call_api("/myself", "GET")
@@ -385,7 +513,7 @@ class JiraAgent(BaseAgent):
         messages = [llm_service.format_user_message(prompt)]
         
         # LLM 호출
-        extraction_result = llm_service.generate(messages)
+        extraction_result = llm_service.generate(messages, agent_type="jira")
         
         # JSON 추출
         import re
@@ -443,103 +571,244 @@ class JiraAgent(BaseAgent):
         
         return result
     
-    def _search_issues(self, query: str, action_plan: str) -> str:
+    def _search_issues(self, query: str, action_plan: str, limit: Optional[int] = None,
+                       fields: Optional[List[str]] = None, cached_jql: Optional[str] = None) -> str:
         """
         이슈 검색
         
         Args:
             query: 자연어 쿼리
             action_plan: 실행 계획
+            limit: 최대 결과 수 (None이면 설정값 search_max_results)
+            fields: 조회할 이슈 필드 (None이면 목록 표시에 필요한 필드만)
+            cached_jql: JQL 캐시에서 찾은 JQL (있으면 LLM 변환 생략)
             
         Returns:
             이슈 검색 결과
         """
-        # 검색 조건 추출을 위한 프롬프트
-        prompt = f"""Jira 이슈를 검색하기 위한 JQL(Jira Query Language)을 작성해주세요:
-
-쿼리: {query}
-실행 계획: {action_plan}
-
-주요 JQL 예시:
-- project = "프로젝트키"
-- status = "상태" (예: "To Do", "In Progress", "Done")
-- assignee = "담당자"
-- reporter = "보고자"
-- priority = "우선순위"
-- created >= "2023-01-01"
-- labels = "라벨"
-- summary ~ "검색어" (제목에 포함)
-- description ~ "검색어" (설명에 포함)
-- ORDER BY 필드 ASC/DESC (정렬)
-
-쿼리를 분석하여 적절한 JQL을 작성해주세요.
-```jql
-여기에 JQL 작성
-```
-"""
+        return "".join(self._stream_search_issues(query, action_plan, limit, fields, cached_jql))
+    
+    def _generate_jql(self, query: str, action_plan: str) -> str:
+        """
+        자연어 쿼리를 JQL로 변환
         
-        # 메시지 구성
-        messages = [llm_service.format_user_message(prompt)]
+        Args:
+            query: 자연어 쿼리
+            action_plan: 실행 계획
+            
+        Returns:
+            JQL
+        """
+        # 검색 조건 추출을 위한 메시지 구성
+        messages = JQL_PROMPT.build_messages(query=query, action_plan=action_plan)
         
         # LLM 호출
-        jql_result = llm_service.generate(messages)
+        jql_result = llm_service.generate(messages, agent_type="jira")
         
         # JQL 추출
-        import re
         jql_match = re.search(r'```jql\s*(.*?)\s*```', jql_result, re.DOTALL)
         
-        jql = "project = AI AND status != Done ORDER BY priority DESC"  # 기본 JQL
+        jql = DEFAULT_JQL  # 기본 JQL
         if jql_match:
             jql = jql_match.group(1).strip()
         
-        # API 호출 데이터 구성
-        api_data = {
-            "jql": jql,
-            "startAt": 0,
-            "maxResults": 10,
-            "fields": ["summary", "status", "assignee", "priority"]
-        }
-        
-        # API 호출
-        response = self._call_api("/search", "POST", data=api_data)
-        
-        if "error" in response:
-            return f"이슈 검색 오류: {response['error']}"
+        return jql
+    
+    def _stream_search_issues(self, query: str, action_plan: str, limit: Optional[int] = None,
+                              fields: Optional[List[str]] = None,
+                              cached_jql: Optional[str] = None) -> Generator[str, None, None]:
+        """
+        이슈 검색 결과를 페이지 단위로 스트리밍
         
-        # 결과 반환
-        result = "## 이슈 검색 결과\n\n"
-        result += f"검색 조건: `{jql}`\n\n"
+        현재 페이지를 렌더링하는 동안 다음 페이지를 미리 조회합니다.
         
-        if "issues" not in response or not response["issues"]:
-            return result + "검색 결과가 없습니다."
+        Args:
+            query: 자연어 쿼리
+            action_plan: 실행 계획
+            limit: 최대 결과 수 (None이면 설정값 search_max_results)
+            fields: 조회할 이슈 필드 (None이면 목록 표시에 필요한 필드만)
+            cached_jql: JQL 캐시에서 찾은 JQL (있으면 LLM 변환 생략)
+            
+        Yields:
+            검색 결과 마크다운 조각
+        """
+        jql = cached_jql or self._generate_jql(query, action_plan)
+        # 새로 변환한 JQL은 검색이 성공하면 캐시에 저장
+        cacheable = cached_jql is None and jql != DEFAULT_JQL
+        fields = list(fields or ISSUE_LIST_FIELDS)
+        limit = self.search_max_results if limit is None else int(limit)
+        
+        # 여러 프로젝트 조건이면 프로젝트별 검색을 동시에 실행
+        project_keys = self._split_project_clause(jql)
+        if len(project_keys) > 1:
+            if cacheable:
+                jql_cache.store(query, jql)
+            yield self._search_projects(jql, project_keys, fields)
+            return
+        
+        def fetch_page(start_at: int, max_results: int):
+            return self._call_api_async("/search", "POST", data={
+                "jql": jql,
+                "startAt": start_at,
+                "maxResults": max_results,
+                "fields": fields
+            })
+        
+        shown = 0
+        total = 0
+        for page in iter_offset_pages(fetch_page, "issues", limit=limit, page_size=self.search_page_size):
+            if "error" in page:
+                if shown:
+                    yield f"\n**검색 중단**: {page['error']}\n"
+                else:
+                    if cached_jql:
+                        # 캐시된 JQL이 더 이상 유효하지 않음 (필드/프로젝트 변경 등)
+                        jql_cache.invalidate(query)
+                    yield f"이슈 검색 오류: {page['error']}"
+                return
+            
+            if page["start_at"] == 0:
+                if cacheable:
+                    jql_cache.store(query, jql)
+                yield f"## 이슈 검색 결과\n\n검색 조건: `{jql}`\n\n"
+                if not page["items"]:
+                    yield "검색 결과가 없습니다."
+                    return
+            
+            total = page["total"]
+            shown += len(page["items"])
+            yield self._format_issue_list(page["items"])
         
-        for issue in response["issues"]:
-            result += f"- **{issue.get('key', 'N/A')}**: {issue.get('fields', {}).get('summary', 'N/A')}\n"
+        # 최대 결과 수로 잘린 경우
+        if total > shown:
+            yield f"\n**참고**: 총 {total}개 중 {shown}개 표시됨\n"
+    
+    def _format_issue_list(self, issues: List[Dict[str, Any]]) -> str:
+        """검색 결과 이슈 목록 포맷팅"""
+        result = ""
+        for issue in issues:
+            fields = issue.get('fields', {})
+            result += f"- **{issue.get('key', 'N/A')}**: {fields.get('summary', 'N/A')}\n"
             
             # 상태 정보
-            status = issue.get('fields', {}).get('status', {}).get('name', 'N/A')
+            status = fields.get('status', {}).get('name', 'N/A')
             result += f"  상태: {status}\n"
             
             # 담당자 정보
-            assignee = issue.get('fields', {}).get('assignee', {})
+            assignee = fields.get('assignee', {})
             if assignee:
                 result += f"  담당자: {assignee.get('displayName', assignee.get('name', 'N/A'))}\n"
             else:
                 result += f"  담당자: 미할당\n"
             
             # 우선순위 정보
-            priority = issue.get('fields', {}).get('priority', {}).get('name', 'N/A')
+            priority = fields.get('priority', {}).get('name', 'N/A')
             result += f"  우선순위: {priority}\n"
             
             result += "\n"
         
-        # 총 결과 수
-        total = response.get("total", 0)
-        if total > len(response["issues"]):
-            result += f"\n**참고**: 총 {total}개 중 {len(response['issues'])}개 표시됨\n"
+        return result
+    
+    def _split_project_clause(self, jql: str) -> List[str]:
+        """JQL의 project in (...) 조건에서 프로젝트 키 목록 추출"""
+        match = PROJECT_IN_PATTERN.search(jql)
+        if not match:
+            return []
+        return [key.strip().strip('"\'') for key in match.group(1).split(",") if key.strip()]
+    
+    def _search_projects(self, jql: str, project_keys: List[str], fields: List[str]) -> str:
+        """
+        여러 프로젝트 이슈 검색 (프로젝트별 검색을 동시에 실행)
+        
+        Args:
+            jql: project in (...) 조건이 포함된 JQL
+            project_keys: 프로젝트 키 목록
+            fields: 조회할 이슈 필드
+            
+        Returns:
+            프로젝트별 이슈 검색 결과
+        """
+        plan = FetchPlan(max_concurrency=self.max_concurrency)
+        for key in project_keys:
+            project_jql = PROJECT_IN_PATTERN.sub(f'project = "{key}"', jql, count=1)
+            plan.add(key, "/search", "POST", data={
+                "jql": project_jql,
+                "startAt": 0,
+                "maxResults": min(self.search_page_size, self.search_max_results),
+                "fields": fields
+            })
+        
+        responses = self._execute_plan(plan)
+        
+        result = "## 이슈 검색 결과\n\n"
+        result += f"검색 조건: `{jql}`\n\n"
+        
+        for key in project_keys:
+            response = responses[key]
+            result += f"### {key}\n\n"
+            
+            if "error" in response:
+                result += f"검색 오류: {response['error']}\n\n"
+                continue
+            
+            issues = response.get("issues") or []
+            if not issues:
+                result += "검색 결과가 없습니다.\n\n"
+                continue
+            
+            result += self._format_issue_list(issues)
+            total = response.get("total", 0)
+            if total > len(issues):
+                result += f"**참고**: 총 {total}개 중 {len(issues)}개 표시됨\n\n"
+        
+        return result
+    
+    def _get_issues_by_keys(self, issue_keys: List[str]) -> str:
+        """
+        여러 이슈 요약 조회 (이슈별 조회를 동시에 실행)
+        
+        Args:
+            issue_keys: 이슈 키 목록
+            
+        Returns:
+            이슈 요약 목록
+        """
+        plan = FetchPlan(max_concurrency=self.max_concurrency)
+        for key in issue_keys:
+            plan.add(key, f"/issue/{key}", params={"fields": ",".join(ISSUE_LIST_FIELDS)})
+        
+        responses = self._execute_plan(plan)
+        
+        result = f"## 이슈 조회 결과 ({len(issue_keys)}개)\n\n"
+        failed = []
+        issues = []
+        for key in issue_keys:
+            response = responses[key]
+            if "error" in response:
+                failed.append(f"{key} ({response['error']})")
+            else:
+                issues.append({"key": key, "fields": response.get("fields", {})})
+        
+        result += self._format_issue_list(issues)
+        if failed:
+            result += f"**조회 실패**: {', '.join(failed)}\n"
         
         return result
     
+    def _related_issue_keys(self, issue: Dict[str, Any]) -> List[tuple]:
+        """이슈의 하위 작업/연결 이슈 (키, 관계) 목록 추출"""
+        fields = issue.get("fields", {})
+        related = [(subtask.get("key"), "하위 작업") for subtask in fields.get("subtasks") or []]
+        
+        for link in fields.get("issuelinks") or []:
+            link_type = link.get("type", {})
+            if "outwardIssue" in link:
+                related.append((link["outwardIssue"].get("key"), link_type.get("outward", "연결")))
+            elif "inwardIssue" in link:
+                related.append((link["inwardIssue"].get("key"), link_type.get("inward", "연결")))
+        
+        return [(key, relation) for key, relation in related if key][:MAX_RELATED_ISSUES]
+    
     def _get_issue_details(self, issue_key: str) -> str:
         """
         이슈 상세 조회
@@ -550,13 +819,35 @@ class JiraAgent(BaseAgent):
         Returns:
             이슈 상세 정보
         """
-        response = self._call_api(f"/issue/{issue_key}", "GET")
+        # 이슈, 댓글, 상태 전환 목록은 동시에 조회하고,
+        # 연관 이슈와 담당자 프로필은 이슈 응답이 도착하는 즉시 동시에 조회
+        related_fields = "summary,status,issuetype"
+        plan = FetchPlan(max_concurrency=self.max_concurrency)
+        plan.add("issue", f"/issue/{issue_key}")
+        plan.add("comments", f"/issue/{issue_key}/comment")
+        plan.add("transitions", f"/issue/{issue_key}/transitions")
+        plan.add("related", depends_on=["issue"], build=lambda done: {
+            key: {"endpoint": f"/issue/{key}", "params": {"fields": related_fields}}
+            for key, _ in self._related_issue_keys(done["issue"])
+        })
+        plan.add("assignee", depends_on=["issue"], build=lambda done: (
+            {"endpoint": "/user", "params": {"username": done["issue"]["fields"]["assignee"]["name"]}}
+            if (done["issue"].get("fields", {}).get("assignee") or {}).get("name") else None
+        ))
+        
+        responses = self._execute_plan(plan)
+        response = responses["issue"]
         
         if "error" in response:
             return f"이슈 상세 조회 오류: {response['error']}"
         
         fields = response.get("fields", {})
         
+        # 댓글 API 응답이 있으면 이슈 필드의 댓글보다 우선 사용
+        comment_data = fields.get("comment") or {}
+        if "error" not in responses["comments"] and "comments" in responses["comments"]:
+            comment_data = responses["comments"]
+        
         result = f"## 이슈 상세: {issue_key}\n\n"
         result += f"제목: {fields.get('summary', 'N/A')}\n"
         result += f"유형: {fields.get('issuetype', {}).get('name', 'N/A')}\n"
@@ -574,6 +865,9 @@ class JiraAgent(BaseAgent):
         
         if assignee:
             result += f"담당자: {assignee.get('displayName', assignee.get('name', 'N/A'))}\n"
+            profile = responses["assignee"]
+            if profile.get("emailAddress"):
+                result += f"담당자 이메일: {profile['emailAddress']}\n"
         
         if reporter:
             result += f"보고자: {reporter.get('displayName', reporter.get('name', 'N/A'))}\n"
@@ -600,17 +894,33 @@ class JiraAgent(BaseAgent):
         result += f"\n### 설명\n{fields.get('description', 'N/A')}\n"
         
         # 댓글 정보
-        if "comment" in fields and "comments" in fields["comment"]:
-            result += f"\n### 댓글 ({len(fields['comment']['comments'])}개)\n\n"
+        if "comments" in comment_data:
+            comments = comment_data["comments"]
+            result += f"\n### 댓글 ({comment_data.get('total', len(comments))}개)\n\n"
             
-            for comment in fields["comment"]["comments"][:3]:  # 최대 3개만 표시
+            for comment in comments[:3]:  # 최대 3개만 표시
                 author = comment.get("author", {}).get("displayName", "N/A")
                 created = comment.get("created", "N/A")
                 body = comment.get("body", "N/A")
                 
                 result += f"**{author}** ({created}):\n{body}\n\n"
             
-            if len(fields["comment"]["comments"]) > 3:
-                result += f"_...외 {len(fields['comment']['comments']) - 3}개 댓글_\n"
+            if len(comments) > 3:
+                result += f"_...외 {len(comments) - 3}개 댓글_\n"
+        
+        # 하위 작업 및 연결 이슈 정보
+        related = responses["related"]
+        if related and "error" not in related:
+            result += "\n### 연관 이슈\n\n"
+            for key, relation in self._related_issue_keys(response):
+                related_fields_data = related.get(key, {}).get("fields", {})
+                status = related_fields_data.get("status", {}).get("name", "N/A")
+                result += f"- **{key}** ({relation}): {related_fields_data.get('summary', 'N/A')} [{status}]\n"
+        
+        # 가능한 상태 전환 정보
+        transitions = responses["transitions"].get("transitions", [])
+        if transitions:
+            names = [transition.get("name", "N/A") for transition in transitions]
+            result += f"\n### 가능한 상태 전환\n{', '.join(names)}\n"
         
         return result
\ No newline at end of file
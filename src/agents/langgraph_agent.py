@@ -14,10 +14,58 @@ from typing import Dict, Any, List, Optional, Union, Callable, Type, TypedDict
 
 import config
 from src.core.llm_service import llm_service
+from src.core.prompt_templates import PromptTemplate, prompt_registry
+from src.core import tracing
 
 # 로깅 설정
 logger = logging.getLogger("langgraph_agent")
 
+# 프롬프트 템플릿 (고정 접두부 + 요청별 접미부)
+ROUTER_PROMPT = prompt_registry.register(PromptTemplate(
+    name="langgraph.router",
+    description="다음에 실행할 에이전트 결정",
+    prefix="""라우터로서 현재 쿼리와 컨텍스트를 분석하여 다음에 실행할 에이전트를 결정해야 합니다.
+
+사용 가능한 에이전트:
+$agent_types
+
+각 에이전트 용도:
+- sql: 데이터베이스 쿼리, 테이블 정보, 데이터 분석
+- jira: 이슈 추적, 티켓 관리, 프로젝트 관리
+- bitbucket: 코드 저장소, 버전 관리, PR 관리
+- s3: 파일 스토리지, 버킷 관리, 객체 관리
+- rag: 문서 검색, 지식 증강, 정보 검색
+- swdp: SW개발 포털 정보, TR 정보 확인, 티켓 조회
+
+작업:
+1) 현재 쿼리를 처리하기 위해 다음에 실행할 최적의 에이전트를 선택하세요.
+2) 선택한 에이전트 이름만 반환하세요(다른 설명 없이).
+3) 선택할 에이전트가 없으면(최종 응답이 가능하거나 종료 필요) "none"을 반환하세요.""",
+    suffix="""현재 쿼리:
+$query
+
+$context_section
+
+에이전트 이름:"""
+))
+
+OUTPUT_PROMPT = prompt_registry.register(PromptTemplate(
+    name="langgraph.output",
+    description="복합 에이전트 워크플로우 최종 응답 생성",
+    prefix="""복합 에이전트 워크플로우의 최종 출력을 생성해야 합니다.
+
+사용자 메시지로 원래 쿼리와 각 에이전트 결과가 주어집니다.
+주어진 정보를 종합하여 사용자에게 명확하고 일관된 최종 응답을 제공하세요.
+각 에이전트의 결과를 적절하게 인용하고, 응답이 어떻게 쿼리에 답하는지 설명하세요.
+불필요한 기술적 세부 사항은 생략하고 사용자에게 가장 유용한 정보에 집중하세요.
+응답 형식은 사용자가 쉽게 이해할 수 있는 명확한 형태로 구성하세요.""",
+    suffix="""원래 쿼리:
+$query
+
+각 에이전트 결과:
+$context_str"""
+))
+
 # 상태 타입 정의
 class GraphState(TypedDict):
     """그래프 상태 타입"""
@@ -125,35 +173,17 @@ class RouterNode:
                 if content:
                     context_str += f"=== {agent_type.upper()} 컨텍스트 ===\n{content}\n\n"
             
-            # 라우팅 프롬프트
-            prompt = f"""라우터로서 현재 쿼리와 컨텍스트를 분석하여 다음에 실행할 에이전트를 결정해야 합니다.
-
-사용 가능한 에이전트:
-{', '.join(self.agent_types)}
-
-각 에이전트 용도:
-- sql: 데이터베이스 쿼리, 테이블 정보, 데이터 분석
-- jira: 이슈 추적, 티켓 관리, 프로젝트 관리
-- bitbucket: 코드 저장소, 버전 관리, PR 관리
-- s3: 파일 스토리지, 버킷 관리, 객체 관리
-- rag: 문서 검색, 지식 증강, 정보 검색
-- swdp: SW개발 포털 정보, TR 정보 확인, 티켓 조회
-
-현재 쿼리:
-{query}
-
-{'현재 컨텍스트:\n' + context_str if context_str else '컨텍스트 없음'}
-
-작업:
-1) 현재 쿼리를 처리하기 위해 다음에 실행할 최적의 에이전트를 선택하세요.
-2) 선택한 에이전트 이름만 반환하세요(다른 설명 없이).
-3) 선택할 에이전트가 없으면(최종 응답이 가능하거나 종료 필요) "none"을 반환하세요.
-
-에이전트 이름:"""
+            # 프롬프트 고정 부분을 제외한 토큰 예산에 맞게 컨텍스트 축소
+            agent_types = ", ".join(self.agent_types)
+            if context_str:
+                reserved = ROUTER_PROMPT.render_text(agent_types=agent_types, query=query, context_section="현재 컨텍스트:\n")
+                context_str = self.llm.fit_context(context_str, reserved)
+            
+            context_section = f"현재 컨텍스트:\n{context_str}" if context_str else "컨텍스트 없음"
             
             # 라우팅 응답 생성
-            messages = [self.llm.format_user_message(prompt)]
-            routing_result = self.llm.generate(messages)
+            messages = ROUTER_PROMPT.build_messages(agent_types=agent_types, query=query, context_section=context_section)
+            routing_result = self.llm.generate(messages, agent_type="router")
             
             # 결과 처리
             if isinstance(routing_result, dict) and "error" in routing_result:
@@ -213,24 +243,13 @@ class OutputNode:
                 if content:
                     context_str += f"=== {agent_type.upper()} 결과 ===\n{content}\n\n"
             
-            # 응답 생성 프롬프트
-            prompt = f"""복합 에이전트 워크플로우의 최종 출력을 생성해야 합니다.
-
-원래 쿼리:
-{query}
-
-각 에이전트 결과:
-{context_str}
-
-위 정보를 종합하여 사용자에게 명확하고 일관된 최종 응답을 제공하세요.
-각 에이전트의 결과를 적절하게 인용하고, 응답이 어떻게 쿼리에 답하는지 설명하세요.
-불필요한 기술적 세부 사항은 생략하고 사용자에게 가장 유용한 정보에 집중하세요.
-응답 형식은 사용자가 쉽게 이해할 수 있는 명확한 형태로 구성하세요.
-"""
+            # 프롬프트 고정 부분을 제외한 토큰 예산에 맞게 컨텍스트 축소
+            if context_str:
+                context_str = llm_service.fit_context(context_str, OUTPUT_PROMPT.render_text(query=query, context_str=""))
             
             # 최종 응답 생성
-            messages = [llm_service.format_system_message(prompt)]
-            final_output = llm_service.generate(messages)
+            messages = OUTPUT_PROMPT.build_messages(query=query, context_str=context_str)
+            final_output = llm_service.generate(messages, agent_type="langgraph")
             
             # 오류 처리
             if isinstance(final_output, dict) and "error" in final_output:
@@ -308,21 +327,25 @@ class LangGraphAgent:
             # 그래프 실행 (라우터 -> 에이전트 -> ... -> 출력)
             while state["next_agent"] and step < max_steps:
                 # 다음 단계 유형에 따라 처리
+                # 노드마다 graph.* 스팬을 남겨 라우팅/에이전트/출력 단계 시간을 구분
                 if state["next_agent"] == "start":
                     # 초기 라우팅
                     state["current_agent"] = "router"
-                    state = self.router.run(state)
+                    with tracing.span("graph.router", step=step):
+                        state = self.router.run(state)
                 elif state["next_agent"] in self.agent_types:
                     # 에이전트 실행
                     agent_type = state["next_agent"]
                     state["current_agent"] = agent_type
-                    state = self.agent_nodes[agent_type].run(state)
+                    with tracing.span("graph.agent", step=step, agent_type=agent_type):
+                        state = self.agent_nodes[agent_type].run(state)
                     # 다시 라우터로 이동
                     state["next_agent"] = "router"
                 elif state["next_agent"] == "router":
                     # 라우터 실행
                     state["current_agent"] = "router"
-                    state = self.router.run(state)
+                    with tracing.span("graph.router", step=step):
+                        state = self.router.run(state)
                     
                 # 최대 단계 확인
                 step += 1
@@ -339,7 +362,8 @@ class LangGraphAgent:
             
             # 최종 출력 생성
             if not state["final_output"]:
-                state = self.output_node.run(state)
+                with tracing.span("graph.output", step=step):
+                    state = self.output_node.run(state)
             
             # 결과 반환
             return self._format_response(state)
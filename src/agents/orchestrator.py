@@ -11,18 +11,9 @@ import logging
 import threading
 from typing import Dict, Any, List, Optional, Union, Generator, Type
 
-# 설정 임포트
-import config
 from src.core.llm_service import llm_service
-
-# 에이전트 임포트
-from src.agents.swdp_db_agent import SWDPDBAgent
-from src.agents.jira_agent import JiraAgent
-from src.agents.bitbucket_agent import BitbucketAgent
-from src.agents.pocket_agent import PocketAgent
-from src.agents.rag_agent import RAGAgent
-from src.agents.swdp_agent import SWDPAgent
-from src.agents.langgraph_agent import LangGraphAgent
+from src.core.service_container import import_object
+from src.core import tracing
 
 # 로깅 설정
 logger = logging.getLogger("agent_orchestrator")
@@ -41,14 +32,15 @@ class AgentOrchestrator:
         """에이전트 오케스트레이터 초기화"""
         logger.info("에이전트 오케스트레이터 초기화")
         
-        # 에이전트 매핑
+        # 에이전트 매핑 (모듈 경로 - sqlalchemy 등 에이전트 의존성은 첫 생성 시 임포트)
+        # rag: 별도 RAG 에이전트 모듈이 없으므로 문서 검색을 담당하는 문서 관리 에이전트 사용
         self.agent_types = {
-            "swdp_db": SWDPDBAgent,
-            "jira": JiraAgent,
-            "bitbucket": BitbucketAgent,
-            "pocket": PocketAgent,
-            "rag": RAGAgent,
-            "swdp": SWDPAgent
+            "swdp_db": "src.agents.swdp_db_agent:SWDPDBAgent",
+            "jira": "src.agents.jira_agent:JiraAgent",
+            "bitbucket": "src.agents.bitbucket_agent:BitbucketAgent",
+            "pocket": "src.agents.pocket_agent:PocketAgent",
+            "rag": "src.agents.document_management_agent:DocumentManagementAgent",
+            "swdp": "src.agents.swdp_agent:SWDPAgent"
         }
         
         # 고급 에이전트 타입
@@ -80,24 +72,30 @@ class AgentOrchestrator:
         logger.info(f"에이전트 실행: {agent_type}, 쿼리: {query}")
         metadata = metadata or {}
         
-        if agent_type == "graph":
-            # 그래프 에이전트 (기본 복합 에이전트)
-            return self._run_graph_agent(query, metadata)
-        elif agent_type == "langgraph":
-            # 고급 langgraph 기반 복합 에이전트
-            return self._run_langgraph_agent(query, metadata)
-        elif agent_type in self.complex_agent_types:
-            # 기타 복합 에이전트
-            return self._run_complex_agent(agent_type, query, metadata)
-        else:
-            # 개별 에이전트
-            return self._run_single_agent(agent_type, query, metadata)
+        with tracing.span("orchestrator.run", "orchestrator", agent_type=agent_type):
+            if agent_type == "graph":
+                # 그래프 에이전트 (기본 복합 에이전트)
+                return self._run_graph_agent(query, metadata)
+            elif agent_type == "langgraph":
+                # 고급 langgraph 기반 복합 에이전트
+                return self._run_langgraph_agent(query, metadata)
+            elif agent_type in self.complex_agent_types:
+                # 기타 복합 에이전트
+                return self._run_complex_agent(agent_type, query, metadata)
+            else:
+                # 개별 에이전트
+                return self._run_single_agent(agent_type, query, metadata)
+    
+    def _create_agent(self, agent_type: str):
+        """에이전트 모듈 임포트 및 인스턴스 생성"""
+        agent_class = import_object(self.agent_types[agent_type])
+        return agent_class()
     
     def _get_agent(self, agent_type: str):
         """에이전트 인스턴스 가져오기 (캐싱)"""
         if agent_type not in self.agent_cache:
             if agent_type in self.agent_types:
-                self.agent_cache[agent_type] = self.agent_types[agent_type]()
+                self.agent_cache[agent_type] = self._create_agent(agent_type)
             elif agent_type in self.complex_agent_types:
                 # 복합 에이전트 생성은 별도 함수에서 처리
                 pass  
@@ -169,12 +167,13 @@ class AgentOrchestrator:
         for agent_type in self.agent_types:
             try:
                 if agent_type not in self.agent_cache:
-                    self.agent_cache[agent_type] = self.agent_types[agent_type]()
+                    self.agent_cache[agent_type] = self._create_agent(agent_type)
                 agent_instances[agent_type] = self.agent_cache[agent_type]
             except Exception as e:
                 logger.warning(f"에이전트 {agent_type} 초기화 실패: {e}")
         
         # LangGraph 에이전트 생성
+        from src.agents.langgraph_agent import LangGraphAgent
         return LangGraphAgent(agent_instances)
     
     def _run_langgraph_agent(self, query: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -217,7 +216,7 @@ class AgentOrchestrator:
         
         # 라우팅 수행
         messages = [llm_service.format_user_message(prompt)]
-        agent_choice = llm_service.generate(messages)
+        agent_choice = llm_service.generate(messages, agent_type="orchestrator")
         
         # 라우팅 결과 처리
         selected_agent = "none"
@@ -279,7 +278,7 @@ class AgentOrchestrator:
         
         # LLM 스트리밍 호출
         with agent_lock:
-            response = llm_service.generate(messages, stream=True)
+            response = llm_service.generate(messages, stream=True, agent_type="orchestrator")
         
         # 스트리밍 처리
         for chunk in llm_service.process_stream(response):
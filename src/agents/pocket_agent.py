@@ -10,13 +10,19 @@ import logging
 import json
 import os
 import re
-from typing import Dict, Any, List, Optional, Union
+import time
+from typing import Dict, Any, List, Optional, Union, Generator
 
 from src.core.llm_service import llm_service
 import config
-from src.core.requests_config import get_secure_http_session
+from src.core.async_client import AsyncIntegrationClient
+from src.core.pagination import iter_cursor_pages
 from src.utils.response_utils import format_agent_response as format_response
 from src.agents.base_interface import BaseAgent
+from src.agents.pocket_object_index import PocketMockStore, parse_list_objects_response, DEFAULT_MAX_KEYS
+from src.agents.pocket_transfer import (
+    PocketTransferClient, resolve_local_path, DEFAULT_PART_SIZE, DEFAULT_TRANSFER_WORKERS, DEFAULT_STATE_DIR
+)
 
 # 로깅 설정
 logger = logging.getLogger("pocket_agent")
@@ -35,31 +41,43 @@ class PocketAgent(BaseAgent):
         self.api_url = self.pocket_config.get('api_url', "https://pocket.internal.example.com/api/v1")
         self.username = self.pocket_config.get('username', "")
         self.password = self.pocket_config.get('password', "")
+        self.timeout = self.pocket_config.get('timeout', 30)
+        # 목록 조회 페이지 크기 / 응답 하나에 표시할 최대 항목 수
+        self.list_page_size = self.pocket_config.get('list_page_size', DEFAULT_MAX_KEYS)
+        self.list_max_keys = self.pocket_config.get('list_max_keys', 100)
         
-        # Mock 모드 설정
-        self.mock_mode = True  # 항상 Mock 모드로 실행
+        # Mock 모드 설정 (기본값: Mock 모드, S3 호환 서버에 연결할 때만 끔)
+        self.mock_mode = self.pocket_config.get('mock_mode', True)
+        
+        # 대용량 전송 설정 / 업로드 원본 디렉토리 / 다운로드 기본 디렉토리
+        # (쿼리로 지정한 로컬 경로는 각 디렉토리 안의 상대 경로만 허용)
+        self.upload_dir = self.pocket_config.get('upload_dir', "uploads")
+        self.download_dir = self.pocket_config.get('download_dir', "downloads")
         
         # 스키마 정보 로드
         self.schema_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
                                         "src", "schema", "pocket.json")
         self.schema_info = self._load_schema()
         
-        # API 세션 초기화 (실제 연결 시 사용)
+        # API 클라이언트 초기화 (실제 연결 시 사용)
         if not self.mock_mode:
-            self.session = get_secure_http_session(timeout=30, verify_ssl=False)
-            
-            # API 인증 헤더 설정
-            if self.username and self.password:
-                import base64
-                auth_str = f"{self.username}:{self.password}"
-                encoded_auth = base64.b64encode(auth_str.encode()).decode()
-                self.session.headers.update({
-                    "Authorization": f"Basic {encoded_auth}",
-                    "Content-Type": "application/json"
-                })
+            auth = (self.username, self.password) if self.username and self.password else None
+            # 비동기 API 클라이언트 (여러 객체 조회/전송을 동시에 실행할 때 사용)
+            self.async_client = AsyncIntegrationClient(
+                "pocket", self.api_url, auth=auth,
+                max_concurrency=self.pocket_config.get('max_concurrency', 8)
+            )
+            # 멀티파트 업로드 / 범위 다운로드 클라이언트 (파일 데이터 전송)
+            self.transfer_client = PocketTransferClient(
+                self.api_url, auth=auth, verify_ssl=self.pocket_config.get('verify_ssl', False),
+                timeout=self.timeout,
+                part_size=self.pocket_config.get('transfer_part_size', DEFAULT_PART_SIZE),
+                max_workers=self.pocket_config.get('transfer_workers', DEFAULT_TRANSFER_WORKERS),
+                state_dir=self.pocket_config.get('transfer_state_dir', DEFAULT_STATE_DIR)
+            )
         
         # 가상 저장소 데이터 초기화 (Mock 모드용)
-        self.mock_buckets = {
+        mock_buckets = {
             "documents": {
                 "creation_date": "2023-01-15",
                 "region": "ap-northeast-2",
@@ -127,6 +145,8 @@ class PocketAgent(BaseAgent):
                 }
             }
         }
+        # 버킷 이름/객체 키를 정렬 인덱스로 관리 (접두사·구분자 목록 조회와 연속 토큰 지원)
+        self.mock_store = PocketMockStore.from_seed(mock_buckets)
         
         logger.info(f"Pocket 에이전트 초기화: {self.agent_id} (Mock 모드: {self.mock_mode})")
     
@@ -177,7 +197,8 @@ class PocketAgent(BaseAgent):
             result = self._create_bucket(bucket_name)
         elif "객체 목록" in action_type:
             bucket_name, prefix = self._extract_list_objects_params(query, action_plan)
-            result = self._list_objects(bucket_name, prefix)
+            options = self._extract_listing_options(query, action_plan)
+            result = self._list_objects(bucket_name, prefix, **options)
         elif "객체 정보" in action_type:
             bucket_name, object_key = self._extract_object_params(query, action_plan)
             result = self._get_object_info(bucket_name, object_key)
@@ -186,7 +207,7 @@ class PocketAgent(BaseAgent):
             result = self._upload_object(bucket_name, object_key, query)
         elif "다운로드" in action_type:
             bucket_name, object_key = self._extract_object_params(query, action_plan)
-            result = self._download_object(bucket_name, object_key)
+            result = self._download_object(bucket_name, object_key, self._extract_local_path(query))
         elif "삭제" in action_type and "객체" in action_type:
             bucket_name, object_key = self._extract_object_params(query, action_plan)
             result = self._delete_object(bucket_name, object_key)
@@ -196,6 +217,9 @@ class PocketAgent(BaseAgent):
         else:
             result = f"지원되지 않는 작업 유형입니다: {action_type}\n\n실행 계획:\n{action_plan}"
         
+        if result is None:
+            result = f"실제 Pocket 연결에서는 아직 지원하지 않는 작업입니다: {action_type}"
+        
         # 응답 반환
         return format_response(self.agent_id, result, llm_service.model_id)
     
@@ -233,7 +257,7 @@ class PocketAgent(BaseAgent):
         messages = [llm_service.format_user_message(prompt)]
         
         # LLM 호출
-        action_plan = llm_service.generate(messages)
+        action_plan = llm_service.generate(messages, agent_type="pocket")
         
         # 오류 처리
         if isinstance(action_plan, dict) and "error" in action_plan:
@@ -366,18 +390,123 @@ class PocketAgent(BaseAgent):
         
         return bucket_name, object_key
     
+    def _extract_local_path(self, query: str) -> Optional[str]:
+        """
+        쿼리에서 로컬 파일 경로 추출 (업로드 원본 / 다운로드 저장 위치)
+        
+        추출한 경로는 검증 전 값이므로 resolve_local_path로 업로드/다운로드 디렉토리 안인지 확인한 뒤 사용합니다.
+        
+        Returns:
+            로컬 경로 (없으면 None)
+        """
+        path_patterns = [
+            r"(?:로컬|local)\s*(?:파일|경로|path|file)?[은는을:\s]*['\"]([^'\"]+)['\"]",
+            r"['\"]([^'\"]+)['\"]\s*(?:에서|(?:으로|로)\s*(?:저장|다운로드))",
+            r"(?:from|to|into)\s+['\"]([^'\"]+)['\"]"
+        ]
+        for pattern in path_patterns:
+            match = re.search(pattern, query, re.IGNORECASE)
+            if match:
+                return match.group(1)
+        
+        # 따옴표 안의 업로드 디렉토리 기존 파일 경로
+        for candidate in re.findall(r"['\"]([^'\"]+)['\"]", query):
+            if os.path.sep in candidate:
+                resolved = resolve_local_path(candidate, self.upload_dir)
+                if resolved and os.path.isfile(resolved):
+                    return candidate
+        return None
+    
+    def _format_transfer_rate(self, size: int, elapsed: float) -> str:
+        """전송 속도 문자열"""
+        return f"{self._format_size(size / elapsed)}/s" if elapsed > 0 else "N/A"
+    
+    def _extract_listing_options(self, query: str, action_plan: str) -> Dict[str, Any]:
+        """
+        객체 목록 조회 옵션 추출 (구분자, 최대 항목 수, 연속 토큰)
+        
+        Returns:
+            {"delimiter": ..., "max_keys": ..., "continuation_token": ...}
+        """
+        text = f"{query}\n{action_plan}"
+        options = {"delimiter": "", "max_keys": self.list_max_keys, "continuation_token": None}
+        
+        # "폴더 구조", "하위 폴더", "delimiter" → 한 단계 "디렉터리" 목록
+        if re.search(r"폴더\s*(?:구조|목록|별)|하위\s*(?:폴더|디렉터리)|디렉터리\s*(?:구조|목록)|delimiter", text, re.IGNORECASE):
+            options["delimiter"] = "/"
+        
+        max_keys_match = re.search(r"(?:최대|max[-_ ]?keys)\s*[:=]?\s*(\d+)|(\d+)\s*개(?:만|까지)", query, re.IGNORECASE)
+        if max_keys_match:
+            options["max_keys"] = int(max_keys_match.group(1) or max_keys_match.group(2))
+        
+        token_match = re.search(r"(?:continuation[-_ ]?token|연속\s*토큰|다음\s*페이지\s*토큰)[은는:\s]+['\"]?([\w=-]+)", query, re.IGNORECASE)
+        if token_match:
+            options["continuation_token"] = token_match.group(1)
+        
+        return options
+    
+    async def _fetch_object_page(self, bucket_name: str, prefix: str, delimiter: str,
+                                 cursor: Optional[str], limit: int) -> Dict[str, Any]:
+        """
+        객체 목록 한 페이지 조회
+        
+        Returns:
+            {"values": [공통 접두사({"prefix": ...}) 및 객체({"key": ...})], "nextCursor": 연속 토큰 또는 None}
+            (실패 시 {"error": ...})
+        """
+        if self.mock_mode:
+            index = self.mock_store.get_index(bucket_name)
+            if index is None:
+                return {"error": f"'{bucket_name}' 버킷이 존재하지 않습니다."}
+            page = index.list_page(prefix, delimiter, limit, continuation_token=cursor)
+        else:
+            params = {"list-type": 2, "prefix": prefix or None, "delimiter": delimiter or None,
+                      "max-keys": limit, "continuation-token": cursor}
+            page = parse_list_objects_response(await self.async_client.get(f"/{bucket_name}", params=params))
+        
+        if "error" in page:
+            return page
+        return {
+            "values": [{"prefix": common_prefix} for common_prefix in page["common_prefixes"]] + page["contents"],
+            "nextCursor": page["next_continuation_token"]
+        }
+    
+    def iter_object_pages(self, bucket_name: str, prefix: str = "", delimiter: str = "",
+                          max_keys: Optional[int] = None,
+                          continuation_token: Optional[str] = None) -> Generator[Dict[str, Any], None, None]:
+        """
+        객체 목록 페이지 순회 (필요한 만큼만 조회, 다음 페이지는 미리 조회)
+        
+        Args:
+            bucket_name: 버킷 이름
+            prefix: 객체 키 접두사
+            delimiter: 구분자 (예: "/")
+            max_keys: 최대 항목 수 (None이면 전체)
+            continuation_token: 이어서 조회할 연속 토큰
+            
+        Yields:
+            {"items": [...], "next_cursor": 다음 연속 토큰, ...} (오류 시 {"error": ...})
+        """
+        yield from iter_cursor_pages(
+            lambda cursor, size: self._fetch_object_page(bucket_name, prefix, delimiter, cursor, size),
+            limit=max_keys, page_size=self.list_page_size, timeout=self.timeout,
+            start_cursor=continuation_token
+        )
+    
     def _list_buckets(self) -> str:
         """버킷 목록 조회"""
         if self.mock_mode:
-            buckets = self.mock_buckets.keys()
+            page = self.mock_store.list_buckets(max_buckets=self.list_max_keys)
             result = "## 버킷 목록\n\n"
             
-            for bucket_name in buckets:
-                bucket_info = self.mock_buckets[bucket_name]
-                result += f"- **{bucket_name}**\n"
+            for bucket_info in page["buckets"]:
+                result += f"- **{bucket_info['name']}**\n"
                 result += f"  생성일: {bucket_info['creation_date']}\n"
                 result += f"  리전: {bucket_info['region']}\n"
-                result += f"  객체 수: {len(bucket_info['objects'])}\n\n"
+                result += f"  객체 수: {bucket_info['object_count']}\n\n"
+            
+            if page["is_truncated"]:
+                result += f"전체 {self.mock_store.bucket_count()}개 중 {len(page['buckets'])}개만 표시했습니다.\n"
             
             return result
         else:
@@ -395,7 +524,7 @@ class PocketAgent(BaseAgent):
             결과 메시지
         """
         if self.mock_mode:
-            if bucket_name in self.mock_buckets:
+            if self.mock_store.has_bucket(bucket_name):
                 return f"오류: '{bucket_name}' 버킷이 이미 존재합니다. 다른 이름을 선택하세요."
             
             # 버킷 이름 검증
@@ -406,11 +535,7 @@ class PocketAgent(BaseAgent):
             import datetime
             today = datetime.date.today().strftime("%Y-%m-%d")
             
-            self.mock_buckets[bucket_name] = {
-                "creation_date": today,
-                "region": "ap-northeast-2",
-                "objects": {}
-            }
+            self.mock_store.add_bucket(bucket_name, today, "ap-northeast-2")
             
             return f"## 버킷 생성 완료\n\n버킷 '{bucket_name}'이(가) 성공적으로 생성되었습니다.\n\n- 생성일: {today}\n- 리전: ap-northeast-2"
         else:
@@ -428,67 +553,71 @@ class PocketAgent(BaseAgent):
             결과 메시지
         """
         if self.mock_mode:
-            if bucket_name not in self.mock_buckets:
+            index = self.mock_store.get_index(bucket_name)
+            if index is None:
                 return f"오류: '{bucket_name}' 버킷이 존재하지 않습니다."
             
             # 버킷이 비어있는지 확인
-            if self.mock_buckets[bucket_name]["objects"]:
+            if len(index):
                 return f"오류: '{bucket_name}' 버킷이 비어있지 않습니다. 먼저 버킷의 모든 객체를 삭제하세요."
             
             # 가상 버킷 삭제
-            del self.mock_buckets[bucket_name]
+            self.mock_store.remove_bucket(bucket_name)
             
             return f"## 버킷 삭제 완료\n\n버킷 '{bucket_name}'이(가) 성공적으로 삭제되었습니다."
         else:
             # 실제 API 호출 로직
             pass
     
-    def _list_objects(self, bucket_name: str, prefix: str = "") -> str:
+    def _list_objects(self, bucket_name: str, prefix: str = "", delimiter: str = "",
+                      max_keys: Optional[int] = None, continuation_token: Optional[str] = None) -> str:
         """
         객체 목록 조회
         
         Args:
             bucket_name: 버킷 이름
             prefix: 객체 접두사 (선택적)
+            delimiter: 구분자 (지정하면 하위 "폴더"를 공통 접두사로 묶어 표시)
+            max_keys: 표시할 최대 항목 수 (기본값: list_max_keys)
+            continuation_token: 이전 조회에서 받은 연속 토큰
             
         Returns:
             결과 메시지
         """
-        if self.mock_mode:
-            if bucket_name not in self.mock_buckets:
-                return f"오류: '{bucket_name}' 버킷이 존재하지 않습니다."
-            
-            # 접두사로 필터링
-            objects = {}
-            for key, info in self.mock_buckets[bucket_name]["objects"].items():
-                if not prefix or key.startswith(prefix):
-                    objects[key] = info
-            
-            result = f"## '{bucket_name}' 버킷 객체 목록\n\n"
-            
-            # 접두사가 있는 경우 표시
-            if prefix:
-                result += f"접두사: {prefix}\n\n"
-            
-            if not objects:
-                result += "객체가 없습니다." if not prefix else f"'{prefix}' 접두사를 가진 객체가 없습니다."
-                return result
-            
-            # 객체 정보 표시
-            result += "| 객체 키 | 크기 | 최종 수정일 | 스토리지 클래스 |\n"
-            result += "|---------|------|------------|----------------|\n"
-            
-            for key, info in objects.items():
-                size = self._format_size(info["size"])
-                last_modified = info["last_modified"]
-                storage_class = info["storage_class"]
-                
-                result += f"| {key} | {size} | {last_modified} | {storage_class} |\n"
-            
+        if self.mock_mode and not self.mock_store.has_bucket(bucket_name):
+            return f"오류: '{bucket_name}' 버킷이 존재하지 않습니다."
+        
+        result = f"## '{bucket_name}' 버킷 객체 목록\n\n"
+        
+        # 접두사가 있는 경우 표시
+        if prefix:
+            result += f"접두사: {prefix}\n\n"
+        
+        rows = []
+        next_token = None
+        for page in self.iter_object_pages(bucket_name, prefix, delimiter, max_keys or self.list_max_keys, continuation_token):
+            if "error" in page:
+                return f"오류: {page['error']}"
+            next_token = page["next_cursor"]
+            for item in page["items"]:
+                if "prefix" in item:
+                    rows.append(f"| {item['prefix']} | 폴더 | - | - |\n")
+                else:
+                    rows.append(f"| {item['key']} | {self._format_size(item['size'])} | {item['last_modified']} | {item['storage_class']} |\n")
+        
+        if not rows:
+            result += "객체가 없습니다." if not prefix else f"'{prefix}' 접두사를 가진 객체가 없습니다."
             return result
-        else:
-            # 실제 API 호출 로직
-            pass
+        
+        # 객체 정보 표시
+        result += "| 객체 키 | 크기 | 최종 수정일 | 스토리지 클래스 |\n"
+        result += "|---------|------|------------|----------------|\n"
+        result += "".join(rows)
+        
+        if next_token:
+            result += f"\n더 많은 객체가 있습니다. 다음 페이지 연속 토큰: `{next_token}`\n"
+        
+        return result
     
     def _get_object_info(self, bucket_name: str, object_key: str) -> str:
         """
@@ -502,14 +631,15 @@ class PocketAgent(BaseAgent):
             결과 메시지
         """
         if self.mock_mode:
-            if bucket_name not in self.mock_buckets:
+            index = self.mock_store.get_index(bucket_name)
+            if index is None:
                 return f"오류: '{bucket_name}' 버킷이 존재하지 않습니다."
             
-            if not object_key or object_key not in self.mock_buckets[bucket_name]["objects"]:
+            if not object_key or object_key not in index:
                 return f"오류: '{bucket_name}' 버킷에 '{object_key}' 객체가 존재하지 않습니다."
             
             # 객체 정보 가져오기
-            info = self.mock_buckets[bucket_name]["objects"][object_key]
+            info = index.get(object_key)
             
             result = f"## 객체 정보: '{object_key}'\n\n"
             result += f"- **버킷**: {bucket_name}\n"
@@ -542,16 +672,24 @@ class PocketAgent(BaseAgent):
             결과 메시지
         """
         if self.mock_mode:
-            if bucket_name not in self.mock_buckets:
+            index = self.mock_store.get_index(bucket_name)
+            if index is None:
                 return f"오류: '{bucket_name}' 버킷이 존재하지 않습니다."
             
             if not object_key:
                 return "오류: 업로드할 객체의 키를 지정해야 합니다."
             
-            # 파일 크기 추출 (가상)
+            # 파일 크기 추출 (로컬 파일이 있으면 실제 크기, 없으면 쿼리의 크기 표현)
             file_size = 1024  # 기본 1KB
+            local_path = self._extract_local_path(query)
+            if local_path:
+                local_path = resolve_local_path(local_path, self.upload_dir)
+                if not local_path:
+                    return f"오류: 로컬 파일 경로는 업로드 디렉토리('{self.upload_dir}') 안의 상대 경로여야 합니다."
             size_match = re.search(r'(\d+)(?:\s*)(kb|mb|gb)', query, re.IGNORECASE)
-            if size_match:
+            if local_path and os.path.isfile(local_path):
+                file_size = os.path.getsize(local_path)
+            elif size_match:
                 size_num = int(size_match.group(1))
                 size_unit = size_match.group(2).lower()
                 
@@ -573,12 +711,12 @@ class PocketAgent(BaseAgent):
             import datetime
             now = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
             
-            self.mock_buckets[bucket_name]["objects"][object_key] = {
+            index.put(object_key, {
                 "size": file_size,
                 "last_modified": now,
                 "etag": f"{uuid.uuid4().hex[:12]}",
                 "storage_class": storage_class
-            }
+            })
             
             result = f"## 객체 업로드 완료\n\n"
             result += f"'{object_key}' 객체가 '{bucket_name}' 버킷에 성공적으로 업로드되었습니다.\n\n"
@@ -588,29 +726,56 @@ class PocketAgent(BaseAgent):
             
             return result
         else:
-            # 실제 API 호출 로직
-            pass
+            if not object_key:
+                return "오류: 업로드할 객체의 키를 지정해야 합니다."
+            
+            local_path = self._extract_local_path(query)
+            if not local_path:
+                return "오류: 업로드할 로컬 파일 경로를 지정해야 합니다. (예: 로컬 파일 'builds/artifact.zip')"
+            local_path = resolve_local_path(local_path, self.upload_dir)
+            if not local_path:
+                return f"오류: 로컬 파일 경로는 업로드 디렉토리('{self.upload_dir}') 안의 상대 경로여야 합니다."
+            
+            # 큰 파일은 병렬 멀티파트 업로드 (중단되면 같은 요청으로 남은 파트만 다시 전송)
+            started = time.perf_counter()
+            upload = self.transfer_client.upload_file(bucket_name, object_key, local_path)
+            elapsed = time.perf_counter() - started
+            if "error" in upload:
+                return f"오류: '{object_key}' 업로드 실패 - {upload['error']}\n\n같은 요청을 다시 실행하면 완료된 파트는 건너뛰고 이어서 업로드합니다."
+            
+            result = f"## 객체 업로드 완료\n\n"
+            result += f"'{local_path}' 파일이 '{bucket_name}' 버킷의 '{object_key}' 객체로 업로드되었습니다.\n\n"
+            result += f"- **크기**: {self._format_size(upload['size'])}\n"
+            result += f"- **파트 수**: {upload['parts']}"
+            if upload["resumed_parts"]:
+                result += f" (이전 업로드에서 {upload['resumed_parts']}개 재사용)"
+            result += f"\n- **ETag**: {upload['etag']}\n"
+            result += f"- **전송 속도**: {self._format_transfer_rate(upload['size'], elapsed)}\n"
+            
+            return result
     
-    def _download_object(self, bucket_name: str, object_key: str) -> str:
+    def _download_object(self, bucket_name: str, object_key: str, dest_path: Optional[str] = None) -> str:
         """
         객체 다운로드
         
         Args:
             bucket_name: 버킷 이름
             object_key: 객체 키
+            dest_path: 저장할 로컬 경로 (기본값: 다운로드 디렉토리/객체 파일명)
             
         Returns:
             결과 메시지
         """
         if self.mock_mode:
-            if bucket_name not in self.mock_buckets:
+            index = self.mock_store.get_index(bucket_name)
+            if index is None:
                 return f"오류: '{bucket_name}' 버킷이 존재하지 않습니다."
             
-            if not object_key or object_key not in self.mock_buckets[bucket_name]["objects"]:
+            if not object_key or object_key not in index:
                 return f"오류: '{bucket_name}' 버킷에 '{object_key}' 객체가 존재하지 않습니다."
             
             # 객체 정보 가져오기
-            info = self.mock_buckets[bucket_name]["objects"][object_key]
+            info = index.get(object_key)
             
             # 아카이브 클래스인 경우 복원 필요
             if info["storage_class"] == "ARCHIVE":
@@ -626,8 +791,34 @@ class PocketAgent(BaseAgent):
             
             return result
         else:
-            # 실제 API 호출 로직
-            pass
+            if not object_key:
+                return "오류: 다운로드할 객체의 키를 지정해야 합니다."
+            
+            # 저장 위치는 다운로드 디렉토리 안으로 제한 (디렉토리를 지정하면 그 안에 객체 파일명으로 저장)
+            relative_path = dest_path or os.path.basename(object_key)
+            dest_path = resolve_local_path(relative_path, self.download_dir)
+            if dest_path and os.path.isdir(dest_path):
+                dest_path = resolve_local_path(os.path.join(relative_path, os.path.basename(object_key)),
+                                               self.download_dir)
+            if not dest_path:
+                return f"오류: 저장 경로는 다운로드 디렉토리('{self.download_dir}') 안의 상대 경로여야 합니다."
+            
+            # Range 요청을 병렬로 받아 미리 할당한 파일에 바로 기록
+            started = time.perf_counter()
+            download = self.transfer_client.download_file(bucket_name, object_key, dest_path)
+            elapsed = time.perf_counter() - started
+            if "error" in download:
+                return f"오류: {download['error']}"
+            
+            result = f"## 객체 다운로드 완료\n\n"
+            result += f"'{object_key}' 객체를 '{bucket_name}' 버킷에서 '{download['path']}'(으)로 다운로드했습니다.\n\n"
+            result += f"- **크기**: {self._format_size(download['size'])}\n"
+            result += f"- **ETag**: {download['etag']}"
+            result += " (MD5 검증 완료)\n" if download["verified"] else "\n"
+            result += f"- **범위 요청 수**: {download['ranges']}\n"
+            result += f"- **전송 속도**: {self._format_transfer_rate(download['size'], elapsed)}\n"
+            
+            return result
     
     def _delete_object(self, bucket_name: str, object_key: str) -> str:
         """
@@ -641,14 +832,15 @@ class PocketAgent(BaseAgent):
             결과 메시지
         """
         if self.mock_mode:
-            if bucket_name not in self.mock_buckets:
+            index = self.mock_store.get_index(bucket_name)
+            if index is None:
                 return f"오류: '{bucket_name}' 버킷이 존재하지 않습니다."
             
-            if not object_key or object_key not in self.mock_buckets[bucket_name]["objects"]:
+            if not object_key or object_key not in index:
                 return f"오류: '{bucket_name}' 버킷에 '{object_key}' 객체가 존재하지 않습니다."
             
             # 가상 객체 삭제
-            del self.mock_buckets[bucket_name]["objects"][object_key]
+            index.delete(object_key)
             
             result = f"## 객체 삭제 완료\n\n"
             result += f"'{object_key}' 객체가 '{bucket_name}' 버킷에서 성공적으로 삭제되었습니다."
@@ -0,0 +1,321 @@
+"""
+Pocket(S3 호환) 객체 목록 인덱스 모듈
+
+버킷 객체를 정렬된 키 목록(bisect)으로 관리해, 객체가 수백만 개여도 전체를 훑지 않고
+S3 ListObjectsV2와 같은 방식의 목록 조회를 제공합니다.
+
+- 접두사 조회: 접두사 위치로 바로 이동(bisect)해 접두사를 벗어나는 순간 중단
+- 구분자(delimiter) 조회: "폴더"는 공통 접두사(CommonPrefixes)로 한 번만 돌려주고, 그 아래 키들은 건너뜀
+- 연속 토큰(continuation token)과 max_keys: 마지막으로 돌려준 위치를 토큰으로 만들어 다음 페이지에서 이어서 조회
+- 실제 API 응답(JSON/XML)도 같은 형식으로 변환해 목 모드와 실제 모드가 같은 페이지 순회 코드를 사용
+"""
+
+import base64
+import bisect
+import logging
+import xml.etree.ElementTree as ElementTree
+from typing import Dict, Any, List, Optional, Tuple
+
+# 로거 설정
+logger = logging.getLogger("pocket_object_index")
+
+# 페이지당 기본 최대 키 수 (S3 기본값)
+DEFAULT_MAX_KEYS = 1000
+
+
+def _prefix_successor(prefix: str) -> str:
+    """접두사로 시작하는 모든 키보다 큰 가장 작은 문자열 (마지막 문자 + 1)"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def encode_continuation_token(marker: str, is_prefix: bool = False) -> str:
+    """
+    연속 토큰 생성
+
+    Args:
+        marker: 마지막으로 돌려준 키 또는 공통 접두사
+        is_prefix: marker가 공통 접두사인지 여부 (그 아래 키를 모두 건너뛰어야 함)
+
+    Returns:
+        불투명 토큰 문자열
+    """
+    raw = ("p:" if is_prefix else "k:") + marker
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_continuation_token(token: str) -> Optional[Tuple[str, bool]]:
+    """
+    연속 토큰 해석
+
+    Returns:
+        (marker, is_prefix) 또는 잘못된 토큰이면 None
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8")
+    except Exception:
+        return None
+    if raw[:2] not in ("k:", "p:") or len(raw) < 3:
+        return None
+    return raw[2:], raw[:2] == "p:"
+
+
+class ObjectIndex:
+    """버킷 하나의 정렬된 객체 키 인덱스"""
+
+    def __init__(self):
+        self._keys: List[str] = []
+        self._objects: Dict[str, Dict[str, Any]] = {}
+        self.total_size = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._objects
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """객체 정보 조회 (없으면 None)"""
+        return self._objects.get(key)
+
+    def put(self, key: str, info: Dict[str, Any]):
+        """객체 추가 또는 교체 (새 키만 정렬 위치에 삽입)"""
+        previous = self._objects.get(key)
+        if previous is None:
+            bisect.insort(self._keys, key)
+        else:
+            self.total_size -= previous.get("size", 0)
+        self._objects[key] = info
+        self.total_size += info.get("size", 0)
+
+    def put_many(self, objects: Dict[str, Dict[str, Any]]):
+        """여러 객체를 한 번에 추가 (키마다 삽입하지 않고 한 번만 정렬)"""
+        for key, info in objects.items():
+            previous = self._objects.get(key)
+            if previous is not None:
+                self.total_size -= previous.get("size", 0)
+            self._objects[key] = info
+            self.total_size += info.get("size", 0)
+        self._keys = sorted(self._objects)
+
+    def delete(self, key: str) -> bool:
+        """객체 삭제 (삭제 여부 반환)"""
+        info = self._objects.pop(key, None)
+        if info is None:
+            return False
+        del self._keys[bisect.bisect_left(self._keys, key)]
+        self.total_size -= info.get("size", 0)
+        return True
+
+    def list_page(self, prefix: str = "", delimiter: str = "", max_keys: int = DEFAULT_MAX_KEYS,
+                  continuation_token: Optional[str] = None, start_after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        객체 목록 한 페이지 조회 (ListObjectsV2 방식)
+
+        Args:
+            prefix: 객체 키 접두사
+            delimiter: 구분자 (예: "/", 빈 값이면 평면 목록)
+            max_keys: 최대 항목 수 (객체와 공통 접두사 합계)
+            continuation_token: 이전 페이지의 next_continuation_token
+            start_after: 이 키 다음부터 조회 (첫 페이지용)
+
+        Returns:
+            {"contents": [{"key": ..., **객체 정보}], "common_prefixes": [...], "key_count": ...,
+             "is_truncated": ..., "next_continuation_token": ...}
+            (잘못된 토큰이면 {"error": ...})
+        """
+        keys = self._keys
+        position = bisect.bisect_left(keys, prefix)
+        if continuation_token:
+            decoded = decode_continuation_token(continuation_token)
+            if decoded is None:
+                return {"error": "유효하지 않은 연속 토큰입니다."}
+            marker, is_prefix = decoded
+            marker_position = (bisect.bisect_left(keys, _prefix_successor(marker)) if is_prefix
+                               else bisect.bisect_right(keys, marker))
+            position = max(position, marker_position)
+        elif start_after:
+            position = max(position, bisect.bisect_right(keys, start_after))
+
+        contents: List[Dict[str, Any]] = []
+        common_prefixes: List[str] = []
+        max_keys = max(0, int(max_keys))
+        last_marker: Optional[Tuple[str, bool]] = None
+        count = len(keys)
+
+        while position < count and len(contents) + len(common_prefixes) < max_keys:
+            key = keys[position]
+            if not key.startswith(prefix):
+                break
+            if delimiter:
+                found = key.find(delimiter, len(prefix))
+                if found >= 0:
+                    # 같은 "폴더" 아래 키들은 공통 접두사 하나로 묶고 건너뜀
+                    common_prefix = key[:found + len(delimiter)]
+                    common_prefixes.append(common_prefix)
+                    last_marker = (common_prefix, True)
+                    position = bisect.bisect_left(keys, _prefix_successor(common_prefix), position)
+                    continue
+            contents.append({"key": key, **self._objects[key]})
+            last_marker = (key, False)
+            position += 1
+
+        is_truncated = position < count and keys[position].startswith(prefix)
+        return {
+            "contents": contents,
+            "common_prefixes": common_prefixes,
+            "key_count": len(contents) + len(common_prefixes),
+            "is_truncated": is_truncated,
+            "next_continuation_token": encode_continuation_token(*last_marker) if is_truncated and last_marker else None
+        }
+
+
+class PocketMockStore:
+    """목 모드 버킷 저장소 (버킷 이름 정렬 목록 + 버킷별 객체 인덱스)"""
+
+    def __init__(self):
+        self._names: List[str] = []
+        self._buckets: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_seed(cls, buckets: Dict[str, Dict[str, Any]]) -> "PocketMockStore":
+        """
+        버킷 시드 데이터로 저장소 생성
+
+        Args:
+            buckets: {버킷 이름: {"creation_date": ..., "region": ..., "objects": {키: 정보}}}
+        """
+        store = cls()
+        for name, bucket in buckets.items():
+            index = store.add_bucket(name, bucket.get("creation_date", ""), bucket.get("region", ""))
+            index.put_many({key: dict(info) for key, info in bucket.get("objects", {}).items()})
+        return store
+
+    def has_bucket(self, name: str) -> bool:
+        return name in self._buckets
+
+    def bucket_count(self) -> int:
+        return len(self._names)
+
+    def add_bucket(self, name: str, creation_date: str, region: str) -> ObjectIndex:
+        """버킷 추가 후 객체 인덱스 반환"""
+        if name not in self._buckets:
+            bisect.insort(self._names, name)
+        self._buckets[name] = {"creation_date": creation_date, "region": region, "index": ObjectIndex()}
+        return self._buckets[name]["index"]
+
+    def remove_bucket(self, name: str) -> bool:
+        """버킷 삭제 (삭제 여부 반환)"""
+        if self._buckets.pop(name, None) is None:
+            return False
+        del self._names[bisect.bisect_left(self._names, name)]
+        return True
+
+    def get_bucket(self, name: str) -> Optional[Dict[str, Any]]:
+        """버킷 정보 조회 ({"creation_date", "region", "index"}, 없으면 None)"""
+        return self._buckets.get(name)
+
+    def get_index(self, name: str) -> Optional[ObjectIndex]:
+        """버킷 객체 인덱스 조회 (없으면 None)"""
+        bucket = self._buckets.get(name)
+        return bucket["index"] if bucket else None
+
+    def list_buckets(self, prefix: str = "", max_buckets: int = DEFAULT_MAX_KEYS,
+                     continuation_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        버킷 목록 한 페이지 조회 (이름순)
+
+        Returns:
+            {"buckets": [{"name", "creation_date", "region", "object_count", "total_size"}],
+             "is_truncated": ..., "next_continuation_token": ...}
+        """
+        position = bisect.bisect_left(self._names, prefix)
+        if continuation_token:
+            decoded = decode_continuation_token(continuation_token)
+            if decoded is None:
+                return {"error": "유효하지 않은 연속 토큰입니다."}
+            position = max(position, bisect.bisect_right(self._names, decoded[0]))
+
+        buckets = []
+        while position < len(self._names) and len(buckets) < max_buckets:
+            name = self._names[position]
+            if not name.startswith(prefix):
+                break
+            bucket = self._buckets[name]
+            buckets.append({
+                "name": name,
+                "creation_date": bucket["creation_date"],
+                "region": bucket["region"],
+                "object_count": len(bucket["index"]),
+                "total_size": bucket["index"].total_size
+            })
+            position += 1
+
+        is_truncated = position < len(self._names) and self._names[position].startswith(prefix)
+        return {
+            "buckets": buckets,
+            "is_truncated": is_truncated,
+            "next_continuation_token": encode_continuation_token(buckets[-1]["name"]) if is_truncated and buckets else None
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """버킷/객체 수 통계"""
+        return {
+            "buckets": len(self._names),
+            "objects": sum(len(bucket["index"]) for bucket in self._buckets.values())
+        }
+
+
+def _xml_text(element: Optional[ElementTree.Element], default: str = "") -> str:
+    return element.text if element is not None and element.text is not None else default
+
+
+def parse_list_objects_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    실제 ListObjectsV2 응답을 ObjectIndex.list_page와 같은 형식으로 변환
+
+    Args:
+        response: API 응답 (JSON 필드 또는 XML 본문 {"text": ...})
+
+    Returns:
+        list_page 형식의 페이지 (실패 시 {"error": ...})
+    """
+    if "error" in response:
+        return response
+
+    if "text" in response:
+        try:
+            root = ElementTree.fromstring(response["text"])
+        except ElementTree.ParseError as e:
+            return {"error": f"목록 응답 해석 오류: {e}"}
+        # S3 응답은 네임스페이스가 붙으므로 태그 이름만 비교
+        for element in root.iter():
+            element.tag = element.tag.rsplit("}", 1)[-1]
+        contents = [{
+            "key": _xml_text(item.find("Key")),
+            "size": int(_xml_text(item.find("Size"), "0")),
+            "last_modified": _xml_text(item.find("LastModified")),
+            "etag": _xml_text(item.find("ETag")).strip('"'),
+            "storage_class": _xml_text(item.find("StorageClass"), "STANDARD")
+        } for item in root.findall("Contents")]
+        common_prefixes = [_xml_text(item.find("Prefix")) for item in root.findall("CommonPrefixes")]
+        is_truncated = _xml_text(root.find("IsTruncated")).lower() == "true"
+        next_token = _xml_text(root.find("NextContinuationToken")) or None
+    else:
+        contents = [{
+            "key": item.get("Key", ""),
+            "size": item.get("Size", 0),
+            "last_modified": item.get("LastModified", ""),
+            "etag": str(item.get("ETag", "")).strip('"'),
+            "storage_class": item.get("StorageClass", "STANDARD")
+        } for item in response.get("Contents", [])]
+        common_prefixes = [item.get("Prefix", "") for item in response.get("CommonPrefixes", [])]
+        is_truncated = bool(response.get("IsTruncated"))
+        next_token = response.get("NextContinuationToken")
+
+    return {
+        "contents": contents,
+        "common_prefixes": common_prefixes,
+        "key_count": len(contents) + len(common_prefixes),
+        "is_truncated": is_truncated,
+        "next_continuation_token": next_token if is_truncated else None
+    }
@@ -0,0 +1,469 @@
+"""
+Pocket(S3 호환) 대용량 객체 전송 모듈
+
+수 GB 빌드 산출물을 메모리에 올리지 않고 주고받기 위한 전송 클라이언트입니다.
+
+- 업로드: 파일을 part_size 단위 파트로 나눠 멀티파트 업로드를 병렬 실행
+  (파트마다 Content-MD5 전송, 완료 후 S3 멀티파트 ETag(파트 MD5들의 MD5-파트 수)와 비교)
+- 재개: 업로드 ID와 완료된 파트 목록을 상태 파일에 기록해, 중단된 업로드는 남은 파트만 다시 전송
+  (파일 크기/수정 시각/파트 크기가 바뀌었거나 서버에 업로드가 없으면 처음부터 다시 시작)
+- 다운로드: HEAD로 크기를 확인한 뒤 임시 파일을 미리 할당하고, Range 요청을 병렬로 받아 각 위치에 바로 기록
+  (단일 파트 객체는 MD5 검증, 완료 후 대상 경로로 교체)
+
+동시에 메모리에 있는 데이터는 최대 (작업자 수 x part_size)입니다.
+"""
+
+import os
+import json
+import base64
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Callable
+from urllib.parse import quote
+from xml.etree import ElementTree
+
+import requests
+
+from src.core.requests_config import session_registry
+
+# 로거 설정
+logger = logging.getLogger("pocket_transfer")
+
+# 기본 파트 크기 (S3는 마지막 파트를 제외하고 5MB 이상 필요)
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+
+# 기본 병렬 전송 수
+DEFAULT_TRANSFER_WORKERS = 4
+
+# 다운로드 스트림 읽기 단위
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# 기본 업로드 상태 디렉토리
+DEFAULT_STATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "pocket_uploads"
+)
+
+# 진행 콜백 형식: (전송된 바이트, 전체 바이트)
+ProgressCallback = Callable[[int, int], None]
+
+
+def multipart_etag(part_md5s: List[bytes]) -> str:
+    """S3 멀티파트 ETag 계산 (파트 MD5 다이제스트를 이어 붙인 MD5 + "-파트 수")"""
+    return f"{hashlib.md5(b''.join(part_md5s)).hexdigest()}-{len(part_md5s)}"
+
+
+def resolve_local_path(path: str, root: str) -> Optional[str]:
+    """
+    사용자가 지정한 로컬 경로를 기준 디렉토리 안의 실제 경로로 변환
+
+    절대 경로, "~" 경로, ".." 세그먼트는 거부하며, 심볼릭 링크를 따라간 실제 경로도 기준 디렉토리 안에 있어야 합니다.
+
+    Args:
+        path: 사용자가 지정한 경로 (기준 디렉토리 기준 상대 경로)
+        root: 기준 디렉토리 (업로드 원본 / 다운로드 저장 디렉토리)
+
+    Returns:
+        기준 디렉토리 안의 실제 경로 (허용되지 않는 경로면 None)
+    """
+    if not path or os.path.isabs(path) or path.startswith("~"):
+        return None
+    if ".." in path.replace("\\", "/").split("/"):
+        return None
+
+    root_path = os.path.realpath(root)
+    resolved = os.path.realpath(os.path.join(root_path, path))
+    if os.path.commonpath([root_path, resolved]) != root_path:
+        return None
+    return resolved
+
+
+def _read_range(file_path: str, offset: int, length: int) -> bytes:
+    """파일의 지정 범위 읽기 (파트마다 파일을 따로 열어 스레드 간 위치 공유 없음)"""
+    with open(file_path, "rb") as f:
+        f.seek(offset)
+        return f.read(length)
+
+
+def _preallocate(path: str, size: int):
+    """다운로드 대상 파일을 전체 크기로 미리 할당"""
+    with open(path, "wb") as f:
+        if size and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+                return
+            except OSError:
+                pass
+        f.truncate(size)
+
+
+class PocketTransferClient:
+    """Pocket 멀티파트 업로드 / 범위 다운로드 클라이언트"""
+
+    def __init__(self, api_url: str, auth: Optional[Tuple[str, str]] = None, verify_ssl: bool = False,
+                 timeout: float = 30, part_size: int = DEFAULT_PART_SIZE,
+                 max_workers: int = DEFAULT_TRANSFER_WORKERS, state_dir: Optional[str] = DEFAULT_STATE_DIR):
+        """
+        전송 클라이언트 초기화
+
+        Args:
+            api_url: S3 호환 API 기본 URL (경로 방식: {api_url}/{bucket}/{key})
+            auth: (사용자명, 비밀번호) 기본 인증 정보
+            verify_ssl: SSL 인증서 검증 여부
+            timeout: 요청당 타임아웃 (초)
+            part_size: 업로드 파트 / 다운로드 범위 크기 (바이트)
+            max_workers: 동시에 전송할 최대 파트 수
+            state_dir: 업로드 재개 상태 디렉토리 (None이면 재개 비활성화)
+        """
+        self.api_url = api_url.rstrip("/")
+        self.auth = auth
+        self.verify_ssl = verify_ssl
+        self.timeout = timeout
+        self.part_size = max(1, int(part_size))
+        self.max_workers = max(1, int(max_workers))
+        self.state_dir = state_dir or None
+        self._lock = threading.Lock()
+        self._stats = {"uploads": 0, "downloads": 0, "parts_uploaded": 0, "parts_resumed": 0,
+                       "ranges_downloaded": 0, "bytes_uploaded": 0, "bytes_downloaded": 0, "failed": 0}
+
+    def _url(self, bucket: str, key: str) -> str:
+        return f"{self.api_url}/{quote(bucket)}/{quote(key)}"
+
+    def _request(self, method: str, bucket: str, key: str, **kwargs):
+        """공유 세션으로 요청 (연결 오류/5xx 재시도는 세션 어댑터가 처리)"""
+        headers = {"Content-Type": "application/octet-stream", "Accept": "*/*", **kwargs.pop("headers", {})}
+        return session_registry.request(method, self._url(bucket, key), verify_ssl=self.verify_ssl, auth=self.auth,
+                                        headers=headers, timeout=self.timeout, **kwargs)
+
+    def _count(self, **increments: int):
+        with self._lock:
+            for name, value in increments.items():
+                self._stats[name] += value
+
+    # ------------------------------------------------------------------
+    # 업로드
+    # ------------------------------------------------------------------
+
+    def _state_path(self, bucket: str, key: str, file_path: str) -> Optional[str]:
+        if not self.state_dir:
+            return None
+        digest = hashlib.sha256(f"{bucket}/{key}\n{os.path.abspath(file_path)}".encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.state_dir, f"{digest}.json")
+
+    def _load_state(self, state_path: Optional[str], expected: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """같은 파일/설정으로 시작한 업로드 상태 로드 (다르면 None)"""
+        if not state_path or not os.path.exists(state_path):
+            return None
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except Exception as e:
+            logger.warning(f"업로드 상태 파일 로드 오류: {e}")
+            return None
+        if any(state.get(name) != value for name, value in expected.items()):
+            return None
+        return state
+
+    def _save_state(self, state_path: Optional[str], state: Dict[str, Any]):
+        """업로드 상태 저장 (임시 파일에 쓴 뒤 교체, 호출 측이 잠금 보유)"""
+        if not state_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(state_path), exist_ok=True)
+            temp_path = f"{state_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(temp_path, state_path)
+        except Exception as e:
+            logger.error(f"업로드 상태 파일 저장 오류: {e}")
+
+    def _discard_state(self, state_path: Optional[str]):
+        if state_path and os.path.exists(state_path):
+            os.remove(state_path)
+
+    def _create_upload(self, bucket: str, key: str) -> Dict[str, Any]:
+        """멀티파트 업로드 시작 (UploadId 발급)"""
+        response = self._request("POST", bucket, key, params={"uploads": ""})
+        if response.status_code != 200:
+            return {"error": f"멀티파트 업로드 시작 실패: {response.status_code}"}
+        try:
+            root = ElementTree.fromstring(response.content)
+        except ElementTree.ParseError as e:
+            return {"error": f"멀티파트 업로드 응답 해석 오류: {e}"}
+        upload_id = next((element.text for element in root.iter() if element.tag.endswith("UploadId")), None)
+        if not upload_id:
+            return {"error": "멀티파트 업로드 ID가 없습니다."}
+        return {"upload_id": upload_id}
+
+    def _upload_part(self, bucket: str, key: str, upload_id: str, file_path: str,
+                     number: int, offset: int, length: int) -> Dict[str, Any]:
+        """파트 하나 업로드 (Content-MD5로 서버 측 무결성 검사, ETag와 MD5 비교)"""
+        data = _read_range(file_path, offset, length)
+        digest = hashlib.md5(data).digest()
+        response = self._request(
+            "PUT", bucket, key, params={"partNumber": number, "uploadId": upload_id}, data=data,
+            headers={"Content-MD5": base64.b64encode(digest).decode("ascii"), "Content-Length": str(len(data))}
+        )
+        if response.status_code == 404:
+            return {"error": "업로드를 찾을 수 없습니다.", "missing_upload": True}
+        if response.status_code != 200:
+            return {"error": f"파트 {number} 업로드 실패: {response.status_code}"}
+        etag = response.headers.get("ETag", "").strip('"')
+        if etag and etag != digest.hex():
+            return {"error": f"파트 {number} 체크섬 불일치 (ETag: {etag})"}
+        return {"number": number, "etag": etag or digest.hex(), "md5": digest.hex(), "size": len(data)}
+
+    def _complete_upload(self, bucket: str, key: str, upload_id: str, parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """멀티파트 업로드 완료 (파트 목록 전송)"""
+        body = "<CompleteMultipartUpload>" + "".join(
+            f"<Part><PartNumber>{part['number']}</PartNumber><ETag>\"{part['etag']}\"</ETag></Part>" for part in parts
+        ) + "</CompleteMultipartUpload>"
+        response = self._request("POST", bucket, key, params={"uploadId": upload_id}, data=body.encode("utf-8"),
+                                 headers={"Content-Type": "application/xml"})
+        if response.status_code == 404:
+            return {"error": "업로드를 찾을 수 없습니다.", "missing_upload": True}
+        if response.status_code != 200:
+            return {"error": f"멀티파트 업로드 완료 실패: {response.status_code}"}
+        try:
+            root = ElementTree.fromstring(response.content)
+            etag = next((element.text for element in root.iter() if element.tag.endswith("ETag")), "") or ""
+        except ElementTree.ParseError:
+            etag = response.headers.get("ETag", "")
+        return {"etag": etag.strip('"')}
+
+    def abort_upload(self, bucket: str, key: str, upload_id: str) -> bool:
+        """멀티파트 업로드 취소 (서버에 올라간 파트 삭제)"""
+        response = self._request("DELETE", bucket, key, params={"uploadId": upload_id})
+        return response.status_code in (200, 204, 404)
+
+    def upload_file(self, bucket: str, key: str, file_path: str,
+                    progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+        """
+        파일 업로드 (part_size 이하는 단일 PUT, 그보다 크면 병렬 멀티파트 업로드)
+
+        Args:
+            bucket: 버킷 이름
+            key: 객체 키
+            file_path: 업로드할 로컬 파일 경로
+            progress: 진행 콜백 (전송된 바이트, 전체 바이트)
+
+        Returns:
+            {"bucket", "key", "size", "etag", "parts", "resumed_parts"} (실패 시 {"error": ...})
+        """
+        if not os.path.isfile(file_path):
+            return {"error": f"파일을 찾을 수 없습니다: {file_path}"}
+        self._count(uploads=1)
+        try:
+            result = self._upload_file(bucket, key, file_path, progress)
+        except (requests.RequestException, OSError) as e:
+            logger.error(f"업로드 오류: {bucket}/{key} - {e}")
+            result = {"error": str(e)}
+        if "error" in result:
+            self._count(failed=1)
+            result.pop("missing_upload", None)
+        return result
+
+    def _upload_file(self, bucket: str, key: str, file_path: str,
+                     progress: Optional[ProgressCallback]) -> Dict[str, Any]:
+        """파일 크기에 따라 단일 PUT 또는 멀티파트 업로드"""
+        size = os.path.getsize(file_path)
+
+        if size <= self.part_size:
+            data = _read_range(file_path, 0, size)
+            digest = hashlib.md5(data).digest()
+            response = self._request("PUT", bucket, key, data=data,
+                                     headers={"Content-MD5": base64.b64encode(digest).decode("ascii")})
+            if response.status_code != 200:
+                return {"error": f"업로드 실패: {response.status_code}"}
+            etag = response.headers.get("ETag", "").strip('"')
+            if etag and etag != digest.hex():
+                return {"error": f"업로드 체크섬 불일치 (ETag: {etag})"}
+            self._count(parts_uploaded=1, bytes_uploaded=size)
+            if progress:
+                progress(size, size)
+            return {"bucket": bucket, "key": key, "size": size, "etag": digest.hex(), "parts": 1, "resumed_parts": 0}
+
+        result = self._upload_multipart(bucket, key, file_path, size, progress)
+        if result.get("missing_upload"):
+            # 상태 파일의 업로드가 서버에서 만료/취소된 경우 새 업로드로 한 번 다시 시도
+            logger.warning(f"재개할 업로드가 서버에 없어 처음부터 다시 업로드: {bucket}/{key}")
+            self._discard_state(self._state_path(bucket, key, file_path))
+            result = self._upload_multipart(bucket, key, file_path, size, progress)
+        return result
+
+    def _upload_multipart(self, bucket: str, key: str, file_path: str, size: int,
+                          progress: Optional[ProgressCallback]) -> Dict[str, Any]:
+        """병렬 멀티파트 업로드 (완료된 파트는 상태 파일에서 건너뜀)"""
+        stat = os.stat(file_path)
+        identity = {"bucket": bucket, "key": key, "size": size, "mtime_ns": stat.st_mtime_ns,
+                    "part_size": self.part_size}
+        state_path = self._state_path(bucket, key, file_path)
+        state = self._load_state(state_path, identity)
+
+        if state is None:
+            created = self._create_upload(bucket, key)
+            if "error" in created:
+                return created
+            state = {**identity, "upload_id": created["upload_id"], "parts": {}}
+            with self._lock:
+                self._save_state(state_path, state)
+
+        upload_id = state["upload_id"]
+        part_count = (size + self.part_size - 1) // self.part_size
+        done = {int(number): part for number, part in state["parts"].items()}
+        resumed = len(done)
+        self._count(parts_resumed=resumed)
+        transferred = [sum(part["size"] for part in done.values())]
+        if progress and resumed:
+            progress(transferred[0], size)
+
+        def upload(number: int) -> Dict[str, Any]:
+            offset = (number - 1) * self.part_size
+            part = self._upload_part(bucket, key, upload_id, file_path, number, offset,
+                                     min(self.part_size, size - offset))
+            if "error" not in part:
+                with self._lock:
+                    state["parts"][str(number)] = part
+                    self._save_state(state_path, state)
+                    self._stats["parts_uploaded"] += 1
+                    self._stats["bytes_uploaded"] += part["size"]
+                    transferred[0] += part["size"]
+                    current = transferred[0]
+                if progress:
+                    progress(current, size)
+            return part
+
+        pending = [number for number in range(1, part_count + 1) if number not in done]
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pocket-upload")
+        try:
+            for part in executor.map(upload, pending):
+                if "error" in part:
+                    # 완료된 파트는 상태 파일에 남아 있으므로 다음 호출에서 이어서 업로드
+                    return part
+                done[part["number"]] = part
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        parts = [done[number] for number in range(1, part_count + 1)]
+        completed = self._complete_upload(bucket, key, upload_id, parts)
+        if "error" in completed:
+            return completed
+
+        expected = multipart_etag([bytes.fromhex(part["md5"]) for part in parts])
+        if completed["etag"] and completed["etag"] != expected:
+            return {"error": f"업로드 체크섬 불일치 (예상: {expected}, 서버: {completed['etag']})"}
+
+        self._discard_state(state_path)
+        return {"bucket": bucket, "key": key, "size": size, "etag": expected, "parts": part_count,
+                "resumed_parts": resumed, "upload_id": upload_id}
+
+    # ------------------------------------------------------------------
+    # 다운로드
+    # ------------------------------------------------------------------
+
+    def _download_range(self, bucket: str, key: str, temp_path: str, start: int, end: int) -> Dict[str, Any]:
+        """Range 요청 하나를 받아 파일의 해당 위치에 바로 기록"""
+        response = self._request("GET", bucket, key, headers={"Range": f"bytes={start}-{end}"}, stream=True)
+        try:
+            if response.status_code != 206:
+                return {"error": f"범위 다운로드 실패 ({start}-{end}): {response.status_code}"}
+            written = 0
+            with open(temp_path, "r+b") as f:
+                f.seek(start)
+                for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                    f.write(chunk)
+                    written += len(chunk)
+        finally:
+            response.close()
+        if written != end - start + 1:
+            return {"error": f"범위 다운로드 크기 불일치 ({start}-{end}): {written}바이트"}
+        return {"start": start, "size": written}
+
+    def download_file(self, bucket: str, key: str, dest_path: str,
+                      progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+        """
+        객체 다운로드 (미리 할당한 임시 파일에 Range 요청을 병렬로 기록한 뒤 교체)
+
+        Args:
+            bucket: 버킷 이름
+            key: 객체 키
+            dest_path: 저장할 로컬 경로
+            progress: 진행 콜백 (받은 바이트, 전체 바이트)
+
+        Returns:
+            {"bucket", "key", "path", "size", "etag", "ranges", "verified"} (실패 시 {"error": ...})
+        """
+        temp_path = f"{dest_path}.part"
+        try:
+            result = self._download_file(bucket, key, dest_path, temp_path, progress)
+        except (requests.RequestException, OSError) as e:
+            logger.error(f"다운로드 오류: {bucket}/{key} - {e}")
+            result = {"error": str(e)}
+        if "error" in result:
+            self._count(failed=1)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return result
+
+    def _download_file(self, bucket: str, key: str, dest_path: str, temp_path: str,
+                       progress: Optional[ProgressCallback]) -> Dict[str, Any]:
+        """범위 병렬 다운로드 후 검증, 대상 경로로 교체"""
+        head = self._request("HEAD", bucket, key)
+        if head.status_code == 404:
+            return {"error": f"'{bucket}' 버킷에 '{key}' 객체가 존재하지 않습니다."}
+        if head.status_code != 200:
+            return {"error": f"객체 정보 조회 실패: {head.status_code}"}
+
+        self._count(downloads=1)
+        size = int(head.headers.get("Content-Length", 0))
+        etag = head.headers.get("ETag", "").strip('"')
+        os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
+        _preallocate(temp_path, size)
+
+        ranges = [(start, min(start + self.part_size, size) - 1) for start in range(0, size, self.part_size)]
+        received = [0]
+
+        def fetch(byte_range: Tuple[int, int]) -> Dict[str, Any]:
+            result = self._download_range(bucket, key, temp_path, *byte_range)
+            if "error" not in result:
+                with self._lock:
+                    self._stats["ranges_downloaded"] += 1
+                    self._stats["bytes_downloaded"] += result["size"]
+                    received[0] += result["size"]
+                    current = received[0]
+                if progress:
+                    progress(current, size)
+            return result
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pocket-download")
+        try:
+            for result in executor.map(fetch, ranges):
+                if "error" in result:
+                    return result
+        finally:
+            # 실패 시 아직 시작하지 않은 범위는 취소하고, 진행 중인 기록이 끝난 뒤 임시 파일 정리
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        # 단일 PUT 객체의 ETag는 내용 MD5이므로 전체 검증 (멀티파트 ETag는 파트 경계를 알 수 없어 크기만 검증)
+        verified = False
+        if etag and "-" not in etag:
+            md5 = hashlib.md5()
+            with open(temp_path, "rb") as f:
+                for block in iter(lambda: f.read(STREAM_CHUNK_SIZE), b""):
+                    md5.update(block)
+            if md5.hexdigest() != etag:
+                return {"error": f"다운로드 체크섬 불일치 (ETag: {etag})"}
+            verified = True
+
+        os.replace(temp_path, dest_path)
+        return {"bucket": bucket, "key": key, "path": dest_path, "size": size, "etag": etag,
+                "ranges": len(ranges), "verified": verified}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """전송 통계 반환"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["part_size"] = self.part_size
+        stats["max_workers"] = self.max_workers
+        return stats
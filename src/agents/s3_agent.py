@@ -52,9 +52,10 @@ class S3Agent:
         bucket_info = metadata.get("bucket", "")
         
         # 프롬프트 구성
+        bucket_section = f"버킷 정보:\n{bucket_info}" if bucket_info else ""
         prompt = f"""S3 클라우드 스토리지 어시스턴트로서 버킷과 객체 관리를 도와줍니다.
 
-{'버킷 정보:\n' + bucket_info if bucket_info else ''}
+{bucket_section}
 
 작업: {query}
 
@@ -73,7 +74,7 @@ class S3Agent:
         messages = [llm_service.format_system_message(prompt)]
         
         # LLM 호출
-        content = llm_service.generate(messages)
+        content = llm_service.generate(messages, agent_type="s3")
         
         # 오류 처리
         if isinstance(content, dict) and "error" in content:
@@ -13,7 +13,7 @@ from typing import Dict, Any, List, Optional, Union
 
 from src.core.llm_service import llm_service
 import config
-from src.core.requests_config import get_secure_http_session
+from src.core.requests_config import make_api_request
 from src.utils.sql_utils import extract_sql_query
 from src.utils.response_utils import format_agent_response as format_response
 from src.agents.base_interface import BaseAgent
@@ -42,21 +42,8 @@ class SWDPAgent(BaseAgent):
         self.verify_ssl = swdp_config.get('verify_ssl', False)
         self.timeout = swdp_config.get('timeout', 30)
         
-        # API 세션 초기화
-        self.session = get_secure_http_session(
-            timeout=self.timeout,
-            verify_ssl=self.verify_ssl
-        )
-        
-        # API 인증 헤더 설정
-        if self.username and self.password:
-            import base64
-            auth_str = f"{self.username}:{self.password}"
-            encoded_auth = base64.b64encode(auth_str.encode()).decode()
-            self.session.headers.update({
-                "Authorization": f"Basic {encoded_auth}",
-                "Content-Type": "application/json"
-            })
+        # API 인증 정보 (요청마다 기본 인증으로 전달, 같은 서버/인증 정보의 공유 세션을 레지스트리에서 재사용)
+        self.auth = (self.username, self.password) if self.username and self.password else None
         
         # 스키마 정보 로드
         self.schema_info = self._load_schema_info()
@@ -90,19 +77,15 @@ class SWDPAgent(BaseAgent):
         logger.info(f"SWDP API 호출: {method} {url}")
         
         try:
-            from src.core.requests_config import make_api_request
-            
-            # API 요청 수행
+            # API 요청 수행 (공유 세션 재사용)
             response = make_api_request(
                 url=url,
                 method=method,
                 data=data,
                 params=params,
-                headers={
-                    "Authorization": f"Basic {base64.b64encode(f'{self.username}:{self.password}'.encode()).decode()}"
-                },
                 verify_ssl=self.verify_ssl,
-                timeout=self.timeout
+                timeout=self.timeout,
+                auth=self.auth
             )
             
             if "error" in response:
@@ -228,7 +211,7 @@ class SWDPAgent(BaseAgent):
         
         # LLM 호출
         messages = [llm_service.format_user_message(prompt)]
-        response = llm_service.generate(messages)
+        response = llm_service.generate(messages, agent_type="swdp")
         
         # SQL 쿼리 추출
         sql_query = extract_sql_query(response, check_sql_keywords=True)
@@ -306,7 +289,7 @@ class SWDPAgent(BaseAgent):
         messages = [llm_service.format_user_message(prompt)]
         
         # LLM 호출
-        action_plan = llm_service.generate(messages)
+        action_plan = llm_service.generate(messages, agent_type="swdp")
         
         # 오류 처리
         if isinstance(action_plan, dict) and "error" in action_plan:
@@ -356,7 +339,7 @@ SWDP Open API는 다음과 같은 기능을 제공합니다:
         messages = [llm_service.format_user_message(prompt)]
         
         # LLM 호출
-        response = llm_service.generate(messages)
+        response = llm_service.generate(messages, agent_type="swdp")
         
         # 오류 처리
         if isinstance(response, dict) and "error" in response:
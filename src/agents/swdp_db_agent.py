@@ -17,13 +17,46 @@ from sqlalchemy.exc import SQLAlchemyError
 import config
 from src.agents.base_db_agent import BaseDBAgent
 from src.core.llm_service import llm_service
+from src.utils.sql_utils import extract_sql_query, extract_function_call
+from src.core.prompt_templates import PromptTemplate, prompt_registry
+from src.core.metrics import instrument_engine
 
 # 로깅 설정
 logger = logging.getLogger("swdp_db_agent")
 
+# SQL/함수 호출 프롬프트 (스키마 포함 고정 접두부 + 질문 접미부)
+prompt_registry.register(PromptTemplate(
+    name="db.swdp",
+    description="SWDP 자연어 질문을 SQL 쿼리 또는 RPC 함수 호출로 변환",
+    prefix="""SWDP 데이터베이스 전문가로서 SWDP 관련 데이터베이스 쿼리를 도와드립니다.
+
+$schema_info
+
+작업: 사용자 메시지의 질문에 대한 SQL 쿼리 작성 및 설명 또는 함수 호출
+
+가능한 함수 목록:
+- get_user_by_single_id(single_id: str): Single ID로 사용자 정보 조회
+- get_user_projects(single_id: str): 사용자가 속한 프로젝트 목록 조회
+- get_build_by_id(build_request_id: str): 빌드 요청 ID로 빌드 정보 조회
+- get_build_logs(build_request_id: str): 빌드 요청 ID로 빌드 로그 조회
+- trigger_build(single_id: str, project_id?: int, project_code?: str, branch?: str, commit_id?: str, environment?: str, title?: str, description?: str): 새 빌드 트리거
+- get_tr_by_code(tr_code: str): TR 코드로 TR 정보 조회
+- get_tr_by_project(project_id: int, status?: str): 프로젝트 ID로 TR 목록 조회
+- create_tr(single_id: str, project_id: int, title: str, description?: str, type?: str, priority?: str, target_release?: str): 새 TR 생성
+
+이 작업에 대해:
+1. 질문을 분석하고 SQL 쿼리를 작성하거나 적절한 함수 호출을 선택하세요.
+2. 함수 호출이 필요한 경우 JSON 형식으로 함수 이름과 매개변수를 지정하세요: {"function": "함수명", "parameters": {"매개변수1": "값1", ...}}
+3. SQL 쿼리가 필요한 경우 ```sql 코드 ``` 형식으로 쿼리를 작성하고 코드의 목적과 로직을 설명하세요.""",
+    suffix="""질문: $query"""
+))
+
 class SWDPDBAgent(BaseDBAgent):
     """SWDP 데이터 쿼리 실행 에이전트"""
     
+    # 프롬프트 템플릿
+    prompt_template_name = "db.swdp"
+    
     def __init__(self):
         """SWDP DB 에이전트 초기화"""
         # 부모 클래스 초기화
@@ -34,6 +67,9 @@ class SWDPDBAgent(BaseDBAgent):
                                         "src", "schema", "swdp-db.json")
         self.schema_info = self._load_schema()
         
+        # 테이블 이름 → 테이블 정보 색인 (Mock 조회 시 테이블 목록 선형 탐색 방지)
+        self.tables_by_name = {table["name"]: table for table in self.schema_info.get("tables", [])}
+        
         # Mock 모드 설정
         self.mock_mode = True
         logger.info(f"SWDP DB 에이전트 초기화 완료 (Mock 모드: {self.mock_mode})")
@@ -73,7 +109,7 @@ class SWDPDBAgent(BaseDBAgent):
         # 데이터베이스 연결 시도
         if self.enabled and self.db_uri:
             try:
-                self.engine = create_engine(self.db_uri)
+                self.engine = instrument_engine(create_engine(self.db_uri), "swdp")
                 
                 # 연결 테스트
                 with self.engine.connect() as conn:
@@ -149,19 +185,18 @@ class SWDPDBAgent(BaseDBAgent):
         """
         # Mock 모드인 경우 스키마 정보에서 컬럼 정보 반환
         if self.mock_mode:
-            if "tables" in self.schema_info:
-                for table_info in self.schema_info["tables"]:
-                    if table_info["name"] == table:
-                        return [
-                            {
-                                'name': col['name'],
-                                'type': col['type'],
-                                'nullable': not col.get('nullable', True),
-                                'primary_key': col.get('primary_key', False),
-                                'default': col.get('default', None)
-                            }
-                            for col in table_info["columns"]
-                        ]
+            table_info = self.tables_by_name.get(table)
+            if table_info:
+                return [
+                    {
+                        'name': col['name'],
+                        'type': col['type'],
+                        'nullable': not col.get('nullable', True),
+                        'primary_key': col.get('primary_key', False),
+                        'default': col.get('default', None)
+                    }
+                    for col in table_info["columns"]
+                ]
             return []
             
         # 원래 DB 연결 로직
@@ -242,17 +277,16 @@ class SWDPDBAgent(BaseDBAgent):
         """
         # Mock 모드인 경우 스키마 정보에서 외래 키 정보 반환
         if self.mock_mode:
-            if "tables" in self.schema_info:
-                for table_info in self.schema_info["tables"]:
-                    if table_info["name"] == table and "foreign_keys" in table_info:
-                        return [
-                            {
-                                'column': fk['column'],
-                                'referenced_table': fk['referenced_table'],
-                                'referenced_column': fk['referenced_column']
-                            }
-                            for fk in table_info["foreign_keys"]
-                        ]
+            table_info = self.tables_by_name.get(table)
+            if table_info and "foreign_keys" in table_info:
+                return [
+                    {
+                        'column': fk['column'],
+                        'referenced_table': fk['referenced_table'],
+                        'referenced_column': fk['referenced_column']
+                    }
+                    for fk in table_info["foreign_keys"]
+                ]
             return []
             
         # 원래 DB 연결 로직
@@ -321,40 +355,6 @@ class SWDPDBAgent(BaseDBAgent):
         
         return foreign_keys
     
-    def _build_prompt(self, query: str, schema_info: str) -> str:
-        """
-        LLM 프롬프트 구성
-        
-        Args:
-            query: 사용자 쿼리
-            schema_info: 스키마 정보
-            
-        Returns:
-            프롬프트 문자열
-        """
-        return f"""SWDP 데이터베이스 전문가로서 SWDP 관련 데이터베이스 쿼리를 도와드립니다.
-
-{schema_info}
-
-작업: 다음 질문에 대한 SQL 쿼리 작성 및 설명 또는 함수 호출
-질문: {query}
-
-가능한 함수 목록:
-- get_user_by_single_id(single_id: str): Single ID로 사용자 정보 조회
-- get_user_projects(single_id: str): 사용자가 속한 프로젝트 목록 조회
-- get_build_by_id(build_request_id: str): 빌드 요청 ID로 빌드 정보 조회
-- get_build_logs(build_request_id: str): 빌드 요청 ID로 빌드 로그 조회
-- trigger_build(single_id: str, project_id?: int, project_code?: str, branch?: str, commit_id?: str, environment?: str, title?: str, description?: str): 새 빌드 트리거
-- get_tr_by_code(tr_code: str): TR 코드로 TR 정보 조회
-- get_tr_by_project(project_id: int, status?: str): 프로젝트 ID로 TR 목록 조회
-- create_tr(single_id: str, project_id: int, title: str, description?: str, type?: str, priority?: str, target_release?: str): 새 TR 생성
-
-이 작업에 대해:
-1. 질문을 분석하고 SQL 쿼리를 작성하거나 적절한 함수 호출을 선택하세요.
-2. 함수 호출이 필요한 경우 JSON 형식으로 함수 이름과 매개변수를 지정하세요: {"function": "함수명", "parameters": {"매개변수1": "값1", ...}}
-3. SQL 쿼리가 필요한 경우 ```sql 코드 ``` 형식으로 쿼리를 작성하고 코드의 목적과 로직을 설명하세요.
-"""
-    
     def _get_schema_info_for_prompt(self) -> str:
         """스키마 정보를 프롬프트용으로 포맷팅"""
         if not self.schema_info:
@@ -415,12 +415,11 @@ class SWDPDBAgent(BaseDBAgent):
         # 스키마 정보 준비
         schema_info = self._get_schema_info_for_prompt()
         
-        # LLM 프롬프트 구성
-        prompt = self._build_prompt(query, schema_info)
+        # LLM 메시지 구성 (스키마는 토큰 예산에 맞게 축소)
+        messages = self._build_messages(query, schema_info)
         
         # LLM 호출
-        messages = [llm_service.format_user_message(prompt)]
-        response = llm_service.generate(messages)
+        response = llm_service.generate(messages, agent_type=self.id_prefix)
         
         # 함수 호출 여부 확인
         function_call = self._extract_function_call(response)
@@ -428,7 +427,6 @@ class SWDPDBAgent(BaseDBAgent):
             return self._handle_function_call(function_call)
         
         # SQL 쿼리 추출
-        from src.utils.sql_utils import extract_sql_query
         sql_query = extract_sql_query(response)
         
         if not sql_query:
@@ -493,11 +491,7 @@ class SWDPDBAgent(BaseDBAgent):
             return []
         
         # 테이블 정보 찾기
-        table_info = None
-        for table in self.schema_info["tables"]:
-            if table["name"] == table_name:
-                table_info = table
-                break
+        table_info = self.tables_by_name.get(table_name)
         
         # 테이블 정보가 없으면 빈 결과 반환
         if not table_info or "sample_data" not in table_info:
@@ -520,11 +514,7 @@ class SWDPDBAgent(BaseDBAgent):
                     join_table_name = join_parts[0].strip('`;')
             
             # 조인 테이블 정보 찾기
-            join_table_info = None
-            for table in self.schema_info["tables"]:
-                if table["name"] == join_table_name:
-                    join_table_info = table
-                    break
+            join_table_info = self.tables_by_name.get(join_table_name)
             
             # 조인 결과 시뮬레이션 (간단한 구현)
             if join_table_info and "sample_data" in join_table_info:
@@ -625,16 +615,8 @@ class SWDPDBAgent(BaseDBAgent):
             함수 호출 정보
         """
         try:
-            # JSON 형식의 함수 호출 추출
-            function_call_match = re.search(r'\{[\s\S]*?"function"[\s\S]*?\}', response)
-            if function_call_match:
-                function_call_str = function_call_match.group(0)
-                function_call = json.loads(function_call_str)
-                
-                if "function" in function_call and "parameters" in function_call:
-                    return function_call
-            
-            return None
+            # JSON 형식의 함수 호출 추출 (중첩 parameters 포함, SQL 추출과 같은 스캔 결과 재사용)
+            return extract_function_call(response)
         except Exception as e:
             logger.error(f"함수 호출 추출 오류: {e}")
             return None
@@ -24,6 +24,7 @@ class SWDPRPCAPI:
         """SWDP RPC API 초기화"""
         self.db_agent = SWDPDBAgent()
         self.schema_info = self.db_agent.schema_info
+        self.tables_by_name = self.db_agent.tables_by_name
         self.mock_mode = True
         logger.info(f"SWDP RPC API 초기화 완료 (Mock 모드: {self.mock_mode})")
     
@@ -46,11 +47,7 @@ class SWDPRPCAPI:
         
         # Mock 모드인 경우
         if self.mock_mode:
-            users_table = None
-            for table in self.schema_info["tables"]:
-                if table["name"] == "users":
-                    users_table = table
-                    break
+            users_table = self.tables_by_name.get("users")
             
             if not users_table or "sample_data" not in users_table:
                 return {"error": "사용자 데이터를 찾을 수 없습니다."}
@@ -122,18 +119,10 @@ class SWDPRPCAPI:
         # Mock 모드인 경우
         if self.mock_mode:
             # 프로젝트 테이블 정보
-            projects_table = None
-            for table in self.schema_info["tables"]:
-                if table["name"] == "projects":
-                    projects_table = table
-                    break
+            projects_table = self.tables_by_name.get("projects")
             
             # 사용자 프로젝트 역할 테이블 정보
-            user_project_roles_table = None
-            for table in self.schema_info["tables"]:
-                if table["name"] == "user_project_roles":
-                    user_project_roles_table = table
-                    break
+            user_project_roles_table = self.tables_by_name.get("user_project_roles")
             
             if (not projects_table or "sample_data" not in projects_table or
                 not user_project_roles_table or "sample_data" not in user_project_roles_table):
@@ -194,11 +183,7 @@ class SWDPRPCAPI:
         
         # Mock 모드인 경우
         if self.mock_mode:
-            builds_table = None
-            for table in self.schema_info["tables"]:
-                if table["name"] == "build_requests":
-                    builds_table = table
-                    break
+            builds_table = self.tables_by_name.get("build_requests")
             
             if not builds_table or "sample_data" not in builds_table:
                 return {"error": "빌드 데이터를 찾을 수 없습니다."}
@@ -261,11 +246,7 @@ class SWDPRPCAPI:
         
         # Mock 모드인 경우
         if self.mock_mode:
-            build_logs_table = None
-            for table in self.schema_info["tables"]:
-                if table["name"] == "build_logs":
-                    build_logs_table = table
-                    break
+            build_logs_table = self.tables_by_name.get("build_logs")
             
             if not build_logs_table or "sample_data" not in build_logs_table:
                 return {"error": "빌드 로그 데이터를 찾을 수 없습니다."}
@@ -341,11 +322,7 @@ class SWDPRPCAPI:
         if not project_id and project_code:
             # 프로젝트 코드로 프로젝트 ID 조회
             if self.mock_mode:
-                projects_table = None
-                for table in self.schema_info["tables"]:
-                    if table["name"] == "projects":
-                        projects_table = table
-                        break
+                projects_table = self.tables_by_name.get("projects")
                 
                 if not projects_table or "sample_data" not in projects_table:
                     return {"error": "프로젝트 데이터를 찾을 수 없습니다."}
@@ -375,11 +352,7 @@ class SWDPRPCAPI:
         
         # 사용자가 프로젝트에 접근 권한이 있는지 확인
         if self.mock_mode:
-            user_project_roles_table = None
-            for table in self.schema_info["tables"]:
-                if table["name"] == "user_project_roles":
-                    user_project_roles_table = table
-                    break
+            user_project_roles_table = self.tables_by_name.get("user_project_roles")
             
             if not user_project_roles_table or "sample_data" not in user_project_roles_table:
                 return {"error": "사용자 프로젝트 역할 데이터를 찾을 수 없습니다."}
@@ -423,11 +396,7 @@ class SWDPRPCAPI:
         if not title:
             # 프로젝트 정보 조회
             if self.mock_mode:
-                projects_table = None
-                for table in self.schema_info["tables"]:
-                    if table["name"] == "projects":
-                        projects_table = table
-                        break
+                projects_table = self.tables_by_name.get("projects")
                 
                 project_name = "Unknown Project"
                 for project in projects_table["sample_data"]:
@@ -456,11 +425,7 @@ class SWDPRPCAPI:
         
         # Mock 모드인 경우 모의 데이터 생성
         if self.mock_mode:
-            builds_table = None
-            for table in self.schema_info["tables"]:
-                if table["name"] == "build_requests":
-                    builds_table = table
-                    break
+            builds_table = self.tables_by_name.get("build_requests")
             
             if not builds_table or "sample_data" not in builds_table:
                 return {"error": "빌드 요청 테이블을 찾을 수 없습니다."}
@@ -549,11 +514,7 @@ class SWDPRPCAPI:
         
         # Mock 모드인 경우
         if self.mock_mode:
-            tr_table = None
-            for table in self.schema_info["tables"]:
-                if table["name"] == "tr_data":
-                    tr_table = table
-                    break
+            tr_table = self.tables_by_name.get("tr_data")
             
             if not tr_table or "sample_data" not in tr_table:
                 return {"error": "TR 데이터를 찾을 수 없습니다."}
@@ -613,11 +574,7 @@ class SWDPRPCAPI:
         
         # Mock 모드인 경우
         if self.mock_mode:
-            tr_table = None
-            for table in self.schema_info["tables"]:
-                if table["name"] == "tr_data":
-                    tr_table = table
-                    break
+            tr_table = self.tables_by_name.get("tr_data")
             
             if not tr_table or "sample_data" not in tr_table:
                 return {"error": "TR 데이터를 찾을 수 없습니다."}
@@ -692,11 +649,7 @@ class SWDPRPCAPI:
         
         # 사용자가 프로젝트에 접근 권한이 있는지 확인
         if self.mock_mode:
-            user_project_roles_table = None
-            for table in self.schema_info["tables"]:
-                if table["name"] == "user_project_roles":
-                    user_project_roles_table = table
-                    break
+            user_project_roles_table = self.tables_by_name.get("user_project_roles")
             
             if not user_project_roles_table or "sample_data" not in user_project_roles_table:
                 return {"error": "사용자 프로젝트 역할 데이터를 찾을 수 없습니다."}
@@ -728,11 +681,7 @@ class SWDPRPCAPI:
         
         # Mock 모드인 경우 모의 데이터 생성
         if self.mock_mode:
-            tr_table = None
-            for table in self.schema_info["tables"]:
-                if table["name"] == "tr_data":
-                    tr_table = table
-                    break
+            tr_table = self.tables_by_name.get("tr_data")
             
             if not tr_table or "sample_data" not in tr_table:
                 return {"error": "TR 테이블을 찾을 수 없습니다."}
@@ -0,0 +1,82 @@
+"""
+관리자 요청 인증 모듈
+
+설정 다시 로드, JQL 캐시 관리, 토큰 사용량 초기화 같은 관리자 API의 접근을 확인합니다.
+프로파일링 설정과 분리되어 있어 profiling.enabled를 꺼도 관리자 API는 계속 사용할 수 있습니다.
+token을 설정하면 X-Admin-Token 헤더가 일치해야 하고, 설정하지 않으면 로컬(loopback) 요청만 허용합니다.
+
+설정 (settings.json의 admin 섹션):
+    {"token": ""}
+
+admin.token이 비어 있으면 기존 설정과의 호환을 위해 profiling.admin_token을 사용합니다.
+"""
+
+import hmac
+import logging
+from typing import Dict, Any, Optional
+
+# 로거 설정
+logger = logging.getLogger("admin_auth")
+
+# 관리자 토큰 헤더
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+# 토큰 없이 허용하는 로컬 클라이언트 주소
+LOCAL_HOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
+
+
+def get_admin_config(settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    관리자 인증 설정 반환 (admin 섹션, 토큰이 없으면 profiling.admin_token)
+
+    Args:
+        settings: 전체 설정 (get_settings() 결과)
+
+    Returns:
+        관리자 인증 설정
+    """
+    settings = settings or {}
+    section = settings.get("admin", {}) or {}
+    token = section.get("token") or (settings.get("profiling", {}) or {}).get("admin_token")
+    return {"token": str(token or "")}
+
+
+class AdminAuth:
+    """관리자 요청 인증"""
+
+    def __init__(self):
+        """관리자 인증 초기화"""
+        self.config = get_admin_config()
+
+    def configure(self, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        설정 적용
+
+        Args:
+            settings: 전체 설정 (get_settings() 결과)
+
+        Returns:
+            적용된 관리자 인증 설정
+        """
+        self.config = get_admin_config(settings)
+        return self.config
+
+    def is_allowed(self, client_host: Optional[str], token: Optional[str] = None) -> bool:
+        """
+        관리자 요청인지 확인 (토큰은 상수 시간 비교)
+
+        Args:
+            client_host: 요청 클라이언트 주소
+            token: X-Admin-Token 헤더 값
+
+        Returns:
+            허용 여부
+        """
+        admin_token = self.config["token"]
+        if admin_token:
+            return hmac.compare_digest((token or "").encode("utf-8"), admin_token.encode("utf-8"))
+        return client_host in LOCAL_HOSTS
+
+
+# 싱글톤 인스턴스
+admin_auth = AdminAuth()
@@ -0,0 +1,360 @@
+"""비동기 외부 연동 API 클라이언트 모듈
+
+Jira, SWDP, Pocket 등 내부 시스템 REST API를 비동기로 호출하는 공통 클라이언트를 제공합니다.
+HTTP 호출은 공유 세션 레지스트리(연결 풀)의 requests 세션을 전용 스레드 풀에서 실행하므로
+이벤트 루프를 막지 않으며, 서로 독립적인 여러 API 호출을 동시에 보낼 수 있습니다.
+
+- 연결 풀: 재시도 없는 전용 HTTPSessionRegistry (재시도는 이 모듈에서 비동기로 처리)
+- 재시도: 연결 오류, 타임아웃, 429/5xx 응답에 대해 지수 백오프 + 전체 지터(Retry-After 우선)
+  멱등 메서드(GET/HEAD/PUT/DELETE/OPTIONS)만 재시도하고, POST 등은 retry=True로 지정한 경우에만 재시도
+- 동시성 제한: 클라이언트별 세마포어 (이벤트 루프마다 하나)
+- 요청 추적: 호출한 쪽의 컨텍스트(현재 스팬)를 스레드 풀과 백그라운드 루프로 넘겨 추적이 이어지게 함
+"""
+
+import random
+import asyncio
+import logging
+import os
+import threading
+import weakref
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple, Awaitable, Callable
+
+import requests
+
+from src.core.requests_config import HTTPSessionRegistry, http_pool_families
+from src.core.metrics import metrics, MetricFamily
+from src.core import tracing
+
+# 로거 설정
+logger = logging.getLogger("async_client")
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# 기본적으로 재시도하는 멱등 HTTP 메서드 (같은 요청을 다시 보내도 결과가 같음)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+# HTTP 호출 스레드 풀 크기 (모든 비동기 클라이언트 공용)
+ASYNC_HTTP_WORKERS = int(os.environ.get("ASYNC_HTTP_WORKERS", "32"))
+
+_executor = ThreadPoolExecutor(max_workers=ASYNC_HTTP_WORKERS, thread_name_prefix="integration-http")
+_session_registry = HTTPSessionRegistry(pool_maxsize=ASYNC_HTTP_WORKERS, max_retries=0)
+
+# 동기 코드에서 코루틴을 실행할 때 사용하는 백그라운드 이벤트 루프
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """백그라운드 이벤트 루프 반환 (없으면 데몬 스레드에서 시작)"""
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="integration-loop", daemon=True).start()
+            _background_loop = loop
+        return _background_loop
+
+
+def run_async(coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """
+    동기 코드에서 코루틴 실행
+
+    현재 스레드에 실행 중인 이벤트 루프가 없으면 asyncio.run으로 실행하고,
+    있으면(비동기 핸들러 안에서 동기 에이전트 코드가 호출된 경우) 백그라운드 루프에 맡기고 결과를 기다립니다.
+
+    Args:
+        coro: 실행할 코루틴
+        timeout: 결과 대기 제한 시간 (초)
+
+    Returns:
+        코루틴 결과
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    return submit_async(coro).result(timeout=timeout)
+
+
+def submit_async(coro: Awaitable[Any]) -> Future:
+    """
+    코루틴을 백그라운드 이벤트 루프에서 실행 (결과를 기다리지 않음)
+
+    동기 코드에서 다음 작업을 미리 시작해 두고(예: 다음 페이지 선조회) 나중에 결과를 받을 때 사용합니다.
+
+    Args:
+        coro: 실행할 코루틴
+
+    Returns:
+        결과를 담을 concurrent.futures.Future
+    """
+    return asyncio.run_coroutine_threadsafe(_run_in_context(coro, contextvars.copy_context()), _get_background_loop())
+
+
+async def _run_in_context(coro: Awaitable[Any], context: contextvars.Context) -> Any:
+    """호출한 스레드의 컨텍스트 변수(현재 스팬, 요청 모델)를 태스크 컨텍스트에 옮긴 뒤 코루틴 실행"""
+    for var, value in context.items():
+        var.set(value)
+    return await coro
+
+
+async def gather_calls(call: Callable[..., Awaitable[Dict[str, Any]]],
+                       calls: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    이름이 붙은 여러 API 호출을 동시에 실행
+
+    Args:
+        call: (endpoint, method, data, params[, headers]) 를 받는 비동기 호출 함수
+        calls: {이름: {"endpoint": ..., "method": "GET", "data": ..., "params": ..., "headers": ...}}
+
+    Returns:
+        {이름: 응답 데이터} (개별 실패는 {"error": ...})
+    """
+    names = list(calls.keys())
+    results = await asyncio.gather(
+        *(call(spec["endpoint"], spec.get("method", "GET"), spec.get("data"), spec.get("params"),
+               **({"headers": spec["headers"]} if spec.get("headers") else {}))
+          for spec in calls.values()),
+        return_exceptions=True
+    )
+    return {
+        name: ({"error": str(result)} if isinstance(result, BaseException) else result)
+        for name, result in zip(names, results)
+    }
+
+
+class AsyncIntegrationClient:
+    """외부 연동 REST API 비동기 클라이언트"""
+
+    def __init__(self, name: str, base_url: str, auth: Optional[Tuple[str, str]] = None,
+                 verify_ssl: bool = False, timeout: float = 30, max_retries: int = 3,
+                 backoff_base: float = 0.2, backoff_max: float = 5.0, max_concurrency: int = 8,
+                 default_headers: Optional[Dict[str, str]] = None):
+        """
+        비동기 클라이언트 초기화
+
+        Args:
+            name: 클라이언트 이름 (로깅/통계용, 예: "jira")
+            base_url: API 기본 URL
+            auth: (사용자명, 비밀번호) 기본 인증 정보
+            verify_ssl: SSL 인증서 검증 여부
+            timeout: 요청 시도당 타임아웃 (초)
+            max_retries: 최대 재시도 횟수
+            backoff_base: 재시도 백오프 기본 시간 (초)
+            backoff_max: 재시도 백오프 최대 시간 (초)
+            max_concurrency: 동시에 진행 중일 수 있는 최대 요청 수
+            default_headers: 모든 요청에 붙일 헤더
+        """
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.auth = tuple(auth) if auth else None
+        self.verify_ssl = verify_ssl
+        self.timeout = timeout
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.default_headers = dict(default_headers or {})
+
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
+        self._stats = {"requests": 0, "attempts": 0, "retries": 0, "errors": 0, "max_in_flight": 0}
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프의 동시성 제한 세마포어"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    def _backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """재시도 대기 시간 계산 (Retry-After 우선, 없으면 전체 지터 지수 백오프)"""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Retry-After 헤더(초 단위) 해석"""
+        value = response.headers.get("Retry-After")
+        try:
+            return max(0.0, float(value)) if value is not None else None
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _parse_response(response: requests.Response) -> Dict[str, Any]:
+        """HTTP 응답을 딕셔너리로 변환 (오류 응답은 error 키 포함)"""
+        if response.status_code >= 400:
+            return {"error": f"API 오류: {response.status_code}", "status_code": response.status_code}
+
+        if not response.content:
+            return {}
+        try:
+            body = response.json()
+        except ValueError:
+            return {"text": response.text}
+        return body if isinstance(body, dict) else {"items": body}
+
+    def _send(self, method: str, url: str, data: Any, params: Optional[Dict[str, Any]],
+              headers: Dict[str, str], timeout: float) -> requests.Response:
+        """스레드 풀에서 실행되는 단일 HTTP 요청"""
+        return _session_registry.request(
+            method, url,
+            verify_ssl=self.verify_ssl,
+            auth=self.auth,
+            headers=headers or None,
+            timeout=timeout,
+            json=data if method.upper() != "GET" else None,
+            params=params
+        )
+
+    async def request(self, method: str, endpoint: str, data: Any = None,
+                      params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+                      timeout: Optional[float] = None, retry: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        API 요청 (재시도 포함)
+
+        Args:
+            method: HTTP 메서드
+            endpoint: API 엔드포인트 경로 (기본 URL 기준) 또는 전체 URL
+            data: 요청 본문 (JSON)
+            params: URL 쿼리 파라미터
+            headers: 요청별 HTTP 헤더
+            timeout: 요청 시도당 타임아웃 (초)
+            retry: 재시도 여부 (None이면 멱등 메서드만 재시도, 조회용 POST 등은 True로 지정)
+
+        Returns:
+            응답 데이터 (실패 시 {"error": ...})
+        """
+        url = endpoint if endpoint.startswith(("http://", "https://")) else f"{self.base_url}/{endpoint.lstrip('/')}"
+        merged_headers = {**self.default_headers, **(headers or {})}
+        send = partial(self._send, method, url, data, params, merged_headers, timeout or self.timeout)
+        if retry is None:
+            retry = method.upper() in IDEMPOTENT_METHODS
+
+        with tracing.span("integration.request", "integration", client=self.name,
+                          method=method.upper(), url=url) as current:
+            result = await self._request_with_retry(method, url, send, self.max_retries if retry else 0)
+            if current is not None and "error" in result:
+                current.set_error(result["error"])
+            return result
+
+    async def _request_with_retry(self, method: str, url: str, send: Callable[[], requests.Response],
+                                  max_retries: int) -> Dict[str, Any]:
+        """
+        재시도 대상 오류에 대해 백오프하며 요청 반복
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            send: 스레드 풀에서 실행할 단일 요청 함수
+            max_retries: 최대 재시도 횟수 (0이면 한 번만 시도)
+
+        Returns:
+            응답 데이터 (실패 시 {"error": ...})
+        """
+        loop = asyncio.get_running_loop()
+        with self._stats_lock:
+            self._stats["requests"] += 1
+
+        last_error = "API 응답 없음"
+        for attempt in range(max_retries + 1):
+            retry_after = None
+
+            async with self._semaphore():
+                with self._stats_lock:
+                    self._stats["attempts"] += 1
+                    self._in_flight += 1
+                    self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._in_flight)
+                try:
+                    # 현재 스팬이 HTTP 호출 스레드에서도 이어지도록 컨텍스트 복사
+                    response = await loop.run_in_executor(_executor, contextvars.copy_context().run, send)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    last_error = str(e)
+                    response = None
+                except requests.RequestException as e:
+                    logger.error(f"{self.name} API 요청 오류: {method} {url} - {e}")
+                    with self._stats_lock:
+                        self._stats["errors"] += 1
+                    return {"error": str(e)}
+                finally:
+                    with self._stats_lock:
+                        self._in_flight -= 1
+
+            if response is not None:
+                if response.status_code not in RETRY_STATUS_CODES or attempt == max_retries:
+                    result = self._parse_response(response)
+                    if "error" in result:
+                        with self._stats_lock:
+                            self._stats["errors"] += 1
+                    return result
+                last_error = f"API 오류: {response.status_code}"
+                retry_after = self._retry_after(response)
+
+            if attempt < max_retries:
+                delay = self._backoff(attempt, retry_after)
+                logger.warning(f"{self.name} API 재시도 {attempt + 1}/{max_retries} ({delay:.2f}초 후): {method} {url} - {last_error}")
+                with self._stats_lock:
+                    self._stats["retries"] += 1
+                await asyncio.sleep(delay)
+
+        logger.error(f"{self.name} API 요청 실패: {method} {url} - {last_error}")
+        with self._stats_lock:
+            self._stats["errors"] += 1
+        return {"error": last_error}
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        """GET 요청"""
+        return await self.request("GET", endpoint, params=params, **kwargs)
+
+    async def post(self, endpoint: str, data: Any = None, **kwargs) -> Dict[str, Any]:
+        """POST 요청"""
+        return await self.request("POST", endpoint, data=data, **kwargs)
+
+    async def fetch_many(self, calls: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        서로 독립적인 여러 API 호출을 동시에 실행
+
+        Args:
+            calls: {이름: {"endpoint": ..., "method": "GET", "data": ..., "params": ...}}
+
+        Returns:
+            {이름: 응답 데이터} (개별 실패는 {"error": ...})
+        """
+        async def _call(endpoint, method, data, params, headers=None):
+            return await self.request(method, endpoint, data=data, params=params, headers=headers)
+
+        return await gather_calls(_call, calls)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """요청/재시도/오류 통계 반환"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = self._in_flight
+        stats["name"] = self.name
+        stats["max_concurrency"] = self.max_concurrency
+        return stats
+
+
+def get_async_session_stats() -> Dict[str, Any]:
+    """비동기 클라이언트 공용 연결 풀 통계 반환"""
+    return _session_registry.get_stats()
+
+
+def _collect_metrics() -> List[MetricFamily]:
+    """공용 HTTP 호출 스레드 풀 대기열 깊이와 연결 풀 사용량 메트릭"""
+    queue_depth = MetricFamily("ape_queue_depth", "gauge", "작업 대기열 깊이",
+                               [({"queue": "integration-http"}, _executor._work_queue.qsize())])
+    return [queue_depth] + http_pool_families(_session_registry, "integration")
+
+
+metrics.add_collector("async_client", _collect_metrics)
@@ -11,6 +11,10 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 from dotenv import load_dotenv
 
+from src.core.config_snapshot import (
+    ConfigSnapshot, config_store, resolve_placeholders, read_settings_file
+)
+
 # 로거 설정
 logger = logging.getLogger("config")
 
@@ -23,9 +27,6 @@ CONFIG_DIR = BASE_DIR / "config"
 MODELS_DIR = BASE_DIR / "models"
 DATA_DIR = BASE_DIR / "data"
 
-# 설정 저장소
-_SETTINGS = {}
-
 def load_dotenv_file():
     """환경 변수 파일 로드"""
     dotenv_path = BASE_DIR / ".env"
@@ -69,72 +70,34 @@ def get_list_env(key: str, default: List[str] = None) -> List[str]:
 
 def resolve_env_vars(config: Dict[str, Any]) -> Dict[str, Any]:
     """설정 사전의 환경 변수 플레이스홀더 해결"""
-    resolved = {}
-    
-    for key, value in config.items():
-        if isinstance(value, dict):
-            resolved[key] = resolve_env_vars(value)
-        elif isinstance(value, str) and value.startswith("${")\
-                and value.endswith("}"):
-            # 환경 변수 해결
-            env_key = value[2:-1]
-            if ":" in env_key:
-                # 기본값 있음
-                env_key, default = env_key.split(":", 1)
-                resolved[key] = get_env(env_key, default)
-            else:
-                # 기본값 없음
-                resolved[key] = get_env(env_key, "")
-        else:
-            resolved[key] = value
-    
-    return resolved
+    return resolve_placeholders(config)
 
 def load_settings_file() -> Dict[str, Any]:
     """설정 파일 로드"""
-    settings_path = CONFIG_DIR / "settings.json"
-    if not settings_path.exists():
-        logger.warning(f"설정 파일을 찾을 수 없음: {settings_path}")
-        return {}
-    
     try:
-        with open(settings_path, 'r', encoding='utf-8') as f:
-            settings = json.load(f)
-        logger.info(f"설정 파일 로드 완료: {settings_path}")
-        return settings
-    except Exception as e:
+        return read_settings_file(CONFIG_DIR / "settings.json")
+    except ValueError as e:
         logger.error(f"설정 파일 로드 오류: {e}")
         return {}
 
-def load_config():
-    """전체 설정 로드"""
-    global _SETTINGS
+def load_config() -> ConfigSnapshot:
+    """전체 설정 다시 로드 (settings.json + .env + APE_ 환경 변수 재정의)
     
+    새 불변 스냅샷을 만든 뒤 원자적으로 교체합니다. 이미 처리 중인 요청은 이전 스냅샷을 계속 사용합니다.
+    """
     # 환경 변수 로드
     load_dotenv_file()
     
-    # 설정 파일 로드
-    settings = load_settings_file()
-    
-    # 환경 변수 해결
-    _SETTINGS = resolve_env_vars(settings)
-    
-    # 기본값 설정
-    if not _SETTINGS.get("api", {}).get("host"):
-        _SETTINGS.setdefault("api", {})["host"] = "localhost"
-        
-    if not _SETTINGS.get("api", {}).get("port"):
-        _SETTINGS.setdefault("api", {})["port"] = "8001"
-    
+    snapshot = config_store.reload("load_config")
     logger.info("설정 로드 완료")
-    return _SETTINGS
-
-def get_settings() -> Dict[str, Any]:
-    """현재 설정 가져오기"""
-    global _SETTINGS
-    if not _SETTINGS:
-        return load_config()
-    return _SETTINGS
+    return snapshot
+
+def get_settings() -> ConfigSnapshot:
+    """현재 설정 스냅샷 가져오기 (락 없음, 읽기 전용)
+    
+    요청 하나를 처리하는 동안 같은 값을 보려면 시작할 때 한 번 받아 둔 스냅샷을 사용하세요.
+    """
+    return config_store.current()
 
 # No embedding, vector DB, document processing, or search config functions
 
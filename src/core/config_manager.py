@@ -10,6 +10,8 @@ import json
 import logging
 from typing import Dict, Any, Optional, Union, List
 
+from src.core.config_snapshot import parse_env_overrides, parse_env_value
+
 # 로깅 설정
 logger = logging.getLogger("config_manager")
 
@@ -105,19 +107,11 @@ class ConfigManager:
         return self._config
     
     def _load_from_env(self) -> None:
-        """환경 변수에서 설정 로드"""
-        for env_name, env_value in os.environ.items():
-            # APE_ 접두사로 시작하는 환경 변수만 처리
-            if env_name.startswith(self._env_prefix):
-                # 환경 변수 이름에서 접두사 제거
-                config_key = env_name[len(self._env_prefix):].lower()
-                
-                # 중첩된 키는 '__'로 구분 (예: APE_SERVER__PORT -> server.port)
-                if '__' in config_key:
-                    parts = config_key.split('__')
-                    self._set_nested_key(self._config, parts, self._parse_env_value(env_value))
-                else:
-                    self._config[config_key] = self._parse_env_value(env_value)
+        """환경 변수에서 설정 로드
+        
+        APE_ 접두사 변수만 설정 스냅샷과 같은 규칙으로 해석합니다 (APE_SERVER__PORT -> server.port).
+        """
+        self._deep_update(self._config, parse_env_overrides(os.environ, self._env_prefix))
     
     def _parse_env_value(self, value: str) -> Any:
         """
@@ -129,32 +123,7 @@ class ConfigManager:
         Returns:
             파싱된 값 (str, int, float, bool, dict, list)
         """
-        # 정수 변환 시도
-        try:
-            return int(value)
-        except ValueError:
-            pass
-        
-        # 실수 변환 시도
-        try:
-            return float(value)
-        except ValueError:
-            pass
-        
-        # 불리언 변환 시도
-        if value.lower() in ('true', 'yes', '1', 'y'):
-            return True
-        if value.lower() in ('false', 'no', '0', 'n'):
-            return False
-        
-        # JSON 변환 시도
-        try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
-            pass
-        
-        # 기본값은 문자열
-        return value
+        return parse_env_value(value)
     
     def _set_nested_key(self, config: Dict[str, Any], keys: List[str], value: Any) -> None:
         """
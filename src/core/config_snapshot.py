@@ -0,0 +1,463 @@
+"""
+불변 설정 스냅샷 모듈
+
+settings.json, .env, APE_ 접두사 환경 변수 재정의를 한 번에 읽어 불변 스냅샷으로 만들고,
+다시 로드할 때는 새 스냅샷을 만든 뒤 참조 하나만 바꿉니다 (원자적 교체).
+- 읽기: config_store.current()는 락 없이 현재 스냅샷 참조를 반환하며, 값 조회는 dict 조회 한 번 (O(1))
+- 일관성: 요청 처리 중에 잡은 스냅샷은 다시 로드되어도 바뀌지 않음
+- 다시 로드: reload(), 설정 파일 변경 감시(start_watching), SIGHUP(install_signal_handler)
+
+스냅샷은 Mapping이므로 기존 get_settings() 호출부의 settings["api"]["port"], settings.get(...) 형태가 그대로 동작하며,
+settings.api.port처럼 속성으로도 읽을 수 있습니다.
+"""
+
+import os
+import re
+import json
+import time
+import signal
+import logging
+import threading
+from pathlib import Path
+from collections.abc import Mapping
+from typing import Dict, Any, List, Optional, Callable, Iterator
+
+from dotenv import dotenv_values
+
+# 로거 설정
+logger = logging.getLogger("config_snapshot")
+
+BASE_DIR = Path(__file__).parent.parent.parent.absolute()
+DEFAULT_SETTINGS_PATH = BASE_DIR / "config" / "settings.json"
+DEFAULT_ENV_PATH = BASE_DIR / ".env"
+ENV_OVERRIDE_PREFIX = "APE_"
+
+# ${VAR} 또는 ${VAR:default} 형식의 플레이스홀더
+PLACEHOLDER_PATTERN = re.compile(r"\$\{([A-Za-z0-9_]+)(?::([^}]*))?\}")
+
+# 스냅샷 생성 시 채우는 기본값
+DEFAULT_SETTINGS = {
+    "api": {"host": "localhost", "port": 8001}
+}
+
+
+def convert_scalar(value: str, digit_flags: bool = False) -> Any:
+    """
+    문자열을 부울/정수/실수로 변환 (변환할 수 없으면 문자열 그대로)
+
+    Args:
+        value: 변환할 문자열
+        digit_flags: "1"/"0"을 정수가 아닌 부울로 변환할지 여부
+
+    Returns:
+        변환된 값
+    """
+    lowered = value.strip().lower()
+    if lowered in ("true", "yes", "y", "t") or (digit_flags and lowered == "1"):
+        return True
+    if lowered in ("false", "no", "n", "f") or (digit_flags and lowered == "0"):
+        return False
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    if "." in value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return value
+
+
+def parse_env_value(value: str) -> Any:
+    """
+    환경 변수 재정의 값 파싱 (정수, 실수, 부울, JSON, 문자열 순)
+
+    Args:
+        value: 환경 변수 값
+
+    Returns:
+        파싱된 값
+    """
+    converted = convert_scalar(value)
+    if not isinstance(converted, str):
+        return converted
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return value
+
+
+def resolve_placeholders(obj: Any, environ: Optional[Mapping] = None) -> Any:
+    """
+    설정 값의 ${VAR} / ${VAR:default} 플레이스홀더를 환경 변수 값으로 치환
+
+    값 전체가 플레이스홀더 하나이면 결과를 부울/정수/실수로 변환하고 ("1"/"0"은 기존 settings_loader와 같이 부울),
+    문자열 일부에 들어 있으면 치환한 문자열을 그대로 사용합니다.
+
+    Args:
+        obj: 설정 값 (dict, list, 문자열, 기타)
+        environ: 환경 변수 매핑 (기본값: os.environ)
+
+    Returns:
+        치환된 값
+    """
+    environ = os.environ if environ is None else environ
+
+    if isinstance(obj, dict):
+        return {key: resolve_placeholders(value, environ) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [resolve_placeholders(value, environ) for value in obj]
+    if not isinstance(obj, str) or "${" not in obj:
+        return obj
+
+    def replace(match: "re.Match") -> str:
+        value = environ.get(match.group(1))
+        if value is None:
+            value = match.group(2) if match.group(2) is not None else ""
+        return value
+
+    resolved = PLACEHOLDER_PATTERN.sub(replace, obj)
+    if PLACEHOLDER_PATTERN.fullmatch(obj):
+        return convert_scalar(resolved, digit_flags=True)
+    return resolved
+
+
+def parse_env_overrides(environ: Mapping, prefix: str = ENV_OVERRIDE_PREFIX) -> Dict[str, Any]:
+    """
+    접두사 환경 변수를 중첩 설정 dict로 변환 (APE_API__PORT=9000 -> {"api": {"port": 9000}})
+
+    Args:
+        environ: 환경 변수 매핑
+        prefix: 환경 변수 접두사
+
+    Returns:
+        재정의 설정
+    """
+    overrides: Dict[str, Any] = {}
+    for name, value in environ.items():
+        if not name.startswith(prefix):
+            continue
+        keys = name[len(prefix):].lower().split("__")
+        current = overrides
+        for key in keys[:-1]:
+            if not isinstance(current.get(key), dict):
+                current[key] = {}
+            current = current[key]
+        current[keys[-1]] = parse_env_value(value)
+    return overrides
+
+
+def deep_merge(target: Dict[str, Any], source: Mapping) -> Dict[str, Any]:
+    """
+    사전 깊은 병합 (source 값 우선, target을 변경하여 반환)
+
+    Args:
+        target: 대상 사전
+        source: 원본 사전
+
+    Returns:
+        병합된 target
+    """
+    for key, value in source.items():
+        if isinstance(target.get(key), dict) and isinstance(value, Mapping):
+            deep_merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+def _apply_defaults(settings: Dict[str, Any], defaults: Mapping) -> None:
+    """비어 있거나 없는 설정 값을 기본값으로 채움"""
+    for key, value in defaults.items():
+        if isinstance(value, Mapping):
+            if not isinstance(settings.get(key), dict):
+                settings[key] = {}
+            _apply_defaults(settings[key], value)
+        elif settings.get(key) in (None, ""):
+            settings[key] = value
+
+
+def read_settings_file(path: Path) -> Dict[str, Any]:
+    """
+    설정 파일(JSON) 읽기
+
+    Args:
+        path: 설정 파일 경로
+
+    Returns:
+        설정 사전 (파일이 없으면 빈 사전)
+
+    Raises:
+        ValueError: JSON 파싱 실패 (다시 로드 시 이전 스냅샷 유지)
+    """
+    if not os.path.exists(path):
+        logger.warning(f"설정 파일을 찾을 수 없음: {path}")
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"설정 파일 파싱 오류: {path}: {e}")
+
+
+def _freeze(value: Any) -> Any:
+    """dict는 ConfigSection, list는 tuple로 재귀 변환"""
+    if isinstance(value, Mapping):
+        return ConfigSection(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """ConfigSection/tuple을 일반 dict/list로 재귀 변환"""
+    if isinstance(value, ConfigSection):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class ConfigSection(Mapping):
+    """
+    불변 설정 섹션
+
+    dict 조회(section["port"], section.get("port"))와 속성 조회(section.port)를 모두 지원합니다.
+    키 이름이 Mapping 메서드(get, items 등)와 겹치면 dict 조회를 사용합니다.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping):
+        object.__setattr__(self, "_data", {key: _freeze(value) for key, value in data.items()})
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("설정 스냅샷은 변경할 수 없습니다. config_store.reload()로 새 스냅샷을 만드세요.")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"ConfigSection({_thaw(self)!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """변경 가능한 일반 dict 복사본 반환"""
+        return _thaw(self)
+
+
+class ConfigSnapshot(ConfigSection):
+    """버전과 로드 정보를 가진 최상위 불변 설정 스냅샷"""
+
+    __slots__ = ("_meta",)
+
+    def __init__(self, data: Mapping, version: int = 1, sources: Optional[List[str]] = None, reason: str = ""):
+        super().__init__(data)
+        object.__setattr__(self, "_meta", {
+            "version": version,
+            "loaded_at": time.time(),
+            "sources": list(sources or []),
+            "reason": reason
+        })
+
+    def snapshot_info(self) -> Dict[str, Any]:
+        """스냅샷 버전, 로드 시각, 원본 파일, 로드 사유"""
+        return dict(self._meta)
+
+
+class ConfigStore:
+    """설정 스냅샷 저장소 (원자적 교체, 락 없는 읽기)"""
+
+    def __init__(self, settings_path: Path = DEFAULT_SETTINGS_PATH, env_path: Path = DEFAULT_ENV_PATH,
+                 environ: Optional[Mapping] = None, env_prefix: str = ENV_OVERRIDE_PREFIX):
+        """
+        설정 저장소 초기화 (첫 current() 호출 시 로드)
+
+        Args:
+            settings_path: settings.json 경로
+            env_path: .env 경로
+            environ: 프로세스 환경 변수 매핑 (기본값: os.environ)
+            env_prefix: 설정 재정의 환경 변수 접두사
+        """
+        self.settings_path = Path(settings_path)
+        self.env_path = Path(env_path)
+        self.environ = os.environ if environ is None else environ
+        self.env_prefix = env_prefix
+
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._reload_lock = threading.Lock()
+        self._listeners: List[Callable[[ConfigSnapshot, Optional[ConfigSnapshot]], None]] = []
+        self._dotenv_values: Dict[str, str] = {}
+        self._watch_stop = threading.Event()
+        self._watch_thread: Optional[threading.Thread] = None
+        self._stats = {"reloads": 0, "failed_reloads": 0, "last_error": None}
+
+    def current(self) -> ConfigSnapshot:
+        """현재 스냅샷 반환 (락 없음, 최초 호출 시에만 로드)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.reload("initial")
+        return snapshot
+
+    def _build_environment(self) -> Dict[str, str]:
+        """
+        플레이스홀더 치환용 환경 변수 구성
+
+        프로세스 환경 변수가 .env보다 우선합니다. 단, 값이 이전에 읽은 .env 값과 같으면
+        load_dotenv가 넣은 값으로 보고 바뀐 .env 값을 사용합니다.
+        """
+        file_values = {key: value for key, value in dotenv_values(self.env_path).items() if value is not None} \
+            if self.env_path.exists() else {}
+        environment = dict(file_values)
+        for key, value in self.environ.items():
+            if key in file_values and self._dotenv_values.get(key) == value:
+                continue
+            environment[key] = value
+        self._dotenv_values = file_values
+        return environment
+
+    def _build(self, reason: str) -> ConfigSnapshot:
+        """설정 원본을 읽어 새 스냅샷 생성"""
+        environment = self._build_environment()
+        settings = resolve_placeholders(read_settings_file(self.settings_path), environment)
+        deep_merge(settings, parse_env_overrides(environment, self.env_prefix))
+        _apply_defaults(settings, DEFAULT_SETTINGS)
+
+        previous = self._snapshot
+        version = previous.snapshot_info()["version"] + 1 if previous is not None else 1
+        sources = [str(path) for path in (self.settings_path, self.env_path) if path.exists()]
+        return ConfigSnapshot(settings, version=version, sources=sources, reason=reason)
+
+    def reload(self, reason: str = "manual") -> ConfigSnapshot:
+        """
+        설정을 다시 읽어 스냅샷 교체
+
+        읽기에 실패하면 이전 스냅샷을 유지합니다 (최초 로드 실패 시 기본값만 가진 스냅샷 사용).
+
+        Args:
+            reason: 로드 사유 (manual, file_changed, SIGHUP 등)
+
+        Returns:
+            교체 후 현재 스냅샷
+        """
+        with self._reload_lock:
+            if reason == "initial" and self._snapshot is not None:
+                return self._snapshot
+            previous = self._snapshot
+            try:
+                snapshot = self._build(reason)
+            except Exception as e:
+                self._stats["failed_reloads"] += 1
+                self._stats["last_error"] = str(e)
+                logger.error(f"설정 다시 로드 실패 ({reason}), 이전 스냅샷 유지: {e}")
+                if previous is not None:
+                    return previous
+                snapshot = ConfigSnapshot(DEFAULT_SETTINGS, version=1, reason=f"{reason} (기본값)")
+            # 참조 교체 한 번으로 새 스냅샷 공개
+            self._snapshot = snapshot
+            self._stats["reloads"] += 1
+            listeners = list(self._listeners)
+
+        logger.info(f"설정 스냅샷 로드 완료 (버전 {snapshot.snapshot_info()['version']}, 사유: {reason})")
+        for listener in listeners:
+            try:
+                listener(snapshot, previous)
+            except Exception as e:
+                logger.warning(f"설정 변경 리스너 오류: {e}")
+        return snapshot
+
+    def add_listener(self, listener: Callable[[ConfigSnapshot, Optional[ConfigSnapshot]], None]) -> None:
+        """
+        스냅샷 교체 후 호출할 함수 등록
+
+        Args:
+            listener: (새 스냅샷, 이전 스냅샷)을 받는 함수
+        """
+        with self._reload_lock:
+            self._listeners.append(listener)
+
+    def _source_mtimes(self) -> Dict[str, Optional[int]]:
+        """설정 원본 파일별 수정 시각"""
+        mtimes = {}
+        for path in (self.settings_path, self.env_path):
+            try:
+                mtimes[str(path)] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[str(path)] = None
+        return mtimes
+
+    def start_watching(self, interval: float = 2.0) -> threading.Thread:
+        """
+        설정 파일 변경 감시 시작 (수정 시각 폴링, 바뀌면 다시 로드)
+
+        Args:
+            interval: 확인 주기 (초)
+
+        Returns:
+            감시 스레드
+        """
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            return self._watch_thread
+
+        self._watch_stop.clear()
+        mtimes = self._source_mtimes()
+
+        def watch() -> None:
+            nonlocal mtimes
+            while not self._watch_stop.wait(interval):
+                current = self._source_mtimes()
+                if current != mtimes:
+                    mtimes = current
+                    self.reload("file_changed")
+
+        self._watch_thread = threading.Thread(target=watch, name="config-watch", daemon=True)
+        self._watch_thread.start()
+        return self._watch_thread
+
+    def stop_watching(self) -> None:
+        """설정 파일 변경 감시 중지"""
+        self._watch_stop.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join(5)
+            self._watch_thread = None
+
+    def install_signal_handler(self) -> bool:
+        """
+        SIGHUP 수신 시 다시 로드하도록 핸들러 등록 (메인 스레드, SIGHUP 지원 플랫폼에서만)
+
+        핸들러는 다시 로드를 별도 스레드로 넘겨 시그널 처리 중 락을 잡지 않습니다.
+
+        Returns:
+            등록 여부
+        """
+        if not hasattr(signal, "SIGHUP") or threading.current_thread() is not threading.main_thread():
+            return False
+
+        def handle(signum, frame) -> None:
+            threading.Thread(target=self.reload, args=("SIGHUP",), name="config-reload", daemon=True).start()
+
+        signal.signal(signal.SIGHUP, handle)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 통계 (현재 스냅샷 정보 포함)"""
+        stats = dict(self._stats)
+        stats["snapshot"] = self._snapshot.snapshot_info() if self._snapshot is not None else None
+        stats["watching"] = bool(self._watch_thread and self._watch_thread.is_alive())
+        return stats
+
+
+# 싱글톤 인스턴스
+config_store = ConfigStore()
@@ -0,0 +1,243 @@
+"""대용량 diff/커밋 요약 모듈
+
+PR diff나 수백 개 커밋처럼 한 번의 LLM 호출에 담을 수 없는 입력을 토큰 예산 안의 청크로 나누고,
+청크별 요약(map)을 병렬로 실행한 뒤 요약들을 합쳐(reduce) 최종 요약을 만듭니다.
+
+- 청크 분할: 파일(diff --git) → 헝크(@@) → 줄 단위 순서로 경계를 지키며 예산 안에 채움
+  (파일을 나눌 때는 각 청크 앞에 파일 헤더를 다시 붙여 어떤 파일의 변경인지 유지)
+- map: 청크가 도착하는 대로(페이지 스트리밍 중에도) 스레드 풀에 제출하고, 끝난 순서대로 부분 요약을 넘겨줌
+- reduce: 부분 요약 합계가 예산을 넘으면 예산 단위 묶음으로 나눠 다시 병렬 요약하고, 한 번에 담기면 최종 요약
+"""
+
+import re
+import logging
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Dict, Any, List, Optional, Callable, Iterable, Generator, Union
+
+from src.core.token_budget import estimate_tokens, trim_text_to_tokens
+
+# 로거 설정
+logger = logging.getLogger("diff_summarizer")
+
+# 청크당 기본 토큰 예산
+DEFAULT_CHUNK_TOKENS = 3000
+
+# 기본 병렬 요약 수
+DEFAULT_MAX_WORKERS = 4
+
+# 요약 함수 형식: (텍스트, 단계 "map" 또는 "reduce") -> 요약 문자열 또는 {"error": ...}
+SummarizeFunction = Callable[[str, str], Union[str, Dict[str, Any]]]
+
+_FILE_BOUNDARY = re.compile(r"(?m)^(?=diff --git )")
+_HUNK_BOUNDARY = re.compile(r"(?m)^(?=@@ )")
+
+# 청크 사이 구분자
+_SEPARATOR = "\n"
+
+
+def iter_token_chunks(pieces: Iterable[str], max_tokens: int, header: str = "") -> Generator[str, None, None]:
+    """
+    조각을 순서대로 예산 안의 청크로 채우며 완성된 청크부터 넘겨줌 (예산보다 큰 조각은 줄 단위로 다시 나눔)
+
+    pieces가 제너레이터(페이지 스트리밍)여도 청크가 차는 즉시 다음 단계로 넘길 수 있습니다.
+
+    Args:
+        pieces: 나눌 조각 목록
+        max_tokens: 청크당 최대 토큰 수 (헤더 포함)
+        header: 모든 청크 앞에 붙일 헤더
+
+    Yields:
+        청크
+    """
+    budget = max(1, max_tokens - estimate_tokens(header))
+    current: List[str] = []
+    current_tokens = 0
+
+    for piece in pieces:
+        tokens = estimate_tokens(piece)
+        if tokens > budget:
+            if current:
+                yield header + "".join(current)
+                current, current_tokens = [], 0
+            lines = piece.splitlines(keepends=True)
+            if len(lines) > 1:
+                yield from iter_token_chunks(lines, max_tokens, header)
+            else:
+                yield header + trim_text_to_tokens(piece, budget)
+            continue
+        if current and current_tokens + tokens > budget:
+            yield header + "".join(current)
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += tokens
+
+    if current:
+        yield header + "".join(current)
+
+
+def split_diff(diff: str, max_tokens: int = DEFAULT_CHUNK_TOKENS) -> List[str]:
+    """
+    unified diff를 토큰 예산 안의 청크로 분할
+
+    Args:
+        diff: unified diff 텍스트
+        max_tokens: 청크당 최대 토큰 수
+
+    Returns:
+        청크 목록 (작은 파일은 한 청크에 여러 개를 묶음)
+    """
+    if not diff or not diff.strip():
+        return []
+
+    pieces: List[str] = []
+    for file_diff in (part for part in _FILE_BOUNDARY.split(diff) if part):
+        if estimate_tokens(file_diff) <= max_tokens:
+            pieces.append(file_diff)
+            continue
+
+        # 큰 파일은 헝크 단위로 나누고 청크마다 파일 헤더를 반복
+        hunks = [part for part in _HUNK_BOUNDARY.split(file_diff) if part]
+        header = hunks.pop(0) if len(hunks) > 1 and not hunks[0].startswith("@@") else ""
+        if estimate_tokens(header) > max_tokens // 4:
+            header = trim_text_to_tokens(header, max_tokens // 4) + "\n"
+        pieces.extend(iter_token_chunks(hunks, max_tokens, header))
+
+    # 파일/헝크 조각을 다시 예산 안에서 묶음 (이미 예산 이하이므로 쪼개지지 않음)
+    return list(iter_token_chunks(pieces, max_tokens))
+
+
+class MapReduceSummarizer:
+    """청크 병렬 요약(map) + 요약 병합(reduce)"""
+
+    def __init__(self, summarize: SummarizeFunction, max_workers: int = DEFAULT_MAX_WORKERS,
+                 reduce_tokens: int = DEFAULT_CHUNK_TOKENS):
+        """
+        요약기 초기화
+
+        Args:
+            summarize: (텍스트, 단계)를 받아 요약을 돌려주는 함수 (LLM 호출)
+            max_workers: 동시에 실행할 최대 요약 호출 수
+            reduce_tokens: reduce 단계 한 번의 입력 최대 토큰 수
+        """
+        self.summarize = summarize
+        self.max_workers = max(1, int(max_workers))
+        self.reduce_tokens = max(1, int(reduce_tokens))
+        self._lock = threading.Lock()
+        self._stats = {"chunks": 0, "map_calls": 0, "reduce_calls": 0, "failed": 0, "reduce_levels": 0}
+
+    def _call(self, text: str, stage: str) -> Union[str, Dict[str, Any]]:
+        """요약 함수 호출 (예외는 오류 응답으로 변환)"""
+        with self._lock:
+            self._stats[f"{stage}_calls"] += 1
+        try:
+            result = self.summarize(text, stage)
+        except Exception as e:
+            logger.error(f"{stage} 요약 오류: {e}")
+            result = {"error": str(e)}
+        if isinstance(result, dict) and "error" in result:
+            with self._lock:
+                self._stats["failed"] += 1
+        return result
+
+    def _submit(self, executor: ThreadPoolExecutor, text: str, stage: str) -> Future:
+        """요약 호출 제출 (호출한 쪽 컨텍스트 변수(요청 모델 등)를 작업 스레드로 복사)"""
+        return executor.submit(contextvars.copy_context().run, self._call, text, stage)
+
+    def _collect(self, done: Iterable[Future], indexes: Dict[Future, int],
+                 summaries: Dict[int, str]) -> Generator[Dict[str, Any], None, None]:
+        """끝난 map 호출의 부분 요약 이벤트 생성"""
+        for future in sorted(done, key=indexes.get):
+            index = indexes.pop(future)
+            result = future.result()
+            if isinstance(result, dict):
+                yield {"type": "error", "index": index, "error": result.get("error", "요약 실패")}
+            else:
+                summaries[index] = result
+                yield {"type": "partial", "index": index, "summary": result}
+
+    def _reduce(self, executor: ThreadPoolExecutor, summaries: List[str]) -> Union[str, Dict[str, Any]]:
+        """부분 요약을 예산 안에 담길 때까지 묶음 단위로 병렬 요약한 뒤 최종 요약"""
+        while len(summaries) > 1 and estimate_tokens(_SEPARATOR.join(summaries)) > self.reduce_tokens:
+            groups = list(iter_token_chunks([summary + _SEPARATOR for summary in summaries], self.reduce_tokens))
+            if len(groups) >= len(summaries):
+                # 요약 하나하나가 예산에 가까워 더 줄일 수 없으면 잘라서 최종 요약
+                break
+            with self._lock:
+                self._stats["reduce_levels"] += 1
+            results = [future.result() for future in [self._submit(executor, group, "reduce") for group in groups]]
+            summaries = [result for result in results if not isinstance(result, dict)]
+            if not summaries:
+                return {"error": "요약 병합 실패"}
+
+        if len(summaries) == 1:
+            return summaries[0]
+        return self._call(trim_text_to_tokens(_SEPARATOR.join(summaries), self.reduce_tokens), "reduce")
+
+    def iter_summaries(self, chunks: Iterable[str]) -> Generator[Dict[str, Any], None, None]:
+        """
+        청크를 병렬 요약하며 이벤트 전달
+
+        chunks는 제너레이터여도 되며, 다음 청크를 기다리는 동안 이미 끝난 부분 요약을 먼저 넘겨줍니다.
+
+        Args:
+            chunks: 요약할 청크 목록
+
+        Yields:
+            {"type": "partial", "index": 청크 번호, "summary": 부분 요약}
+            {"type": "error", "index": 청크 번호, "error": 오류}
+            {"type": "final", "summary": 최종 요약, "chunks": 청크 수, "failed": 실패 청크 수}
+            (모든 청크가 실패하면 마지막 이벤트는 {"type": "final", "error": ...})
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="map-reduce")
+        indexes: Dict[Future, int] = {}
+        summaries: Dict[int, str] = {}
+        count = 0
+        try:
+            for chunk in chunks:
+                future = self._submit(executor, chunk, "map")
+                indexes[future] = count
+                count += 1
+
+                # 제출이 너무 앞서가지 않도록 실행 중인 요약이 작업자 수의 2배를 넘으면 하나가 끝날 때까지 대기
+                if len(indexes) >= self.max_workers * 2:
+                    wait(list(indexes), return_when=FIRST_COMPLETED)
+                yield from self._collect([f for f in list(indexes) if f.done()], indexes, summaries)
+
+            while indexes:
+                done, _ = wait(list(indexes), return_when=FIRST_COMPLETED)
+                yield from self._collect(done, indexes, summaries)
+
+            with self._lock:
+                self._stats["chunks"] += count
+
+            ordered = [summaries[index] for index in sorted(summaries)]
+            if not ordered:
+                yield {"type": "final", "error": "요약할 내용이 없거나 모든 청크 요약에 실패했습니다.", "chunks": count}
+                return
+
+            final = self._reduce(executor, ordered)
+            if isinstance(final, dict):
+                yield {"type": "final", "error": final.get("error", "요약 병합 실패"), "chunks": count}
+            else:
+                yield {"type": "final", "summary": final, "chunks": count, "failed": count - len(ordered)}
+        finally:
+            # 호출 측이 순회를 중단하면 아직 시작하지 않은 요약 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def summarize_all(self, chunks: Iterable[str]) -> Dict[str, Any]:
+        """모든 청크를 요약해 최종 이벤트만 반환"""
+        final: Dict[str, Any] = {"type": "final", "error": "요약 결과 없음"}
+        for event in self.iter_summaries(chunks):
+            if event["type"] == "final":
+                final = event
+        return final
+
+    def get_stats(self) -> Dict[str, Any]:
+        """청크/호출/실패 통계 반환"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["max_workers"] = self.max_workers
+        stats["reduce_tokens"] = self.reduce_tokens
+        return stats
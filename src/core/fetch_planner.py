@@ -0,0 +1,187 @@
+"""API 호출 실행 계획 모듈
+
+서로 의존 관계가 있는 여러 외부 API 호출을 작은 실행 계획(DAG)으로 구성하고,
+선행 호출이 끝난 단계부터 동시성 제한 안에서 병렬로 실행합니다.
+
+예) 이슈 상세 조회
+    issue ─┬─> related   (연관 이슈/하위 작업 N건 동시 조회)
+           └─> assignee  (담당자 프로필)
+    comments, transitions (이슈와 독립적으로 즉시 실행)
+
+단계는 고정 호출(endpoint 지정)이거나, 선행 단계 결과로 호출 명세를 만드는 build 함수입니다.
+build 함수는 단일 호출 명세 또는 {하위 이름: 호출 명세} (fan-out)를 반환할 수 있습니다.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Dict, Any, Optional, Callable, Awaitable, Iterable
+
+# 로거 설정
+logger = logging.getLogger("fetch_planner")
+
+# 단계 실행 함수 형식: (endpoint, method, data, params) -> 응답
+CallFunction = Callable[[str, str, Any, Optional[Dict[str, Any]]], Awaitable[Dict[str, Any]]]
+BuildFunction = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+class FetchStep:
+    """실행 계획의 단일 단계"""
+
+    def __init__(self, name: str, endpoint: Optional[str] = None, method: str = "GET",
+                 data: Any = None, params: Optional[Dict[str, Any]] = None,
+                 depends_on: Iterable[str] = (), build: Optional[BuildFunction] = None):
+        """
+        단계 초기화
+
+        Args:
+            name: 단계 이름 (결과 키)
+            endpoint: 고정 호출 엔드포인트 (build가 없을 때 사용)
+            method: HTTP 메서드
+            data: 요청 본문
+            params: URL 쿼리 파라미터
+            depends_on: 먼저 끝나야 하는 단계 이름 목록
+            build: 선행 단계 결과({이름: 응답})로 호출 명세를 만드는 함수 (None 또는 빈 딕셔너리면 건너뜀)
+        """
+        if endpoint is None and build is None:
+            raise ValueError(f"단계 '{name}'에 endpoint 또는 build가 필요합니다.")
+
+        self.name = name
+        self.spec = {"endpoint": endpoint, "method": method, "data": data, "params": params}
+        self.depends_on = list(depends_on)
+        self.build = build
+
+
+class FetchPlan:
+    """의존 관계를 고려한 API 호출 실행 계획"""
+
+    def __init__(self, max_concurrency: int = 8):
+        """
+        실행 계획 초기화
+
+        Args:
+            max_concurrency: 동시에 진행 중일 수 있는 최대 API 호출 수
+        """
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.steps: Dict[str, FetchStep] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "skipped": 0, "failed": 0, "in_flight": 0, "max_in_flight": 0}
+
+    def add(self, name: str, endpoint: Optional[str] = None, method: str = "GET",
+            data: Any = None, params: Optional[Dict[str, Any]] = None,
+            depends_on: Iterable[str] = (), build: Optional[BuildFunction] = None) -> "FetchPlan":
+        """
+        단계 추가
+
+        Args:
+            FetchStep과 동일
+
+        Returns:
+            실행 계획 (연쇄 호출용)
+        """
+        if name in self.steps:
+            raise ValueError(f"중복된 단계 이름: {name}")
+        self.steps[name] = FetchStep(name, endpoint, method, data, params, depends_on, build)
+        return self
+
+    def _validate(self):
+        """알 수 없는 의존 단계와 순환 의존 검사"""
+        for step in self.steps.values():
+            for dependency in step.depends_on:
+                if dependency not in self.steps:
+                    raise ValueError(f"단계 '{step.name}'의 의존 단계가 없습니다: {dependency}")
+
+        visiting, done = set(), set()
+
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"순환 의존 관계: {name}")
+            visiting.add(name)
+            for dependency in self.steps[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.steps:
+            visit(name)
+
+    async def _call(self, call: CallFunction, semaphore: asyncio.Semaphore, spec: Dict[str, Any]) -> Dict[str, Any]:
+        """동시성 제한 안에서 단일 API 호출 (예외는 오류 응답으로 변환)"""
+        async with semaphore:
+            with self._lock:
+                self._stats["calls"] += 1
+                self._stats["in_flight"] += 1
+                self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._stats["in_flight"])
+            try:
+                return await call(spec["endpoint"], spec.get("method", "GET"), spec.get("data"), spec.get("params"))
+            except Exception as e:
+                logger.error(f"API 호출 단계 오류: {spec.get('endpoint')} - {e}")
+                return {"error": str(e)}
+            finally:
+                with self._lock:
+                    self._stats["in_flight"] -= 1
+
+    async def _run_step(self, step: FetchStep, call: CallFunction, semaphore: asyncio.Semaphore,
+                        tasks: Dict[str, "asyncio.Task"]) -> Any:
+        """선행 단계를 기다린 뒤 단계 실행"""
+        dependencies = {name: await tasks[name] for name in step.depends_on}
+
+        failed = [name for name, result in dependencies.items() if isinstance(result, dict) and "error" in result]
+        if failed:
+            with self._lock:
+                self._stats["failed"] += 1
+            return {"error": f"선행 단계 실패: {', '.join(failed)}"}
+
+        if step.build is None:
+            return await self._call(call, semaphore, step.spec)
+
+        try:
+            specs = step.build(dependencies)
+        except Exception as e:
+            logger.error(f"단계 '{step.name}' 호출 명세 생성 오류: {e}")
+            with self._lock:
+                self._stats["failed"] += 1
+            return {"error": str(e)}
+
+        if not specs:
+            with self._lock:
+                self._stats["skipped"] += 1
+            return {}
+
+        if "endpoint" in specs:
+            return await self._call(call, semaphore, specs)
+
+        names = list(specs.keys())
+        responses = await asyncio.gather(*(self._call(call, semaphore, spec) for spec in specs.values()))
+        return dict(zip(names, responses))
+
+    async def execute(self, call: CallFunction) -> Dict[str, Any]:
+        """
+        실행 계획 실행
+
+        Args:
+            call: (endpoint, method, data, params)를 받는 비동기 API 호출 함수
+
+        Returns:
+            {단계 이름: 응답} (fan-out 단계는 {하위 이름: 응답}, 실패 단계는 {"error": ...})
+        """
+        self._validate()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # 모든 단계 태스크를 먼저 만든 뒤 각 단계가 선행 태스크를 기다림
+        tasks: Dict[str, "asyncio.Task"] = {}
+        for step in self.steps.values():
+            tasks[step.name] = asyncio.ensure_future(self._run_step(step, call, semaphore, tasks))
+
+        results = await asyncio.gather(*tasks.values())
+        return dict(zip(tasks.keys(), results))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """호출/건너뜀/실패 단계 수와 최대 동시 호출 수 반환"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["steps"] = len(self.steps)
+        stats["max_concurrency"] = self.max_concurrency
+        return stats
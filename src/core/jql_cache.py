@@ -0,0 +1,338 @@
+"""자연어 → JQL 변환 캐시 모듈
+
+Jira 이슈 검색은 매번 LLM을 한 번 호출해 사용자 문장을 JQL로 바꾸지만, 실제로는 같은 질문이 하루 종일 반복됩니다.
+이 모듈은 정규화한 자연어 쿼리를 키로 검증된 JQL을 저장해 두고, 같은 질문이 오면 LLM 호출 없이 JQL을 돌려줍니다.
+
+- 정규화: 유니코드 NFKC, 소문자화, 공백 정리, 끝 문장부호 제거
+- 날짜 표현: "이번 주", "어제", "last month" 등은 키에서 <this_week> 같은 토큰으로 바꾸고,
+  JQL 안의 해당 날짜 값은 $this_week_start 같은 파라미터로 저장해 조회 시점 날짜로 다시 채웁니다.
+  파라미터로 바꿀 수 없는 상대 시간 표현("지난 3일", "this sprint" 등)이 있는 쿼리는 캐시하지 않습니다.
+- LRU 제거, 적중률 통계, JSON 파일 영속화 (JQL_CACHE_PATH, 빈 값이면 메모리 전용)
+"""
+
+import os
+import re
+import json
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from string import Template
+from typing import Dict, Any, List, Optional, Tuple, Callable
+
+from src.core.metrics import metrics, cache_families
+
+# 로거 설정
+logger = logging.getLogger("jql_cache")
+
+# 기본 캐시 파일 경로
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "jql_cache.json"
+)
+
+# 최대 캐시 항목 수
+DEFAULT_MAX_ENTRIES = int(os.environ.get("JQL_CACHE_MAX_ENTRIES", "512"))
+
+
+def _week_start(today: date) -> date:
+    """해당 주 월요일"""
+    return today - timedelta(days=today.weekday())
+
+
+def _month_start(today: date) -> date:
+    """해당 월 1일"""
+    return today.replace(day=1)
+
+
+def _previous_month_start(today: date) -> date:
+    """전월 1일"""
+    return (_month_start(today) - timedelta(days=1)).replace(day=1)
+
+
+# 날짜 표현: (이름, 패턴, 날짜 범위 계산 함수(오늘) -> (시작일, 종료일(미포함)))
+DATE_PHRASES: List[Tuple[str, "re.Pattern", Callable[[date], Tuple[date, date]]]] = [
+    ("today", re.compile(r"오늘|금일|\btoday\b"),
+     lambda d: (d, d + timedelta(days=1))),
+    ("yesterday", re.compile(r"어제|전일|\byesterday\b"),
+     lambda d: (d - timedelta(days=1), d)),
+    ("this_week", re.compile(r"이번\s*주|금주|\bthis\s+week\b"),
+     lambda d: (_week_start(d), _week_start(d) + timedelta(days=7))),
+    ("last_week", re.compile(r"지난\s*주|저번\s*주|전주|\blast\s+week\b"),
+     lambda d: (_week_start(d) - timedelta(days=7), _week_start(d))),
+    ("this_month", re.compile(r"이번\s*달|이번\s*월|금월|\bthis\s+month\b"),
+     lambda d: (_month_start(d), (_month_start(d) + timedelta(days=32)).replace(day=1))),
+    ("last_month", re.compile(r"지난\s*달|지난\s*월|저번\s*달|전월|\blast\s+month\b"),
+     lambda d: (_previous_month_start(d), _month_start(d))),
+]
+
+# DATE_PHRASES로 파라미터화하지 못하는 상대 시간 표현 ("지난 3일", "최근", "this sprint" 등)
+# 같은 문장이라도 묻는 시점마다 다른 JQL이 되므로 캐시하지 않음
+RELATIVE_TIME = re.compile(
+    r"지난\s*\d+|최근|\d+\s*(?:분|시간|일|주|개월|달|년)\s*(?:전|이내|동안|간)|"
+    r"(?:이번|지난|저번|현재|다음)\s*(?:스프린트|분기|해|주|달|월)|올해|금년|작년|내일|모레|그제|그저께|"
+    r"\b(?:last|past|previous|next)\s+\d+\b|\b\d+\s+(?:minutes?|hours?|days?|weeks?|months?|years?)\s+ago\b|"
+    r"\brecent(?:ly)?\b|\b(?:this|last|current|next|previous)\s+(?:sprint|quarter|year|week|month)\b|\btomorrow\b"
+)
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.。？！~]+$")
+_ISO_DATE = re.compile(r"\d{4}[-/]\d{1,2}[-/]\d{1,2}")
+
+
+def normalize_query(query: str, today: Optional[date] = None) -> Tuple[str, Dict[str, str]]:
+    """
+    자연어 쿼리 정규화
+
+    Args:
+        query: 자연어 쿼리
+        today: 기준 날짜 (기본값: 오늘)
+
+    Returns:
+        (캐시 키, 날짜 파라미터 {"this_week_start": "2024-05-13", ...})
+    """
+    today = today or date.today()
+    text = unicodedata.normalize("NFKC", query).lower()
+    text = _WHITESPACE.sub(" ", text).strip()
+    text = _TRAILING_PUNCTUATION.sub("", text)
+
+    params: Dict[str, str] = {}
+    for name, pattern, date_range in DATE_PHRASES:
+        if pattern.search(text):
+            text = pattern.sub(f"<{name}>", text)
+            start, end = date_range(today)
+            params[f"{name}_start"] = start.isoformat()
+            params[f"{name}_end"] = end.isoformat()
+
+    return text, params
+
+
+def is_cacheable(key: str) -> bool:
+    """
+    정규화한 쿼리 키의 캐시 가능 여부
+
+    Args:
+        key: normalize_query가 만든 캐시 키 (DATE_PHRASES 표현은 토큰으로 바뀐 상태)
+
+    Returns:
+        파라미터화하지 못한 상대 시간 표현이 없으면 True
+    """
+    return RELATIVE_TIME.search(key) is None
+
+
+def validate_jql(jql: str) -> bool:
+    """
+    캐시에 저장할 수 있는 JQL인지 간단히 검증 (따옴표/괄호 짝, 조건식 존재)
+
+    Args:
+        jql: JQL 문자열
+
+    Returns:
+        검증 통과 여부
+    """
+    if not jql or not jql.strip() or len(jql) > 2000:
+        return False
+    if jql.count('"') % 2 or jql.count("'") % 2:
+        return False
+
+    depth = 0
+    for char in jql:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                return False
+    if depth:
+        return False
+
+    return bool(re.search(r"[=~<>]|\b(?:in|is|was|changed)\b|\border\s+by\b", jql, re.IGNORECASE))
+
+
+def _to_template(jql: str, params: Dict[str, str]) -> str:
+    """JQL 안의 날짜 값을 $파라미터로 바꾼 템플릿 생성"""
+    template = jql.replace("$", "$$")
+    # 같은 날짜를 여러 파라미터가 가리키면 먼저 나온 파라미터로 치환
+    for name, value in params.items():
+        template = re.sub(rf"(?<![\d-]){re.escape(value)}(?![\d-])", f"${{{name}}}", template)
+    return template
+
+
+class JQLCache:
+    """자연어 쿼리 → JQL LRU 캐시"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, path: Optional[str] = DEFAULT_CACHE_PATH):
+        """
+        JQL 캐시 초기화
+
+        Args:
+            max_entries: 최대 캐시 항목 수
+            path: 캐시 영속화 JSON 파일 경로 (None 또는 빈 값이면 메모리 전용)
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.path = path or None
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "rejected": 0, "evictions": 0, "invalidations": 0}
+        self._load()
+
+    def _load(self):
+        """캐시 파일 로드"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f).get("entries", [])
+            for entry in entries[-self.max_entries:]:
+                self._entries[entry["key"]] = entry
+            logger.info(f"JQL 캐시 로드: {len(self._entries)}개 ({self.path})")
+        except Exception as e:
+            logger.error(f"JQL 캐시 파일 로드 오류: {e}")
+
+    def _save(self):
+        """캐시 파일 저장 (임시 파일에 쓴 뒤 교체, 호출 측이 잠금 보유)"""
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"entries": list(self._entries.values())}, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.error(f"JQL 캐시 파일 저장 오류: {e}")
+
+    def lookup(self, query: str, today: Optional[date] = None) -> Optional[str]:
+        """
+        캐시된 JQL 조회
+
+        Args:
+            query: 자연어 쿼리
+            today: 기준 날짜 (날짜 파라미터 계산용)
+
+        Returns:
+            조회 시점 날짜가 채워진 JQL (없으면 None)
+        """
+        key, params = normalize_query(query, today)
+        with self._lock:
+            entry = self._entries.get(key) if is_cacheable(key) else None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            entry["hits"] = entry.get("hits", 0) + 1
+            entry["last_used"] = datetime.now().isoformat(timespec="seconds")
+            self._stats["hits"] += 1
+            template = entry["template"]
+
+        return Template(template).safe_substitute(params)
+
+    def store(self, query: str, jql: str, today: Optional[date] = None) -> bool:
+        """
+        검증된 JQL 저장
+
+        Args:
+            query: 자연어 쿼리
+            jql: 쿼리를 변환한 JQL (검색이 성공한 JQL)
+            today: 기준 날짜 (날짜 값 → 파라미터 치환용)
+
+        Returns:
+            저장 여부 (검증 실패 시 False)
+        """
+        if not validate_jql(jql):
+            with self._lock:
+                self._stats["rejected"] += 1
+            logger.debug(f"JQL 캐시 저장 거부 (검증 실패): {jql}")
+            return False
+
+        key, params = normalize_query(query, today)
+        if not is_cacheable(key):
+            with self._lock:
+                self._stats["rejected"] += 1
+            logger.debug(f"JQL 캐시 저장 거부 (상대 시간 표현): {query}")
+            return False
+
+        template = _to_template(jql, params)
+
+        # 상대 날짜 질문인데 파라미터로 바꾸지 못한 날짜 값이 남으면 다음 날 잘못된 결과가 되므로 저장하지 않음
+        if params and _ISO_DATE.search(template):
+            with self._lock:
+                self._stats["rejected"] += 1
+            logger.debug(f"JQL 캐시 저장 거부 (고정 날짜 포함): {jql}")
+            return False
+
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            self._entries[key] = {
+                "key": key,
+                "template": template,
+                "example_query": query,
+                "hits": 0,
+                "created": now,
+                "last_used": now
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+            self._stats["stores"] += 1
+            self._save()
+        return True
+
+    def invalidate(self, query: str) -> bool:
+        """
+        쿼리의 캐시 항목 제거 (캐시된 JQL로 검색이 실패한 경우)
+
+        Args:
+            query: 자연어 쿼리
+
+        Returns:
+            제거 여부
+        """
+        return self.purge(normalize_query(query)[0], invalidation=True) > 0
+
+    def purge(self, key: Optional[str] = None, invalidation: bool = False) -> int:
+        """
+        캐시 항목 삭제
+
+        Args:
+            key: 삭제할 캐시 키 (None이면 전체 삭제)
+            invalidation: 통계에 무효화로 기록할지 여부
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            if key is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                removed = 1 if self._entries.pop(key, None) is not None else 0
+            if invalidation:
+                self._stats["invalidations"] += removed
+            if removed:
+                self._save()
+        return removed
+
+    def list_entries(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """최근 사용 순 캐시 항목 목록 반환"""
+        with self._lock:
+            entries = list(self._entries.values())
+        return [dict(entry) for entry in reversed(entries[-limit:])] if limit > 0 else []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중률 및 캐시 통계 반환"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["lookups"] = lookups
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["max_entries"] = self.max_entries
+        stats["persistent"] = self.path is not None
+        return stats
+
+
+# 싱글톤 인스턴스
+jql_cache = JQLCache(path=os.environ.get("JQL_CACHE_PATH", DEFAULT_CACHE_PATH))
+metrics.add_collector("jql_cache", lambda: cache_families("jql", jql_cache._stats["hits"], jql_cache._stats["misses"]))
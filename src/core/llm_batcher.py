@@ -0,0 +1,201 @@
+"""LLM 마이크로 배처 모듈
+
+짧은 시간 동안 들어온 LLM 요청을 모아 하나의 배치 호출로 전송하고,
+응답을 요청별로 다시 분배하는 기능을 제공합니다.
+배치 추론을 지원하는 내부 LLM 서버에서 분류형 짧은 프롬프트의 처리량을 높이기 위해 사용합니다.
+"""
+
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, List, Callable, Optional
+
+# 로거 설정
+logger = logging.getLogger("llm_batcher")
+
+# 기본 배치 설정
+DEFAULT_MAX_BATCH_SIZE = 8
+DEFAULT_MAX_WAIT_MS = 5
+DEFAULT_MAX_INFLIGHT = 2
+
+
+class BatcherClosedError(RuntimeError):
+    """종료된 마이크로 배처에 요청을 제출한 경우"""
+
+
+class MicroBatcher:
+    """LLM 요청 마이크로 배처 클래스
+
+    submit()으로 들어온 요청을 최대 max_wait_ms 동안 또는 max_batch_size개가 찰 때까지 모은 뒤
+    send_batch 함수로 한 번에 전송합니다. send_batch는 요청 목록과 같은 순서의 응답 목록을 반환해야 합니다.
+    """
+
+    def __init__(self, send_batch: Callable[[List[Any]], List[Any]],
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+                 max_inflight: int = DEFAULT_MAX_INFLIGHT,
+                 name: str = "default"):
+        """
+        마이크로 배처 초기화
+
+        Args:
+            send_batch: 요청 목록을 받아 같은 순서의 응답 목록을 반환하는 함수
+            max_batch_size: 최대 배치 크기
+            max_wait_ms: 첫 요청 이후 추가 요청을 기다리는 최대 시간 (밀리초)
+            max_inflight: 동시에 전송 중일 수 있는 최대 배치 수
+            name: 배처 이름 (로깅용)
+        """
+        self.send_batch = send_batch
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.name = name
+
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._closed = False
+        self._stats_lock = threading.Lock()
+        self._stats = {"requests": 0, "batches": 0, "max_batch_size": 0, "errors": 0, "cancelled": 0}
+
+        # 배치 전송 스레드 풀 (수집 스레드는 전송을 기다리지 않고 다음 배치를 수집)
+        self._inflight = threading.BoundedSemaphore(max(1, int(max_inflight)))
+        self._sender = ThreadPoolExecutor(max_workers=max(1, int(max_inflight)),
+                                          thread_name_prefix=f"llm-batch-send-{name}")
+
+        self._worker = threading.Thread(target=self._run, name=f"llm-batcher-{name}", daemon=True)
+        self._worker.start()
+
+        logger.info(f"마이크로 배처 시작: {name} (최대 배치 {self.max_batch_size}, 대기 {max_wait_ms}ms)")
+
+    def submit(self, request: Any, timeout: Optional[float] = None) -> Any:
+        """
+        요청 제출 후 응답 대기
+
+        제한 시간 안에 응답이 없으면 요청을 취소하므로, 아직 전송되지 않은 요청은 배치에서 빠집니다.
+
+        Args:
+            request: 배치에 포함할 요청
+            timeout: 응답 대기 제한 시간 (초)
+
+        Returns:
+            해당 요청의 응답
+
+        Raises:
+            concurrent.futures.TimeoutError: 제한 시간 안에 응답이 없는 경우
+        """
+        future = self.submit_async(request)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def submit_async(self, request: Any) -> Future:
+        """
+        요청 제출 (응답을 기다리지 않음)
+
+        Args:
+            request: 배치에 포함할 요청
+
+        Returns:
+            응답을 받을 Future 객체
+
+        Raises:
+            BatcherClosedError: 배처가 종료된 경우
+        """
+        if self._closed:
+            raise BatcherClosedError(f"마이크로 배처가 종료되었습니다: {self.name}")
+
+        future: Future = Future()
+        self._queue.put((request, future))
+        return future
+
+    def close(self):
+        """배처 종료 (대기 중인 요청은 모두 처리한 뒤 종료)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join(timeout=5)
+        self._sender.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """배치 통계 반환"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["avg_batch_size"] = round(stats["requests"] / stats["batches"], 2) if stats["batches"] else 0.0
+        stats["queue_depth"] = self._queue.qsize()
+        return stats
+
+    def _collect(self, first: tuple) -> List[tuple]:
+        """첫 요청 이후 대기 시간 또는 최대 배치 크기까지 요청 수집"""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is None:
+                # 종료 신호는 현재 배치 처리 후 다시 처리하도록 되돌려 놓음
+                self._queue.put(None)
+                break
+            batch.append(item)
+
+        return batch
+
+    def _run(self):
+        """배치 수집 및 전송 루프"""
+        while True:
+            first = self._queue.get()
+            if first is None:
+                # 남은 요청이 있으면 모두 처리한 뒤 종료
+                if self._queue.empty():
+                    break
+                self._queue.put(None)
+                continue
+
+            # 전송 슬롯이 빌 때까지 대기하는 동안 들어온 요청도 다음 배치에 포함됨
+            self._inflight.acquire()
+            batch = self._collect(first)
+
+            with self._stats_lock:
+                self._stats["requests"] += len(batch)
+                self._stats["batches"] += 1
+                self._stats["max_batch_size"] = max(self._stats["max_batch_size"], len(batch))
+
+            self._sender.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch: List[tuple]):
+        """배치 전송 및 응답 역다중화 (대기 중에 취소된 요청은 보내지 않음)"""
+        pending = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        requests_ = [item[0] for item in pending]
+        futures = [item[1] for item in pending]
+
+        try:
+            if len(pending) < len(batch):
+                with self._stats_lock:
+                    self._stats["cancelled"] += len(batch) - len(pending)
+            if not pending:
+                return
+
+            responses = self.send_batch(requests_)
+            if len(responses) != len(requests_):
+                raise ValueError(f"배치 응답 수 불일치: 요청 {len(requests_)}개, 응답 {len(responses)}개")
+
+            for future, response in zip(futures, responses):
+                future.set_result(response)
+
+        except Exception as e:
+            logger.error(f"마이크로 배치 전송 오류 ({self.name}): {e}")
+            with self._stats_lock:
+                self._stats["errors"] += 1
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+
+        finally:
+            self._inflight.release()
@@ -7,24 +7,105 @@ import os
 import json
 import time
 import logging
-import requests
-from typing import Dict, List, Any, Optional, Union, Generator
+import threading
+from typing import Dict, List, Any, Optional, Union, Generator, Tuple
 
 from src.core.config import get_settings, get_model_config, get_available_models, get_default_model, set_default_model
+from src.core.token_budget import (
+    estimate_tokens, estimate_messages_tokens, trim_text_to_tokens, fit_messages_to_budget, prompt_token_budget,
+    token_usage_tracker, MESSAGE_OVERHEAD_TOKENS
+)
+from src.core.prompt_templates import apply_cache_hints
+from src.core.llm_batcher import MicroBatcher, BatcherClosedError, DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS, DEFAULT_MAX_INFLIGHT
+from src.core.model_clients import ModelClient, ModelClientRegistry, make_model_client, get_requested_model
+from src.core.response_cache import response_cache
+from src.core.metrics import metrics, MetricFamily, llm_request_seconds, llm_ttft_seconds
+from src.core import tracing
 
 # 로거 설정
 logger = logging.getLogger("llm_service")
 
+# Mock 스트리밍 청크 간 지연 (벤치마크에서는 0으로 두어 응답 시간 왜곡 방지)
+MOCK_STREAM_CHUNK_DELAY = float(os.environ.get("LLM_MOCK_CHUNK_DELAY_MS", "100")) / 1000.0
+
 class LLMService:
     """LLM 서비스 클래스"""
     
     def __init__(self):
         """LLM 서비스 초기화"""
-        self.settings = get_settings()
-        self.current_model = get_default_model()
-        self.model_config = get_model_config(self.current_model)
+        # 모델/엔드포인트별 마이크로 배처와 배처를 만든 클라이언트 (batching.enabled 모델에서만 생성)
+        self._batchers: Dict[str, Tuple[ModelClient, MicroBatcher]] = {}
+        self._batchers_lock = threading.Lock()
+        
+        # 모델별 불변 클라이언트 (요청별 모델 선택 시 전역 상태를 바꾸지 않고 조회)
+        self._clients = ModelClientRegistry()
+        self.refresh_clients()
+        self._default_model = get_default_model()
         self.available_providers = self._get_available_providers()
-        self.model_id = self.model_config.get("id", "")
+    
+    def refresh_clients(self) -> None:
+        """사용 가능한 모델 설정으로 모델 클라이언트 레지스트리 다시 생성 (이전 클라이언트의 배처는 종료)"""
+        self._clients.build({model_key: get_model_config(model_key) for model_key in get_available_models()})
+        with self._batchers_lock:
+            batchers = [batcher for _, batcher in self._batchers.values()]
+            self._batchers = {}
+        # 대기 중인 요청은 이전 클라이언트 설정으로 마저 전송한 뒤 종료
+        for batcher in batchers:
+            batcher.close()
+    
+    def get_client_stats(self) -> Dict[str, Any]:
+        """모델 클라이언트 레지스트리 통계 (기본 모델 포함)"""
+        stats = self._clients.get_stats()
+        stats["default_model"] = self._default_model
+        return stats
+    
+    def has_model(self, model_key: str) -> bool:
+        """모델 클라이언트 존재 여부"""
+        return model_key in self._clients
+    
+    def get_client(self, model_key: Optional[str] = None) -> ModelClient:
+        """
+        모델 클라이언트 반환
+        
+        모델 키를 지정하지 않으면 요청이 고른 모델(use_model), 그것도 없으면 기본 모델을 사용합니다.
+        
+        Args:
+            model_key: 모델 키
+            
+        Returns:
+            모델 클라이언트
+            
+        Raises:
+            ValueError: 요청한 모델이 없는 경우
+        """
+        model_key = model_key or get_requested_model() or self._default_model
+        client = self._clients.get(model_key)
+        if client is not None:
+            return client
+        if model_key != self._default_model:
+            raise ValueError(f"사용할 수 없는 모델: {model_key}")
+        # 기본 모델 설정이 목록에 없어도 기존처럼 빈 설정으로 동작 (Mock 모드)
+        return make_model_client(model_key, get_model_config(model_key), self._clients.http)
+    
+    @property
+    def settings(self):
+        """현재 설정 스냅샷 (다시 로드되면 새 스냅샷)"""
+        return get_settings()
+    
+    @property
+    def current_model(self) -> str:
+        """현재 모델 키 (요청이 고른 모델 우선)"""
+        return self.get_client().key
+    
+    @property
+    def model_config(self) -> Dict[str, Any]:
+        """현재 모델 설정 (요청이 고른 모델 우선)"""
+        return self.get_client().config
+    
+    @property
+    def model_id(self) -> str:
+        """현재 모델 ID (요청이 고른 모델 우선)"""
+        return self.get_client().model_id
     
     def _get_available_providers(self) -> List[str]:
         """사용 가능한 LLM 프로바이더 목록 반환"""
@@ -60,22 +141,23 @@ class LLMService:
         return self.current_model
     
     def change_model(self, model_key: str) -> bool:
-        """사용 모델 변경"""
+        """기본 모델 변경 (요청별로 모델을 고른 요청에는 영향 없음)"""
         available_models = get_available_models()
         
         if model_key not in available_models:
             logger.error(f"사용할 수 없는 모델: {model_key}")
             return False
         
-        # 모델 설정 변경
-        self.current_model = model_key
-        self.model_config = get_model_config(model_key)
-        self.model_id = self.model_config.get("id", "")
+        # 기본 모델 키만 교체 (클라이언트는 미리 만든 불변 값이므로 읽는 쪽이 섞인 값을 보지 않음)
+        self._default_model = model_key
         
         # 기본 모델 설정 업데이트
         set_default_model(model_key)
         
-        logger.info(f"모델 변경 완료: {model_key} ({self.model_config.get('name')})")
+        # 모델 정보가 들어 있는 /health, /models 응답 무효화
+        response_cache.invalidate(f"change_model:{model_key}")
+        
+        logger.info(f"모델 변경 완료: {model_key} ({self.get_client(model_key).config.get('name')})")
         return True
     
     def format_system_message(self, content: str) -> Dict[str, str]:
@@ -90,27 +172,130 @@ class LLMService:
         """어시스턴트 메시지 형식화"""
         return {"role": "assistant", "content": content}
     
-    def generate(self, messages: List[Dict[str, str]], stream: bool = False) -> Union[str, Generator[str, None, None]]:
-        """메시지 생성"""
+    def is_mock_mode(self) -> bool:
+        """API 키가 없거나 mock 값이어서 가짜 응답을 반환하는지 여부"""
+        return self.get_client().is_mock
+    
+    def get_prompt_token_budget(self, client: Optional[ModelClient] = None) -> int:
+        """현재 모델의 프롬프트 토큰 예산 반환
+        
+        모델 설정에 maxPromptTokens가 있으면 우선 사용하고, 없으면 컨텍스트 윈도(contextWindow)에서
+        완료 토큰 상한(maxTokens)을 뺀 값을 사용합니다.
+        """
+        return prompt_token_budget((client or self.get_client()).config)
+    
+    def fit_context(self, context: str, reserved_text: str = "") -> str:
+        """
+        프롬프트 고정 부분을 제외한 남은 토큰 예산에 맞게 컨텍스트 축소
+        
+        Args:
+            context: 축소 대상 컨텍스트 (스키마, 검색 결과, 이전 에이전트 결과 등)
+            reserved_text: 컨텍스트를 제외한 프롬프트 나머지 부분
+            
+        Returns:
+            예산에 맞게 잘린 컨텍스트
+        """
+        # 시스템(접두부) + 사용자(접미부) 두 메시지 기준 오버헤드 예약
+        available = self.get_prompt_token_budget() - estimate_tokens(reserved_text) - 2 * MESSAGE_OVERHEAD_TOKENS
+        fitted = trim_text_to_tokens(context, max(available, 0))
+        if fitted != context:
+            logger.info(f"컨텍스트 축소: {estimate_tokens(context)} -> {estimate_tokens(fitted)} 토큰")
+        return fitted
+    
+    def _apply_prompt_budget(self, messages: List[Dict[str, str]], client: ModelClient) -> List[Dict[str, str]]:
+        """요청 전 프롬프트가 토큰 예산을 넘지 않도록 메시지 축소"""
+        fitted = fit_messages_to_budget(messages, self.get_prompt_token_budget(client))
+        if fitted is not messages:
+            token_usage_tracker.record_trim()
+        return fitted
+    
+    def _supports_cache_control(self, model_config: Dict[str, Any]) -> bool:
+        """프롬프트 캐시 힌트(cache_control) 지원 여부
+        
+        모델 설정의 cacheControl 값을 우선 사용하고, 없으면 OpenRouter의 Anthropic 모델만 지원으로 판단합니다.
+        """
+        if "cacheControl" in model_config:
+            return bool(model_config["cacheControl"])
+        return model_config.get("provider") == "openrouter" and model_config.get("id", "").startswith("anthropic/")
+    
+    def _record_usage(self, client: ModelClient, agent_type: str, endpoint: str, messages: List[Dict[str, str]],
+                      completion: str, usage: Optional[Dict[str, Any]] = None):
+        """
+        토큰 사용량 기록
+        
+        프로바이더가 usage를 보고한 경우 그 값을 사용하고, 없으면 추정치를 기록합니다.
+        
+        Args:
+            client: 호출한 모델 클라이언트
+            agent_type: 호출한 에이전트 유형
+            endpoint: 호출 엔드포인트
+            messages: 요청 메시지
+            completion: 생성된 응답
+            usage: 프로바이더 보고 사용량
+        """
+        try:
+            if usage and "prompt_tokens" in usage:
+                prompt_tokens = int(usage.get("prompt_tokens") or 0)
+                completion_tokens = int(usage.get("completion_tokens") or 0)
+                estimated = False
+            else:
+                prompt_tokens = estimate_messages_tokens(messages)
+                completion_tokens = estimate_tokens(completion)
+                estimated = True
+            
+            token_usage_tracker.record(agent_type, client.key, endpoint,
+                                       prompt_tokens, completion_tokens, estimated)
+        except Exception as e:
+            logger.warning(f"토큰 사용량 기록 오류: {e}")
+    
+    def generate(self, messages: List[Dict[str, str]], stream: bool = False,
+                 agent_type: str = "direct", model: Optional[str] = None) -> Union[str, Generator[str, None, None]]:
+        """메시지 생성
+        
+        모델 클라이언트는 호출 시점에 한 번만 정하므로, 스트리밍 도중 기본 모델이 바뀌어도
+        같은 모델로 끝까지 응답합니다.
+        
+        Args:
+            messages: 채팅 메시지 목록
+            stream: 스트리밍 여부
+            agent_type: 호출한 에이전트 유형 (토큰 사용량 집계용)
+            model: 사용할 모델 키 (None이면 요청이 고른 모델 또는 기본 모델)
+        """
+        client = self.get_client(model)
+        messages = self._apply_prompt_budget(messages, client)
+        
+        # 호출한 에이전트 유형별 단계(llm.router, llm.langgraph 등)로 추적
+        stage = f"llm.{agent_type}"
         if stream:
-            return self._generate_stream(messages)
-        else:
-            return self._generate_sync(messages)
+            current = tracing.start_span("llm.generate", stage, model=client.key, mode="stream", mock=client.is_mock)
+            return tracing.trace_stream(self._generate_stream(messages, client, agent_type), current)
+        
+        with tracing.span("llm.generate", stage, model=client.key, mode="sync", mock=client.is_mock) as current:
+            result = self._generate_sync(messages, client, agent_type)
+            if current is not None and isinstance(result, dict) and "error" in result:
+                current.set_error(result["error"])
+            return result
     
-    def _generate_sync(self, messages: List[Dict[str, str]]) -> Union[str, Dict[str, str]]:
+    def _generate_sync(self, messages: List[Dict[str, str]], client: ModelClient,
+                       agent_type: str = "direct") -> Union[str, Dict[str, str]]:
         """동기 방식 메시지 생성"""
         # API 키가 mock, empty 또는 비어 있으면 가짜 응답 반환
-        api_key = self.model_config.get("apiKey", "")
-        if not api_key or api_key.startswith("mock_") or api_key == "your-api-key":
-            logger.info(f"MOCK 모드로 {self.model_config.get('provider')} LLM 호출 (API 키 미설정)")
-            return self._generate_mock_response(messages)
+        if client.is_mock:
+            logger.info(f"MOCK 모드로 {client.config.get('provider')} LLM 호출 (API 키 미설정)")
+            response = self._generate_mock_response(messages)
+            self._record_usage(client, agent_type, "mock", messages, response)
+            return response
             
         # 모델 정보 가져오기
-        model_name = self.model_config.get("name", self.current_model)
+        model_name = client.config.get("name", client.key)
         
+        start = time.perf_counter()
         try:
-            return self._call_llm_service(messages)
+            content = self._call_llm_service(messages, client, agent_type)
+            llm_request_seconds.observe(time.perf_counter() - start, client.key, "sync", "success")
+            return content
         except Exception as e:
+            llm_request_seconds.observe(time.perf_counter() - start, client.key, "sync", "error")
             error_msg = f"{model_name} 모델 호출 실패: {str(e)}"
             logger.warning(error_msg)
             
@@ -143,27 +328,45 @@ class LLMService:
         else:
             return f"죄송합니다만, '{user_message}'에 대한 정보를 찾을 수 없습니다. 다른 질문을 해주시겠어요?"
     
-    def _generate_stream(self, messages: List[Dict[str, str]]) -> Generator[str, None, None]:
+    def _generate_stream(self, messages: List[Dict[str, str]], client: ModelClient,
+                         agent_type: str = "direct") -> Generator[str, None, None]:
         """스트리밍 방식 메시지 생성"""
         # API 키가 mock, empty 또는 비어 있으면 가짜 응답 반환
-        api_key = self.model_config.get("apiKey", "")
-        if not api_key or api_key.startswith("mock_") or api_key == "your-api-key":
-            logger.info(f"MOCK 모드로 {self.model_config.get('provider')} LLM 스트리밍 호출 (API 키 미설정)")
-            yield from self._generate_mock_stream(messages)
+        if client.is_mock:
+            logger.info(f"MOCK 모드로 {client.config.get('provider')} LLM 스트리밍 호출 (API 키 미설정)")
+            chunks = []
+            for chunk in self._generate_mock_stream(messages):
+                chunks.append(chunk)
+                yield chunk
+            self._record_usage(client, agent_type, "mock", messages, "".join(chunks))
             return
             
         # 모델 정보 가져오기
-        model_name = self.model_config.get("name", self.current_model)
+        model_name = client.config.get("name", client.key)
         
+        start = time.perf_counter()
+        status = "success"
+        first_token = True
         try:
-            yield from self._call_llm_service_stream(messages)
+            for chunk in self._call_llm_service_stream(messages, client, agent_type):
+                if first_token:
+                    llm_ttft_seconds.observe(time.perf_counter() - start, client.key)
+                    first_token = False
+                yield chunk
             return
+        except GeneratorExit:
+            # 클라이언트 연결 종료 등으로 스트리밍 중단
+            status = "cancelled"
+            raise
         except Exception as e:
+            status = "error"
             error_msg = f"{model_name} 모델 스트리밍 호출 실패: {str(e)}"
             logger.warning(error_msg)
             
             # 오류 반환
             yield f"오류: {error_msg}"
+        finally:
+            llm_request_seconds.observe(time.perf_counter() - start, client.key, "stream", status)
         
     def _generate_mock_stream(self, messages: List[Dict[str, str]]) -> Generator[str, None, None]:
         """목(Mock) 스트리밍 응답 생성
@@ -202,7 +405,8 @@ class LLMService:
             
         # 각 청크마다 약간의 지연 추가하여 스트리밍처럼 보이게 함
         for chunk in chunks:
-            time.sleep(0.1)  # 100ms 지연
+            if MOCK_STREAM_CHUNK_DELAY:
+                time.sleep(MOCK_STREAM_CHUNK_DELAY)
             yield chunk
     
     def _get_provider_model(self, provider: str) -> Optional[str]:
@@ -210,50 +414,102 @@ class LLMService:
         # 더 이상 사용하지 않는 함수지만 호환성을 위해 유지
         return None
     
-    def _call_llm_service(self, messages: List[Dict[str, str]]) -> str:
+    def _call_llm_service(self, messages: List[Dict[str, str]], client: ModelClient, agent_type: str = "direct") -> str:
         """LLM 서비스 호출"""
-        endpoint = self.model_config.get("endpoint", "")
-        if not endpoint:
+        if not client.endpoint:
             raise Exception("LLM 엔드포인트가 설정되지 않았습니다")
         
-        # 프로바이더에 따라 적절한 호출 메서드 선택
-        provider = self.model_config.get("provider", "")
+        # 프로바이더에 따라 적절한 호출 메서드 선택 (호출이 끝날 때까지 연결 풀을 빌려 씀)
+        provider = client.config.get("provider", "")
         
-        if provider == "openrouter":
-            return self._call_openrouter(messages, self.model_config)
-        else:
-            return self._call_standard_llm(messages, self.model_config)
+        with self._clients.lease(client):
+            if provider == "openrouter":
+                return self._call_openrouter(messages, client, agent_type)
+            else:
+                return self._call_standard_llm(messages, client, agent_type)
     
-    def _call_llm_service_stream(self, messages: List[Dict[str, str]]) -> Generator[str, None, None]:
+    def _call_llm_service_stream(self, messages: List[Dict[str, str]], client: ModelClient,
+                                 agent_type: str = "direct") -> Generator[str, None, None]:
         """LLM 서비스 스트리밍 호출"""
-        endpoint = self.model_config.get("endpoint", "")
-        if not endpoint:
+        if not client.endpoint:
             raise Exception("LLM 엔드포인트가 설정되지 않았습니다")
         
-        # 프로바이더에 따라 적절한 호출 메서드 선택
-        provider = self.model_config.get("provider", "")
+        # 프로바이더에 따라 적절한 호출 메서드 선택 (마지막 청크까지 연결 풀을 빌려 씀)
+        provider = client.config.get("provider", "")
         
-        if provider == "openrouter":
-            yield from self._call_openrouter_stream(messages, self.model_config)
-        else:
-            yield from self._call_standard_llm_stream(messages, self.model_config)
+        with self._clients.lease(client):
+            if provider == "openrouter":
+                yield from self._call_openrouter_stream(messages, client, agent_type)
+            else:
+                yield from self._call_standard_llm_stream(messages, client, agent_type)
     
-    def _call_standard_llm(self, messages: List[Dict[str, str]], model_config: Dict[str, Any]) -> str:
+    def _call_standard_llm(self, messages: List[Dict[str, str]], client: ModelClient, agent_type: str = "direct") -> str:
         """표준 LLM 서비스 호출"""
+        model_config = client.config
         endpoint = model_config.get("endpoint", "")
         if not endpoint:
             raise Exception("LLM 엔드포인트가 설정되지 않았습니다")
         
         # 요청 템플릿 가져오기
         request_template = model_config.get("requestTemplate", {})
-        headers = request_template.get("headers", {}).copy()
         payload = request_template.get("payload", {}).copy()
         
-        # API 키 설정
-        api_key = model_config.get("apiKey", "")
+        # 모델 설정
+        payload["messages"] = apply_cache_hints(messages, self._supports_cache_control(model_config))
+        payload["temperature"] = model_config.get("temperature", 0.7)
+        payload["max_tokens"] = model_config.get("maxTokens", 4096)
+        payload["stream"] = False
         
-        # 헤더 변수 치환
+        # 엔드포인트 처리
+        if not endpoint.endswith("/chat/completions"):
+            endpoint = endpoint.rstrip("/") + "/chat/completions"
+        
+        # 요청 및 응답 처리 (배칭 활성화 시 마이크로 배처를 통해 전송)
+        result = None
+        batcher = self._get_batcher(endpoint, client) if model_config.get("batching", {}).get("enabled") else None
+        if batcher is not None:
+            try:
+                result = batcher.submit(payload, timeout=model_config.get("timeout", 30))
+            except BatcherClosedError:
+                # 조회 직후 클라이언트가 교체되어 배처가 닫힌 경우 단건으로 전송
+                result = None
+            if result is not None and "error" in result:
+                raise Exception(f"LLM 배치 응답 오류: {result['error']}")
+        
+        if result is None:
+            response = client.request(
+                "POST", endpoint,
+                headers=self._build_request_headers(model_config),
+                timeout=model_config.get("timeout", 30),
+                json=payload
+            )
+            
+            if response.status_code != 200:
+                raise Exception(f"LLM 서비스 응답 오류: {response.status_code}, {response.text}")
+            
+            result = response.json()
+        
+        content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+        self._record_usage(client, agent_type, endpoint, messages, content, result.get("usage"))
+        return content
+    
+    def _build_request_headers(self, model_config: Dict[str, Any], api_key: Optional[str] = None) -> Dict[str, str]:
+        """
+        요청 템플릿 헤더 생성 (API 키, 요청 ID 치환)
+        
+        요청 ID는 호출마다 새로 만들므로 HTTP 요청을 보낼 때마다 호출해야 합니다.
+        
+        Args:
+            model_config: 모델 설정
+            api_key: API 키 (없으면 모델 설정의 apiKey)
+            
+        Returns:
+            요청 헤더
+        """
         import uuid
+        headers = model_config.get("requestTemplate", {}).get("headers", {}).copy()
+        if api_key is None:
+            api_key = model_config.get("apiKey", "")
         request_id = str(uuid.uuid4())
         
         for key, value in headers.items():
@@ -269,66 +525,100 @@ class LLMService:
         if auth_type != "bearer" and "Authorization" in headers:
             # Bearer가 아닌 다른 인증 방식인 경우 (예: Basic 등)
             headers["Authorization"] = f"{auth_type.capitalize()} {api_key}"
+        return headers
+    
+    def _get_batcher(self, endpoint: str, client: ModelClient) -> Optional[MicroBatcher]:
+        """
+        모델/엔드포인트별 마이크로 배처 반환 (없으면 생성)
         
-        # 모델 설정
-        payload["messages"] = messages
-        payload["temperature"] = model_config.get("temperature", 0.7)
-        payload["max_tokens"] = model_config.get("maxTokens", 4096)
-        payload["stream"] = False
+        배처는 만든 클라이언트의 설정(API 키, 연결 풀, 배치 설정)으로 전송하므로 현재 레지스트리의
+        클라이언트에만 배처를 만들어 줍니다. 레지스트리가 교체된 뒤 이전 클라이언트로 들어온 요청은
+        배칭 없이 단건으로 전송합니다.
         
-        # 엔드포인트 처리
-        if not endpoint.endswith("/chat/completions"):
-            endpoint = endpoint.rstrip("/") + "/chat/completions"
+        Args:
+            endpoint: 단건 호출 엔드포인트
+            client: 모델 클라이언트
+            
+        Returns:
+            마이크로 배처 (이전 클라이언트면 None)
+        """
+        if self._clients.get(client.key) is not client:
+            return None
+        
+        model_config = client.config
+        batcher_key = f"{client.key}:{endpoint}"
+        with self._batchers_lock:
+            entry = self._batchers.get(batcher_key)
+            batcher = entry[1] if entry is not None and entry[0] is client else None
+            if batcher is None:
+                batching = model_config.get("batching", {})
+                batch_endpoint = batching.get("endpoint") or endpoint.rstrip("/") + "/batch"
+                batcher = MicroBatcher(
+                    lambda payloads: self._send_llm_batch(payloads, endpoint, batch_endpoint, client),
+                    max_batch_size=batching.get("maxBatchSize", DEFAULT_MAX_BATCH_SIZE),
+                    max_wait_ms=batching.get("maxWaitMs", DEFAULT_MAX_WAIT_MS),
+                    max_inflight=batching.get("maxInflight", DEFAULT_MAX_INFLIGHT),
+                    name=model_config.get("id", endpoint)
+                )
+                self._batchers[batcher_key] = (client, batcher)
+            return batcher
+    
+    def _send_llm_batch(self, payloads: List[Dict[str, Any]], endpoint: str, batch_endpoint: str,
+                        client: ModelClient) -> List[Dict[str, Any]]:
+        """
+        배치 LLM 호출
         
-        # 요청 및 응답 처리
-        response = requests.post(
-            endpoint,
-            json=payload,
-            headers=headers,
-            verify=model_config.get("verify_ssl", False),
-            timeout=model_config.get("timeout", 30)
+        배치 요청 형식: {"requests": [chat/completions 페이로드, ...]}
+        배치 응답 형식: {"responses": [chat/completions 응답 또는 {"error": ...}, ...]} (요청과 같은 순서)
+        헤더(요청 ID 포함)는 배치를 보낼 때마다 새로 만듭니다.
+        
+        Args:
+            payloads: 개별 chat/completions 페이로드 목록
+            endpoint: 단건 호출 엔드포인트
+            batch_endpoint: 배치 호출 엔드포인트
+            client: 모델 클라이언트
+            
+        Returns:
+            요청 순서와 같은 응답 목록
+        """
+        # 한 건만 모인 경우 배치 오버헤드 없이 단건 엔드포인트로 호출
+        if len(payloads) == 1:
+            url, body = endpoint, payloads[0]
+        else:
+            url, body = batch_endpoint, {"requests": payloads}
+        
+        model_config = client.config
+        response = client.request(
+            "POST", url,
+            headers=self._build_request_headers(model_config),
+            timeout=model_config.get("timeout", 30),
+            json=body
         )
         
         if response.status_code != 200:
             raise Exception(f"LLM 서비스 응답 오류: {response.status_code}, {response.text}")
         
         result = response.json()
-        return result.get("choices", [{}])[0].get("message", {}).get("content", "")
+        if len(payloads) == 1:
+            return [result]
+        
+        logger.debug(f"LLM 배치 호출 완료: {len(payloads)}건")
+        return result.get("responses", [])
     
-    def _call_standard_llm_stream(self, messages: List[Dict[str, str]], model_config: Dict[str, Any]) -> Generator[str, None, None]:
+    def _call_standard_llm_stream(self, messages: List[Dict[str, str]], client: ModelClient, agent_type: str = "direct") -> Generator[str, None, None]:
         """표준 LLM 서비스 스트리밍 호출"""
+        model_config = client.config
         endpoint = model_config.get("endpoint", "")
         if not endpoint:
             raise Exception("LLM 엔드포인트가 설정되지 않았습니다")
         
         # 요청 템플릿 가져오기
         request_template = model_config.get("requestTemplate", {})
-        headers = request_template.get("headers", {}).copy()
+        headers = self._build_request_headers(model_config)
         payload = request_template.get("payload", {}).copy()
         
-        # API 키 설정
-        api_key = model_config.get("apiKey", "")
-        
-        # 헤더 변수 치환
-        import uuid
-        request_id = str(uuid.uuid4())
-        
-        for key, value in headers.items():
-            if isinstance(value, str):
-                # API 키 치환
-                value = value.replace("${API_KEY}", api_key)
-                # 요청 ID 치환
-                value = value.replace("${REQUEST_ID}", request_id)
-                headers[key] = value
-        
-        # 인증 타입에 따른 헤더 설정
-        auth_type = model_config.get("auth_type", "bearer").lower()
-        if auth_type != "bearer" and "Authorization" in headers:
-            # Bearer가 아닌 다른 인증 방식인 경우 (예: Basic 등)
-            headers["Authorization"] = f"{auth_type.capitalize()} {api_key}"
-        
         # 모델 설정
-        payload["messages"] = messages
+        payload["messages"] = apply_cache_hints(messages, self._supports_cache_control(model_config))
         payload["temperature"] = model_config.get("temperature", 0.7)
         payload["max_tokens"] = model_config.get("maxTokens", 4096)
         payload["stream"] = True
@@ -338,18 +628,19 @@ class LLMService:
             endpoint = endpoint.rstrip("/") + "/chat/completions"
         
         # 요청 및 응답 처리
-        response = requests.post(
-            endpoint,
-            json=payload,
+        response = client.request(
+            "POST", endpoint,
             headers=headers,
-            verify=model_config.get("verify_ssl", False),
-            stream=True,
-            timeout=model_config.get("timeout", 30)
+            timeout=model_config.get("timeout", 30),
+            json=payload,
+            stream=True
         )
         
         if response.status_code != 200:
             raise Exception(f"LLM 서비스 스트리밍 응답 오류: {response.status_code}, {response.text}")
         
+        chunks = []
+        usage = None
         for chunk in response.iter_lines():
             if chunk:
                 try:
@@ -360,16 +651,25 @@ class LLMService:
                         break
                     
                     json_data = json.loads(data)
-                    delta = json_data.get("choices", [{}])[0].get("delta", {})
+                    
+                    # 일부 프로바이더는 마지막 청크에 usage를 포함
+                    if json_data.get("usage"):
+                        usage = json_data["usage"]
+                    
+                    delta = (json_data.get("choices") or [{}])[0].get("delta", {})
                     content = delta.get("content", "")
                     
                     if content:
+                        chunks.append(content)
                         yield content
                 except Exception as e:
                     logger.error(f"LLM 스트리밍 청크 처리 오류: {e}")
+        
+        self._record_usage(client, agent_type, endpoint, messages, "".join(chunks), usage)
     
-    def _call_openrouter(self, messages: List[Dict[str, str]], model_config: Dict[str, Any]) -> str:
+    def _call_openrouter(self, messages: List[Dict[str, str]], client: ModelClient, agent_type: str = "direct") -> str:
         """OpenRouter 호출"""
+        model_config = client.config
         endpoint = model_config.get("endpoint", "")
         if not endpoint:
             raise Exception("OpenRouter 엔드포인트가 설정되지 않았습니다")
@@ -383,25 +683,13 @@ class LLMService:
         
         # 요청 템플릿 가져오기
         request_template = model_config.get("requestTemplate", {})
-        headers = request_template.get("headers", {}).copy()
+        headers = self._build_request_headers(model_config, api_key)
         payload = request_template.get("payload", {}).copy()
         
-        # 헤더 변수 치환
-        import uuid
-        request_id = str(uuid.uuid4())
-        
-        for key, value in headers.items():
-            if isinstance(value, str):
-                # API 키 치환
-                value = value.replace("${API_KEY}", api_key)
-                # 요청 ID 치환
-                value = value.replace("${REQUEST_ID}", request_id)
-                headers[key] = value
-        
         # 모델 설정
         model_id = model_config.get("id", "")
         payload["model"] = model_id
-        payload["messages"] = messages
+        payload["messages"] = apply_cache_hints(messages, self._supports_cache_control(model_config))
         payload["temperature"] = model_config.get("temperature", 0.7)
         payload["max_tokens"] = model_config.get("maxTokens", 4096)
         payload["stream"] = False
@@ -411,21 +699,24 @@ class LLMService:
             endpoint = endpoint.rstrip("/") + "/chat/completions"
         
         # 요청 및 응답 처리
-        response = requests.post(
-            endpoint,
-            json=payload,
+        response = client.request(
+            "POST", endpoint,
             headers=headers,
-            timeout=model_config.get("timeout", 30)
+            timeout=model_config.get("timeout", 30),
+            json=payload
         )
         
         if response.status_code != 200:
             raise Exception(f"OpenRouter 응답 오류: {response.status_code}, {response.text}")
         
         result = response.json()
-        return result.get("choices", [{}])[0].get("message", {}).get("content", "")
+        content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+        self._record_usage(client, agent_type, endpoint, messages, content, result.get("usage"))
+        return content
     
-    def _call_openrouter_stream(self, messages: List[Dict[str, str]], model_config: Dict[str, Any]) -> Generator[str, None, None]:
+    def _call_openrouter_stream(self, messages: List[Dict[str, str]], client: ModelClient, agent_type: str = "direct") -> Generator[str, None, None]:
         """OpenRouter 스트리밍 호출"""
+        model_config = client.config
         endpoint = model_config.get("endpoint", "")
         if not endpoint:
             raise Exception("OpenRouter 엔드포인트가 설정되지 않았습니다")
@@ -439,34 +730,31 @@ class LLMService:
         
         # 요청 템플릿 가져오기
         request_template = model_config.get("requestTemplate", {})
-        headers = request_template.get("headers", {}).copy()
+        headers = self._build_request_headers(model_config, api_key)
         payload = request_template.get("payload", {}).copy()
         
-        # API 키 설정
-        for key, value in headers.items():
-            if isinstance(value, str):
-                headers[key] = value.replace("${API_KEY}", api_key)
-        
         # 모델 설정
         model_id = model_config.get("id", "")
         payload["model"] = model_id
-        payload["messages"] = messages
+        payload["messages"] = apply_cache_hints(messages, self._supports_cache_control(model_config))
         payload["temperature"] = model_config.get("temperature", 0.7)
         payload["max_tokens"] = model_config.get("maxTokens", 4096)
         payload["stream"] = True
         
         # 요청 및 응답 처리
-        response = requests.post(
-            endpoint,
-            json=payload,
+        response = client.request(
+            "POST", endpoint,
             headers=headers,
-            stream=True,
-            timeout=model_config.get("timeout", 30)
+            timeout=model_config.get("timeout", 30),
+            json=payload,
+            stream=True
         )
         
         if response.status_code != 200:
             raise Exception(f"OpenRouter 스트리밍 응답 오류: {response.status_code}, {response.text}")
         
+        chunks = []
+        usage = None
         for chunk in response.iter_lines():
             if chunk:
                 try:
@@ -477,13 +765,29 @@ class LLMService:
                         break
                     
                     json_data = json.loads(data)
-                    delta = json_data.get("choices", [{}])[0].get("delta", {})
+                    
+                    # 일부 프로바이더는 마지막 청크에 usage를 포함
+                    if json_data.get("usage"):
+                        usage = json_data["usage"]
+                    
+                    delta = (json_data.get("choices") or [{}])[0].get("delta", {})
                     content = delta.get("content", "")
                     
                     if content:
+                        chunks.append(content)
                         yield content
                 except Exception as e:
                     logger.error(f"OpenRouter 스트리밍 청크 처리 오류: {e}")
+        
+        self._record_usage(client, agent_type, endpoint, messages, "".join(chunks), usage)
 
 # 싱글톤 인스턴스
-llm_service = LLMService()
\ No newline at end of file
+llm_service = LLMService()
+
+def _collect_batcher_metrics() -> List[MetricFamily]:
+    """LLM 마이크로 배처 대기열 깊이 메트릭"""
+    samples = [({"queue": f"llm-batch:{key}"}, batcher.get_stats()["queue_depth"])
+               for key, (_, batcher) in list(llm_service._batchers.items())]
+    return [MetricFamily("ape_queue_depth", "gauge", "작업 대기열 깊이", samples)]
+
+metrics.add_collector("llm_batchers", _collect_batcher_metrics)
\ No newline at end of file
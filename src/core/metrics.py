@@ -0,0 +1,413 @@
+"""
+Prometheus 형식 메트릭 모듈
+
+HTTP 처리, 에이전트 실행, LLM 호출(첫 토큰까지의 시간 포함), DB 쿼리 지연 시간 히스토그램과
+캐시 적중률, 연결 풀 사용률, 대기열 깊이 게이지를 /metrics에서 텍스트 형식으로 제공합니다.
+
+- 기록 경로 비용을 줄이기 위해 값은 미리 집계(버킷별 개수, 합계)하고, 스레드마다 고정된
+  스트라이프(락 + 값 사전)에만 기록합니다. 조회 시에만 스트라이프를 합칩니다.
+- 캐시/연결 풀/대기열처럼 이미 통계를 가진 구성 요소는 조회 시점에 수집 함수(collector)로 읽습니다.
+"""
+
+import time
+import bisect
+import logging
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, List, Tuple, Optional, Callable, Iterable, Iterator, NamedTuple, Sequence
+
+# 로거 설정
+logger = logging.getLogger("metrics")
+
+# 지연 시간 히스토그램 기본 버킷 (초)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 스트라이프 수 (동시에 기록하는 스레드가 같은 락을 잡을 확률을 낮춤)
+DEFAULT_STRIPES = 16
+
+# Prometheus 텍스트 형식 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 스레드별 스트라이프 번호 (처음 기록할 때 순서대로 배정)
+_stripe_local = threading.local()
+_stripe_counter = itertools.count()
+
+
+def _stripe_index() -> int:
+    """현재 스레드의 스트라이프 번호 (스트라이프 수로 나누기 전)"""
+    try:
+        return _stripe_local.index
+    except AttributeError:
+        index = _stripe_local.index = next(_stripe_counter)
+        return index
+
+
+class MetricFamily(NamedTuple):
+    """수집 함수가 반환하는 메트릭 (이름, 유형, 설명, [(레이블, 값), ...])"""
+    name: str
+    type: str
+    help: str
+    samples: List[Tuple[Dict[str, str], float]]
+
+
+class _Stripe:
+    """락 하나와 그 락이 보호하는 레이블별 값"""
+
+    __slots__ = ("lock", "values")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values: Dict[Tuple[str, ...], Any] = {}
+
+
+class _Metric:
+    """레이블별 값을 스트라이프에 나눠 기록하는 메트릭 기본 클래스"""
+
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), stripes: int = DEFAULT_STRIPES):
+        """
+        메트릭 초기화
+
+        Args:
+            name: 메트릭 이름
+            help: 설명
+            labelnames: 레이블 이름 목록
+            stripes: 스트라이프 수
+        """
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._stripes = [_Stripe() for _ in range(max(1, int(stripes)))]
+        self._stripe_count = len(self._stripes)
+
+    def _stripe(self, labels: Tuple[Any, ...]) -> _Stripe:
+        """레이블 수 확인 후 현재 스레드의 스트라이프 반환"""
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} 레이블 수 불일치: {self.labelnames}")
+        return self._stripes[_stripe_index() % self._stripe_count]
+
+    def _entries(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        """전체 스트라이프의 (레이블 문자열, 값) 목록 (기록 경로의 문자열 변환은 조회 시점으로 미룸)"""
+        entries = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                items = list(stripe.values.items())
+            entries.extend((tuple(str(label) for label in key), value) for key, value in items)
+        return entries
+
+    def reset(self) -> None:
+        """기록된 값 초기화"""
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.values.clear()
+
+
+class Counter(_Metric):
+    """누적 카운터"""
+
+    type = "counter"
+
+    def inc(self, *labels: Any, amount: float = 1.0) -> None:
+        """
+        카운터 증가
+
+        Args:
+            *labels: 레이블 값 (labelnames 순서)
+            amount: 증가량
+        """
+        stripe = self._stripe(labels)
+        with stripe.lock:
+            stripe.values[labels] = stripe.values.get(labels, 0.0) + amount
+
+    def collect(self) -> Dict[Tuple[str, ...], float]:
+        """레이블별 합계"""
+        totals: Dict[Tuple[str, ...], float] = {}
+        for key, value in self._entries():
+            totals[key] = totals.get(key, 0.0) + value
+        return totals
+
+
+class Gauge(Counter):
+    """증감 게이지 (진행 중인 요청 수 등)"""
+
+    type = "gauge"
+
+    def dec(self, *labels: Any, amount: float = 1.0) -> None:
+        """게이지 감소"""
+        self.inc(*labels, amount=-amount)
+
+    @contextmanager
+    def track(self, *labels: Any) -> Iterator[None]:
+        """블록 실행 동안 게이지 1 증가"""
+        self.inc(*labels)
+        try:
+            yield
+        finally:
+            self.dec(*labels)
+
+
+class Histogram(_Metric):
+    """버킷 히스토그램 (버킷별 개수, 합계, 개수를 미리 집계)"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS, stripes: int = DEFAULT_STRIPES):
+        """
+        히스토그램 초기화
+
+        Args:
+            name: 메트릭 이름
+            help: 설명
+            labelnames: 레이블 이름 목록
+            buckets: 버킷 상한 목록 (+Inf는 자동 추가)
+            stripes: 스트라이프 수
+        """
+        super().__init__(name, help, labelnames, stripes)
+        self.buckets = tuple(sorted(float(bucket) for bucket in buckets))
+
+    def observe(self, value: float, *labels: Any) -> None:
+        """
+        관측값 기록
+
+        Args:
+            value: 관측값 (지연 시간은 초 단위)
+            *labels: 레이블 값 (labelnames 순서)
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        stripe = self._stripe(labels)
+        with stripe.lock:
+            entry = stripe.values.get(labels)
+            if entry is None:
+                # [버킷별 개수(+Inf 포함), 합계, 개수]
+                entry = stripe.values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    @contextmanager
+    def time(self, *labels: Any) -> Iterator[None]:
+        """블록 실행 시간을 초 단위로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def collect(self) -> Dict[Tuple[str, ...], Tuple[List[int], float, int]]:
+        """레이블별 (누적 버킷 개수, 합계, 개수)"""
+        merged: Dict[Tuple[str, ...], list] = {}
+        for stripe in self._stripes:
+            with stripe.lock:
+                items = [(tuple(str(label) for label in key), (list(entry[0]), entry[1], entry[2]))
+                         for key, entry in stripe.values.items()]
+            for key, (counts, total, count) in items:
+                target = merged.get(key)
+                if target is None:
+                    merged[key] = [counts, total, count]
+                else:
+                    target[0] = [a + b for a, b in zip(target[0], counts)]
+                    target[1] += total
+                    target[2] += count
+        return {key: (list(itertools.accumulate(counts)), total, count)
+                for key, (counts, total, count) in merged.items()}
+
+
+def _escape(value: str) -> str:
+    """레이블 값 이스케이프"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """레이블 문자열 생성 ({a="1",b="2"})"""
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    """값 문자열 (정수는 소수점 없이)"""
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리"""
+
+    def __init__(self):
+        """레지스트리 초기화"""
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[MetricFamily]]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """카운터 등록 (같은 이름이 있으면 기존 카운터 반환)"""
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """게이지 등록 (같은 이름이 있으면 기존 게이지 반환)"""
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        """히스토그램 등록 (같은 이름이 있으면 기존 히스토그램 반환)"""
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def add_collector(self, name: str, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """
+        조회 시점에 호출할 수집 함수 등록 (같은 이름이면 교체)
+
+        Args:
+            name: 수집 함수 이름
+            collector: MetricFamily 목록을 반환하는 함수
+        """
+        with self._lock:
+            self._collectors[name] = collector
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 전체 메트릭 출력"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.items())
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            if isinstance(metric, Histogram):
+                bounds = [_format_value(bucket) for bucket in metric.buckets] + ["+Inf"]
+                names = metric.labelnames + ("le",)
+                for key, (cumulative, total, count) in sorted(metric.collect().items()):
+                    for bound, value in zip(bounds, cumulative):
+                        lines.append(f"{metric.name}_bucket{_format_labels(names, key + (bound,))} {value}")
+                    labels = _format_labels(metric.labelnames, key)
+                    lines.append(f"{metric.name}_sum{labels} {_format_value(total)}")
+                    lines.append(f"{metric.name}_count{labels} {count}")
+            else:
+                for key, value in sorted(metric.collect().items()):
+                    lines.append(f"{metric.name}{_format_labels(metric.labelnames, key)} {_format_value(value)}")
+
+        # 여러 수집 함수가 같은 이름의 메트릭을 내면 한 메트릭 아래로 합침
+        families: Dict[str, MetricFamily] = {}
+        for name, collector in collectors:
+            try:
+                collected = list(collector())
+            except Exception as e:
+                logger.warning(f"메트릭 수집 오류 ({name}): {e}")
+                continue
+            for family in collected:
+                existing = families.get(family.name)
+                if existing is None:
+                    families[family.name] = MetricFamily(family.name, family.type, family.help, list(family.samples))
+                else:
+                    existing.samples.extend(family.samples)
+
+        for family in families.values():
+            lines.append(f"# HELP {family.name} {family.help}")
+            lines.append(f"# TYPE {family.name} {family.type}")
+            for labels, value in family.samples:
+                lines.append(f"{family.name}{_format_labels(list(labels), list(labels.values()))} "
+                             f"{_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """기록된 값 초기화 (등록된 메트릭과 수집 함수는 유지)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+# 싱글톤 인스턴스
+metrics = MetricsRegistry()
+
+# 요청 처리 단계별 메트릭
+http_request_seconds = metrics.histogram(
+    "ape_http_request_duration_seconds", "HTTP 핸들러 처리 시간", ["method", "route", "status"])
+http_requests_in_flight = metrics.gauge(
+    "ape_http_requests_in_flight", "처리 중인 HTTP 요청 수")
+agent_run_seconds = metrics.histogram(
+    "ape_agent_run_duration_seconds", "에이전트 실행 시간", ["agent_type", "mode", "status"])
+llm_request_seconds = metrics.histogram(
+    "ape_llm_request_duration_seconds", "LLM 호출 전체 시간", ["model", "mode", "status"])
+llm_ttft_seconds = metrics.histogram(
+    "ape_llm_time_to_first_token_seconds", "LLM 스트리밍 첫 토큰까지의 시간", ["model"])
+db_query_seconds = metrics.histogram(
+    "ape_db_query_duration_seconds", "DB 쿼리 실행 시간", ["engine"])
+db_query_errors = metrics.counter(
+    "ape_db_query_errors_total", "DB 쿼리 오류 수", ["engine"])
+
+
+def cache_families(name: str, hits: float, misses: float) -> List[MetricFamily]:
+    """
+    캐시 적중/미적중 수와 적중률 메트릭 생성
+
+    Args:
+        name: 캐시 이름
+        hits: 적중 수
+        misses: 미적중 수
+
+    Returns:
+        메트릭 목록
+    """
+    labels = {"cache": name}
+    lookups = hits + misses
+    return [
+        MetricFamily("ape_cache_hits_total", "counter", "캐시 적중 수", [(labels, hits)]),
+        MetricFamily("ape_cache_misses_total", "counter", "캐시 미적중 수", [(labels, misses)]),
+        MetricFamily("ape_cache_hit_ratio", "gauge", "캐시 적중률", [(labels, round(hits / lookups, 4) if lookups else 0.0)])
+    ]
+
+
+def instrument_engine(engine: Any, name: str) -> Any:
+    """
+    SQLAlchemy 엔진의 쿼리 실행 시간과 연결 풀 사용량을 메트릭으로 기록
+
+    Args:
+        engine: SQLAlchemy 엔진
+        name: 엔진 이름 (메트릭 레이블)
+
+    Returns:
+        같은 엔진
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("ape_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("ape_query_start")
+        if starts:
+            db_query_seconds.observe(time.perf_counter() - starts.pop(), name)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        starts = exception_context.connection.info.get("ape_query_start") if exception_context.connection else None
+        if starts:
+            db_query_seconds.observe(time.perf_counter() - starts.pop(), name)
+        db_query_errors.inc(name)
+
+    def collect() -> List[MetricFamily]:
+        pool = engine.pool
+        samples = []
+        for field in ("checkedout", "checkedin", "size", "overflow"):
+            method = getattr(pool, field, None)
+            if callable(method):
+                samples.append(({"engine": name, "state": field}, float(method())))
+        return [MetricFamily("ape_db_pool_connections", "gauge", "DB 연결 풀 연결 수", samples)]
+
+    metrics.add_collector(f"db:{name}", collect)
+    return engine
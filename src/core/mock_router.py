@@ -0,0 +1,165 @@
+"""Mock API 엔드포인트 라우터 모듈
+
+src/schema/*.json의 api_endpoints 목록을 로드 시점에 한 번 컴파일해,
+요청마다 전체 목록을 훑지 않고 (메서드, 경로)에 맞는 Mock 응답을 찾습니다.
+
+- 고정 경로: 메서드별 딕셔너리에서 바로 조회
+- 패턴 경로: 첫 파라미터 앞의 고정 접두사(예: /rest/api/2/issue/)별로 묶어 묶음마다 하나의 정규식(이름 그룹 대안)으로
+  합치고, 요청 경로의 접두사 몇 개만 확인하므로 엔드포인트 수가 늘어도 검사할 패턴 수는 거의 늘지 않음
+- 경로 파라미터({issueKey})는 캡처해서 돌려줌
+- find_response는 응답의 복사본을 돌려주므로 호출 측이 수정해도 다음 요청에 영향이 없음
+- 패턴 문법: {이름} = 한 경로 세그먼트 캡처, 중간 * = 한 세그먼트, 끝 * = 나머지 경로 전체
+- 같은 경로에 여러 항목이 맞으면 스키마에 먼저 나온 항목이 우선 (고정 경로는 패턴보다 우선)
+- 같은 패턴 경로의 항목이 여러 개면 path_params 값이 요청 파라미터와 일치하는 항목을 우선 (없으면 첫 항목)
+"""
+
+import re
+import copy
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+# 로거 설정
+logger = logging.getLogger("mock_router")
+
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+
+def _literal_prefix(endpoint: str) -> str:
+    """첫 파라미터/와일드카드 앞까지의 고정 접두사 ('/'로 끝남)"""
+    first = min((endpoint.find(token) for token in ("{", "*") if token in endpoint), default=len(endpoint))
+    return endpoint[:endpoint.rfind("/", 0, first) + 1]
+
+
+def _compile_pattern(endpoint: str, route_index: int) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    스키마 엔드포인트를 정규식 조각으로 변환
+
+    Args:
+        endpoint: 스키마 엔드포인트 (예: /rest/api/2/issue/{issueKey}/comment)
+        route_index: 경로 번호 (그룹 이름 충돌 방지용)
+
+    Returns:
+        (정규식 조각, [(그룹 이름, 파라미터 이름)])
+    """
+    params: List[Tuple[str, str]] = []
+    parts: List[str] = []
+    position = 0
+    tokens = list(re.finditer(r"\{\w+\}|\*", endpoint))
+
+    for token in tokens:
+        parts.append(re.escape(endpoint[position:token.start()]))
+        if token.group() == "*":
+            parts.append(".+" if token.end() == len(endpoint) else "[^/]+")
+        else:
+            group = f"p{route_index}_{len(params)}"
+            params.append((group, _PATH_PARAM.match(token.group()).group(1)))
+            parts.append(f"(?P<{group}>[^/]+)")
+        position = token.end()
+
+    parts.append(re.escape(endpoint[position:]))
+    return "".join(parts), params
+
+
+class MockEndpointRouter:
+    """스키마 api_endpoints를 컴파일한 Mock 응답 라우터"""
+
+    def __init__(self, endpoints: Optional[List[Dict[str, Any]]] = None):
+        """
+        라우터 초기화 (엔드포인트 컴파일)
+
+        Args:
+            endpoints: 스키마 api_endpoints 목록
+                       ({"endpoint": ..., "method": "GET", "response": ...})
+        """
+        self._static: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._patterns: Dict[str, Dict[str, "re.Pattern"]] = {}
+        self._routes: Dict[str, Tuple[int, List[Dict[str, Any]], List[Tuple[str, str]]]] = {}
+        self.size = 0
+
+        pattern_parts: Dict[str, Dict[str, List[str]]] = {}
+        route_names: Dict[Tuple[str, str], str] = {}
+        for index, entry in enumerate(endpoints or []):
+            endpoint = entry.get("endpoint", "")
+            method = entry.get("method", "GET").upper()
+            normalized = endpoint.rstrip("/") or "/"
+            self.size += 1
+
+            if "{" not in endpoint and "*" not in endpoint:
+                self._static.setdefault(method, {}).setdefault(normalized, entry)
+                continue
+
+            # 같은 패턴의 항목은 하나의 경로에 묶고 path_params로 구분
+            route = route_names.get((method, normalized))
+            if route is not None:
+                self._routes[route][1].append(entry)
+                continue
+
+            regex, params = _compile_pattern(normalized, index)
+            route = f"r{index}"
+            route_names[(method, normalized)] = route
+            self._routes[route] = (index, [entry], params)
+            pattern_parts.setdefault(method, {}).setdefault(_literal_prefix(normalized), []).append(
+                f"(?P<{route}>{regex})")
+
+        for method, buckets in pattern_parts.items():
+            self._patterns[method] = {prefix: re.compile("|".join(parts)) for prefix, parts in buckets.items()}
+
+    @classmethod
+    def from_schema(cls, schema: Optional[Dict[str, Any]]) -> "MockEndpointRouter":
+        """스키마 딕셔너리에서 라우터 생성"""
+        return cls((schema or {}).get("api_endpoints", []))
+
+    def match(self, method: str, path: str) -> Optional[Tuple[Dict[str, Any], Dict[str, str]]]:
+        """
+        요청에 맞는 스키마 항목 찾기
+
+        Args:
+            method: HTTP 메서드
+            path: 요청 경로 (쿼리 문자열 허용)
+
+        Returns:
+            (스키마 항목, 경로 파라미터) 또는 None
+        """
+        method = method.upper()
+        path = path.split("?", 1)[0].rstrip("/") or "/"
+
+        entry = self._static.get(method, {}).get(path)
+        if entry is not None:
+            return entry, {}
+
+        buckets = self._patterns.get(method)
+        if not buckets:
+            return None
+
+        # 요청 경로의 '/'까지 접두사마다 해당 묶음만 검사하고, 여러 묶음이 맞으면 스키마 순서가 빠른 경로 선택
+        best = None
+        position = -1
+        while True:
+            pattern = buckets.get(path[:position + 1])
+            matched = pattern.fullmatch(path) if pattern is not None else None
+            if matched is not None:
+                # 바깥 경로 그룹이 마지막에 닫히므로 lastgroup이 맞은 경로 이름
+                route = self._routes[matched.lastgroup]
+                if best is None or route[0] < best[0][0]:
+                    best = (route, matched)
+            position = path.find("/", position + 1)
+            if position < 0:
+                break
+
+        if best is None:
+            return None
+
+        (_, entries, params), matched = best
+        values = {name: matched.group(group) for group, name in params}
+
+        if len(entries) > 1:
+            for entry in entries:
+                path_params = entry.get("path_params")
+                if path_params and all(values.get(name) == str(value) for name, value in path_params.items()):
+                    return entry, values
+        return entries[0], values
+
+    def find_response(self, method: str, path: str) -> Optional[Any]:
+        """요청에 맞는 Mock 응답 반환 (없으면 None, 호출 측이 수정해도 스키마에 남지 않도록 복사본)"""
+        found = self.match(method, path)
+        return copy.deepcopy(found[0].get("response", {})) if found else None
@@ -0,0 +1,294 @@
+"""
+모델별 LLM 클라이언트 레지스트리
+
+사용 가능한 모델마다 불변 클라이언트(ModelClient)를 미리 만들어 두고, 요청이 고른 모델의
+클라이언트를 조회합니다. 클라이언트 목록은 참조 교체로 공개하며, 락은 조회 통계와 대여 수를 셀 때만
+잠깐 잡습니다. 클라이언트마다 공유 세션 레지스트리의 별도 연결 풀을 사용하므로
+한 모델로 몰린 요청이 다른 모델의 연결을 잡아 두지 않습니다.
+
+LLM 호출은 과금되고 멱등이 아니므로 모델 연결 풀은 재시도하지 않는 전용 세션 레지스트리
+(model_session_registry)를 사용합니다. 5xx/429 응답이나 연결 오류를 다시 보내면 같은 생성 요청이 여러 번 과금됩니다.
+
+요청은 lease()로 클라이언트를 빌려 쓰며, 레지스트리를 다시 만들 때 더 이상 쓰지 않는 연결 풀은
+빌려 간 요청(스트리밍 포함)이 모두 반납된 뒤에 닫습니다. 조회와 대여 사이에 레지스트리가 교체되어
+이미 닫힌 연결 풀을 빌리면, 그 요청이 다시 만든 연결 풀도 반납할 때 닫습니다.
+
+요청별 모델은 컨텍스트 변수로 전달합니다. 라우터가 요청 처리 구간을 use_model()로 감싸면
+그 안에서 호출되는 에이전트와 LLMService가 전역 기본 모델 대신 요청 모델을 사용합니다.
+"""
+
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, Mapping, NamedTuple, Optional, Set, Tuple, TypeVar
+
+from src.core.metrics import metrics
+from src.core.requests_config import HTTPSessionRegistry, http_pool_families
+
+# 로거 설정
+logger = logging.getLogger("model_clients")
+
+# 요청이 고른 모델 키 (없으면 LLMService 기본 모델)
+_requested_model: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("requested_model", default=None)
+
+T = TypeVar("T")
+
+# 모델 연결 풀 전용 세션 레지스트리 (LLM POST를 재시도하지 않도록 urllib3 재시도 비활성화)
+model_session_registry = HTTPSessionRegistry(max_retries=0)
+
+
+class ModelClient(NamedTuple):
+    """모델별 불변 LLM 클라이언트 (모델 설정, ID, 연결 풀 이름, 세션 레지스트리)"""
+    key: str
+    config: Dict[str, Any]
+    model_id: str
+    endpoint: str
+    verify_ssl: bool
+    pool: str
+    http: HTTPSessionRegistry = model_session_registry
+
+    @property
+    def is_mock(self) -> bool:
+        """API 키가 없거나 mock 값이어서 가짜 응답을 반환하는지 여부"""
+        api_key = self.config.get("apiKey", "")
+        return not api_key or api_key.startswith("mock_") or api_key == "your-api-key"
+
+    def request(self, method: str, url: str, http: Optional[HTTPSessionRegistry] = None, **kwargs):
+        """
+        모델 전용 연결 풀로 HTTP 요청 수행
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            http: 세션 레지스트리 (없으면 클라이언트를 만든 레지스트리의 세션 레지스트리)
+            **kwargs: HTTPSessionRegistry.request 추가 인자 (headers, timeout, json, stream 등)
+
+        Returns:
+            HTTP 응답
+        """
+        return (http or self.http).request(method, url, verify_ssl=self.verify_ssl, pool=self.pool, **kwargs)
+
+    @property
+    def session_key(self) -> Tuple[str, bool, str, str]:
+        """세션 레지스트리의 세션 키 (스킴+호스트, SSL 검증 여부, 인증 정보 해시, 풀 이름)"""
+        return HTTPSessionRegistry._session_key(self.endpoint, self.verify_ssl, None, self.pool)
+
+
+def make_model_client(model_key: str, model_config: Optional[Mapping[str, Any]],
+                      http: HTTPSessionRegistry = model_session_registry) -> ModelClient:
+    """
+    모델 설정으로 클라이언트 생성
+
+    Args:
+        model_key: 모델 키
+        model_config: 모델 설정
+        http: 연결 풀을 만들 세션 레지스트리
+
+    Returns:
+        모델 클라이언트
+    """
+    config = dict(model_config or {})
+    # OpenRouter 호출은 항상 SSL 검증
+    if config.get("provider") == "openrouter":
+        verify_ssl = True
+    else:
+        verify_ssl = bool(config.get("verify_ssl", False))
+    return ModelClient(model_key, config, config.get("id", ""), config.get("endpoint", ""),
+                       verify_ssl, f"model:{model_key}", http)
+
+
+def get_requested_model() -> Optional[str]:
+    """현재 요청이 고른 모델 키 (없으면 None)"""
+    return _requested_model.get()
+
+
+@contextmanager
+def use_model(model_key: Optional[str]) -> Iterator[None]:
+    """
+    블록 안의 LLM 호출이 지정한 모델을 사용하도록 설정 (None이면 기본 모델)
+
+    Args:
+        model_key: 모델 키
+    """
+    token = _requested_model.set(model_key)
+    try:
+        yield
+    finally:
+        _requested_model.reset(token)
+
+
+def bind_model(iterable: Iterable[T], model_key: Optional[str]) -> Iterator[T]:
+    """
+    스트리밍 제너레이터가 다음 값을 만들 때마다 지정한 모델을 사용하도록 감쌈
+
+    StreamingResponse는 핸들러가 반환된 뒤 (스레드 풀에서) 제너레이터를 진행하므로
+    use_model() 블록이 이미 끝나 있습니다. 값마다 모델을 다시 설정해 요청 모델을 유지합니다.
+
+    Args:
+        iterable: 스트리밍 제너레이터
+        model_key: 모델 키 (None이면 그대로 반환)
+
+    Yields:
+        원래 제너레이터의 값
+    """
+    if model_key is None:
+        yield from iterable
+        return
+
+    iterator = iter(iterable)
+    while True:
+        token = _requested_model.set(model_key)
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _requested_model.reset(token)
+        yield item
+
+
+class ModelClientRegistry:
+    """모델 클라이언트 레지스트리 (통째로 교체, 연결 풀 대여 관리)"""
+
+    def __init__(self, http: HTTPSessionRegistry = model_session_registry):
+        """
+        레지스트리 초기화
+
+        Args:
+            http: 모델별 연결 풀을 만들 세션 레지스트리
+        """
+        self.http = http
+        self._clients: Dict[str, ModelClient] = {}
+        # 현재 클라이언트 목록이 쓰는 연결 풀
+        self._current: Set[Tuple[str, bool, str, str]] = set()
+        self._lock = threading.Lock()
+        # 연결 풀별 빌려 간 요청 수 / 교체되어 반납을 기다리는 연결 풀
+        self._leases: Dict[Tuple[str, bool, str, str], int] = {}
+        self._retired: Set[Tuple[str, bool, str, str]] = set()
+        self._stats = {"builds": 0, "lookups": 0, "misses": 0, "pools_closed": 0}
+
+    def build(self, model_configs: Mapping[str, Optional[Mapping[str, Any]]]) -> Dict[str, ModelClient]:
+        """
+        모델 설정 전체로 클라이언트를 만들어 레지스트리 교체
+
+        엔드포인트가 있고 Mock 모드가 아닌 모델은 연결 풀(세션)도 미리 만들어 워밍업이
+        연결을 열 수 있게 합니다. 설정이 바뀌거나 빠진 모델의 이전 연결 풀은 빌려 간 요청이 없으면
+        바로 닫고, 있으면 마지막 요청이 반납될 때 닫습니다.
+
+        Args:
+            model_configs: 모델 키별 설정
+
+        Returns:
+            새 클라이언트 목록
+        """
+        clients = {key: make_model_client(key, config, self.http) for key, config in model_configs.items()}
+        for client in clients.values():
+            if client.endpoint and not client.is_mock:
+                self.http.get_session(client.endpoint, verify_ssl=client.verify_ssl, pool=client.pool)
+
+        current = {client.session_key for client in clients.values()}
+        with self._lock:
+            previous = self._clients
+            # 참조 교체 한 번으로 새 클라이언트 목록 공개
+            self._clients = clients
+            self._current = current
+            self._stats["builds"] += 1
+            # 다시 쓰게 된 연결 풀은 닫지 않음
+            self._retired -= current
+            closing = []
+            for client in previous.values():
+                if client.session_key in current:
+                    continue
+                if self._leases.get(client.session_key):
+                    self._retired.add(client.session_key)
+                else:
+                    closing.append(client)
+
+        for client in closing:
+            self._close(client.session_key)
+        logger.info(f"모델 클라이언트 {len(clients)}개 준비 완료")
+        return clients
+
+    def get(self, model_key: str) -> Optional[ModelClient]:
+        """
+        모델 클라이언트 조회
+
+        클라이언트 목록은 락 없이 읽고, 조회/미스 통계만 락 안에서 셉니다.
+
+        Args:
+            model_key: 모델 키
+
+        Returns:
+            모델 클라이언트 (없으면 None)
+        """
+        client = self._clients.get(model_key)
+        with self._lock:
+            self._stats["lookups"] += 1
+            if client is None:
+                self._stats["misses"] += 1
+        return client
+
+    @contextmanager
+    def lease(self, client: ModelClient) -> Iterator[ModelClient]:
+        """
+        요청이 끝날 때까지 클라이언트의 연결 풀을 빌려 씀 (스트리밍이면 마지막 청크까지)
+
+        빌려 쓰는 동안 레지스트리가 교체되어도 연결 풀을 닫지 않고, 교체된 연결 풀은 마지막 요청이
+        반납될 때 닫습니다. 조회한 뒤 빌리기 전에 교체되어 현재 목록에 없는 연결 풀(목록 밖에서 만든
+        클라이언트 포함)도 교체된 것으로 보고 반납할 때 닫습니다.
+
+        Args:
+            client: 모델 클라이언트
+
+        Yields:
+            같은 모델 클라이언트
+        """
+        key = client.session_key
+        with self._lock:
+            self._leases[key] = self._leases.get(key, 0) + 1
+            # 이미 교체된 연결 풀이면 요청이 다시 만든 세션이 남지 않도록 반납 때 닫음
+            if key not in self._current:
+                self._retired.add(key)
+        try:
+            yield client
+        finally:
+            with self._lock:
+                remaining = self._leases[key] - 1
+                if remaining:
+                    self._leases[key] = remaining
+                else:
+                    del self._leases[key]
+                drained = not remaining and key in self._retired
+                if drained:
+                    self._retired.discard(key)
+            if drained:
+                self._close(key)
+
+    def _close(self, session_key: Tuple[str, bool, str, str]):
+        """교체된 연결 풀의 세션 종료 (같은 이름의 새 연결 풀은 유지)"""
+        base_url, verify_ssl, _, pool = session_key
+        if self.http.close_session(base_url, verify_ssl=verify_ssl, pool=pool):
+            with self._lock:
+                self._stats["pools_closed"] += 1
+
+    def __contains__(self, model_key: str) -> bool:
+        return model_key in self._clients
+
+    def keys(self):
+        """등록된 모델 키 목록"""
+        return list(self._clients)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """레지스트리 통계 (모델별 연결 풀 포함)"""
+        clients = self._clients
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["leased"] = sum(self._leases.values())
+            stats["draining"] = len(self._retired)
+        stats["models"] = [{"key": client.key, "model_id": client.model_id, "pool": client.pool,
+                            "mock": client.is_mock} for client in clients.values()]
+        return stats
+
+
+metrics.add_collector("http:model", lambda: http_pool_families(model_session_registry, "model"))
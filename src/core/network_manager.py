@@ -9,6 +9,8 @@ from typing import Dict, Any, List, Optional, Union
 
 # 모델 설정 직접 임포트
 from config.models_config import MODELS, DEFAULT_MODEL, get_models, get_default_model
+from src.core.response_cache import response_cache
+from src.core.service_container import service_container
 
 # 로거 설정
 logger = logging.getLogger("network_manager")
@@ -50,6 +52,10 @@ class NetworkManager:
     def refresh_models(self) -> None:
         """사용 가능한 모델 목록 갱신"""
         self.available_models = self._get_available_models()
+        response_cache.invalidate("refresh_models")
+        # 이미 생성된 LLM 서비스의 모델 클라이언트도 새 목록으로 교체
+        if service_container.is_loaded("llm_service"):
+            service_container.get("llm_service").refresh_clients()
         logger.debug(f"모델 목록 갱신 완료: {len(self.available_models)} 모델 사용 가능")
     
     def get_status(self) -> Dict[str, Any]:
@@ -0,0 +1,140 @@
+"""페이지 단위 API 결과 조회 모듈
+
+startAt/maxResults 방식(Jira 검색 등)과 커서 방식(Bitbucket nextPageStart, 커밋 ID 등)의 페이지 API를 순회하는 반복자를 제공합니다.
+현재 페이지를 호출 측이 처리(렌더링, 전송)하는 동안 다음 페이지를 백그라운드 이벤트 루프에서 미리 조회하므로,
+큰 결과도 한 번에 받는 응답을 기다리지 않고 페이지가 도착하는 대로 흘려보낼 수 있습니다.
+"""
+
+import logging
+from typing import Dict, Any, Optional, Callable, Awaitable, Generator
+
+from src.core.async_client import submit_async
+
+# 로거 설정
+logger = logging.getLogger("pagination")
+
+# 기본 페이지 크기
+DEFAULT_PAGE_SIZE = 50
+
+# 페이지 조회 함수 형식: (start_at, max_results) -> 응답 코루틴
+PageFetcher = Callable[[int, int], Awaitable[Dict[str, Any]]]
+
+# 커서 페이지 조회 함수 형식: (cursor, limit) -> {"values": [...], "nextCursor": 다음 커서 또는 None} 코루틴
+CursorPageFetcher = Callable[[Optional[Any], int], Awaitable[Dict[str, Any]]]
+
+
+def iter_offset_pages(fetch_page: PageFetcher, items_key: str, limit: Optional[int] = None,
+                      page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True,
+                      timeout: Optional[float] = None) -> Generator[Dict[str, Any], None, None]:
+    """
+    startAt/maxResults 페이지 API 순회
+
+    Args:
+        fetch_page: (start_at, max_results)를 받아 응답을 돌려주는 코루틴 함수
+        items_key: 응답에서 항목 목록이 들어 있는 키 (예: "issues")
+        limit: 최대 항목 수 (None이면 전체)
+        page_size: 페이지당 요청 항목 수
+        prefetch: 현재 페이지를 넘겨주기 전에 다음 페이지 조회 시작 여부
+        timeout: 페이지당 결과 대기 제한 시간 (초)
+
+    Yields:
+        {"start_at": 시작 위치, "items": 항목 목록, "total": 서버 기준 전체 항목 수}
+        오류 시 {"error": ...}를 한 번 넘겨주고 종료
+    """
+    page_size = max(1, int(page_size))
+    limit = None if limit is None or limit <= 0 else int(limit)
+
+    def request(start_at: int):
+        size = page_size if limit is None else min(page_size, limit - start_at)
+        return submit_async(fetch_page(start_at, size))
+
+    start_at = 0
+    pending = request(start_at)
+    try:
+        while pending is not None:
+            response = pending.result(timeout=timeout)
+            pending = None
+
+            if "error" in response:
+                yield {"error": response["error"], "start_at": start_at}
+                return
+
+            items = response.get(items_key) or []
+            if limit is not None:
+                items = items[:limit - start_at]
+            total = response.get("total", start_at + len(items))
+
+            next_start = start_at + len(items)
+            has_more = bool(items) and next_start < (total if limit is None else min(total, limit))
+
+            if has_more and prefetch:
+                pending = request(next_start)
+
+            yield {"start_at": start_at, "items": items, "total": total}
+
+            if has_more and pending is None:
+                pending = request(next_start)
+            start_at = next_start
+    finally:
+        # 호출 측이 순회를 중단하면 미리 시작한 조회 취소
+        if pending is not None:
+            pending.cancel()
+
+
+def iter_cursor_pages(fetch_page: CursorPageFetcher, limit: Optional[int] = None,
+                      page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True,
+                      timeout: Optional[float] = None,
+                      start_cursor: Optional[Any] = None) -> Generator[Dict[str, Any], None, None]:
+    """
+    커서 페이지 API 순회 (다음 페이지 위치를 응답의 nextCursor로 받는 방식)
+
+    Args:
+        fetch_page: (cursor, limit)를 받아 {"values": [...], "nextCursor": ...}를 돌려주는 코루틴 함수
+                    (첫 페이지는 cursor=None, 마지막 페이지는 nextCursor=None)
+        limit: 최대 항목 수 (None이면 전체)
+        page_size: 페이지당 요청 항목 수
+        prefetch: 현재 페이지를 넘겨주기 전에 다음 페이지 조회 시작 여부
+        timeout: 페이지당 결과 대기 제한 시간 (초)
+        start_cursor: 첫 페이지 커서 (이전 순회에서 받은 next_cursor로 이어서 조회)
+
+    Yields:
+        {"cursor": 페이지 커서, "items": 항목 목록, "offset": 앞선 항목 수, "next_cursor": 다음 페이지 커서}
+        오류 시 {"error": ...}를 한 번 넘겨주고 종료
+    """
+    page_size = max(1, int(page_size))
+    limit = None if limit is None or limit <= 0 else int(limit)
+
+    def request(cursor: Optional[Any], offset: int):
+        size = page_size if limit is None else min(page_size, limit - offset)
+        return submit_async(fetch_page(cursor, size))
+
+    cursor, offset = start_cursor, 0
+    pending = request(cursor, offset)
+    try:
+        while pending is not None:
+            response = pending.result(timeout=timeout)
+            pending = None
+
+            if "error" in response:
+                yield {"error": response["error"], "cursor": cursor}
+                return
+
+            items = response.get("values") or []
+            if limit is not None:
+                items = items[:limit - offset]
+            next_cursor = response.get("nextCursor")
+            next_offset = offset + len(items)
+            has_more = bool(items) and next_cursor is not None and (limit is None or next_offset < limit)
+
+            if has_more and prefetch:
+                pending = request(next_cursor, next_offset)
+
+            yield {"cursor": cursor, "items": items, "offset": offset, "next_cursor": next_cursor}
+
+            if has_more and pending is None:
+                pending = request(next_cursor, next_offset)
+            cursor, offset = next_cursor, next_offset
+    finally:
+        # 호출 측이 순회를 중단하면 미리 시작한 조회 취소
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,282 @@
+"""
+실행 중인 워커 프로파일링 모듈
+
+py-spy를 직접 붙이지 않고도 운영 중인 워커의 CPU 사용 구간을 확인할 수 있도록 두 가지 방법을 제공합니다.
+- 샘플링 프로파일러: 지정한 시간 동안 일정 간격으로 모든 스레드의 스택(sys._current_frames)을 수집해
+  collapsed stack 형식(flamegraph.pl, speedscope 호환)으로 반환합니다. 추적 훅을 걸지 않으므로
+  대상 코드의 실행 속도에는 영향이 거의 없고, 비용은 샘플링 스레드의 스택 수집뿐입니다.
+- 요청 단위 cProfile: 에이전트 실행 한 번을 cProfile로 감싸 함수별 호출 수/시간 요약을 응답에 붙입니다.
+  cProfile은 실행한 스레드만 측정하므로 스레드 풀에서 실행되는 작업은 포함되지 않습니다.
+
+두 기능 모두 관리자 전용이며 profiling.enabled가 꺼져 있으면 사용할 수 없습니다. admin_token을 설정하면
+X-Admin-Token 헤더가 일치해야 하고, 설정하지 않으면 로컬(loopback) 요청만 허용합니다.
+다른 관리자 API의 인증은 admin_auth 모듈이 따로 담당합니다.
+
+설정 (settings.json의 profiling 섹션):
+    {"enabled": true, "admin_token": "", "max_seconds": 60, "interval_ms": 5, "top": 30}
+"""
+
+import os
+import sys
+import hmac
+import time
+import pstats
+import cProfile
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+from src.core.admin_auth import LOCAL_HOSTS
+
+# 로거 설정
+logger = logging.getLogger("profiler")
+
+# 요청 단위 프로파일 헤더
+PROFILE_HEADER = "X-Profile"
+
+# 대기 중인 스레드로 보고 기본적으로 제외하는 최상위(leaf) 프레임
+IDLE_FRAMES = frozenset({
+    "threading:Condition.wait", "threading:Event.wait", "threading:Thread._wait_for_tstate_lock",
+    "selectors:_PollLikeSelector.select", "selectors:KqueueSelector.select", "selectors:SelectSelector.select",
+    "thread:_worker", "socket:socket.accept"
+})
+
+# 프로파일링 기본 설정
+DEFAULT_PROFILING_CONFIG = {
+    "enabled": True,
+    "admin_token": "",
+    "max_seconds": 60.0,
+    "interval_ms": 5.0,
+    "top": 30
+}
+
+
+def get_profiling_config(settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    프로파일링 설정 반환 (settings의 profiling 섹션을 기본값에 덮어씀)
+
+    Args:
+        settings: 전체 설정 (get_settings() 결과)
+
+    Returns:
+        프로파일링 설정
+    """
+    section = dict((settings or {}).get("profiling", {}) or {})
+    config = dict(DEFAULT_PROFILING_CONFIG)
+    config.update({key: value for key, value in section.items() if value is not None})
+
+    enabled = config["enabled"]
+    config["enabled"] = enabled.strip().lower() in ("1", "true", "yes", "on") if isinstance(enabled, str) else bool(enabled)
+    config["admin_token"] = str(config["admin_token"] or "")
+    config["max_seconds"] = float(config["max_seconds"])
+    config["interval_ms"] = max(float(config["interval_ms"]), 1.0)
+    config["top"] = int(config["top"])
+    return config
+
+
+# 코드 객체별 프레임 이름 캐시 (샘플마다 문자열을 다시 만들지 않음)
+_labels: Dict[Any, str] = {}
+
+
+def _frame_label(code) -> str:
+    """프레임 이름 (모듈:한정된 함수 이름, 예: llm_service:LLMService.generate)"""
+    label = _labels.get(code)
+    if label is None:
+        module = os.path.splitext(os.path.basename(code.co_filename))[0]
+        label = f"{module}:{getattr(code, 'co_qualname', code.co_name)}".replace(";", ":").replace(" ", "_")
+        _labels[code] = label
+    return label
+
+
+def collapse_stack(frame) -> List[str]:
+    """
+    프레임에서 호출 스택 이름 목록 생성 (바깥 호출부터)
+
+    Args:
+        frame: 스레드의 현재 프레임
+
+    Returns:
+        프레임 이름 목록
+    """
+    stack = []
+    while frame is not None:
+        stack.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def render_collapsed(stacks: Dict[str, int]) -> str:
+    """
+    collapsed stack 텍스트 생성 (한 줄에 "프레임;프레임;... 샘플 수", 많은 순)
+
+    Args:
+        stacks: 스택 문자열별 샘플 수
+
+    Returns:
+        flamegraph.pl, speedscope에서 읽을 수 있는 텍스트
+    """
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items(), key=lambda item: -item[1]))
+
+
+def summarize_profile(profile: cProfile.Profile, top: int = 30) -> Dict[str, Any]:
+    """
+    cProfile 결과 요약 (누적 시간 순 상위 함수)
+
+    Args:
+        profile: 측정을 마친 cProfile.Profile
+        top: 포함할 함수 수
+
+    Returns:
+        전체 호출 수와 함수별 호출 수/자체 시간/누적 시간 (밀리초)
+    """
+    stats = pstats.Stats(profile)
+    entries = sorted(stats.stats.items(), key=lambda item: -item[1][3])
+    functions = []
+    for (filename, line, name), (primitive_calls, calls, total_time, cumulative_time, _) in entries[:top]:
+        location = f"{os.path.basename(filename)}:{line}" if line else filename
+        functions.append({
+            "function": f"{location}({name})",
+            "ncalls": calls if calls == primitive_calls else f"{calls}/{primitive_calls}",
+            "tottime_ms": round(total_time * 1000, 3),
+            "cumtime_ms": round(cumulative_time * 1000, 3)
+        })
+    return {
+        "total_calls": stats.total_calls,
+        "primitive_calls": stats.prim_calls,
+        "total_ms": round(stats.total_tt * 1000, 3),
+        "sort": "cumulative",
+        "functions": functions
+    }
+
+
+class SamplingProfiler:
+    """워커 프로파일러 (샘플링 프로파일, 요청 단위 cProfile, 관리자 접근 확인)"""
+
+    def __init__(self):
+        """프로파일러 초기화"""
+        self.config = get_profiling_config()
+        self._busy = threading.Lock()
+        self._stats = {"profiles": 0, "samples": 0, "rejected": 0, "request_profiles": 0}
+
+    def configure(self, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        설정 적용
+
+        Args:
+            settings: 전체 설정 (get_settings() 결과)
+
+        Returns:
+            적용된 프로파일링 설정
+        """
+        self.config = get_profiling_config(settings)
+        return self.config
+
+    def is_allowed(self, client_host: Optional[str], token: Optional[str] = None) -> bool:
+        """
+        프로파일링을 허용할 관리자 요청인지 확인 (토큰은 상수 시간 비교)
+
+        Args:
+            client_host: 요청 클라이언트 주소
+            token: X-Admin-Token 헤더 값
+
+        Returns:
+            허용 여부 (프로파일링이 꺼져 있으면 항상 False)
+        """
+        if not self.config["enabled"]:
+            return False
+        admin_token = self.config["admin_token"]
+        if admin_token:
+            return hmac.compare_digest((token or "").encode("utf-8"), admin_token.encode("utf-8"))
+        return client_host in LOCAL_HOSTS
+
+    def sample(self, seconds: float, interval_ms: Optional[float] = None, include_idle: bool = False) -> Dict[str, Any]:
+        """
+        모든 스레드의 스택을 일정 간격으로 수집 (호출한 스레드는 제외)
+
+        Args:
+            seconds: 수집 시간 (초, max_seconds로 제한)
+            interval_ms: 샘플 간격 (밀리초, None이면 설정 값)
+            include_idle: 대기 중인 스레드 스택 포함 여부
+
+        Returns:
+            {"seconds", "interval_ms", "samples", "stacks": {스택 문자열: 샘플 수}}
+
+        Raises:
+            RuntimeError: 다른 샘플링이 진행 중인 경우
+        """
+        if not self._busy.acquire(blocking=False):
+            self._stats["rejected"] += 1
+            raise RuntimeError("다른 프로파일링이 진행 중입니다")
+
+        try:
+            seconds = min(max(float(seconds), 0.0), self.config["max_seconds"])
+            interval = max(float(interval_ms or self.config["interval_ms"]), 1.0) / 1000.0
+            own_thread = threading.get_ident()
+            stacks: Counter = Counter()
+            samples = 0
+
+            start = time.perf_counter()
+            deadline = start + seconds
+            while True:
+                names = {thread.ident: thread.name.replace(" ", "_").replace(";", ":")
+                         for thread in threading.enumerate()}
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == own_thread:
+                        continue
+                    stack = collapse_stack(frame)
+                    if not include_idle and stack and stack[-1] in IDLE_FRAMES:
+                        continue
+                    stacks[names.get(thread_id, str(thread_id)) + ";" + ";".join(stack)] += 1
+                samples += 1
+                if time.perf_counter() >= deadline:
+                    break
+                time.sleep(interval)
+            elapsed = time.perf_counter() - start
+
+            self._stats["profiles"] += 1
+            self._stats["samples"] += samples
+            logger.info(f"샘플링 프로파일 완료: {elapsed:.2f}초, 샘플 {samples}회, 스택 {len(stacks)}개")
+            return {"seconds": round(elapsed, 3), "interval_ms": interval * 1000, "samples": samples,
+                    "stacks": dict(stacks)}
+        finally:
+            self._busy.release()
+
+    def profile_call(self, func: Callable[..., Any], *args, **kwargs) -> Tuple[Any, Dict[str, Any]]:
+        """
+        함수 한 번 실행을 cProfile로 측정
+
+        다른 프로파일러가 이미 실행 중이어서 측정할 수 없으면 그냥 실행하고 요약에 오류를 담습니다.
+
+        Args:
+            func: 실행할 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            (함수 결과, 프로파일 요약)
+        """
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            logger.warning(f"요청 프로파일 시작 실패: {e}")
+            return func(*args, **kwargs), {"error": str(e)}
+
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            profile.disable()
+        self._stats["request_profiles"] += 1
+        return result, summarize_profile(profile, self.config["top"])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """프로파일링 통계"""
+        stats: Dict[str, Any] = dict(self._stats)
+        stats.update({"enabled": self.config["enabled"], "token_required": bool(self.config["admin_token"]),
+                      "running": self._busy.locked()})
+        return stats
+
+
+# 싱글톤 인스턴스
+sampling_profiler = SamplingProfiler()
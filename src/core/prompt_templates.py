@@ -0,0 +1,162 @@
+"""프롬프트 템플릿 레지스트리 모듈
+
+에이전트 프롬프트를 캐시 가능한 고정 접두부(지시문, 스키마, 예시)와
+요청마다 달라지는 접미부(쿼리, 컨텍스트)로 나누어 관리합니다.
+
+접두부는 시스템 메시지, 접미부는 사용자 메시지로 분리해 전송하므로
+요청 간 프롬프트 앞부분이 바이트 단위로 동일하게 유지되어 프로바이더 측 접두사(KV) 캐시가 적중할 수 있습니다.
+템플릿 변수는 JSON 예시의 중괄호와 충돌하지 않도록 $변수 형식(string.Template)을 사용합니다.
+"""
+
+import logging
+import threading
+from string import Template
+from typing import Dict, Any, List, Optional, Tuple
+
+# 로거 설정
+logger = logging.getLogger("prompt_templates")
+
+# 접두부 메시지에 붙이는 캐시 힌트 (Anthropic 계열 cache_control 형식)
+CACHE_CONTROL_HINT = {"type": "ephemeral"}
+
+
+class PromptTemplate:
+    """접두부/접미부로 구성된 프롬프트 템플릿"""
+
+    def __init__(self, name: str, prefix: str, suffix: str, description: str = ""):
+        """
+        프롬프트 템플릿 초기화
+
+        Args:
+            name: 템플릿 이름 (예: "jira.search_jql")
+            prefix: 고정 접두부 템플릿 (지시문, 스키마, 예시)
+            suffix: 요청별 접미부 템플릿 (쿼리, 컨텍스트)
+            description: 템플릿 설명
+        """
+        self.name = name
+        self.description = description
+        self._prefix = Template(prefix)
+        self._suffix = Template(suffix)
+
+    def render(self, **variables: Any) -> Tuple[str, str]:
+        """
+        접두부와 접미부 렌더링
+
+        Args:
+            **variables: 템플릿 변수 (접두부/접미부 공용)
+
+        Returns:
+            (접두부, 접미부) 튜플
+        """
+        return self._prefix.substitute(variables), self._suffix.substitute(variables)
+
+    def render_text(self, **variables: Any) -> str:
+        """접두부와 접미부를 합친 단일 프롬프트 렌더링 (토큰 예산 계산용)"""
+        prefix, suffix = self.render(**variables)
+        return f"{prefix}\n\n{suffix}"
+
+    def build_messages(self, cache_prefix: bool = True, **variables: Any) -> List[Dict[str, Any]]:
+        """
+        채팅 메시지 목록 구성
+
+        Args:
+            cache_prefix: 접두부 메시지에 캐시 힌트 표시 여부
+            **variables: 템플릿 변수
+
+        Returns:
+            [시스템(접두부), 사용자(접미부)] 메시지 목록
+        """
+        prefix, suffix = self.render(**variables)
+
+        system_message: Dict[str, Any] = {"role": "system", "content": prefix}
+        if cache_prefix:
+            system_message["cache_control"] = dict(CACHE_CONTROL_HINT)
+
+        return [system_message, {"role": "user", "content": suffix}]
+
+
+class PromptRegistry:
+    """프롬프트 템플릿 레지스트리"""
+
+    def __init__(self):
+        """레지스트리 초기화"""
+        self._templates: Dict[str, PromptTemplate] = {}
+        self._lock = threading.Lock()
+
+    def register(self, template: PromptTemplate) -> PromptTemplate:
+        """
+        템플릿 등록 (같은 이름이 있으면 교체)
+
+        Args:
+            template: 등록할 템플릿
+
+        Returns:
+            등록된 템플릿
+        """
+        with self._lock:
+            if template.name in self._templates:
+                logger.debug(f"프롬프트 템플릿 교체: {template.name}")
+            self._templates[template.name] = template
+        return template
+
+    def get(self, name: str) -> PromptTemplate:
+        """
+        템플릿 조회
+
+        Args:
+            name: 템플릿 이름
+
+        Returns:
+            프롬프트 템플릿
+        """
+        template = self._templates.get(name)
+        if template is None:
+            raise KeyError(f"등록되지 않은 프롬프트 템플릿: {name}")
+        return template
+
+    def list_templates(self) -> List[Dict[str, str]]:
+        """등록된 템플릿 목록 반환"""
+        return [
+            {"name": template.name, "description": template.description}
+            for template in self._templates.values()
+        ]
+
+
+def apply_cache_hints(messages: List[Dict[str, Any]], supported: bool) -> List[Dict[str, Any]]:
+    """
+    메시지의 캐시 힌트를 프로바이더 형식으로 변환
+
+    지원하는 프로바이더는 content를 cache_control이 붙은 텍스트 파트 목록으로 바꾸고,
+    지원하지 않는 프로바이더는 힌트만 제거합니다 (자동 접두사 캐시는 고정 접두부만으로 적중).
+
+    Args:
+        messages: 채팅 메시지 목록
+        supported: cache_control 지원 여부
+
+    Returns:
+        변환된 메시지 목록
+    """
+    if not any("cache_control" in message for message in messages):
+        return messages
+
+    prepared = []
+    for message in messages:
+        if "cache_control" not in message:
+            prepared.append(message)
+            continue
+
+        cache_control = message["cache_control"]
+        converted = {key: value for key, value in message.items() if key != "cache_control"}
+        if supported:
+            converted["content"] = [{
+                "type": "text",
+                "text": message.get("content", ""),
+                "cache_control": cache_control
+            }]
+        prepared.append(converted)
+
+    return prepared
+
+
+# 싱글톤 인스턴스
+prompt_registry = PromptRegistry()
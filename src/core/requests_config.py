@@ -2,18 +2,34 @@
 Requests 라이브러리 설정
 
 이 모듈은 안전한 HTTP 요청을 위한 세션 및 기본 설정을 제공합니다.
+같은 서버로 가는 요청은 프로세스 전역 세션 레지스트리의 공유 세션(연결 풀)을 재사용합니다.
 """
 
+import os
+import time
+import hashlib
 import logging
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlsplit
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 import requests
 
+from src.core.metrics import metrics, MetricFamily
+from src.core import tracing
+
 # 로깅 설정
 logger = logging.getLogger("requests_config")
 
+# 연결 풀 기본 설정 (pool_connections: 호스트별 풀 수, pool_maxsize: 풀당 최대 연결 수)
+DEFAULT_POOL_CONNECTIONS = int(os.environ.get("HTTP_POOL_CONNECTIONS", "10"))
+DEFAULT_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", "20"))
+
 def get_secure_http_session(timeout: int = 30, max_retries: int = 3,
-                           verify_ssl: bool = False) -> requests.Session:
+                           verify_ssl: bool = False,
+                           pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                           pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> requests.Session:
     """
     안전한 HTTP 세션 생성 및 반환
     
@@ -21,6 +37,8 @@ def get_secure_http_session(timeout: int = 30, max_retries: int = 3,
         timeout: 요청 타임아웃 (초)
         max_retries: 최대 재시도 횟수
         verify_ssl: SSL 인증서 검증 여부
+        pool_connections: 호스트별 연결 풀 수
+        pool_maxsize: 풀당 최대 연결 수
         
     Returns:
         구성된 requests 세션
@@ -30,11 +48,13 @@ def get_secure_http_session(timeout: int = 30, max_retries: int = 3,
         total=max_retries,
         backoff_factor=0.5,
         status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"]
+        allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
+        # 재시도 소진 시 예외 대신 마지막 응답 반환 (상태 코드는 호출 측에서 처리)
+        raise_on_status=False
     )
     
     # 어댑터 생성 및 세션에 추가
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
     
     # 기본 세션 구성
     session = requests.Session()
@@ -55,11 +75,330 @@ def get_secure_http_session(timeout: int = 30, max_retries: int = 3,
     logger.info(f"HTTP 세션 생성 완료 (타임아웃: {timeout}초, 최대 재시도: {max_retries}회, SSL 검증: {verify_ssl})")
     return session
 
+class HTTPSessionRegistry:
+    """공유 HTTP 세션 레지스트리
+    
+    (기본 URL, SSL 검증 여부, 인증 정보, 풀 이름) 조합마다 세션을 하나만 만들어 재사용합니다.
+    세션은 생성 후 변경하지 않으며, 요청별 헤더와 타임아웃은 요청 인자로 전달합니다.
+    풀 이름을 지정하면 같은 서버로 가는 요청이라도 별도의 연결 풀을 사용합니다 (예: LLM 모델별 풀).
+    """
+    
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE, max_retries: int = 3):
+        """
+        세션 레지스트리 초기화
+        
+        Args:
+            pool_connections: 호스트별 연결 풀 수
+            pool_maxsize: 풀당 최대 연결 수
+            max_retries: 최대 재시도 횟수
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        
+        self._sessions: Dict[Tuple[str, bool, str, str], requests.Session] = {}
+        self._requests: Dict[Tuple[str, bool, str, str], int] = {}
+        self._lock = threading.Lock()
+        self._stats = {"sessions_created": 0, "session_hits": 0}
+    
+    @staticmethod
+    def _session_key(url: str, verify_ssl: bool, auth: Optional[Tuple[str, str]],
+                     pool: str = "") -> Tuple[str, bool, str, str]:
+        """세션 키 생성 (스킴+호스트, SSL 검증 여부, 인증 정보 해시, 풀 이름)"""
+        parts = urlsplit(url)
+        auth_key = hashlib.sha256(f"{auth[0]}:{auth[1]}".encode("utf-8")).hexdigest()[:16] if auth else ""
+        return f"{parts.scheme}://{parts.netloc}".lower(), bool(verify_ssl), auth_key, pool or ""
+    
+    def get_session(self, url: str, verify_ssl: bool = False,
+                    auth: Optional[Tuple[str, str]] = None, pool: str = "") -> requests.Session:
+        """
+        URL에 해당하는 공유 세션 반환 (없으면 생성)
+        
+        Args:
+            url: 요청 URL 또는 기본 URL
+            verify_ssl: SSL 인증서 검증 여부
+            auth: (사용자명, 비밀번호) 기본 인증 정보
+            pool: 연결 풀 이름 (지정하면 같은 서버라도 별도 세션 사용)
+            
+        Returns:
+            공유 requests 세션
+        """
+        key = self._session_key(url, verify_ssl, auth, pool)
+        
+        session = self._sessions.get(key)
+        if session is not None:
+            with self._lock:
+                self._stats["session_hits"] += 1
+            return session
+        
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = get_secure_http_session(
+                    max_retries=self.max_retries,
+                    verify_ssl=verify_ssl,
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize
+                )
+                if auth:
+                    session.auth = tuple(auth)
+                self._sessions[key] = session
+                self._requests[key] = 0
+                self._stats["sessions_created"] += 1
+            else:
+                self._stats["session_hits"] += 1
+        
+        return session
+    
+    def request(self, method: str, url: str, verify_ssl: bool = False,
+                auth: Optional[Tuple[str, str]] = None, headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[float] = 30, pool: str = "", **kwargs) -> requests.Response:
+        """
+        공유 세션으로 HTTP 요청 수행
+        
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            verify_ssl: SSL 인증서 검증 여부
+            auth: (사용자명, 비밀번호) 기본 인증 정보
+            headers: 요청별 HTTP 헤더 (세션 헤더는 변경하지 않음)
+            timeout: 요청 타임아웃 (초)
+            pool: 연결 풀 이름
+            **kwargs: requests.Session.request 추가 인자 (json, params 등)
+            
+        Returns:
+            HTTP 응답
+        """
+        session = self.get_session(url, verify_ssl=verify_ssl, auth=auth, pool=pool)
+        key = self._session_key(url, verify_ssl, auth, pool)
+        with self._lock:
+            self._requests[key] = self._requests.get(key, 0) + 1
+        
+        if tracing.get_current_span() is None:
+            return session.request(method.upper(), url, headers=headers, timeout=timeout, **kwargs)
+        
+        # 요청 추적 중이면 HTTP 호출 구간을 남기고 traceparent 헤더로 추적 전파
+        with tracing.span("http.request", "http", method=method.upper(), url=url, pool=pool) as current:
+            response = session.request(method.upper(), url, headers=tracing.inject_headers(headers),
+                                       timeout=timeout, **kwargs)
+            current.set_attribute("status_code", response.status_code)
+            return response
+    
+    def preconnect(self, url: str, verify_ssl: bool = False,
+                   auth: Optional[Tuple[str, str]] = None, timeout: float = 5, pool: str = "") -> Dict[str, Any]:
+        """
+        공유 세션 연결 풀에 연결 미리 열기 (TCP/TLS 핸드셰이크를 첫 요청 전에 수행)
+    
+        기본 URL로 HEAD 요청을 보내며, 응답 상태 코드와 무관하게 연결은 풀에 반환되어 재사용됩니다.
+    
+        Args:
+            url: 요청 URL 또는 기본 URL
+            verify_ssl: SSL 인증서 검증 여부
+            auth: (사용자명, 비밀번호) 기본 인증 정보
+            timeout: 연결 타임아웃 (초)
+            pool: 연결 풀 이름
+    
+        Returns:
+            연결 결과 (base_url, status 또는 error, elapsed_ms)
+        """
+        session = self.get_session(url, verify_ssl=verify_ssl, auth=auth, pool=pool)
+        return self._preconnect(session, self._session_key(url, verify_ssl, auth, pool)[0], timeout)
+    
+    def preconnect_all(self, timeout: float = 5) -> List[Dict[str, Any]]:
+        """
+        이미 생성된 모든 공유 세션의 연결 미리 열기
+    
+        Args:
+            timeout: 연결 타임아웃 (초)
+    
+        Returns:
+            세션별 연결 결과 목록
+        """
+        with self._lock:
+            entries = list(self._sessions.items())
+        return [self._preconnect(session, key[0], timeout) for key, session in entries]
+    
+    @staticmethod
+    def _preconnect(session: requests.Session, base_url: str, timeout: float) -> Dict[str, Any]:
+        """세션으로 HEAD 요청을 보내 연결을 풀에 남김"""
+        start = time.perf_counter()
+        try:
+            response = session.request("HEAD", base_url + "/", timeout=timeout, allow_redirects=False)
+            # 본문을 읽어야 연결이 닫히지 않고 풀로 반환됨
+            response.content
+            result = {"base_url": base_url, "status": response.status_code}
+        except requests.RequestException as e:
+            result = {"base_url": base_url, "error": str(e)}
+        result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        return result
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        세션 및 연결 재사용 통계 반환
+        
+        연결 수는 urllib3 연결 풀이 실제로 연 연결 수이며, 나머지 요청은 기존 연결을 재사용한 것입니다.
+        
+        Returns:
+            통계 정보
+        """
+        with self._lock:
+            entries = list(self._sessions.items())
+            request_counts = dict(self._requests)
+            stats: Dict[str, Any] = dict(self._stats)
+        
+        sessions = []
+        total_requests = 0
+        total_connections = 0
+        for key, session in entries:
+            connections = 0
+            pool_requests = 0
+            for adapter in set(session.adapters.values()):
+                pool_manager = getattr(adapter, "poolmanager", None)
+                if pool_manager is None:
+                    continue
+                for pool_key in list(pool_manager.pools.keys()):
+                    pool = pool_manager.pools.get(pool_key)
+                    if pool is not None:
+                        connections += pool.num_connections
+                        pool_requests += pool.num_requests
+            
+            total_requests += pool_requests
+            total_connections += connections
+            sessions.append({
+                "base_url": key[0],
+                "verify_ssl": key[1],
+                "authenticated": bool(key[2]),
+                "pool": key[3],
+                "requests": request_counts.get(key, 0),
+                "http_requests": pool_requests,
+                "connections_opened": connections,
+                "connections_reused": max(0, pool_requests - connections)
+            })
+        
+        stats.update({
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "sessions": sessions,
+            "http_requests": total_requests,
+            "connections_opened": total_connections,
+            "connections_reused": max(0, total_requests - total_connections),
+            "reuse_ratio": round(1 - total_connections / total_requests, 3) if total_requests else 0.0
+        })
+        return stats
+    
+    def get_pool_usage(self) -> List[Dict[str, Any]]:
+        """
+        세션별 연결 풀 사용량 (사용 중 연결 수, 풀 최대 크기)
+        
+        Returns:
+            세션별 사용량 목록
+        """
+        with self._lock:
+            entries = list(self._sessions.items())
+        
+        usage = []
+        for key, session in entries:
+            in_use = 0
+            maxsize = 0
+            for adapter in set(session.adapters.values()):
+                pool_manager = getattr(adapter, "poolmanager", None)
+                if pool_manager is None:
+                    continue
+                for pool_key in list(pool_manager.pools.keys()):
+                    pool = pool_manager.pools.get(pool_key)
+                    slots = getattr(pool, "pool", None) if pool is not None else None
+                    if slots is not None:
+                        # 풀 대기열에는 쉬는 연결과 빈 자리만 있으므로 나머지가 사용 중인 연결
+                        in_use += slots.maxsize - slots.qsize()
+                        maxsize += slots.maxsize
+            usage.append({"base_url": key[0], "pool": key[3], "in_use": in_use,
+                          "maxsize": maxsize or self.pool_maxsize})
+        return usage
+    
+    def close_pool(self, pool: str) -> int:
+        """
+        지정한 연결 풀 이름의 세션 종료
+        
+        Args:
+            pool: 연결 풀 이름
+            
+        Returns:
+            종료한 세션 수
+        """
+        with self._lock:
+            keys = [key for key in self._sessions if key[3] == pool]
+            sessions = [self._sessions.pop(key) for key in keys]
+            for key in keys:
+                self._requests.pop(key, None)
+        for session in sessions:
+            session.close()
+        return len(sessions)
+    
+    def close_session(self, url: str, verify_ssl: bool = False,
+                      auth: Optional[Tuple[str, str]] = None, pool: str = "") -> bool:
+        """
+        지정한 서버/연결 풀의 세션 하나만 종료 (같은 풀 이름의 다른 서버 세션은 유지)
+        
+        Args:
+            url: 요청 URL 또는 기본 URL
+            verify_ssl: SSL 인증서 검증 여부
+            auth: (사용자명, 비밀번호) 기본 인증 정보
+            pool: 연결 풀 이름
+            
+        Returns:
+            종료 여부 (세션이 없으면 False)
+        """
+        key = self._session_key(url, verify_ssl, auth, pool)
+        with self._lock:
+            session = self._sessions.pop(key, None)
+            self._requests.pop(key, None)
+        if session is None:
+            return False
+        session.close()
+        return True
+    
+    def close_all(self):
+        """모든 공유 세션 종료"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._requests.clear()
+        for session in sessions:
+            session.close()
+
+def http_pool_families(registry: HTTPSessionRegistry, name: str) -> List[MetricFamily]:
+    """
+    세션 레지스트리의 연결 풀 사용량 메트릭 생성
+    
+    Args:
+        registry: 세션 레지스트리
+        name: 레지스트리 이름 (메트릭 레이블)
+        
+    Returns:
+        메트릭 목록
+    """
+    in_use = []
+    utilization = []
+    for item in registry.get_pool_usage():
+        labels = {"registry": name, "base_url": item["base_url"], "pool": item["pool"]}
+        in_use.append((labels, item["in_use"]))
+        utilization.append((labels, round(item["in_use"] / item["maxsize"], 4) if item["maxsize"] else 0.0))
+    return [
+        MetricFamily("ape_http_pool_connections_in_use", "gauge", "HTTP 연결 풀 사용 중 연결 수", in_use),
+        MetricFamily("ape_http_pool_utilization", "gauge", "HTTP 연결 풀 사용률", utilization)
+    ]
+
+# 싱글톤 인스턴스
+session_registry = HTTPSessionRegistry()
+metrics.add_collector("http:shared", lambda: http_pool_families(session_registry, "shared"))
+
 def make_api_request(url: str, method: str = "GET", data: dict = None, 
                     params: dict = None, headers: dict = None, 
-                    verify_ssl: bool = False, timeout: int = 30) -> dict:
+                    verify_ssl: bool = False, timeout: int = 30,
+                    auth: Optional[Tuple[str, str]] = None) -> dict:
     """
-    API 요청 수행 및 응답 반환
+    API 요청 수행 및 응답 반환 (공유 세션 레지스트리 사용)
     
     Args:
         url: API 엔드포인트 URL
@@ -69,6 +408,7 @@ def make_api_request(url: str, method: str = "GET", data: dict = None,
         headers: HTTP 헤더
         verify_ssl: SSL 인증서 검증 여부
         timeout: 요청 타임아웃 (초)
+        auth: (사용자명, 비밀번호) 기본 인증 정보
         
     Returns:
         응답 데이터 (JSON)
@@ -76,27 +416,23 @@ def make_api_request(url: str, method: str = "GET", data: dict = None,
     Raises:
         requests.RequestException: API 요청 중 발생한 오류
     """
-    session = get_secure_http_session(timeout=timeout, verify_ssl=verify_ssl)
+    if method.upper() not in ("GET", "POST", "PUT", "DELETE"):
+        logger.error(f"지원되지 않는 HTTP 메서드: {method}")
+        raise ValueError(f"지원되지 않는 HTTP 메서드: {method}")
     
-    # 커스텀 헤더 추가
-    if headers:
-        session.headers.update(headers)
-    
-    # 메서드에 따른 요청 실행
+    # 메서드에 따른 요청 실행 (GET은 본문 없이 전송)
     try:
-        logger.info(f"API 요청: {method} {url}")
-        
-        if method.upper() == "GET":
-            response = session.get(url, params=params)
-        elif method.upper() == "POST":
-            response = session.post(url, json=data, params=params)
-        elif method.upper() == "PUT":
-            response = session.put(url, json=data, params=params)
-        elif method.upper() == "DELETE":
-            response = session.delete(url, json=data, params=params)
-        else:
-            logger.error(f"지원되지 않는 HTTP 메서드: {method}")
-            raise ValueError(f"지원되지 않는 HTTP 메서드: {method}")
+        logger.debug(f"API 요청: {method} {url}")
+        
+        response = session_registry.request(
+            method, url,
+            verify_ssl=verify_ssl,
+            auth=auth,
+            headers=headers,
+            timeout=timeout,
+            json=data if method.upper() != "GET" else None,
+            params=params
+        )
         
         # 응답 상태 코드 확인
         response.raise_for_status()
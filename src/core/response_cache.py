@@ -0,0 +1,88 @@
+"""
+사전 직렬화 응답 캐시 모듈
+
+/health, /models처럼 자주 조회되지만 드물게 바뀌는 응답 본문을 JSON 바이트로 한 번만 만들어 재사용합니다.
+모델 변경(change_model), 모델 목록 갱신(refresh_models), 에이전트 생성 등 원본이 바뀌는 지점에서
+invalidate()를 호출하면 다음 조회에서 다시 만듭니다.
+"""
+
+import json
+import time
+import logging
+import threading
+from typing import Dict, Any, Callable, Optional
+
+from src.core.metrics import metrics, cache_families
+
+# 로거 설정
+logger = logging.getLogger("response_cache")
+
+
+def serialize_json(payload: Any) -> bytes:
+    """응답 본문을 압축 JSON 바이트로 직렬화"""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class PrecomputedResponses:
+    """사전 직렬화 응답 캐시"""
+
+    def __init__(self):
+        """응답 캐시 초기화"""
+        self._bodies: Dict[str, bytes] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "builds": 0, "invalidations": 0}
+        self._last_invalidation: Optional[Dict[str, Any]] = None
+
+    def get(self, name: str, builder: Callable[[], Any]) -> bytes:
+        """
+        캐시된 응답 본문 반환 (없으면 builder 결과를 직렬화하여 저장)
+
+        Args:
+            name: 응답 이름
+            builder: 응답 본문(dict 등)을 만드는 함수
+
+        Returns:
+            JSON 바이트
+        """
+        body = self._bodies.get(name)
+        if body is not None:
+            self._stats["hits"] += 1
+            return body
+
+        generation = self._generation
+        body = serialize_json(builder())
+        with self._lock:
+            self._stats["builds"] += 1
+            # 만드는 도중 무효화되었으면 저장하지 않음 (이번 응답에만 사용)
+            if generation == self._generation:
+                self._bodies[name] = body
+        return body
+
+    def invalidate(self, reason: str = "") -> None:
+        """
+        캐시된 응답 전체 무효화
+
+        Args:
+            reason: 무효화 사유 (통계/로그용)
+        """
+        with self._lock:
+            self._generation += 1
+            self._bodies.clear()
+            self._stats["invalidations"] += 1
+            self._last_invalidation = {"reason": reason, "time": time.time()}
+        logger.debug(f"응답 캐시 무효화: {reason}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cached"] = sorted(self._bodies)
+            stats["last_invalidation"] = self._last_invalidation
+        return stats
+
+
+# 싱글톤 인스턴스
+response_cache = PrecomputedResponses()
+metrics.add_collector("response_cache", lambda: cache_families("response", response_cache._stats["hits"],
+                                                                response_cache._stats["builds"]))
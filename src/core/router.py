@@ -9,20 +9,37 @@ from typing import Dict, Any, List, Optional, Union
 from enum import Enum
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, status, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
 from src.core.config import get_settings
-from src.core.llm_service import llm_service
-from src.agents.agent_manager import agent_manager
-from src.agents.swdp_rpc_api import SWDPRPCAPI
+from src.core.config_snapshot import config_store
+from src.core.token_budget import token_usage_tracker
+from src.core.requests_config import session_registry
+from src.core.async_client import get_async_session_stats
+from src.core.jql_cache import jql_cache
+from src.core.service_container import service_container
+from src.core.warmup import warmup_manager
+from src.core.response_cache import response_cache
+from src.core.model_clients import use_model, bind_model, model_session_registry
+from src.core.metrics import metrics, http_request_seconds, http_requests_in_flight, CONTENT_TYPE
+from src.core import tracing
+from src.core.tracing import tracer, server_timing, TRACEPARENT_HEADER, TRACE_ID_HEADER
+from src.core.profiler import sampling_profiler, render_collapsed, PROFILE_HEADER
+from src.core.admin_auth import admin_auth, ADMIN_TOKEN_HEADER
 
 # 로깅 설정
 logger = logging.getLogger("api_router")
 
-# SWDP RPC API 인스턴스 초기화
-swdp_rpc_api = SWDPRPCAPI()
+# 서비스 지연 프록시 - 에이전트/DB 스키마/LLM 설정은 첫 요청 또는 워밍업에서 생성
+llm_service = service_container.proxy("llm_service")
+agent_manager = service_container.proxy("agent_manager")
+swdp_rpc_api = service_container.proxy("swdp_rpc_api")
+
+# 요청별 모델 선택 헤더 (QueryRequest.metadata의 model이 우선)
+MODEL_HEADER = "X-Model"
 
 # ===== API 모델 =====
 
@@ -130,6 +147,81 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_http_metrics(request: Request, call_next):
+    """HTTP 핸들러 처리 시간과 처리 중인 요청 수 기록 (경로는 라우트 템플릿 기준)"""
+    start = time.perf_counter()
+    status_code = 500
+    http_requests_in_flight.inc()
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        http_requests_in_flight.dec()
+        route = request.scope.get("route")
+        http_request_seconds.observe(time.perf_counter() - start, request.method,
+                                     getattr(route, "path", "unmatched"), status_code)
+
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    """
+    요청 추적 시작 (들어온 traceparent가 있으면 같은 trace_id 사용)
+
+    응답 헤더에 X-Trace-Id와 단계별 소요 시간(Server-Timing)을 붙이고, 응답 본문 전송이 끝나면
+    추적을 종료해 내보냅니다. 스트리밍 응답의 본문 생성 구간은 헤더를 보낸 뒤에 끝나므로
+    Server-Timing에는 포함되지 않고 내보낸 추적에만 남습니다.
+    """
+    root = tracer.start_trace("http.request", request.headers.get(TRACEPARENT_HEADER),
+                              method=request.method, path=request.url.path)
+    if root is None:
+        return await call_next(request)
+
+    with tracing.activate(root):
+        try:
+            response = await call_next(request)
+        except Exception as e:
+            root.set_error(e)
+            tracer.finish_trace(root)
+            raise
+
+    root.set_attribute("route", getattr(request.scope.get("route"), "path", "unmatched"))
+    root.set_attribute("status_code", response.status_code)
+    response.headers[TRACE_ID_HEADER] = root.trace_id
+    response.headers["Server-Timing"] = server_timing(root.trace, root.elapsed)
+
+    body_iterator = response.body_iterator
+
+    async def finish_after_body():
+        try:
+            async for chunk in body_iterator:
+                yield chunk
+        finally:
+            tracer.finish_trace(root)
+
+    response.body_iterator = finish_after_body()
+    return response
+
+# 설정 스냅샷이 교체되면 설정 값(버전, API 주소)이 들어 있는 사전 직렬화 응답 무효화
+config_store.add_listener(lambda snapshot, previous: response_cache.invalidate("config_reload"))
+# 설정 스냅샷이 교체되면 추적 설정(내보내기 대상, 샘플링 비율) 다시 적용
+config_store.add_listener(lambda snapshot, previous: tracer.configure(snapshot))
+# 설정 스냅샷이 교체되면 프로파일링 설정(관리자 토큰, 최대 시간)과 관리자 인증 설정 다시 적용
+config_store.add_listener(lambda snapshot, previous: sampling_profiler.configure(snapshot))
+config_store.add_listener(lambda snapshot, previous: admin_auth.configure(snapshot))
+
+@app.on_event("startup")
+async def configure_tracing():
+    """settings.json의 tracing, profiling, admin 섹션으로 요청 추적, 프로파일링, 관리자 인증 설정"""
+    tracer.configure(get_settings())
+    sampling_profiler.configure(get_settings())
+    admin_auth.configure(get_settings())
+
+@app.on_event("startup")
+async def start_warmup():
+    """워밍업 시작 (main.init_system에서 이미 시작했으면 무시)"""
+    warmup_manager.start(get_settings())
+
 @app.get("/")
 async def root():
     """API 루트"""
@@ -149,7 +241,15 @@ async def root():
             "문서 삭제": "/documents/{doc_id}",
             "문서 검색": "/documents/search",
             "SWDP API": "/api/swdp",
-            "상태 확인": "/health"
+            "토큰 사용량": "/metrics/tokens",
+            "HTTP 연결 재사용": "/metrics/http",
+            "요청 추적": "/metrics/traces",
+            "서비스 초기화 상태": "/metrics/services",
+            "JQL 캐시 관리": "/admin/jql-cache",
+            "워커 프로파일": "/admin/profile?seconds=N",
+            "상태 확인": "/health",
+            "생존 확인": "/live",
+            "준비 상태 확인": "/ready"
         }
     }
 
@@ -166,23 +266,90 @@ async def list_agents():
             detail=f"에이전트 목록 조회 오류: {str(e)}"
         )
 
+def _request_model(request: QueryRequest, raw_request: Request) -> Optional[str]:
+    """
+    요청이 고른 모델 키 (metadata의 model 우선, 없으면 X-Model 헤더)
+    
+    Returns:
+        모델 키 (지정하지 않았으면 None - 기본 모델 사용)
+        
+    Raises:
+        HTTPException: 알 수 없는 모델인 경우
+    """
+    model = (request.metadata or {}).get("model") or raw_request.headers.get(MODEL_HEADER)
+    if model and not llm_service.has_model(model):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 모델: {model}"
+        )
+    return model or None
+
+def _require_admin(raw_request: Request) -> None:
+    """
+    관리자 요청인지 확인 (admin.token 설정 시 X-Admin-Token 일치, 없으면 로컬 요청만)
+    
+    Raises:
+        HTTPException: 허용되지 않은 요청인 경우
+    """
+    client_host = raw_request.client.host if raw_request.client else None
+    if not admin_auth.is_allowed(client_host, raw_request.headers.get(ADMIN_TOKEN_HEADER)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 전용 기능입니다"
+        )
+
+def _require_profiling(raw_request: Request) -> None:
+    """
+    프로파일링을 허용할 관리자 요청인지 확인 (profiling.enabled가 꺼져 있으면 거부)
+    
+    Raises:
+        HTTPException: 허용되지 않은 요청인 경우
+    """
+    client_host = raw_request.client.host if raw_request.client else None
+    if not sampling_profiler.is_allowed(client_host, raw_request.headers.get(ADMIN_TOKEN_HEADER)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="프로파일링이 비활성화되어 있거나 관리자 요청이 아닙니다"
+        )
+
+def _profile_requested(request: QueryRequest, raw_request: Request) -> bool:
+    """
+    요청 단위 프로파일 여부 (metadata의 profile 또는 X-Profile 헤더, 관리자 요청만)
+    
+    Raises:
+        HTTPException: 프로파일을 요청했지만 관리자 요청이 아닌 경우
+    """
+    flag = (request.metadata or {}).get("profile") or raw_request.headers.get(PROFILE_HEADER)
+    if not flag or str(flag).lower() in ("0", "false", "no", "off"):
+        return False
+    _require_profiling(raw_request)
+    return True
+
 @app.post("/agents/{agent_type}")
 async def run_agent(
     agent_type: AgentType,
     request: QueryRequest,
+    raw_request: Request,
     background_tasks: BackgroundTasks
 ):
-    """에이전트 실행 엔드포인트"""
+    """에이전트 실행 엔드포인트 (요청별 모델 선택 가능, 기본 모델은 바꾸지 않음, 관리자는 cProfile 요약 요청 가능)"""
+    model = _request_model(request, raw_request)
+    profile = _profile_requested(request, raw_request)
     try:
         if request.streaming:
-            # 스트리밍 응답
+            # 스트리밍 응답 (요청 단위 프로파일은 일반 응답에서만 지원)
             return StreamingResponse(
-                agent_manager.run_agent_stream(agent_type.value, request.query, request.metadata),
+                bind_model(agent_manager.run_agent_stream(agent_type.value, request.query, request.metadata), model),
                 media_type="text/event-stream"
             )
-        else:
+        with use_model(model):
             # 일반 응답
-            result = agent_manager.run_agent(agent_type.value, request.query, request.metadata)
+            profile_summary = None
+            if profile:
+                result, profile_summary = sampling_profiler.profile_call(
+                    agent_manager.run_agent, agent_type.value, request.query, request.metadata)
+            else:
+                result = agent_manager.run_agent(agent_type.value, request.query, request.metadata)
             
             # 딕셔너리 형태로 반환
             if isinstance(result, dict) and "error" in result:
@@ -203,6 +370,8 @@ async def run_agent(
                 result["model"] = llm_service.model_id
             if "agent_id" not in result:
                 result["agent_id"] = f"{agent_type.value}-unknown"
+            if profile_summary is not None:
+                result["profile"] = profile_summary
                 
             return result
     
@@ -232,13 +401,16 @@ async def get_agent_status(agent_id: str):
         )
 
 @app.post("/query")
-async def direct_query(request: QueryRequest):
-    """직접 LLM 쿼리 엔드포인트"""
+async def direct_query(request: QueryRequest, raw_request: Request):
+    """직접 LLM 쿼리 엔드포인트 (요청별 모델 선택 가능, 기본 모델은 바꾸지 않음)"""
+    model = _request_model(request, raw_request)
     try:
         if request.streaming:
-            # 스트리밍 응답
+            # 스트리밍 응답 (모델 클라이언트는 generate 호출 시점에 정해짐)
+            chunks = llm_service.generate([llm_service.format_user_message(request.query)], stream=True, model=model)
+            
             async def stream_generator():
-                for chunk in llm_service.generate([llm_service.format_user_message(request.query)], stream=True):
+                for chunk in chunks:
                     yield f"data: {chunk}\n\n"
                 yield "data: [DONE]\n\n"
                 
@@ -248,7 +420,7 @@ async def direct_query(request: QueryRequest):
             )
         else:
             # 일반 응답
-            result = llm_service.generate([llm_service.format_user_message(request.query)], stream=False)
+            result = llm_service.generate([llm_service.format_user_message(request.query)], stream=False, model=model)
             
             if isinstance(result, dict) and "error" in result:
                 raise HTTPException(
@@ -257,7 +429,7 @@ async def direct_query(request: QueryRequest):
                 )
                 
             # 모델 ID 확인
-            model_id = llm_service.model_id
+            model_id = llm_service.get_client(model).model_id
             if model_id is None:
                 model_id = "unknown_model"  # 기본값 제공
                 
@@ -270,28 +442,49 @@ async def direct_query(request: QueryRequest):
             detail=f"쿼리 실행 오류: {str(e)}"
         )
 
+def _models_info() -> List[Dict[str, Any]]:
+    """응답용 모델 정보 목록"""
+    models_info = []
+    for model in llm_service.list_available_models():
+        models_info.append({
+            "key": model.get("key", ""),
+            "name": model.get("name", ""),
+            "provider": model.get("provider", ""),
+            "description": model.get("description", ""),
+            "id": model.get("id", "")
+        })
+    return models_info
+
+def _build_models_response() -> Dict[str, Any]:
+    """/models 응답 본문 (response_cache에서 무효화 전까지 재사용)"""
+    return {
+        "models": _models_info(),
+        "current_model": llm_service.current_model,
+        "model_id": llm_service.model_id
+    }
+
+def _build_health_response() -> Dict[str, Any]:
+    """/health 응답 본문 - timestamp 제외 (response_cache에서 무효화 전까지 재사용)"""
+    settings = get_settings()
+    
+    # 에이전트 관리자가 아직 생성되지 않았으면 상태 확인 때문에 생성하지 않음
+    agents = agent_manager.list_agents() if service_container.is_loaded("agent_manager") else []
+    
+    return {
+        "status": "healthy",
+        "version": settings.get("version", "0.5.0"),
+        "model": llm_service.model_id,
+        "api_host": f"{settings.get('api', {}).get('host', 'localhost')}:{settings.get('api', {}).get('port', '8001')}",
+        "agents": agents,
+        "available_models": _models_info(),
+        "default_model": llm_service.current_model
+    }
+
 @app.get("/models")
 async def list_models():
-    """사용 가능한 모델 목록 조회"""
+    """사용 가능한 모델 목록 조회 (사전 직렬화 응답)"""
     try:
-        models = llm_service.list_available_models()
-        
-        # 모델 정보 목록으로 변환
-        models_info = []
-        for model in models:
-            models_info.append({
-                "key": model.get("key", ""),
-                "name": model.get("name", ""),
-                "provider": model.get("provider", ""),
-                "description": model.get("description", ""),
-                "id": model.get("id", "")
-            })
-        
-        return {
-            "models": models_info,
-            "current_model": llm_service.current_model,
-            "model_id": llm_service.model_id
-        }
+        return Response(content=response_cache.get("models", _build_models_response), media_type="application/json")
     except Exception as e:
         logger.error(f"모델 목록 조회 오류: {e}")
         raise HTTPException(
@@ -488,8 +681,9 @@ async def delete_document(doc_id: str):
         )
 
 @app.post("/documents/search")
-async def search_documents(request: QueryRequest):
-    """문서 검색 엔드포인트"""
+async def search_documents(request: QueryRequest, raw_request: Request):
+    """문서 검색 엔드포인트 (요청별 모델 선택 가능)"""
+    model = _request_model(request, raw_request)
     try:
         # 문서 관리 에이전트 초기화
         document_agent = agent_manager.get_or_create_agent("document")
@@ -510,12 +704,13 @@ async def search_documents(request: QueryRequest):
         if request.streaming:
             # 스트리밍 응답
             return StreamingResponse(
-                agent_manager.run_agent_stream("document", request.query, metadata),
+                bind_model(agent_manager.run_agent_stream("document", request.query, metadata), model),
                 media_type="text/event-stream"
             )
         else:
             # 일반 응답
-            result = document_agent.run(request.query, metadata)
+            with use_model(model):
+                result = document_agent.run(request.query, metadata)
             
             return {
                 "status": "success",
@@ -732,30 +927,140 @@ async def create_tr(request: TRCreateRequest):
             detail=f"TR 생성 오류: {str(e)}"
         )
 
-@app.get("/health")
-async def health_check():
-    """서비스 상태 확인"""
-    settings = get_settings()
+@app.get("/metrics/tokens")
+async def get_token_metrics():
+    """토큰 사용량 집계 조회 (에이전트/모델/엔드포인트별)"""
+    try:
+        summary = token_usage_tracker.get_summary()
+        summary["prompt_token_budget"] = llm_service.get_prompt_token_budget()
+        return summary
+    except Exception as e:
+        logger.error(f"토큰 사용량 조회 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"토큰 사용량 조회 오류: {str(e)}"
+        )
+
+@app.delete("/metrics/tokens")
+async def reset_token_metrics(raw_request: Request):
+    """토큰 사용량 집계 초기화 (관리자 전용)"""
+    _require_admin(raw_request)
+    token_usage_tracker.reset()
+    return {"status": "success"}
+
+@app.get("/metrics/http")
+async def get_http_metrics():
+    """외부 API 공유 세션 및 연결 재사용 통계 조회 (비동기 연동 클라이언트, LLM 모델 연결 풀 포함)"""
+    try:
+        stats = session_registry.get_stats()
+        stats["async"] = get_async_session_stats()
+        stats["model"] = model_session_registry.get_stats()
+        return stats
+    except Exception as e:
+        logger.error(f"HTTP 연결 통계 조회 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"HTTP 연결 통계 조회 오류: {str(e)}"
+        )
+
+@app.get("/metrics")
+async def get_prometheus_metrics():
+    """Prometheus 형식 메트릭 조회"""
+    return Response(content=metrics.render(), media_type=CONTENT_TYPE)
+
+@app.get("/metrics/traces")
+async def get_trace_metrics():
+    """요청 추적 및 내보내기 통계 조회"""
+    return tracer.get_stats()
+
+@app.get("/metrics/models")
+async def get_model_client_metrics():
+    """모델 클라이언트 레지스트리 통계 조회"""
+    return llm_service.get_client_stats()
+
+@app.get("/metrics/services")
+async def get_service_metrics():
+    """지연 서비스 컨테이너의 서비스별 생성 여부 및 생성 시간 조회"""
+    return service_container.get_stats()
+
+@app.get("/admin/config")
+async def get_config_status(raw_request: Request):
+    """현재 설정 스냅샷 버전 및 다시 로드 통계 조회 (관리자 전용)"""
+    _require_admin(raw_request)
+    return config_store.get_stats()
+
+@app.post("/admin/config/reload")
+async def reload_config(raw_request: Request):
+    """설정 다시 로드 (실패 시 이전 스냅샷 유지, 관리자 전용)"""
+    _require_admin(raw_request)
+    snapshot = config_store.reload("api")
+    return {"status": "success", "snapshot": snapshot.snapshot_info(), "stats": config_store.get_stats()}
+
+@app.get("/admin/profile")
+async def profile_worker(raw_request: Request, seconds: float = 5.0, interval_ms: Optional[float] = None,
+                         format: str = "collapsed", idle: bool = False):
+    """
+    현재 워커 샘플링 프로파일 (관리자 전용)
     
-    # 모델 정보 가져오기
-    models_info = []
-    models = llm_service.list_available_models()
-    for model in models:
-        models_info.append({
-            "key": model.get("key", ""),
-            "name": model.get("name", ""),
-            "provider": model.get("provider", ""),
-            "description": model.get("description", ""),
-            "id": model.get("id", "")
-        })
+    seconds 동안 모든 스레드의 스택을 수집해 collapsed stack 텍스트(flamegraph.pl, speedscope 입력)로 반환합니다.
+    format=json이면 샘플 수와 스택별 개수를 JSON으로 반환합니다.
+    """
+    _require_profiling(raw_request)
+    max_seconds = sampling_profiler.config["max_seconds"]
+    if not 0 < seconds <= max_seconds or format not in ("collapsed", "json"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"seconds는 0 초과 {max_seconds} 이하, format은 collapsed 또는 json이어야 합니다"
+        )
+    try:
+        # 수집은 스레드 풀에서 실행 (이벤트 루프 스레드도 샘플링 대상)
+        result = await run_in_threadpool(sampling_profiler.sample, seconds, interval_ms, idle)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     
+    if format == "json":
+        return result
+    return Response(content=render_collapsed(result["stacks"]), media_type="text/plain; charset=utf-8")
+
+@app.get("/admin/jql-cache")
+async def get_jql_cache(raw_request: Request, limit: int = 100):
+    """자연어 → JQL 캐시 통계 및 최근 사용 항목 조회 (관리자 전용)"""
+    _require_admin(raw_request)
     return {
-        "status": "healthy",
-        "version": settings.get("version", "0.5.0"),
-        "timestamp": time.time(),
-        "model": llm_service.model_id,
-        "api_host": f"{settings.get('api', {}).get('host', 'localhost')}:{settings.get('api', {}).get('port', '8001')}",
-        "agents": agent_manager.list_agents(),
-        "available_models": models_info,
-        "default_model": llm_service.current_model
-    }
\ No newline at end of file
+        "stats": jql_cache.get_stats(),
+        "entries": jql_cache.list_entries(limit)
+    }
+
+@app.delete("/admin/jql-cache")
+async def purge_jql_cache(raw_request: Request, key: Optional[str] = None):
+    """자연어 → JQL 캐시 항목 삭제 (key가 없으면 전체 삭제, 관리자 전용)"""
+    _require_admin(raw_request)
+    removed = jql_cache.purge(key)
+    if key is not None and not removed:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"JQL 캐시 항목을 찾을 수 없음: {key}"
+        )
+    return {"status": "success", "removed": removed}
+
+@app.get("/live")
+async def liveness_check():
+    """생존 확인 (프로세스가 요청에 응답하는지만 확인, 의존성 미사용)"""
+    return {"status": "alive"}
+
+@app.get("/ready")
+async def readiness_check():
+    """준비 상태 확인 (워밍업 완료 전에는 503)"""
+    warmup_status = warmup_manager.get_status()
+    if not warmup_status["ready"]:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=warmup_status)
+    return warmup_status
+
+@app.get("/health")
+async def health_check():
+    """서비스 상태 확인 (사전 직렬화 응답, 모델 변경/모델 목록 갱신/에이전트 생성 시에만 다시 생성)"""
+    body = response_cache.get("health", _build_health_response)
+    
+    # 요청마다 바뀌는 timestamp만 캐시된 본문 앞에 붙임
+    content = b'{"timestamp":' + repr(time.time()).encode("ascii") + b"," + body[1:]
+    return Response(content=content, media_type="application/json")
\ No newline at end of file
@@ -0,0 +1,235 @@
+"""
+지연 서비스 컨테이너 모듈
+
+에이전트와 무거운 의존성(sqlalchemy 등)을 모듈 임포트 시점이 아니라 처음 사용할 때 생성합니다.
+서비스는 "패키지.모듈:속성" 경로로 등록되므로 등록만으로는 어떤 모듈도 임포트되지 않으며,
+warm_up()으로 서버 시작 후 백그라운드 스레드에서 미리 생성할 수 있습니다.
+"""
+
+import time
+import logging
+import importlib
+import threading
+from typing import Dict, Any, List, Optional, Union, Callable
+
+# 로거 설정
+logger = logging.getLogger("service_container")
+
+
+def import_object(path: str) -> Any:
+    """
+    "패키지.모듈:속성" 경로의 객체 임포트
+
+    Args:
+        path: 모듈 경로 (속성이 없으면 모듈 자체 반환)
+
+    Returns:
+        임포트된 객체
+    """
+    module_path, _, attribute = path.partition(":")
+    module = importlib.import_module(module_path)
+    if not attribute:
+        return module
+    target = module
+    for name in attribute.split("."):
+        target = getattr(target, name)
+    return target
+
+
+class ServiceProxy:
+    """
+    서비스 지연 프록시
+
+    모듈 전역 변수 자리에 두고 속성에 처음 접근할 때 컨테이너에서 서비스를 생성합니다.
+    """
+
+    __slots__ = ("_container", "_name")
+
+    def __init__(self, container: "ServiceContainer", name: str):
+        self._container = container
+        self._name = name
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._container.get(self._name), item)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._container.is_loaded(self._name) else "lazy"
+        return f"<ServiceProxy {self._name} ({state})>"
+
+
+class ServiceContainer:
+    """지연 서비스 컨테이너"""
+
+    def __init__(self):
+        """서비스 컨테이너 초기화"""
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._targets: Dict[str, str] = {}
+        self._warm_up: List[str] = []
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._load_times: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._warm_up_thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, target: Union[str, Callable[[], Any]], warm_up: bool = True) -> None:
+        """
+        서비스 등록 (생성은 첫 get() 또는 warm_up()까지 미룸)
+
+        Args:
+            name: 서비스 이름
+            target: "패키지.모듈:속성" 경로 또는 인자 없는 팩토리 함수.
+                경로가 클래스를 가리키면 인자 없이 생성하고, 그 밖의 객체(모듈 싱글톤 등)는 그대로 사용합니다.
+            warm_up: 백그라운드 워밍업 대상 여부
+        """
+        if isinstance(target, str):
+            path = target
+
+            def factory() -> Any:
+                resolved = import_object(path)
+                return resolved() if isinstance(resolved, type) else resolved
+        else:
+            path = f"{getattr(target, '__module__', '?')}:{getattr(target, '__qualname__', repr(target))}"
+            factory = target
+
+        with self._lock:
+            self._factories[name] = factory
+            self._targets[name] = path
+            self._locks.setdefault(name, threading.Lock())
+            self._instances.pop(name, None)
+            self._errors.pop(name, None)
+            if warm_up and name not in self._warm_up:
+                self._warm_up.append(name)
+            elif not warm_up and name in self._warm_up:
+                self._warm_up.remove(name)
+
+    def get(self, name: str) -> Any:
+        """
+        서비스 인스턴스 반환 (처음 호출 시 한 번만 생성)
+
+        Args:
+            name: 서비스 이름
+
+        Returns:
+            서비스 인스턴스
+
+        Raises:
+            KeyError: 등록되지 않은 서비스
+            Exception: 서비스 생성 실패 (다음 호출에서 다시 시도)
+        """
+        try:
+            return self._instances[name]
+        except KeyError:
+            pass
+
+        lock = self._locks.get(name)
+        if lock is None:
+            raise KeyError(f"등록되지 않은 서비스: {name}")
+
+        # 서비스별 락 - 한 서비스 생성이 다른 서비스 조회를 막지 않음
+        with lock:
+            if name in self._instances:
+                return self._instances[name]
+
+            start = time.perf_counter()
+            try:
+                instance = self._factories[name]()
+            except Exception as e:
+                self._errors[name] = str(e)
+                logger.error(f"서비스 생성 실패: {name} ({self._targets[name]}): {e}")
+                raise
+
+            elapsed = time.perf_counter() - start
+            self._load_times[name] = elapsed
+            self._errors.pop(name, None)
+            self._instances[name] = instance
+            logger.info(f"서비스 생성 완료: {name} ({elapsed * 1000:.1f}ms)")
+            return instance
+
+    def proxy(self, name: str) -> ServiceProxy:
+        """
+        서비스 지연 프록시 반환
+
+        Args:
+            name: 서비스 이름
+
+        Returns:
+            첫 속성 접근 시 서비스를 생성하는 프록시
+        """
+        return ServiceProxy(self, name)
+
+    def is_loaded(self, name: str) -> bool:
+        """서비스 생성 여부"""
+        return name in self._instances
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """
+        생성된 인스턴스 폐기 (다음 get()에서 다시 생성)
+
+        Args:
+            name: 서비스 이름 (없으면 전체)
+        """
+        with self._lock:
+            names = [name] if name else list(self._instances)
+            for item in names:
+                self._instances.pop(item, None)
+                self._load_times.pop(item, None)
+                self._errors.pop(item, None)
+
+    def warm_up(self, names: Optional[List[str]] = None, background: bool = True) -> Optional[threading.Thread]:
+        """
+        서비스 미리 생성
+
+        실패한 서비스는 기록만 하고 건너뛰므로 첫 요청에서 다시 시도됩니다.
+
+        Args:
+            names: 생성할 서비스 이름 목록 (없으면 워밍업 대상 전체)
+            background: 데몬 스레드에서 실행 여부
+
+        Returns:
+            백그라운드 실행 시 워밍업 스레드, 동기 실행 시 None
+        """
+        targets = list(names) if names is not None else list(self._warm_up)
+
+        def run() -> None:
+            start = time.perf_counter()
+            for name in targets:
+                try:
+                    self.get(name)
+                except Exception:
+                    continue
+            logger.info(f"서비스 워밍업 완료: {len(targets)}개 ({(time.perf_counter() - start) * 1000:.1f}ms)")
+
+        if not background:
+            run()
+            return None
+
+        thread = threading.Thread(target=run, name="service-warm-up", daemon=True)
+        self._warm_up_thread = thread
+        thread.start()
+        return thread
+
+    def get_stats(self) -> Dict[str, Any]:
+        """서비스별 생성 상태 및 생성 시간 통계"""
+        services = {}
+        for name, path in self._targets.items():
+            services[name] = {
+                "target": path,
+                "loaded": name in self._instances,
+                "load_ms": round(self._load_times[name] * 1000, 2) if name in self._load_times else None,
+                "error": self._errors.get(name)
+            }
+        return {
+            "registered": len(self._targets),
+            "loaded": len(self._instances),
+            "warming_up": bool(self._warm_up_thread and self._warm_up_thread.is_alive()),
+            "services": services
+        }
+
+
+# 싱글톤 인스턴스
+service_container = ServiceContainer()
+service_container.register("llm_service", "src.core.llm_service:llm_service")
+service_container.register("agent_manager", "src.agents.agent_manager:agent_manager")
+service_container.register("swdp_rpc_api", "src.agents.swdp_rpc_api:SWDPRPCAPI")
+service_container.register("orchestrator", "src.agents.orchestrator:AgentOrchestrator", warm_up=False)
@@ -0,0 +1,264 @@
+"""토큰 예산 모듈
+
+LLM 호출에 사용되는 토큰 수 추정, 프롬프트 예산 적용, 사용량 집계 기능을 제공합니다.
+토크나이저 의존성 없이 동작하는 빠른 추정치를 사용합니다.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Dict, Any, List, Optional
+
+# 로거 설정
+logger = logging.getLogger("token_budget")
+
+# 메시지당 역할/구분자 오버헤드 (OpenAI 호환 채팅 포맷 기준)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# 영문/숫자 등 ASCII 문자는 평균 4자당 1토큰, 한글 등 비 ASCII 문자는 1자당 1토큰으로 추정
+ASCII_CHARS_PER_TOKEN = 4
+
+# 모델 설정에 contextWindow가 없을 때 사용하는 컨텍스트 윈도 크기 (프롬프트 + 완료 토큰)
+DEFAULT_CONTEXT_WINDOW = int(os.environ.get("LLM_CONTEXT_WINDOW", "32768"))
+
+# 예산 초과 시 잘라낼 수 있는 메시지 역할 (질문/검색 결과/이전 에이전트 결과 등 사용자 컨텍스트)
+# 시스템 메시지는 지시와 스키마를 담은 프롬프트 캐시 접두부이므로 자르지 않음
+TRIMMABLE_ROLES = ("user",)
+
+# 잘린 컨텍스트 끝에 붙이는 표식
+TRUNCATION_MARKER = "\n...(토큰 예산 초과로 이하 생략)"
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """
+    텍스트의 토큰 수 추정
+
+    Args:
+        text: 추정할 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+
+    # ASCII 인코딩은 C 레벨에서 처리되므로 문자 단위 루프보다 훨씬 빠름
+    ascii_count = len(text.encode("ascii", "ignore"))
+    non_ascii_count = len(text) - ascii_count
+
+    return -(-ascii_count // ASCII_CHARS_PER_TOKEN) + non_ascii_count
+
+
+def estimate_messages_tokens(messages: List[Dict[str, Any]]) -> int:
+    """
+    메시지 목록의 프롬프트 토큰 수 추정
+
+    Args:
+        messages: 채팅 메시지 목록
+
+    Returns:
+        추정 토큰 수
+    """
+    total = 0
+    for message in messages:
+        content = message.get("content", "")
+        if not isinstance(content, str):
+            content = str(content)
+        total += estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+    return total
+
+
+def trim_text_to_tokens(text: str, max_tokens: int, marker: str = TRUNCATION_MARKER) -> str:
+    """
+    텍스트를 최대 토큰 수에 맞게 앞부분만 남기고 잘라냄
+
+    Args:
+        text: 원본 텍스트
+        max_tokens: 허용 최대 토큰 수 (표식 포함)
+        marker: 잘린 경우 끝에 붙일 표식
+
+    Returns:
+        예산에 맞게 잘린 텍스트
+    """
+    if not text or estimate_tokens(text) <= max_tokens:
+        return text
+
+    available = max_tokens - estimate_tokens(marker)
+    if available <= 0:
+        return ""
+
+    # 추정 함수가 접두사 길이에 대해 단조 증가하므로 이분 탐색으로 잘라낼 위치 결정
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) <= available:
+            low = mid
+        else:
+            high = mid - 1
+
+    trimmed = text[:low]
+
+    # 가능하면 줄 단위로 자름
+    last_newline = trimmed.rfind("\n")
+    if last_newline > len(trimmed) // 2:
+        trimmed = trimmed[:last_newline]
+
+    return trimmed + marker
+
+
+def prompt_token_budget(model_config: Dict[str, Any]) -> int:
+    """
+    모델 설정의 프롬프트 토큰 예산
+
+    maxPromptTokens가 있으면 그대로 사용하고, 없으면 컨텍스트 윈도(contextWindow)에서
+    완료 토큰 상한(maxTokens, 요청의 max_tokens)을 뺀 값을 사용합니다.
+
+    Args:
+        model_config: 모델 설정
+
+    Returns:
+        프롬프트 최대 토큰 수
+    """
+    if model_config.get("maxPromptTokens"):
+        return int(model_config["maxPromptTokens"])
+    context_window = int(model_config.get("contextWindow") or DEFAULT_CONTEXT_WINDOW)
+    return max(context_window - int(model_config.get("maxTokens", 4096)), 0)
+
+
+def fit_messages_to_budget(messages: List[Dict[str, Any]], max_tokens: int) -> List[Dict[str, Any]]:
+    """
+    메시지 목록이 프롬프트 예산을 넘으면 잘라낼 수 있는 메시지(TRIMMABLE_ROLES) 중 가장 긴 메시지부터 잘라냄
+
+    시스템 메시지(지시, 스키마)는 자르지 않으므로 프롬프트 캐시 접두부가 바뀌지 않습니다.
+    원본 메시지는 변경하지 않고, 잘린 메시지만 새 딕셔너리로 교체한 목록을 반환합니다.
+
+    Args:
+        messages: 채팅 메시지 목록
+        max_tokens: 프롬프트 최대 토큰 수
+
+    Returns:
+        예산에 맞게 조정된 메시지 목록
+    """
+    total = estimate_messages_tokens(messages)
+    if total <= max_tokens:
+        return messages
+
+    fitted = list(messages)
+    trimmable = [i for i, message in enumerate(fitted) if message.get("role") in TRIMMABLE_ROLES]
+
+    # 잘라낼 수 없는 메시지만으로 예산을 넘으면 질문까지 지워지므로 축소하지 않음
+    fixed = estimate_messages_tokens([message for i, message in enumerate(fitted) if i not in trimmable])
+    if fixed >= max_tokens:
+        logger.warning(f"잘라낼 수 없는 메시지(시스템 지시 등)만으로 프롬프트 토큰 예산 초과: "
+                       f"{max_tokens} 토큰 예산, {fixed} 토큰")
+        return messages
+
+    # 잘라낼 수 있는 메시지 수만큼만 반복 (매 반복마다 가장 긴 메시지 하나를 잘라냄)
+    for _ in range(len(trimmable)):
+        excess = total - max_tokens
+        if excess <= 0:
+            break
+
+        index = max(trimmable, key=lambda i: estimate_tokens(str(fitted[i].get("content", ""))))
+        content = str(fitted[index].get("content", ""))
+        content_tokens = estimate_tokens(content)
+        if content_tokens == 0:
+            break
+
+        trimmed = trim_text_to_tokens(content, max(content_tokens - excess, 0))
+        fitted[index] = {**fitted[index], "content": trimmed}
+        total = estimate_messages_tokens(fitted)
+
+    logger.warning(f"프롬프트 토큰 예산 초과로 메시지 축소: {max_tokens} 토큰 예산, 조정 후 {total} 토큰")
+    return fitted
+
+
+class TokenUsageTracker:
+    """토큰 사용량 집계 클래스
+
+    에이전트 유형, 모델, 엔드포인트별로 프롬프트/완료 토큰 사용량을 누적합니다.
+    """
+
+    def __init__(self):
+        """토큰 사용량 집계 초기화"""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """집계 초기화"""
+        with self._lock:
+            self._started_at = time.time()
+            self._totals = self._new_bucket()
+            self._by_agent: Dict[str, Dict[str, int]] = {}
+            self._by_model: Dict[str, Dict[str, int]] = {}
+            self._by_endpoint: Dict[str, Dict[str, int]] = {}
+            self._trimmed_requests = 0
+
+    @staticmethod
+    def _new_bucket() -> Dict[str, int]:
+        """빈 집계 버킷 생성"""
+        return {
+            "requests": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0,
+            "estimated_requests": 0
+        }
+
+    @staticmethod
+    def _add(bucket: Dict[str, int], prompt_tokens: int, completion_tokens: int, estimated: bool):
+        """버킷에 사용량 누적"""
+        bucket["requests"] += 1
+        bucket["prompt_tokens"] += prompt_tokens
+        bucket["completion_tokens"] += completion_tokens
+        bucket["total_tokens"] += prompt_tokens + completion_tokens
+        if estimated:
+            bucket["estimated_requests"] += 1
+
+    def record(self, agent_type: str, model: str, endpoint: str,
+               prompt_tokens: int, completion_tokens: int, estimated: bool = False):
+        """
+        LLM 호출 한 건의 토큰 사용량 기록
+
+        Args:
+            agent_type: 호출한 에이전트 유형
+            model: 모델 키
+            endpoint: 호출 엔드포인트
+            prompt_tokens: 프롬프트 토큰 수
+            completion_tokens: 완료 토큰 수
+            estimated: 프로바이더 보고값이 아닌 추정치 여부
+        """
+        with self._lock:
+            self._add(self._totals, prompt_tokens, completion_tokens, estimated)
+            for key, table in ((agent_type, self._by_agent), (model, self._by_model), (endpoint, self._by_endpoint)):
+                bucket = table.get(key)
+                if bucket is None:
+                    bucket = table[key] = self._new_bucket()
+                self._add(bucket, prompt_tokens, completion_tokens, estimated)
+
+    def record_trim(self):
+        """프롬프트 예산 초과로 축소된 요청 수 증가"""
+        with self._lock:
+            self._trimmed_requests += 1
+
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        집계 요약 반환
+
+        Returns:
+            전체/에이전트별/모델별/엔드포인트별 토큰 사용량
+        """
+        with self._lock:
+            return {
+                "since": self._started_at,
+                "totals": dict(self._totals),
+                "trimmed_requests": self._trimmed_requests,
+                "by_agent": {key: dict(value) for key, value in self._by_agent.items()},
+                "by_model": {key: dict(value) for key, value in self._by_model.items()},
+                "by_endpoint": {key: dict(value) for key, value in self._by_endpoint.items()}
+            }
+
+
+# 싱글톤 인스턴스
+token_usage_tracker = TokenUsageTracker()
@@ -0,0 +1,606 @@
+"""
+요청 추적(스팬) 모듈
+
+FastAPI 미들웨어가 요청마다 추적(trace)을 시작하고, 그 안에서 실행되는 AgentManager, AgentOrchestrator,
+LangGraph 노드, LLMService, 외부 연동 HTTP 호출이 현재 스팬의 자식 스팬을 남깁니다.
+현재 스팬은 컨텍스트 변수로 전달되므로 스레드 풀(copy_context)과 백그라운드 이벤트 루프에서도 이어집니다.
+
+- 단계(stage): 스팬마다 집계 이름이 있으며 (예: llm.router, llm.sql, graph.output, http)
+  응답의 Server-Timing 헤더에 단계별 소요 시간 합계로 표시됩니다.
+- 내보내기: 요청이 끝나면 추적 전체를 백그라운드 스레드에서 JSONL 파일 또는 OTLP/HTTP(JSON) 수집기로 전송
+- 전파: 외부 HTTP 호출에 W3C traceparent 헤더를 붙이고, 들어온 요청의 traceparent를 이어받음
+
+설정 (settings.json의 tracing 섹션):
+    {"enabled": true, "exporter": "jsonl" | "otlp" | "none", "path": "./logs/traces.jsonl",
+     "otlp_endpoint": "http://localhost:4318/v1/traces", "sample_rate": 1.0, "service_name": "ape-agent"}
+"""
+
+import os
+import json
+import time
+import queue
+import random
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Any, List, Iterable, Iterator, Optional, TypeVar
+
+# 로거 설정
+logger = logging.getLogger("tracing")
+
+# W3C Trace Context 헤더
+TRACEPARENT_HEADER = "traceparent"
+TRACE_ID_HEADER = "X-Trace-Id"
+
+# 내보내기 대기열 크기 (가득 차면 버림)
+EXPORT_QUEUE_SIZE = 1000
+
+# 추적 기본 설정
+DEFAULT_TRACING_CONFIG = {
+    "enabled": True,
+    "exporter": "none",
+    "path": "./logs/traces.jsonl",
+    "otlp_endpoint": "http://localhost:4318/v1/traces",
+    "otlp_timeout": 5.0,
+    "sample_rate": 1.0,
+    "service_name": "ape-agent"
+}
+
+# 현재 스팬 (없으면 추적하지 않는 구간)
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+T = TypeVar("T")
+
+
+def _new_id(bits: int) -> str:
+    """임의의 16진수 ID (trace: 128비트, span: 64비트)"""
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[tuple]:
+    """
+    W3C traceparent 헤더 파싱
+
+    Args:
+        value: 헤더 값 (예: 00-<trace_id 32자>-<span_id 16자>-01)
+
+    Returns:
+        (trace_id, parent_span_id) 또는 형식이 잘못되었으면 None
+    """
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    trace_id, span_id = parts[1].lower(), parts[2].lower()
+    try:
+        int(trace_id, 16)
+        int(span_id, 16)
+    except ValueError:
+        return None
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return trace_id, span_id
+
+
+def get_tracing_config(settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    추적 설정 반환 (settings의 tracing 섹션을 기본값에 덮어씀)
+
+    Args:
+        settings: 전체 설정 (get_settings() 결과)
+
+    Returns:
+        추적 설정
+    """
+    section = dict((settings or {}).get("tracing", {}) or {})
+    config = dict(DEFAULT_TRACING_CONFIG)
+    config.update({key: value for key, value in section.items() if value not in (None, "")})
+
+    enabled = config["enabled"]
+    config["enabled"] = enabled.strip().lower() in ("1", "true", "yes", "on") if isinstance(enabled, str) else bool(enabled)
+    config["exporter"] = str(config["exporter"]).lower()
+    config["sample_rate"] = min(max(float(config["sample_rate"]), 0.0), 1.0)
+    config["otlp_timeout"] = float(config["otlp_timeout"])
+    return config
+
+
+class Trace:
+    """요청 하나의 추적 (완료된 스팬 모음)"""
+
+    __slots__ = ("trace_id", "sampled", "spans")
+
+    def __init__(self, trace_id: str, sampled: bool = True):
+        self.trace_id = trace_id
+        self.sampled = sampled
+        self.spans: List["Span"] = []
+
+    def stage_durations(self) -> Dict[str, float]:
+        """
+        단계별 소요 시간 합계 (밀리초, 루트 스팬 제외)
+
+        같은 단계의 스팬이 여러 번 실행되면 합산하며, 단계는 처음 시작한 순서로 나열합니다.
+        단계끼리는 중첩될 수 있습니다. (예: graph.router 안에 llm.router)
+        """
+        durations: Dict[str, float] = {}
+        for span in sorted(self.spans, key=lambda item: item._start):
+            if span.parent_id is None or span.duration is None or span.stage is None:
+                continue
+            durations[span.stage] = durations.get(span.stage, 0.0) + span.duration * 1000
+        return durations
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSONL 내보내기용 dict"""
+        return {"trace_id": self.trace_id, "spans": [span.to_dict() for span in list(self.spans)]}
+
+
+class Span:
+    """추적 구간 하나 (이름, 단계, 부모, 시작 시각, 소요 시간, 속성)"""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "stage", "attributes",
+                 "start_time", "_start", "duration", "status", "remote_parent")
+
+    def __init__(self, trace: Trace, name: str, parent_id: Optional[str] = None,
+                 stage: Optional[str] = None, attributes: Optional[Dict[str, Any]] = None,
+                 remote_parent: Optional[str] = None):
+        self.trace = trace
+        self.span_id = _new_id(64)
+        self.parent_id = parent_id
+        self.name = name
+        self.stage = stage
+        self.attributes = attributes or {}
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.status = "ok"
+        self.remote_parent = remote_parent
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    @property
+    def elapsed(self) -> float:
+        """시작 후 경과 시간 (초, 종료되었으면 소요 시간)"""
+        return self.duration if self.duration is not None else time.perf_counter() - self._start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """속성 설정"""
+        self.attributes[key] = value
+
+    def set_error(self, error: Any) -> None:
+        """오류 상태로 표시"""
+        self.status = "error"
+        self.attributes["error"] = str(error)
+
+    def end(self) -> None:
+        """스팬 종료 (추적에 기록, 두 번째 호출부터 무시)"""
+        if self.duration is not None:
+            return
+        self.duration = time.perf_counter() - self._start
+        self.trace.spans.append(self)
+
+    def traceparent(self) -> str:
+        """이 스팬을 부모로 하는 W3C traceparent 헤더 값"""
+        return f"00-{self.trace.trace_id}-{self.span_id}-{'01' if self.trace.sampled else '00'}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """스팬 정보 dict"""
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id or self.remote_parent,
+            "name": self.name,
+            "stage": self.stage,
+            "start_time": self.start_time,
+            "duration_ms": round(self.duration * 1000, 3) if self.duration is not None else None,
+            "status": self.status,
+            "attributes": self.attributes
+        }
+
+
+def get_current_span() -> Optional[Span]:
+    """현재 스팬 (추적 중이 아니면 None)"""
+    return _current_span.get()
+
+
+@contextmanager
+def activate(span: Optional[Span]) -> Iterator[Optional[Span]]:
+    """
+    블록 안에서 지정한 스팬을 현재 스팬으로 설정 (스팬을 종료하지는 않음)
+
+    Args:
+        span: 현재 스팬으로 설정할 스팬
+    """
+    token = _current_span.set(span)
+    try:
+        yield span
+    finally:
+        _current_span.reset(token)
+
+
+@contextmanager
+def span(name: str, stage: Optional[str] = None, **attributes) -> Iterator[Optional[Span]]:
+    """
+    현재 스팬의 자식 스팬 구간
+
+    추적 중이 아니면 아무것도 기록하지 않고 None을 반환합니다.
+    블록에서 예외가 발생하면 오류 상태로 기록하고 예외를 다시 발생시킵니다.
+
+    Args:
+        name: 스팬 이름
+        stage: Server-Timing 집계 단계 (None이면 이름과 같음)
+        **attributes: 스팬 속성
+
+    Yields:
+        새 스팬 또는 None
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    child = Span(parent.trace, name, parent.span_id, stage or name, attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        if isinstance(e, GeneratorExit):
+            child.status = "cancelled"
+        else:
+            child.set_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        child.end()
+
+
+def start_span(name: str, stage: Optional[str] = None, **attributes) -> Optional[Span]:
+    """
+    현재 스팬의 자식 스팬 시작 (현재 스팬으로 설정하지 않음)
+
+    스트리밍 제너레이터처럼 yield를 사이에 두고 이어지는 구간에 사용합니다.
+    호출자가 bind()로 제너레이터를 감싸고 끝날 때 end()를 호출해야 합니다.
+
+    Args:
+        name: 스팬 이름
+        stage: Server-Timing 집계 단계 (None이면 이름과 같음)
+        **attributes: 스팬 속성
+
+    Returns:
+        새 스팬 (추적 중이 아니면 None)
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return None
+    return Span(parent.trace, name, parent.span_id, stage or name, attributes)
+
+
+def bind(iterable: Iterable[T], current: Optional[Span]) -> Iterator[T]:
+    """
+    제너레이터가 다음 값을 만들 때마다 지정한 스팬을 현재 스팬으로 설정하도록 감쌈
+
+    StreamingResponse는 값마다 다른 (복사된) 컨텍스트에서 제너레이터를 진행하므로, yield를 사이에 두고
+    컨텍스트 변수를 설정/복원할 수 없습니다. model_clients.bind_model과 같은 방식으로 값마다 다시 설정합니다.
+
+    Args:
+        iterable: 스트리밍 제너레이터
+        current: 현재 스팬으로 설정할 스팬 (None이면 그대로 반환)
+
+    Yields:
+        원래 제너레이터의 값
+    """
+    if current is None:
+        yield from iterable
+        return
+
+    iterator = iter(iterable)
+    while True:
+        token = _current_span.set(current)
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _current_span.reset(token)
+        yield item
+
+
+def trace_stream(iterable: Iterable[T], current: Optional[Span]) -> Iterator[T]:
+    """
+    스트리밍 구간 전체를 스팬으로 기록
+
+    값마다 스팬을 현재 스팬으로 설정하고(bind), 첫 값까지 걸린 시간을 first_chunk_ms 속성으로 남기며,
+    제너레이터가 끝나거나 중단되면 스팬을 종료합니다.
+
+    Args:
+        iterable: 스트리밍 제너레이터
+        current: start_span()으로 만든 스팬 (None이면 그대로 반환)
+
+    Yields:
+        원래 제너레이터의 값
+    """
+    if current is None:
+        yield from iterable
+        return
+
+    first = True
+    try:
+        for item in bind(iterable, current):
+            if first:
+                current.set_attribute("first_chunk_ms", round(current.elapsed * 1000, 3))
+                first = False
+            yield item
+    except GeneratorExit:
+        current.status = "cancelled"
+        raise
+    except Exception as e:
+        current.set_error(e)
+        raise
+    finally:
+        current.end()
+
+
+def inject_headers(headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+    """
+    외부 호출 헤더에 현재 스팬의 traceparent 추가 (추적 중이 아니거나 이미 있으면 그대로)
+
+    Args:
+        headers: 요청 헤더
+
+    Returns:
+        traceparent가 추가된 새 헤더 dict (변경이 없으면 원래 객체)
+    """
+    current = _current_span.get()
+    if current is None or (headers and TRACEPARENT_HEADER in headers):
+        return headers
+    return {**(headers or {}), TRACEPARENT_HEADER: current.traceparent()}
+
+
+def server_timing(trace: Trace, total: Optional[float] = None) -> str:
+    """
+    Server-Timing 헤더 값 생성
+
+    Args:
+        trace: 추적
+        total: 전체 처리 시간 (초, 지정하면 total 항목 추가)
+
+    Returns:
+        헤더 값 (예: llm.router;dur=12.3, agent.sql;dur=40.1, total;dur=55.0)
+    """
+    entries = [f"{stage};dur={duration:.1f}" for stage, duration in trace.stage_durations().items()]
+    if total is not None:
+        entries.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(entries)
+
+
+class JsonlTraceExporter:
+    """추적을 한 줄에 하나씩 JSONL 파일로 기록"""
+
+    def __init__(self, path: str):
+        """
+        JSONL 내보내기 초기화
+
+        Args:
+            path: 기록할 파일 경로 (디렉토리가 없으면 생성)
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def export(self, traces: List[Trace]) -> None:
+        """추적 목록 기록"""
+        lines = "".join(json.dumps(trace.to_dict(), ensure_ascii=False, default=str) + "\n" for trace in traces)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """OTLP AnyValue 변환"""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class OTLPTraceExporter:
+    """추적을 OTLP/HTTP(JSON) 형식으로 수집기에 전송"""
+
+    def __init__(self, endpoint: str, service_name: str = "ape-agent", timeout: float = 5.0,
+                 http=None):
+        """
+        OTLP 내보내기 초기화
+
+        Args:
+            endpoint: 수집기 URL (예: http://localhost:4318/v1/traces)
+            service_name: resource의 service.name
+            timeout: 전송 타임아웃 (초)
+            http: 세션 레지스트리 (None이면 공유 세션 레지스트리)
+        """
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+        if http is None:
+            # requests_config가 이 모듈을 가져오므로 순환 참조를 피해 여기서 가져옴
+            from src.core.requests_config import session_registry as http
+        self.http = http
+
+    def to_payload(self, traces: List[Trace]) -> Dict[str, Any]:
+        """OTLP ExportTraceServiceRequest(JSON) 생성"""
+        spans = []
+        for trace in traces:
+            for item in list(trace.spans):
+                start_ns = int(item.start_time * 1e9)
+                attributes = {"ape.stage": item.stage, **item.attributes} if item.stage else item.attributes
+                spans.append({
+                    "traceId": trace.trace_id,
+                    "spanId": item.span_id,
+                    "parentSpanId": item.parent_id or item.remote_parent or "",
+                    "name": item.name,
+                    "kind": 2 if item.parent_id is None else 1,
+                    "startTimeUnixNano": str(start_ns),
+                    "endTimeUnixNano": str(start_ns + int((item.duration or 0.0) * 1e9)),
+                    "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()],
+                    "status": {"code": 2 if item.status == "error" else 1}
+                })
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]},
+                "scopeSpans": [{"scope": {"name": "src.core.tracing"}, "spans": spans}]
+            }]
+        }
+
+    def export(self, traces: List[Trace]) -> None:
+        """추적 목록 전송 (실패 시 예외)"""
+        response = self.http.request("POST", self.endpoint, json=self.to_payload(traces),
+                                     timeout=self.timeout, pool="otlp")
+        response.raise_for_status()
+
+
+class Tracer:
+    """요청 추적 관리자 (설정, 추적 시작/종료, 백그라운드 내보내기)"""
+
+    def __init__(self):
+        """추적 관리자 초기화 (설정 전에는 추적만 하고 내보내지 않음)"""
+        self.config = get_tracing_config()
+        self.exporter = None
+        self._queue: "queue.Queue[Optional[Trace]]" = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {"traces": 0, "sampled": 0, "exported": 0, "dropped": 0, "export_errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        """추적 사용 여부"""
+        return self.config["enabled"]
+
+    def configure(self, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        설정으로 추적 사용 여부와 내보내기 대상 설정
+
+        Args:
+            settings: 전체 설정 (get_settings() 결과)
+
+        Returns:
+            적용된 추적 설정
+        """
+        config = get_tracing_config(settings)
+        exporter = None
+        try:
+            if config["exporter"] == "jsonl":
+                exporter = JsonlTraceExporter(config["path"])
+            elif config["exporter"] == "otlp":
+                exporter = OTLPTraceExporter(config["otlp_endpoint"], config["service_name"], config["otlp_timeout"])
+        except OSError as e:
+            logger.error(f"추적 내보내기 설정 오류: {e}")
+
+        self.config = config
+        self.exporter = exporter
+        logger.info(f"요청 추적 설정: enabled={config['enabled']}, exporter={config['exporter']}")
+        return config
+
+    def start_trace(self, name: str, traceparent: Optional[str] = None, **attributes) -> Optional[Span]:
+        """
+        새 추적의 루트 스팬 생성 (현재 스팬으로 설정하지 않음)
+
+        Args:
+            name: 루트 스팬 이름
+            traceparent: 들어온 요청의 traceparent 헤더 (있으면 같은 trace_id를 이어서 사용)
+            **attributes: 루트 스팬 속성
+
+        Returns:
+            루트 스팬 (추적이 꺼져 있으면 None)
+        """
+        if not self.config["enabled"]:
+            return None
+        parent = parse_traceparent(traceparent)
+        trace_id, remote_parent = parent if parent else (_new_id(128), None)
+        sample_rate = self.config["sample_rate"]
+        sampled = sample_rate >= 1.0 or random.random() < sample_rate
+        return Span(Trace(trace_id, sampled), name, attributes=attributes, remote_parent=remote_parent)
+
+    def finish_trace(self, root: Optional[Span]) -> None:
+        """
+        루트 스팬을 종료하고 추적 내보내기 예약
+
+        Args:
+            root: start_trace()가 반환한 루트 스팬
+        """
+        if root is None:
+            return
+        root.end()
+        self._stats["traces"] += 1
+        if not root.trace.sampled or self.exporter is None:
+            return
+        self._stats["sampled"] += 1
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(root.trace)
+        except queue.Full:
+            self._stats["dropped"] += 1
+
+    def _ensure_worker(self) -> None:
+        """내보내기 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._export_loop, name="trace-export", daemon=True)
+                self._thread.start()
+
+    def _export_loop(self) -> None:
+        """대기열의 추적을 모아서 내보내기"""
+        while True:
+            trace = self._queue.get()
+            batch = [trace]
+            while len(batch) < 100:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                exporter = self.exporter
+                if exporter is not None:
+                    exporter.export(batch)
+                    self._stats["exported"] += len(batch)
+            except Exception as e:
+                self._stats["export_errors"] += 1
+                logger.warning(f"추적 내보내기 실패 ({len(batch)}건): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        대기 중인 추적을 모두 내보낼 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            모두 내보냈는지 여부
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """추적 통계"""
+        stats: Dict[str, Any] = dict(self._stats)
+        stats.update({
+            "enabled": self.config["enabled"],
+            "exporter": self.config["exporter"] if self.exporter is not None else "none",
+            "sample_rate": self.config["sample_rate"],
+            "queue_depth": self._queue.qsize()
+        })
+        return stats
+
+
+# 싱글톤 인스턴스
+tracer = Tracer()
@@ -0,0 +1,276 @@
+"""
+시작 워밍업 모듈
+
+서버가 요청을 받기 전에 첫 요청이 치르던 초기화 비용을 미리 지불합니다.
+- services: 지연 서비스 컨테이너의 서비스 생성 (에이전트 관리자, SWDP RPC API/DB 스키마 로드 등)
+- agents: 에이전트 관리자의 에이전트 미리 생성
+- db: 생성된 서비스의 DB 엔진 연결 풀 채우기
+- http: LLM 엔드포인트 및 에이전트 API 공유 세션의 TCP/TLS 연결 미리 열기
+- llm: 짧은 프라이밍 LLM 호출 (선택)
+
+준비 상태(/ready)는 워밍업이 끝난 뒤에만 참이 되며, 생존 확인(/live)과 분리됩니다.
+단계 실패는 기록만 하고 다음 단계로 넘어가므로 실패한 초기화는 첫 요청에서 다시 시도됩니다.
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Any, List, Optional
+
+from src.core.service_container import ServiceContainer, service_container
+from src.core.requests_config import HTTPSessionRegistry, session_registry
+from src.core.model_clients import model_session_registry
+
+# 로거 설정
+logger = logging.getLogger("warmup")
+
+WARMUP_STEPS = ["services", "agents", "db", "http", "llm"]
+
+DEFAULT_WARMUP_CONFIG = {
+    "enabled": True,
+    "background": True,
+    "services": None,           # None이면 컨테이너의 워밍업 대상 전체
+    "agents": ["document"],
+    "connect_db": True,
+    "connect_http": True,
+    "prime_llm": False,
+    "prime_prompt": "ping",
+    "timeout": 5
+}
+
+
+def _as_bool(value: Any) -> bool:
+    """설정 값(문자열 포함)을 부울로 변환"""
+    if isinstance(value, str):
+        return value.strip().lower() in ["true", "1", "yes", "y", "t"]
+    return bool(value)
+
+
+def _as_list(value: Any) -> Optional[List[str]]:
+    """설정 값(쉼표 구분 문자열 포함)을 목록으로 변환"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return list(value)
+
+
+def get_warmup_config(settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    워밍업 설정 반환 (settings의 warmup 섹션을 기본값에 덮어씀)
+
+    Args:
+        settings: 전체 설정 (get_settings() 결과)
+
+    Returns:
+        워밍업 설정
+    """
+    section = dict((settings or {}).get("warmup", {}) or {})
+    config = dict(DEFAULT_WARMUP_CONFIG)
+    config.update({key: value for key, value in section.items() if value not in (None, "")})
+
+    for key in ["enabled", "background", "connect_db", "connect_http", "prime_llm"]:
+        config[key] = _as_bool(config[key])
+    config["services"] = _as_list(config["services"])
+    config["agents"] = _as_list(config["agents"]) or []
+    config["timeout"] = float(config["timeout"])
+    return config
+
+
+class WarmupManager:
+    """시작 워밍업 및 준비 상태 관리"""
+
+    def __init__(self, container: ServiceContainer = service_container,
+                 registry: HTTPSessionRegistry = session_registry,
+                 model_registry: HTTPSessionRegistry = model_session_registry):
+        """
+        워밍업 관리자 초기화
+
+        Args:
+            container: 서비스 컨테이너
+            registry: 공유 HTTP 세션 레지스트리
+            model_registry: LLM 모델 연결 풀 세션 레지스트리
+        """
+        self.container = container
+        self.registry = registry
+        self.model_registry = model_registry
+        self.state = "pending"
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def is_ready(self) -> bool:
+        """워밍업 완료 여부"""
+        return self._ready.is_set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        워밍업 완료 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            완료 여부
+        """
+        return self._ready.wait(timeout)
+
+    def start(self, settings: Optional[Dict[str, Any]] = None) -> Optional[threading.Thread]:
+        """
+        워밍업 시작 (이미 시작했으면 무시)
+
+        Args:
+            settings: 전체 설정 (get_settings() 결과)
+
+        Returns:
+            백그라운드 실행 시 워밍업 스레드, 그 밖에는 None
+        """
+        config = get_warmup_config(settings)
+
+        with self._lock:
+            if self.state != "pending":
+                return self._thread
+            self.state = "running"
+            self.started_at = time.time()
+
+        if not config["enabled"]:
+            logger.info("워밍업 비활성화 - 즉시 준비 상태로 전환")
+            self._finish()
+            return None
+
+        if not config["background"]:
+            self._run(config)
+            return None
+
+        self._thread = threading.Thread(target=self._run, args=(config,), name="startup-warm-up", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def _run(self, config: Dict[str, Any]) -> None:
+        """워밍업 단계 순차 실행"""
+        start = time.perf_counter()
+        self._step("services", self._warm_services, config)
+        self._step("agents", self._warm_agents, config)
+        if config["connect_db"]:
+            self._step("db", self._connect_db, config)
+        if config["connect_http"]:
+            self._step("http", self._connect_http, config)
+        if config["prime_llm"]:
+            self._step("llm", self._prime_llm, config)
+
+        failed = [name for name, step in self.steps.items() if step.get("error")]
+        logger.info(f"워밍업 완료 ({(time.perf_counter() - start) * 1000:.1f}ms, 실패 단계: {failed or '없음'})")
+        self._finish()
+
+    def _finish(self) -> None:
+        """준비 상태로 전환"""
+        self.finished_at = time.time()
+        self.state = "ready"
+        self._ready.set()
+
+    def _step(self, name: str, func, config: Dict[str, Any]) -> None:
+        """단계 실행 및 소요 시간/결과 기록"""
+        start = time.perf_counter()
+        try:
+            result = func(config)
+            step = {"detail": result}
+            errors = [item for item in (result or []) if isinstance(item, dict) and "error" in item]
+            if errors:
+                step["error"] = f"{len(errors)}건 실패"
+        except Exception as e:
+            logger.warning(f"워밍업 단계 실패: {name}: {e}")
+            step = {"error": str(e)}
+        step["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        self.steps[name] = step
+
+    def _warm_services(self, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """서비스 컨테이너의 서비스 생성"""
+        self.container.warm_up(config["services"], background=False)
+        stats = self.container.get_stats()["services"]
+        names = config["services"] if config["services"] is not None else [
+            name for name in stats if stats[name]["loaded"] or stats[name]["error"]
+        ]
+        results = []
+        for name in names:
+            service = stats.get(name, {"loaded": False, "error": "등록되지 않은 서비스"})
+            if service["error"]:
+                results.append({"service": name, "error": service["error"]})
+            else:
+                results.append({"service": name, "load_ms": service["load_ms"]})
+        return results
+
+    def _warm_agents(self, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """에이전트 관리자의 에이전트 미리 생성"""
+        if not config["agents"]:
+            return []
+        manager = self.container.get("agent_manager")
+        results = []
+        for agent_type in config["agents"]:
+            agent = manager.get_or_create_agent(agent_type)
+            if agent is None:
+                results.append({"agent": agent_type, "error": "에이전트 생성 실패"})
+            else:
+                results.append({"agent": agent_type, "agent_id": agent.agent_id})
+        return results
+
+    def _connect_db(self, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """생성된 서비스의 DB 엔진 연결 풀 채우기 (Mock 모드 DB는 건너뜀)"""
+        results = []
+        for name in self.container.get_stats()["services"]:
+            if not self.container.is_loaded(name):
+                continue
+            service = self.container.get(name)
+            db_agent = getattr(service, "db_agent", service)
+            engine = getattr(db_agent, "engine", None)
+            if engine is None:
+                continue
+            from sqlalchemy import text
+            start = time.perf_counter()
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                results.append({"service": name, "elapsed_ms": round((time.perf_counter() - start) * 1000, 1)})
+            except Exception as e:
+                results.append({"service": name, "error": str(e)})
+        return results
+
+    def _connect_http(self, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """LLM 엔드포인트와 기존 공유 세션의 연결 미리 열기 (Mock 모드 LLM은 건너뜀)"""
+        results = []
+        if self.container.is_loaded("llm_service"):
+            # 기본 모델 클라이언트와 같은 세션 키(모델별 연결 풀) 사용
+            client = self.container.get("llm_service").get_client()
+            if client.endpoint and not client.is_mock:
+                self.model_registry.get_session(client.endpoint, verify_ssl=client.verify_ssl, pool=client.pool)
+            if self.model_registry is not self.registry:
+                results.extend(self.model_registry.preconnect_all(timeout=config["timeout"]))
+        return results + self.registry.preconnect_all(timeout=config["timeout"])
+
+    def _prime_llm(self, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """짧은 프라이밍 LLM 호출"""
+        llm_service = self.container.get("llm_service")
+        start = time.perf_counter()
+        response = llm_service.generate([llm_service.format_user_message(config["prime_prompt"])], agent_type="warmup")
+        result = {"model": llm_service.model_id, "elapsed_ms": round((time.perf_counter() - start) * 1000, 1)}
+        if isinstance(response, dict) and "error" in response:
+            result["error"] = response["error"]
+        return [result]
+
+    def get_status(self) -> Dict[str, Any]:
+        """워밍업 상태 및 단계별 결과"""
+        status = {
+            "ready": self.is_ready(),
+            "state": self.state,
+            "steps": dict(self.steps)
+        }
+        if self.started_at:
+            end = self.finished_at or time.time()
+            status["elapsed_ms"] = round((end - self.started_at) * 1000, 1)
+        return status
+
+
+# 싱글톤 인스턴스
+warmup_manager = WarmupManager()
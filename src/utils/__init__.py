@@ -1,7 +1,8 @@
 # 유틸리티 패키지 초기화 파일
 
 # SQL 유틸리티 함수 가져오기
-from src.utils.sql_utils import extract_sql_query, format_query_result
+from src.utils.sql_utils import extract_sql_query, extract_function_call, scan_llm_response, format_query_result
+from src.utils.sql_utils import render_result_rows, normalize_result_format, parse_result_options, RESULT_FORMATS
 
 # 응답 유틸리티 함수
 from src.utils.response_utils import format_agent_response
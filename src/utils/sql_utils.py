@@ -4,8 +4,133 @@ SQL 관련 유틸리티 함수
 SQL 쿼리 추출, 포맷팅, 결과 처리 등을 위한 공통 함수 제공
 """
 
+import io
+import os
 import re
-from typing import Optional, Dict, Any, List
+import csv
+import json
+import logging
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
+
+# 로거 설정
+logger = logging.getLogger("sql_utils")
+
+# 쿼리 결과 출력 형식 (요청 메타데이터 result_format으로 선택)
+RESULT_FORMATS = ("markdown", "csv", "json")
+
+# 쿼리 결과 기본 최대 출력 행 수 (요청 메타데이터 max_rows로 재정의, 0 이하는 제한 없음)
+# 기본값은 제한 없음이며, SQL_RESULT_MAX_ROWS 환경 변수를 설정한 경우에만 기본 제한을 적용
+DEFAULT_MAX_RESULT_ROWS = int(os.environ.get("SQL_RESULT_MAX_ROWS", "0") or 0)
+
+# 결과 렌더링 시 한 번에 문자열로 변환하는 행 수
+_RENDER_CHUNK_ROWS = 1000
+
+# SQL 키워드 (코드 블록이 없을 때 SQL 라인 판별용)
+SQL_KEYWORDS = ("SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "ALTER", "DROP")
+
+# 코드 블록 (```sql\n...```, ```sql\r\n...```, ```\n...```, 한 줄 블록 ```sql SELECT ...```)
+_CODE_BLOCK = re.compile(
+    r"```[ \t]*(?:(?P<lang>[A-Za-z0-9_+-]*)[ \t]*\r?\n|(?P<inline>(?i:sql))\s+)?(?P<body>.*?)```", re.DOTALL
+)
+
+# SQL 키워드로 시작하는 라인 (SELECTION 같은 단어는 제외)
+_SQL_LINE = re.compile(r"^[ \t]*(?:" + "|".join(SQL_KEYWORDS) + r")\b[^\n]*", re.IGNORECASE | re.MULTILINE)
+
+# 함수 호출 JSON 키
+_FUNCTION_KEY = re.compile(r"\"function\"\s*:")
+
+_json_decoder = json.JSONDecoder()
+
+
+def _decode_function_call(text: str, key_pos: int) -> Optional[Dict[str, Any]]:
+    """
+    함수 호출 키 위치 앞의 여는 중괄호부터 JSON 객체 디코딩
+
+    중첩된 parameters 객체도 온전히 파싱되도록 정규식 대신 raw_decode를 사용합니다.
+    """
+    start = text.rfind("{", 0, key_pos)
+    while start != -1:
+        try:
+            obj, _ = _json_decoder.raw_decode(text, start)
+            if isinstance(obj, dict) and "function" in obj and "parameters" in obj:
+                return obj
+        except ValueError:
+            pass
+        # 바깥쪽 객체일 수 있으므로 더 앞의 중괄호로 재시도
+        start = text.rfind("{", 0, start)
+    return None
+
+
+@lru_cache(maxsize=32)
+def _scan(text: str) -> Tuple[Tuple[Tuple[str, str], ...], Optional[str], int, Optional[str]]:
+    """
+    LLM 응답 스캔 (같은 응답을 여러 번 조회해도 한 번만 스캔하도록 캐시)
+
+    코드 블록 패턴은 리터럴 접두사(```)로 후보 위치를 건너뛰고, 함수 호출 키는 str.find로 찾은 위치에서만 매칭합니다.
+
+    Returns:
+        (코드 블록 목록[(언어, 내용)], 첫 SQL 키워드 라인, 마지막 SQL 블록 끝 위치, 함수 호출 JSON 문자열)
+    """
+    code_blocks: List[Tuple[str, str]] = []
+    last_sql_end = -1
+
+    for match in _CODE_BLOCK.finditer(text):
+        lang = (match.group("lang") or match.group("inline") or "").lower()
+        body = match.group("body")
+        code_blocks.append((lang, body.strip()))
+
+        if lang == "sql":
+            last_sql_end = match.end()
+
+    # SQL 키워드 라인은 코드 블록이 없을 때만 사용되므로 그때만 검색
+    sql_line = None
+    if not code_blocks:
+        match = _SQL_LINE.search(text)
+        if match:
+            sql_line = match.group(0).strip()
+
+    function_call = None
+    pos = text.find('"function"')
+    while pos != -1:
+        if _FUNCTION_KEY.match(text, pos):
+            found = _decode_function_call(text, pos)
+            if found is not None:
+                function_call = json.dumps(found, ensure_ascii=False)
+                break
+        pos = text.find('"function"', pos + 1)
+
+    return tuple(code_blocks), sql_line, last_sql_end, function_call
+
+
+def scan_llm_response(text: str) -> Dict[str, Any]:
+    """
+    LLM 응답에서 SQL 블록, 분석 텍스트, 함수 호출 JSON을 한 번에 추출
+
+    Args:
+        text: LLM 응답
+
+    Returns:
+        스캔 결과
+            - code_blocks: 모든 코드 블록 [(언어, 내용)]
+            - sql_blocks: ```sql 블록 내용 목록
+            - sql_line: 코드 블록이 없을 때 SQL 키워드로 시작하는 첫 라인
+            - analysis: 마지막 ```sql 블록 이후의 텍스트
+            - function_call: {"function": ..., "parameters": ...} 형식의 함수 호출 (없으면 None)
+    """
+    if not text:
+        return {"code_blocks": [], "sql_blocks": [], "sql_line": None, "analysis": "", "function_call": None}
+
+    code_blocks, sql_line, last_sql_end, function_call = _scan(text)
+
+    return {
+        "code_blocks": list(code_blocks),
+        "sql_blocks": [body for lang, body in code_blocks if lang == "sql"],
+        "sql_line": sql_line,
+        "analysis": text[last_sql_end:].strip() if last_sql_end != -1 else "",
+        "function_call": json.loads(function_call) if function_call else None
+    }
+
 
 def extract_sql_query(text: str, check_sql_keywords: bool = True) -> Optional[str]:
     """
@@ -18,32 +143,171 @@ def extract_sql_query(text: str, check_sql_keywords: bool = True) -> Optional[st
     Returns:
         추출된 SQL 쿼리 (없으면 None)
     """
-    # SQL 코드 블록 찾기 (sql 태그 포함)
-    sql_pattern = re.compile(r"```sql\s*(.*?)\s*```", re.DOTALL)
-    match = sql_pattern.search(text)
+    if not text:
+        return None
     
-    if match:
-        return match.group(1).strip()
+    code_blocks, sql_line, _, _ = _scan(text)
     
-    # 일반 코드 블록 찾기
-    code_pattern = re.compile(r"```\s*(.*?)\s*```", re.DOTALL)
-    match = code_pattern.search(text)
+    # SQL 코드 블록 우선, 없으면 첫 번째 일반 코드 블록
+    for lang, body in code_blocks:
+        if lang == "sql":
+            return body
     
-    if match:
-        return match.group(1).strip()
+    if code_blocks:
+        return code_blocks[0][1]
     
-    # SQL 키워드로 시작하는 라인 찾기
+    # SQL 키워드로 시작하는 라인
     if check_sql_keywords:
-        sql_keywords = ["SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "ALTER", "DROP"]
-        
-        for line in text.split('\n'):
-            for keyword in sql_keywords:
-                if line.strip().upper().startswith(keyword):
-                    return line.strip()
+        return sql_line
     
     return None
 
-def format_query_result(result: Any, sql_query: str, llm_response: str, agent_type: str) -> str:
+
+def extract_function_call(text: str) -> Optional[Dict[str, Any]]:
+    """
+    텍스트에서 함수 호출 JSON 추출
+    
+    Args:
+        text: LLM 응답
+        
+    Returns:
+        {"function": 함수명, "parameters": {...}} 형식의 함수 호출 (없으면 None)
+    """
+    if not text:
+        return None
+    
+    function_call = _scan(text)[3]
+    return json.loads(function_call) if function_call else None
+
+def normalize_result_format(output_format: Optional[str]) -> str:
+    """
+    출력 형식 이름 정규화 (알 수 없는 형식은 markdown)
+    
+    Args:
+        output_format: 요청된 출력 형식
+        
+    Returns:
+        RESULT_FORMATS 중 하나
+    """
+    name = (output_format or "markdown").strip().lower()
+    if name not in RESULT_FORMATS:
+        logger.warning(f"지원하지 않는 결과 형식: {output_format} (markdown 사용)")
+        return "markdown"
+    return name
+
+def parse_result_options(result_format: Any, max_rows: Any) -> Tuple[str, Optional[int]]:
+    """
+    요청 메타데이터의 결과 형식과 최대 출력 행 수 검증
+    
+    알 수 없는 형식 이름은 normalize_result_format처럼 markdown으로 바꾸고,
+    형식이 문자열이 아니거나 최대 행 수가 정수가 아니면 ValueError를 발생시킵니다.
+    
+    Args:
+        result_format: 요청된 출력 형식
+        max_rows: 요청된 최대 출력 행 수 (정수 또는 정수 문자열)
+        
+    Returns:
+        (출력 형식, 최대 출력 행 수)
+        
+    Raises:
+        ValueError: 형식이나 최대 행 수 값이 잘못된 경우
+    """
+    if result_format is not None and not isinstance(result_format, str):
+        raise ValueError(f"result_format은 문자열이어야 합니다 (지원 형식: {', '.join(RESULT_FORMATS)}): {result_format!r}")
+    if isinstance(max_rows, str) and re.fullmatch(r"\s*-?\d+\s*", max_rows):
+        max_rows = int(max_rows)
+    elif max_rows is not None and (isinstance(max_rows, bool) or not isinstance(max_rows, int)):
+        raise ValueError(f"max_rows는 정수여야 합니다: {max_rows!r}")
+    return normalize_result_format(result_format), max_rows
+
+def _resolve_max_rows(max_rows: Optional[int]) -> Optional[int]:
+    """최대 출력 행 수 결정 (None이면 기본값, 0 이하는 제한 없음)"""
+    if max_rows is None:
+        max_rows = DEFAULT_MAX_RESULT_ROWS
+    max_rows = int(max_rows)
+    return max_rows if max_rows > 0 else None
+
+def _visible_rows(rows: List[Dict[str, Any]], max_rows: Optional[int]) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """컬럼 목록과 최대 출력 행 수까지의 행 반환"""
+    limit = _resolve_max_rows(max_rows)
+    columns = list(rows[0].keys()) if rows and isinstance(rows[0], dict) else []
+    return columns, (rows if limit is None else rows[:limit])
+
+def _columnar_data(rows: List[Dict[str, Any]], columns: List[str]) -> Dict[str, List[Any]]:
+    """행 목록을 컬럼별 배열로 변환 (행마다 키를 반복하지 않음)"""
+    return {column: [row.get(column) for row in rows] for column in columns}
+
+def _stringify_columns(rows: List[Dict[str, Any]], columns: List[str], null_text: str) -> List[List[str]]:
+    """행 묶음을 컬럼별 문자열 목록으로 변환"""
+    converted = []
+    for column in columns:
+        values = [row.get(column, "") for row in rows]
+        converted.append([value if isinstance(value, str) else (null_text if value is None else str(value))
+                          for value in values])
+    return converted
+
+def render_result_rows(rows: List[Dict[str, Any]], output_format: str = "markdown",
+                       max_rows: Optional[int] = None) -> Tuple[str, Dict[str, Any]]:
+    """
+    쿼리 결과 행 렌더링
+    
+    행을 일정 개수씩 컬럼 단위로 문자열 변환한 뒤 리스트/StringIO에 쓰고 마지막에 한 번만 합칩니다.
+    max_rows를 넘는 행은 렌더링하지 않고 요약 정보에 전체 행 수만 남깁니다.
+    
+    Args:
+        rows: 쿼리 결과 행 목록 (딕셔너리)
+        output_format: 출력 형식 (markdown, csv, json)
+        max_rows: 최대 출력 행 수 (None이면 기본값, 0 이하는 제한 없음)
+        
+    Returns:
+        (렌더링 결과, 요약 정보) 튜플
+            - 요약 정보: columns, total_rows, rendered_rows, truncated, column_widths
+    """
+    output_format = normalize_result_format(output_format)
+    columns, visible = _visible_rows(rows, max_rows)
+    widths = [len(column) for column in columns]
+    
+    if output_format == "json":
+        body = json.dumps({"columns": columns, "data": _columnar_data(visible, columns)}, ensure_ascii=False, default=str)
+    
+    elif output_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(columns)
+        for start in range(0, len(visible), _RENDER_CHUNK_ROWS):
+            converted = _stringify_columns(visible[start:start + _RENDER_CHUNK_ROWS], columns, "")
+            widths = [max(width, max(map(len, values))) for width, values in zip(widths, converted)]
+            writer.writerows(zip(*converted))
+        body = buffer.getvalue()
+    
+    else:
+        parts = [
+            "| " + " | ".join(columns) + " |",
+            "| " + " | ".join(["---"] * len(columns)) + " |"
+        ]
+        for start in range(0, len(visible), _RENDER_CHUNK_ROWS):
+            converted = _stringify_columns(visible[start:start + _RENDER_CHUNK_ROWS], columns, "NULL")
+            widths = [max(width, max(map(len, values))) for width, values in zip(widths, converted)]
+            
+            # 셀/행 구분자를 임시 문자로 합친 뒤 파이프 문자를 한 번에 이스케이프
+            chunk = "\x01".join(map("\x00".join, zip(*converted)))
+            if "|" in chunk:
+                chunk = chunk.replace("|", "\\|")
+            parts.append("| " + chunk.replace("\x00", " | ").replace("\x01", " |\n| ") + " |")
+        parts.append("")
+        body = "\n".join(parts)
+    
+    summary = {
+        "columns": columns,
+        "total_rows": len(rows),
+        "rendered_rows": len(visible),
+        "truncated": len(visible) < len(rows),
+        "column_widths": dict(zip(columns, widths)) if output_format != "json" else {}
+    }
+    return body, summary
+
+def format_query_result(result: Any, sql_query: str, llm_response: str, agent_type: str,
+                        output_format: str = "markdown", max_rows: Optional[int] = None) -> str:
     """
     쿼리 결과 포맷팅
     
@@ -52,67 +316,71 @@ def format_query_result(result: Any, sql_query: str, llm_response: str, agent_ty
         sql_query: 실행된 SQL 쿼리
         llm_response: LLM 응답 전체
         agent_type: 에이전트 유형
+        output_format: 출력 형식 (markdown: 설명 포함 문서, csv: 결과 표만, json: 컬럼별 배열)
+        max_rows: 최대 출력 행 수 (None이면 기본값, 0 이하는 제한 없음)
             
     Returns:
         포맷팅된 결과 문자열
     """
-    response = f"## 실행된 쿼리\n```sql\n{sql_query}\n```\n\n"
+    output_format = normalize_result_format(output_format)
+    rows = result if isinstance(result, list) and result else []
+    
+    # 쿼리와 결과 분석 (LLM 응답에서 마지막 SQL 코드 블록 이후 부분, 스캔 결과 재사용)
+    analysis = scan_llm_response(llm_response)["analysis"] if isinstance(llm_response, str) else ""
+    
+    if output_format == "csv":
+        if isinstance(result, int) and not isinstance(result, bool):
+            return f"affected_rows\n{result}\n"
+        if not rows and not (isinstance(result, (list, dict)) or result is None):
+            rows = [{"result": result}]
+        return render_result_rows(rows, "csv", max_rows)[0]
+    
+    if output_format == "json":
+        payload: Dict[str, Any] = {"sql": sql_query}
+        if isinstance(result, int) and not isinstance(result, bool):
+            payload["affected_rows"] = result
+        elif rows or isinstance(result, (list, dict)) or result is None:
+            columns, visible = _visible_rows(rows, max_rows)
+            payload["columns"] = columns
+            payload["data"] = _columnar_data(visible, columns)
+            payload["total_rows"] = len(rows)
+            payload["truncated"] = len(visible) < len(rows)
+        else:
+            payload["result"] = str(result)
+        payload["analysis"] = analysis
+        return json.dumps(payload, ensure_ascii=False, default=str)
+    
+    parts = [f"## 실행된 쿼리\n```sql\n{sql_query}\n```\n\n"]
     
     # 결과가 리스트 또는 딕셔너리인 경우 (SELECT 쿼리)
     if isinstance(result, (list, dict)) and result:
         # 데이터가 있는 경우
-        if isinstance(result, list) and len(result) > 0:
-            # 컬럼 이름 추출
-            columns = result[0].keys() if result and isinstance(result[0], dict) else []
-            
-            # 마크다운 테이블 헤더
-            response += "## 쿼리 결과\n\n"
-            response += "| " + " | ".join(columns) + " |\n"
-            response += "| " + " | ".join(["---"] * len(columns)) + " |\n"
-            
-            # 각 행을 마크다운 테이블 형식으로 추가
-            for row in result:
-                values = []
-                for col in columns:
-                    value = row.get(col, "")
-                    # 문자열이 아닌 경우 변환
-                    if not isinstance(value, str):
-                        if value is None:
-                            value = "NULL"
-                        else:
-                            value = str(value)
-                    # 파이프 문자 이스케이프
-                    value = value.replace("|", "\\|")
-                    values.append(value)
-                
-                response += "| " + " | ".join(values) + " |\n"
+        if rows:
+            table, summary = render_result_rows(rows, "markdown", max_rows)
+            parts.append("## 쿼리 결과\n\n")
+            parts.append(table)
             
             # 결과 요약 추가
-            response += f"\n총 {len(result)}개의 행이 반환되었습니다.\n\n"
+            if summary["truncated"]:
+                parts.append(f"\n총 {summary['total_rows']}개의 행 중 {summary['rendered_rows']}개만 표시했습니다.\n")
+            else:
+                parts.append(f"\n총 {summary['total_rows']}개의 행이 반환되었습니다.\n")
+            widths = ", ".join(f"{column} {width}자" for column, width in summary["column_widths"].items())
+            parts.append(f"컬럼 최대 길이: {widths}\n\n")
             
         # 결과가 없는 경우
         else:
-            response += "## 쿼리 결과\n\n결과가 없습니다.\n\n"
+            parts.append("## 쿼리 결과\n\n결과가 없습니다.\n\n")
     
     # DML 쿼리 결과 (영향 받은 행 수)
     elif isinstance(result, int):
-        response += f"## 쿼리 결과\n\n{result}개의 행이 영향을 받았습니다.\n\n"
+        parts.append(f"## 쿼리 결과\n\n{result}개의 행이 영향을 받았습니다.\n\n")
         
     # 기타 결과
     else:
-        response += f"## 쿼리 결과\n\n{str(result)}\n\n"
-    
-    # 쿼리와 결과 분석 추가 (LLM 응답에서 SQL 코드 블록 이후 부분 추출)
-    analysis = ""
-    sql_blocks = re.findall(r"```sql.*?```", llm_response, re.DOTALL)
-    
-    if sql_blocks:
-        # 마지막 SQL 블록 이후의 텍스트 추출
-        last_sql_block_end = llm_response.rfind(sql_blocks[-1]) + len(sql_blocks[-1])
-        if last_sql_block_end < len(llm_response):
-            analysis = llm_response[last_sql_block_end:].strip()
+        parts.append(f"## 쿼리 결과\n\n{str(result)}\n\n")
     
     if analysis:
-        response += "## 분석\n\n" + analysis
+        parts.append("## 분석\n\n" + analysis)
         
-    return response
\ No newline at end of file
+    return "".join(parts)
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+외부 연동 API 동시 호출 벤치마크
+
+이슈 상세 화면 하나를 구성하는 API 호출(이슈, 댓글, 상태 전환)을 두 가지 방식으로 실행해 지연 시간을 비교합니다.
+- sequential: make_api_request를 순차 호출 (기존 방식)
+- concurrent: AsyncIntegrationClient.fetch_many로 동시 호출
+
+실행:
+    python tests/benchmarks/benchmark_async_integration.py --iterations 20 --latency-ms 50
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.requests_config import make_api_request
+from src.core.async_client import AsyncIntegrationClient
+from tests.benchmarks.stub_integration_server import StubIntegrationServer, StubIntegrationConfig
+
+SCHEMA = {
+    "api_endpoints": [
+        {"endpoint": "/rest/api/2/issue/{issueKey}", "method": "GET", "response": {"key": "AI-101", "fields": {}}},
+        {"endpoint": "/rest/api/2/issue/{issueKey}/comment", "method": "GET", "response": {"comments": []}},
+        {"endpoint": "/rest/api/2/issue/{issueKey}/transitions", "method": "GET", "response": {"transitions": []}}
+    ]
+}
+
+ENDPOINTS = ["/issue/AI-101", "/issue/AI-101/comment", "/issue/AI-101/transitions"]
+
+
+def _summary(label: str, samples: list) -> dict:
+    """지연 시간 통계"""
+    samples = sorted(samples)
+    return {
+        "mode": label,
+        "iterations": len(samples),
+        "p50_ms": round(statistics.median(samples) * 1000, 1),
+        "p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)] * 1000, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="외부 연동 API 동시 호출 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20, help="모드별 반복 횟수")
+    parser.add_argument("--latency-ms", type=float, default=50, help="스텁 서버 응답 지연")
+    args = parser.parse_args()
+
+    config = StubIntegrationConfig(latency_ms=args.latency_ms)
+    with StubIntegrationServer(schemas={"jira": SCHEMA}, config=config) as server:
+        base_url = server.url("jira") + "/rest/api/2"
+
+        sequential = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            for endpoint in ENDPOINTS:
+                make_api_request(base_url + endpoint)
+            sequential.append(time.perf_counter() - start)
+
+        client = AsyncIntegrationClient("jira", base_url)
+        calls = {endpoint: {"endpoint": endpoint} for endpoint in ENDPOINTS}
+
+        async def run_concurrent():
+            samples = []
+            for _ in range(args.iterations):
+                start = time.perf_counter()
+                await client.fetch_many(calls)
+                samples.append(time.perf_counter() - start)
+            return samples
+
+        concurrent = asyncio.run(run_concurrent())
+
+    results = [_summary("sequential", sequential), _summary("concurrent", concurrent)]
+    report = {
+        "config": vars(args),
+        "results": results,
+        "p50_speedup": round(results[0]["p50_ms"] / results[1]["p50_ms"], 2),
+        "client_stats": client.get_stats()
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Bitbucket 모크 저장소 벤치마크
+
+PR/브랜치가 많은 저장소에서 모크 작업별 평균 시간을 두 가지 방식으로 비교하고, 합성 데이터 생성 시간을 측정합니다.
+- linear: 저장소별 리스트를 선형 탐색 (기존 BitbucketAgent 모크 데이터 방식)
+- indexed: RepositoryStore 색인 (PR ID/상태 색인, 정렬된 브랜치 목록)
+
+실행:
+    python tests/benchmarks/benchmark_bitbucket_store.py --pull-requests 5000 --branches 2000 --repos 2000
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.agents.bitbucket_mock_store import BitbucketMockStore, generate_synthetic_data
+
+
+def _timed(function, arguments: list) -> float:
+    """호출당 평균 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for argument in arguments:
+        function(argument)
+    return round((time.perf_counter() - start) / len(arguments) * 1e6, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bitbucket 모크 저장소 벤치마크")
+    parser.add_argument("--pull-requests", type=int, default=5000, help="저장소의 PR 수")
+    parser.add_argument("--branches", type=int, default=2000, help="저장소의 브랜치 수")
+    parser.add_argument("--operations", type=int, default=2000, help="작업별 측정 횟수")
+    parser.add_argument("--repos", type=int, default=2000, help="합성 데이터 생성 저장소 수 (0이면 생략)")
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    states = ["OPEN", "MERGED", "MERGED", "DECLINED"]
+    pull_requests = [{"id": index + 1, "state": rng.choice(states), "version": 1}
+                     for index in range(args.pull_requests)]
+    branch_names = [f"feature/branch-{index:05d}" for index in range(args.branches)]
+
+    # 기존 방식: 리스트
+    legacy_pull_requests = [dict(pr) for pr in pull_requests]
+    legacy_branches = [{"displayId": name} for name in branch_names]
+
+    # 색인 방식
+    store = BitbucketMockStore()
+    repository = store.add_repository("BENCH", {"slug": "repo"})
+    for pr in pull_requests:
+        repository.add_pull_request(dict(pr))
+    for name in branch_names:
+        repository.add_branch(name)
+
+    lookup_ids = [rng.randint(1, args.pull_requests) for _ in range(args.operations)]
+    lookup_branches = [rng.choice(branch_names) for _ in range(args.operations)]
+
+    def legacy_get(pull_request_id):
+        for pr in legacy_pull_requests:
+            if pr["id"] == pull_request_id:
+                return pr
+        return None
+
+    def legacy_branch_check(name):
+        # 기존 _create_mock_branch: 시작점 확인과 중복 확인으로 두 번 탐색
+        start_exists = any(branch["displayId"] == "feature/branch-00000" for branch in legacy_branches)
+        return start_exists and any(branch["displayId"] == name for branch in legacy_branches)
+
+    def legacy_open(_):
+        return [pr for pr in legacy_pull_requests if pr["state"] == "OPEN"][:25]
+
+    results = [
+        {"operation": "get_pull_request",
+         "linear_us": _timed(legacy_get, lookup_ids),
+         "indexed_us": _timed(repository.get_pull_request, lookup_ids)},
+        {"operation": "create_branch_checks",
+         "linear_us": _timed(legacy_branch_check, lookup_branches),
+         "indexed_us": _timed(lambda name: repository.has_branch("feature/branch-00000") and repository.has_branch(name),
+                              lookup_branches)},
+        {"operation": "list_open_pull_requests",
+         "linear_us": _timed(legacy_open, lookup_ids[:200]),
+         "indexed_us": _timed(lambda _: repository.list_pull_requests("OPEN"), lookup_ids[:200])}
+    ]
+    for result in results:
+        result["speedup"] = round(result["linear_us"] / result["indexed_us"], 1) if result["indexed_us"] else None
+
+    report = {"config": vars(args), "results": results}
+
+    if args.repos > 0:
+        repos_per_project = min(args.repos, 100)
+        start = time.perf_counter()
+        synthetic = generate_synthetic_data(BitbucketMockStore(), project_count=-(-args.repos // repos_per_project),
+                                            repos_per_project=repos_per_project, seed=args.seed)
+        report["synthetic"] = dict(synthetic.get_stats(), generate_s=round(time.perf_counter() - start, 2))
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
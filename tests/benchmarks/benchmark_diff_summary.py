@@ -0,0 +1,82 @@
+"""
+대용량 diff 요약 벤치마크
+
+합성 PR diff를 토큰 예산 청크로 나누고, LLM 호출 지연을 흉내낸 요약 함수로 두 방식을 비교합니다.
+- sequential: 청크를 하나씩 순서대로 요약한 뒤 병합 (작업자 1개)
+- parallel: MapReduceSummarizer 병렬 map (작업자 N개) + 계층 reduce
+
+첫 부분 요약까지의 시간(사용자가 첫 응답을 보는 시점)과 전체 완료 시간을 함께 기록합니다.
+
+실행:
+    python tests/benchmarks/benchmark_diff_summary.py --files 40 --workers 1 4 8 --latency 0.2
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.diff_summarizer import split_diff, MapReduceSummarizer
+from src.agents.bitbucket_mock_store import synthetic_diff
+
+
+def _run(chunks: list, workers: int, latency: float, reduce_tokens: int) -> dict:
+    """작업자 수별 첫 부분 요약/전체 완료 시간 측정"""
+    def summarize(text: str, stage: str) -> str:
+        time.sleep(latency)
+        return f"{stage} 요약 " + "x" * 200
+
+    summarizer = MapReduceSummarizer(summarize, max_workers=workers, reduce_tokens=reduce_tokens)
+    start = time.perf_counter()
+    first = None
+    for event in summarizer.iter_summaries(chunks):
+        if first is None and event["type"] == "partial":
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+
+    stats = summarizer.get_stats()
+    return {
+        "workers": workers,
+        "first_partial_sec": round(first or 0.0, 3),
+        "total_sec": round(total, 3),
+        "map_calls": stats["map_calls"],
+        "reduce_calls": stats["reduce_calls"],
+        "reduce_levels": stats["reduce_levels"]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대용량 diff 요약 벤치마크")
+    parser.add_argument("--files", type=int, default=40, help="합성 diff 파일 수")
+    parser.add_argument("--hunks", type=int, default=4, help="파일당 헝크 수")
+    parser.add_argument("--lines", type=int, default=30, help="헝크당 변경 줄 수")
+    parser.add_argument("--chunk-tokens", type=int, default=3000, help="청크당 토큰 예산")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8], help="비교할 병렬 요약 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="요약 호출당 지연 (초)")
+    args = parser.parse_args()
+
+    diff = synthetic_diff("BENCH/repo#1", files=args.files, hunks_per_file=args.hunks, lines_per_hunk=args.lines)
+    start = time.perf_counter()
+    chunks = split_diff(diff, args.chunk_tokens)
+    split_ms = round((time.perf_counter() - start) * 1000, 2)
+
+    results = [_run(chunks, workers, args.latency, args.chunk_tokens) for workers in args.workers]
+    baseline = results[0]["total_sec"]
+    for result in results:
+        result["speedup"] = round(baseline / result["total_sec"], 2) if result["total_sec"] else None
+
+    print(json.dumps({
+        "diff_chars": len(diff),
+        "chunks": len(chunks),
+        "split_ms": split_ms,
+        "latency_sec": args.latency,
+        "results": results
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
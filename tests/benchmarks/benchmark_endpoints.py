@@ -0,0 +1,255 @@
+"""
+엔드투엔드 엔드포인트 벤치마크
+
+API 서버를 별도 프로세스(uvicorn)로 띄우고, 실제 LLM 대신 로컬 OpenAI 호환 스텁 서버(stub_llm_server)를
+기본 모델(primary) 엔드포인트로 연결한 뒤 엔드포인트별로 정해진 동시성 수준에서 요청을 보내 측정합니다.
+- 처리량(성공 요청/초), 지연 p50/p95/p99, 스트리밍 응답의 첫 청크 시간(TTFT) p50/p95/p99
+- 상태 코드별 요청 수와 스텁 서버 호출/주입 오류 수
+
+스텁 서버는 고정 또는 무작위 지연, TTFT, 토큰 생성 속도, 응답 길이, 오류 주입을 설정할 수 있고
+--seed로 무작위 값을 재현할 수 있습니다. 실제 모델이나 미리 띄운 서버가 필요하지 않으므로
+결과 JSON(--output)을 커밋별로 저장해 회귀를 추적할 수 있습니다.
+Mock 스트리밍의 청크 간 지연(LLM_MOCK_CHUNK_DELAY_MS)은 0으로 두어 측정을 왜곡하지 않게 합니다.
+
+실행:
+    python tests/benchmarks/benchmark_endpoints.py --concurrency 1 8 32 --requests 200
+    python tests/benchmarks/benchmark_endpoints.py --scenarios query query_stream swdp_user \\
+        --llm-latency-ms 50 --llm-jitter-ms 30 --ttft-ms 80 --tokens-per-second 40 --completion-tokens 64 \\
+        --error-rate 0.02 --seed 7 --output bench.json
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import threading
+import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+import requests
+
+# 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(ROOT_DIR)
+
+from tests.benchmarks.stub_llm_server import StubLLMServer, StubLLMConfig
+
+QUERY = "APE 에이전트의 주요 기능을 요약해 주세요"
+
+
+def build_scenarios(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    """엔드포인트별 요청 정의 (이름 -> method, path, json, stream)"""
+    return {
+        "query": {"method": "POST", "path": "/query", "json": {"query": QUERY}},
+        "query_stream": {"method": "POST", "path": "/query", "json": {"query": QUERY, "streaming": True}, "stream": True},
+        "agents_rag": {"method": "POST", "path": "/agents/rag", "json": {"query": QUERY}},
+        "agents_graph": {"method": "POST", "path": "/agents/graph", "json": {"query": QUERY}},
+        "agents_document": {"method": "POST", "path": "/agents/document", "json": {"query": QUERY}},
+        "agents_stream": {"method": "POST", "path": "/agents/rag", "json": {"query": QUERY, "streaming": True},
+                          "stream": True},
+        "documents_list": {"method": "GET", "path": "/documents"},
+        "documents_search": {"method": "POST", "path": "/documents/search",
+                             "json": {"query": QUERY, "metadata": {"num_results": 3}}},
+        "swdp_user": {"method": "POST", "path": "/api/swdp/user", "json": {"single_id": args.single_id}},
+        "swdp_user_projects": {"method": "POST", "path": "/api/swdp/user/projects", "json": {"single_id": args.single_id}},
+        "swdp_tr": {"method": "POST", "path": "/api/swdp/tr", "json": {"tr_code": args.tr_code}},
+        "swdp_tr_list": {"method": "POST", "path": "/api/swdp/tr/list", "json": {"project_id": args.project_id}},
+        "swdp_build": {"method": "POST", "path": "/api/swdp/build", "json": {"build_request_id": args.build_id}}
+    }
+
+
+def _free_port() -> int:
+    """사용 가능한 로컬 포트"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_api_server(port: int, env: Dict[str, str]) -> subprocess.Popen:
+    """API 서버를 uvicorn 하위 프로세스로 시작"""
+    command = [sys.executable, "-m", "uvicorn", "src.core.router:app",
+               "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"]
+    return subprocess.Popen(command, cwd=ROOT_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True)
+
+
+def wait_until_ready(base_url: str, process: subprocess.Popen, timeout: float) -> float:
+    """
+    /ready가 200을 반환할 때까지 대기
+
+    Returns:
+        준비까지 걸린 시간 (초)
+
+    Raises:
+        RuntimeError: 서버 프로세스가 종료되었거나 제한 시간을 넘긴 경우
+    """
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        if process.poll() is not None:
+            stderr = process.stderr.read() if process.stderr else ""
+            raise RuntimeError(f"API 서버 종료 (exit {process.returncode}): {stderr.strip()[-2000:]}")
+        try:
+            if requests.get(f"{base_url}/ready", timeout=1).status_code == 200:
+                return time.perf_counter() - start
+        except requests.RequestException:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"API 서버가 {timeout}초 안에 준비되지 않음")
+
+
+def _percentile(samples: List[float], q: float) -> Optional[float]:
+    """정렬된 표본의 백분위수 (nearest-rank, 밀리초)"""
+    if not samples:
+        return None
+    index = max(0, min(len(samples) - 1, -(-len(samples) * q // 100) - 1))
+    return round(samples[int(index)] * 1000, 1)
+
+
+def run_request(session: requests.Session, base_url: str, scenario: Dict[str, Any], headers: Dict[str, str],
+                timeout: float) -> Tuple[float, Optional[float], str]:
+    """
+    요청 1건 실행
+
+    Returns:
+        (지연 초, 첫 청크까지 초 (스트리밍만), 상태 코드 또는 오류 유형)
+    """
+    start = time.perf_counter()
+    ttft = None
+    try:
+        with session.request(scenario["method"], base_url + scenario["path"], json=scenario.get("json"),
+                             headers=headers, timeout=timeout, stream=scenario.get("stream", False)) as response:
+            if scenario.get("stream"):
+                for chunk in response.iter_content(chunk_size=None):
+                    if chunk and ttft is None:
+                        ttft = time.perf_counter() - start
+            else:
+                response.content
+            return time.perf_counter() - start, ttft, str(response.status_code)
+    except requests.RequestException as e:
+        return time.perf_counter() - start, ttft, type(e).__name__
+
+
+def run_level(base_url: str, scenario: Dict[str, Any], concurrency: int, total: int, warmup: int,
+              headers: Dict[str, str], timeout: float) -> Dict[str, Any]:
+    """한 동시성 수준에서 total건을 실행하고 처리량/지연/TTFT 요약"""
+    local = threading.local()
+
+    def call(_):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        return run_request(session, base_url, scenario, headers, timeout)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(call, range(warmup)))
+        start = time.perf_counter()
+        samples = list(pool.map(call, range(total)))
+        elapsed = time.perf_counter() - start
+
+    statuses = Counter(status for _, _, status in samples)
+    ok = [latency for latency, _, status in samples if status.startswith("2")]
+    latencies = sorted(latency for latency, _, _ in samples)
+    ttfts = sorted(ttft for _, ttft, status in samples if ttft is not None and status.startswith("2"))
+    result = {
+        "concurrency": concurrency,
+        "requests": total,
+        "ok": len(ok),
+        "statuses": dict(statuses),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(ok) / elapsed, 1) if elapsed else None,
+        "latency_p50_ms": _percentile(latencies, 50),
+        "latency_p95_ms": _percentile(latencies, 95),
+        "latency_p99_ms": _percentile(latencies, 99)
+    }
+    if scenario.get("stream"):
+        result.update({"ttft_p50_ms": _percentile(ttfts, 50), "ttft_p95_ms": _percentile(ttfts, 95),
+                       "ttft_p99_ms": _percentile(ttfts, 99)})
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔드투엔드 엔드포인트 벤치마크")
+    parser.add_argument("--scenarios", nargs="+", default=None, help="실행할 시나리오 (기본: 전체)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="동시성 수준")
+    parser.add_argument("--requests", type=int, default=200, help="수준별 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=10, help="수준별 측정 전 요청 수")
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--ready-timeout", type=float, default=120.0, help="서버 준비 대기 시간 (초)")
+    parser.add_argument("--model", default="primary", help="X-Model 헤더로 지정할 모델 키 (스텁에 연결)")
+    parser.add_argument("--single-id", default="user001", help="SWDP 사용자 단일 ID")
+    parser.add_argument("--project-id", type=int, default=1, help="SWDP 프로젝트 ID")
+    parser.add_argument("--tr-code", default="TR-001", help="SWDP TR 코드")
+    parser.add_argument("--build-id", default="BR-001", help="SWDP 빌드 요청 ID")
+    parser.add_argument("--llm-latency-ms", type=float, default=20.0, help="스텁 호출당 고정 지연")
+    parser.add_argument("--llm-jitter-ms", type=float, default=0.0, help="스텁 호출당 무작위 추가 지연 (0~값)")
+    parser.add_argument("--ttft-ms", type=float, default=0.0, help="스텁 첫 토큰 추가 지연")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="스텁 토큰 생성 속도 (0이면 즉시)")
+    parser.add_argument("--completion-tokens", type=int, default=0, help="스텁 응답 토큰 수 (0이면 짧은 응답)")
+    parser.add_argument("--inference-slots", type=int, default=8, help="스텁 동시 추론 수")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="스텁 오류 주입 확률 (0~1)")
+    parser.add_argument("--error-status", type=int, default=503, help="스텁 주입 오류 상태 코드")
+    parser.add_argument("--seed", type=int, default=None, help="스텁 무작위 시드")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    scenarios = build_scenarios(args)
+    names = args.scenarios or list(scenarios)
+    unknown = [name for name in names if name not in scenarios]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)} (사용 가능: {', '.join(scenarios)})")
+
+    stub_config = StubLLMConfig(call_latency_ms=args.llm_latency_ms, per_item_latency_ms=0.0,
+                                inference_slots=args.inference_slots, latency_jitter_ms=args.llm_jitter_ms,
+                                ttft_ms=args.ttft_ms, tokens_per_second=args.tokens_per_second,
+                                completion_tokens=args.completion_tokens, error_rate=args.error_rate,
+                                error_status=args.error_status, seed=args.seed)
+    report: Dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "stub": {key: getattr(args, key) for key in ["llm_latency_ms", "llm_jitter_ms", "ttft_ms", "tokens_per_second",
+                                                      "completion_tokens", "inference_slots", "error_rate", "seed"]},
+        "requests": args.requests,
+        "results": []
+    }
+
+    with StubLLMServer(config=stub_config) as stub:
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        env = dict(os.environ, LLM_ENDPOINT=stub.endpoint, LLM_API_KEY="bench-key", NETWORK_MODE="internal",
+                   LLM_MOCK_CHUNK_DELAY_MS="0", PYTHONDONTWRITEBYTECODE="1")
+        process = start_api_server(port, env)
+        try:
+            report["ready_s"] = round(wait_until_ready(base_url, process, args.ready_timeout), 2)
+            headers = {"X-Model": args.model} if args.model else {}
+            for name in names:
+                for concurrency in args.concurrency:
+                    before = dict(stub_config.stats)
+                    result = run_level(base_url, scenarios[name], concurrency, args.requests, args.warmup,
+                                       headers, args.timeout)
+                    result["scenario"] = name
+                    result["llm_calls"] = stub_config.stats["calls"] - before["calls"]
+                    result["llm_injected_errors"] = stub_config.stats["errors"] - before["errors"]
+                    report["results"].append(result)
+        except RuntimeError as e:
+            report["error"] = str(e)
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    if "error" in report:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
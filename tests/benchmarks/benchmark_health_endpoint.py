@@ -0,0 +1,115 @@
+"""
+/health, /models 응답 벤치마크
+
+같은 내용의 상태 확인 응답을 FastAPI 앱 두 경로로 반복 조회하여 요청당 처리 시간을 비교합니다.
+- rebuild: 요청마다 모델 설정을 조회해 dict를 만들고 FastAPI가 직렬화 (기존 방식)
+- cached: PrecomputedResponses의 사전 직렬화 바이트에 timestamp만 붙여 반환
+
+모델 설정 조회는 network_manager.get_model_config처럼 모델마다 설정 dict를 복사하는 함수로 흉내냅니다.
+
+실행:
+    python tests/benchmarks/benchmark_health_endpoint.py --models 5 20 50 --requests 2000
+"""
+
+import os
+import sys
+import copy
+import json
+import time
+import argparse
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from src.core.response_cache import PrecomputedResponses
+
+
+def _build_models(count: int) -> dict:
+    """모델 설정 생성 (config.models_config 형식)"""
+    return {
+        f"model-{index}": {
+            "name": f"Model {index}", "provider": "internal", "id": f"org/model-{index}",
+            "description": "벤치마크용 모델 " * 4, "endpoint": f"https://llm.internal/v1/model-{index}",
+            "requestTemplate": {"headers": {"Authorization": "Bearer ${API_KEY}"}, "payload": {"temperature": 0.2}}
+        }
+        for index in range(count)
+    }
+
+
+def _create_app(models: dict) -> FastAPI:
+    """기존 방식과 캐시 방식 경로를 가진 앱 생성"""
+    cache = PrecomputedResponses()
+    agents = [{"id": f"doc-{index}", "type": "document", "status": "active"} for index in range(3)]
+
+    def get_model_config(key: str) -> dict:
+        return copy.deepcopy(models[key])
+
+    def build_health() -> dict:
+        models_info = []
+        for key in list(models):
+            config = get_model_config(key)
+            models_info.append({"key": key, "name": config.get("name", key), "provider": config.get("provider"),
+                                "description": config.get("description", ""), "id": config.get("id", key)})
+        return {"status": "healthy", "version": "0.5.0", "model": "org/model-0", "api_host": "localhost:8001",
+                "agents": agents, "available_models": models_info, "default_model": "model-0"}
+
+    app = FastAPI()
+
+    @app.get("/health/rebuild")
+    async def health_rebuild():
+        body = build_health()
+        body["timestamp"] = time.time()
+        return body
+
+    @app.get("/health/cached")
+    async def health_cached():
+        body = cache.get("health", build_health)
+        return Response(content=b'{"timestamp":' + repr(time.time()).encode("ascii") + b"," + body[1:],
+                        media_type="application/json")
+
+    return app
+
+
+def _measure(client: TestClient, path: str, requests: int) -> float:
+    """요청당 평균 처리 시간 (마이크로초)"""
+    for _ in range(50):
+        client.get(path)
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.get(path)
+    return round((time.perf_counter() - start) / requests * 1e6, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/health, /models 응답 벤치마크")
+    parser.add_argument("--models", type=int, nargs="+", default=[5, 20, 50], help="모델 수")
+    parser.add_argument("--requests", type=int, default=2000, help="경로별 요청 수")
+    args = parser.parse_args()
+
+    results = []
+    for count in args.models:
+        with TestClient(_create_app(_build_models(count))) as client:
+            rebuild = client.get("/health/rebuild").json()
+            cached = client.get("/health/cached").json()
+            rebuild.pop("timestamp")
+            cached.pop("timestamp")
+
+            rebuild_us = _measure(client, "/health/rebuild", args.requests)
+            cached_us = _measure(client, "/health/cached", args.requests)
+            results.append({
+                "models": count,
+                "rebuild_us": rebuild_us,
+                "cached_us": cached_us,
+                "speedup": round(rebuild_us / cached_us, 2),
+                "same_body": rebuild == cached
+            })
+
+    print(json.dumps({"requests": args.requests, "results": results}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+"""
+에이전트 핫 패스 마이크로벤치마크
+
+요청마다 반복 실행되는 에이전트 내부 함수를 합성 데이터(synthetic_data.py)로 측정하고,
+저장된 기준값(baselines/hot_paths.json)보다 임계값 이상 느려진 항목이 있으면 실패(종료 코드 1)합니다.
+기준값과 데이터 크기가 다른(params_changed) 항목도 비교할 수 없으므로 실패로 봅니다.
+기준값이 아직 없는 항목(new)은 실패로 보지 않고 보고서의 new 목록에 표시하므로, --update-baseline으로 기록합니다.
+일시적인 부하로 인한 실패를 줄이기 위해 느려진 항목은 한 번 더 측정해 빠른 쪽 결과로 판정합니다.
+
+측정 항목:
+- sql_extract: extract_sql_query (SQL 코드 블록 20개가 섞인 LLM 응답)
+- format_result_markdown, format_result_json: format_query_result (10,000행, 행 수 제한 없음)
+- schema_info: BaseDBAgent._get_schema_info (테이블 500개 스키마, SWDPDBAgent Mock 모드)
+- mock_query_join: SWDPDBAgent._execute_mock_query 외래 키 조인
+- swdp_rpc_lookups: SWDPRPCAPI 사용자/프로젝트/빌드/TR 조회 (마지막 항목 조회)
+- jira_find_endpoint: JiraAgent._find_endpoint_response (스키마 항목 전체 조회)
+- langgraph_state_copy: LangGraph AgentNode 실행 (누적 결과가 큰 상태 복사)
+- list_documents: DocumentManagementAgent.list_documents (컬렉션 20개 x 파일 500개)
+
+머신 속도 차이를 줄이기 위해 실행마다 고정된 보정 루프(calibration)를 먼저 측정하고, 기준값 기록 시의
+보정 루프 시간과의 비율로 기준값을 환산해 비교합니다. 보정은 CPU 속도 차이만 흡수하므로 인터프리터 버전이나
+머신 종류가 크게 다르면 CI에서 --update-baseline으로 기준값을 다시 기록해야 합니다.
+에이전트 항목(schema_info, mock_query_join, swdp_rpc_lookups, jira_find_endpoint, langgraph_state_copy)은
+전체 설정(config.network_config)과 스키마(src/schema)가 있어야 준비되므로, 해당 환경에서
+--update-baseline --cases ...로 기준값을 기록합니다.
+의존성 부족 등으로 준비할 수 없는 항목은 skipped로 표시하고 실패로 보지 않습니다.
+
+실행:
+    python tests/benchmarks/benchmark_hot_paths.py
+    python tests/benchmarks/benchmark_hot_paths.py --cases schema_info mock_query_join --threshold 1.0
+    python tests/benchmarks/benchmark_hot_paths.py --update-baseline
+"""
+
+import os
+import gc
+import sys
+import json
+import time
+import itertools
+import logging
+import argparse
+import tempfile
+import statistics
+import contextlib
+from typing import Dict, Any, Callable, Optional, Tuple
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from tests.benchmarks import synthetic_data
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "hot_paths.json")
+
+# 기준값 대비 허용하는 최대 지연 비율 (0.5 = 50% 느려지면 실패, 같은 머신에서도 실행 간 편차가 20~30% 있음)
+DEFAULT_THRESHOLD = 0.5
+
+# 실패로 판정하는 비교 상태 (데이터 크기 변경은 비교할 수 없으므로 실패, 기준값이 없는 new는 기록 전까지 통과)
+GATE_FAILURES = ("regression", "params_changed")
+
+Setup = Tuple[Callable[[], Any], Dict[str, Any]]
+
+
+def _sql_extract(args: argparse.Namespace, stack: contextlib.ExitStack) -> Setup:
+    """extract_sql_query"""
+    from src.utils.sql_utils import extract_sql_query
+
+    # 응답 스캔 캐시(lru_cache 32개)에 걸리지 않도록 캐시보다 많은 응답을 돌아가며 사용
+    texts = itertools.cycle([synthetic_data.llm_response(args.blocks, seed=seed) for seed in range(64)])
+    return (lambda: extract_sql_query(next(texts))), {"blocks": args.blocks}
+
+
+def _format_result(output_format: str) -> Callable[[argparse.Namespace, contextlib.ExitStack], Setup]:
+    """format_query_result (출력 형식별)"""
+    def setup(args: argparse.Namespace, stack: contextlib.ExitStack) -> Setup:
+        from src.utils.sql_utils import format_query_result
+
+        rows = synthetic_data.result_rows(args.rows)
+        response = synthetic_data.llm_response(2)
+        return (lambda: format_query_result(rows, "SELECT * FROM builds", response, "SWDP DB",
+                                            output_format=output_format, max_rows=0)), {"rows": args.rows}
+    return setup
+
+
+def _db_agent(schema: Dict[str, Any]):
+    """합성 스키마를 사용하는 Mock 모드 SWDPDBAgent"""
+    from src.agents.swdp_db_agent import SWDPDBAgent
+
+    agent = SWDPDBAgent()
+    agent.schema_info = schema
+    agent.tables_by_name = {table["name"]: table for table in schema["tables"]}
+    return agent
+
+
+def _schema_info(args: argparse.Namespace, stack: contextlib.ExitStack) -> Setup:
+    """BaseDBAgent._get_schema_info"""
+    agent = _db_agent(synthetic_data.db_schema(args.tables, args.columns))
+    return agent._get_schema_info, {"tables": args.tables, "columns": args.columns}
+
+
+def _mock_query_join(args: argparse.Namespace, stack: contextlib.ExitStack) -> Setup:
+    """SWDPDBAgent._execute_mock_query (외래 키 조인)"""
+    agent = _db_agent(synthetic_data.db_schema(2, 6, args.join_rows))
+    query = ("SELECT table_001.id, table_000.field_0 FROM table_001 "
+             "JOIN table_000 ON table_001.table_000_id = table_000.id")
+    return (lambda: agent._execute_mock_query(query)), {"join_rows": args.join_rows}
+
+
+def _swdp_rpc_lookups(args: argparse.Namespace, stack: contextlib.ExitStack) -> Setup:
+    """SWDPRPCAPI 조회"""
+    from src.agents.swdp_rpc_api import SWDPRPCAPI
+
+    schema = synthetic_data.swdp_schema(args.swdp_rows, args.swdp_rows // 4, args.swdp_rows, args.swdp_rows)
+    api = SWDPRPCAPI()
+    api.schema_info = schema
+    api.tables_by_name = {table["name"]: table for table in schema["tables"]}
+    last = args.swdp_rows
+
+    def lookups():
+        api.get_user_by_single_id(f"user{last:04d}")
+        api.get_user_projects(f"user{last:04d}")
+        api.get_build_by_id(f"BR-{last:05d}")
+        api.get_tr_by_code(f"TR-{last:05d}")
+    return lookups, {"swdp_rows": args.swdp_rows}
+
+
+def _jira_find_endpoint(args: argparse.Namespace, stack: contextlib.ExitStack) -> Setup:
+    """JiraAgent._find_endpoint_response"""
+    from src.agents.jira_agent import JiraAgent
+    from src.core.mock_router import MockEndpointRouter
+
+    schema, requests = synthetic_data.api_schema(args.endpoints)
+    agent = JiraAgent()
+    agent.schema_info = schema
+    agent.mock_router = MockEndpointRouter.from_schema(schema)
+
+    def lookups():
+        for method, path in requests:
+            agent._find_endpoint_response(path, method)
+    return lookups, {"endpoints": args.endpoints}
+
+
+class _EchoAgent:
+    """고정 응답을 반환하는 그래프 노드용 에이전트 (상태 복사 비용만 측정)"""
+
+    def run(self, query: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {"content": "완료", "agent_id": "echo"}
+
+
+def _langgraph_state_copy(args: argparse.Namespace, stack: contextlib.ExitStack) -> Setup:
+    """LangGraph AgentNode 실행 (상태 복사)"""
+    from src.agents.langgraph_agent import AgentNode
+
+    node = AgentNode("agent0", _EchoAgent())
+    state = synthetic_data.graph_state(args.graph_agents, rows=args.graph_rows)
+    return (lambda: node.run(state)), {"graph_agents": args.graph_agents, "graph_rows": args.graph_rows}
+
+
+def _list_documents(args: argparse.Namespace, stack: contextlib.ExitStack) -> Setup:
+    """DocumentManagementAgent.list_documents"""
+    from src.agents.document_management_agent import DocumentManagementAgent
+
+    docs_dir = stack.enter_context(tempfile.TemporaryDirectory())
+    synthetic_data.document_tree(docs_dir, args.collections, args.files)
+    agent = DocumentManagementAgent()
+    agent.docs_dir = docs_dir
+    return agent.list_documents, {"collections": args.collections, "files": args.files}
+
+
+CASES: Dict[str, Callable[[argparse.Namespace, contextlib.ExitStack], Setup]] = {
+    "sql_extract": _sql_extract,
+    "format_result_markdown": _format_result("markdown"),
+    "format_result_json": _format_result("json"),
+    "schema_info": _schema_info,
+    "mock_query_join": _mock_query_join,
+    "swdp_rpc_lookups": _swdp_rpc_lookups,
+    "jira_find_endpoint": _jira_find_endpoint,
+    "langgraph_state_copy": _langgraph_state_copy,
+    "list_documents": _list_documents
+}
+
+
+def _calibration_loop() -> int:
+    """머신 속도 보정용 고정 작업 (핫 패스와 비슷한 문자열 포맷팅/딕셔너리/정수 연산)"""
+    counts: Dict[str, int] = {}
+    total = 0
+    for i in range(20000):
+        key = f"key-{i % 512}"
+        counts[key] = counts.get(key, 0) + i
+        total += len(key)
+    return total + len(counts)
+
+
+def calibrate(rounds: int = 7, min_round_time: float = 0.05) -> float:
+    """보정 루프 1회 실행 시간 (ms, 라운드 최솟값)"""
+    return measure(_calibration_loop, rounds, min_round_time)["min_ms"]
+
+
+def measure(func: Callable[[], Any], rounds: int = 7, min_round_time: float = 0.05) -> Dict[str, Any]:
+    """
+    호출당 실행 시간 측정 (timeit처럼 측정 중 GC 비활성화)
+
+    한 라운드가 min_round_time 이상 걸리도록 라운드당 호출 수를 정합니다.
+
+    Args:
+        func: 측정할 함수 (인자 없음)
+        rounds: 라운드 수
+        min_round_time: 라운드당 최소 시간 (초)
+
+    Returns:
+        {"number", "rounds", "min_ms", "median_ms", "max_ms"}
+    """
+    start = time.perf_counter()
+    func()
+    first = time.perf_counter() - start
+    number = max(1, int(min_round_time / first) if first > 0 else 1000)
+
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append((time.perf_counter() - start) / number * 1000)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return {"number": number, "rounds": rounds, "min_ms": round(min(timings), 4),
+            "median_ms": round(statistics.median(timings), 4), "max_ms": round(max(timings), 4)}
+
+
+def compare(result: Dict[str, Any], baseline: Optional[Dict[str, Any]], threshold: float,
+            calibration_ms: Optional[float] = None) -> Dict[str, Any]:
+    """
+    측정 결과를 기준값과 비교 (최솟값 기준)
+
+    기준값과 현재 실행 모두 보정 루프 시간이 있으면 기준값을 현재 머신 속도로 환산해 비교합니다.
+
+    Args:
+        result: measure 결과와 params
+        baseline: 같은 항목의 기준값 (없으면 None)
+        threshold: 허용 지연 비율
+        calibration_ms: 현재 실행의 보정 루프 시간
+
+    Returns:
+        {"status": ok|regression|new|params_changed, "baseline_ms", "ratio"}
+    """
+    if not baseline:
+        return {"status": "new"}
+    if baseline.get("params") != result["params"]:
+        return {"status": "params_changed", "baseline_params": baseline.get("params")}
+
+    baseline_ms = baseline["min_ms"]
+    if calibration_ms and baseline.get("calibration_ms"):
+        baseline_ms = baseline_ms * calibration_ms / baseline["calibration_ms"]
+    ratio = result["min_ms"] / baseline_ms if baseline_ms else 1.0
+    return {"status": "regression" if ratio > 1 + threshold else "ok",
+            "baseline_ms": round(baseline_ms, 4), "ratio": round(ratio, 3)}
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    """기준값 파일 로드 (없으면 빈 기준값)"""
+    if not os.path.exists(path):
+        return {"cases": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, baseline: Dict[str, Any], results: list, calibration_ms: Optional[float] = None) -> None:
+    """측정한 항목의 기준값 갱신 (측정하지 못한 항목의 기존 기준값은 유지, 항목마다 기록 시 보정 루프 시간 저장)"""
+    cases = dict(baseline.get("cases", {}))
+    for result in results:
+        if "min_ms" in result:
+            cases[result["case"]] = {key: result[key] for key in ["params", "min_ms", "median_ms"]}
+            if calibration_ms:
+                cases[result["case"]]["calibration_ms"] = calibration_ms
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"python": sys.version.split()[0], "cases": dict(sorted(cases.items()))}, f,
+                  ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def run_case(name: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    항목 하나 준비 및 측정
+
+    Args:
+        name: 항목 이름
+        args: 명령행 인자 (데이터 크기)
+
+    Returns:
+        측정 결과 (준비 실패 시 status=skipped와 오류)
+    """
+    with contextlib.ExitStack() as stack:
+        try:
+            func, params = CASES[name](args, stack)
+        except Exception as e:
+            return {"case": name, "status": "skipped", "error": f"{type(e).__name__}: {e}"}
+        result = measure(func, args.rounds, args.min_round_time)
+    return {"case": name, "params": params, **result}
+
+
+def run_baseline_case(name: str, args: argparse.Namespace, runs: int) -> Dict[str, Any]:
+    """
+    기준값 기록용 측정 (여러 번 측정해 최솟값이 중앙인 결과 사용)
+
+    한 번만 측정하면 유난히 빠른 실행이 기준값이 되어 이후 비교가 자주 실패하므로 중앙값을 사용합니다.
+
+    Args:
+        name: 항목 이름
+        args: 명령행 인자
+        runs: 측정 횟수
+
+    Returns:
+        측정 결과
+    """
+    results = [run_case(name, args) for _ in range(max(runs, 1))]
+    measured = sorted((result for result in results if "min_ms" in result), key=lambda result: result["min_ms"])
+    return measured[len(measured) // 2] if measured else results[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="에이전트 핫 패스 마이크로벤치마크")
+    parser.add_argument("--cases", nargs="+", default=None, help="실행할 항목 (기본: 전체)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="허용 지연 비율 (0.5 = 50%%)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준값 파일 경로")
+    parser.add_argument("--update-baseline", action="store_true", help="측정 결과를 기준값으로 저장 (비교하지 않음)")
+    parser.add_argument("--baseline-runs", type=int, default=5, help="기준값 기록 시 항목별 측정 횟수")
+    parser.add_argument("--rounds", type=int, default=7, help="항목별 측정 라운드 수")
+    parser.add_argument("--min-round-time", type=float, default=0.05, help="라운드당 최소 측정 시간 (초)")
+    parser.add_argument("--blocks", type=int, default=20, help="LLM 응답의 SQL 코드 블록 수")
+    parser.add_argument("--rows", type=int, default=10000, help="포맷팅할 결과 행 수")
+    parser.add_argument("--tables", type=int, default=500, help="스키마 테이블 수")
+    parser.add_argument("--columns", type=int, default=12, help="테이블당 컬럼 수")
+    parser.add_argument("--join-rows", type=int, default=500, help="조인 테이블별 샘플 행 수")
+    parser.add_argument("--swdp-rows", type=int, default=2000, help="SWDP 사용자/빌드/TR 행 수")
+    parser.add_argument("--endpoints", type=int, default=300, help="Jira 스키마 엔드포인트 수")
+    parser.add_argument("--graph-agents", type=int, default=6, help="그래프 상태에 누적된 에이전트 결과 수")
+    parser.add_argument("--graph-rows", type=int, default=500, help="에이전트 결과별 데이터 행 수")
+    parser.add_argument("--collections", type=int, default=20, help="문서 컬렉션 수")
+    parser.add_argument("--files", type=int, default=500, help="컬렉션별 문서 파일 수")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    names = args.cases or list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        parser.error(f"알 수 없는 항목: {', '.join(unknown)} (사용 가능: {', '.join(CASES)})")
+
+    # 에이전트의 호출별 INFO 로그가 측정 시간에 포함되지 않도록 비활성화
+    logging.disable(logging.INFO)
+
+    baseline = load_baseline(args.baseline)
+    calibration_ms = calibrate(args.rounds, args.min_round_time)
+    results = []
+    for name in names:
+        if args.update_baseline:
+            results.append(run_baseline_case(name, args, args.baseline_runs))
+            continue
+
+        result = run_case(name, args)
+        if "min_ms" in result:
+            case_baseline = baseline.get("cases", {}).get(name)
+            result.update(compare(result, case_baseline, args.threshold, calibration_ms))
+            if result["status"] == "regression":
+                retry = run_case(name, args)
+                if retry.get("min_ms", result["min_ms"]) < result["min_ms"]:
+                    result = dict(retry, **compare(retry, case_baseline, args.threshold, calibration_ms))
+                result["retried"] = True
+        results.append(result)
+
+    report: Dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "baseline": args.baseline,
+        "baseline_python": baseline.get("python"),
+        "threshold": args.threshold,
+        "calibration_ms": calibration_ms,
+        "results": results,
+        "regressions": [result["case"] for result in results if result.get("status") == "regression"],
+        "failures": [result["case"] for result in results if result.get("status") in GATE_FAILURES],
+        "new": [result["case"] for result in results if result.get("status") == "new"],
+        "skipped": [result["case"] for result in results if result.get("status") == "skipped"]
+    }
+    if args.update_baseline:
+        save_baseline(args.baseline, baseline, results, calibration_ms)
+        report["updated"] = [result["case"] for result in results if "min_ms" in result]
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    if report["failures"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
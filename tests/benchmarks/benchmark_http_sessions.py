@@ -0,0 +1,120 @@
+"""
+HTTP 세션 재사용 벤치마크
+
+로컬 keep-alive HTTP 서버를 대상으로 API 호출을 반복하여
+호출마다 세션을 만드는 기존 방식과 공유 세션 레지스트리의 처리 시간과 연결 수를 비교합니다.
+
+실행:
+    python tests/benchmarks/benchmark_http_sessions.py --requests 500 --concurrency 8
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.requests_config import HTTPSessionRegistry, get_secure_http_session
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """연결 수를 세는 keep-alive JSON 응답 처리기"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with _KeepAliveHandler.lock:
+            _KeepAliveHandler.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _run(label: str, call, total: int, concurrency: int) -> Dict[str, Any]:
+    """동시 호출 실행 후 처리 시간과 서버 측 연결 수 반환"""
+    _KeepAliveHandler.connections = 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(call, range(total)))
+    elapsed = time.perf_counter() - started
+    return {
+        "mode": label,
+        "requests": total,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 1),
+        "server_connections": _KeepAliveHandler.connections
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP 세션 재사용 벤치마크")
+    parser.add_argument("--requests", type=int, default=500, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 호출 수")
+    args = parser.parse_args()
+
+    # 세션 생성 로그는 측정 대상이 아니므로 숨김
+    logging.getLogger("requests_config").setLevel(logging.WARNING)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    url = f"http://{host}:{port}/api/tr"
+
+    def per_call_session(i):
+        # 기존 make_api_request: 호출마다 세션/어댑터/재시도 정책 생성 후 헤더 변경
+        session = get_secure_http_session(timeout=30, verify_ssl=False)
+        session.headers.update({"Authorization": "Basic dXNlcjpwdw=="})
+        try:
+            return session.post(url, json={"i": i}).status_code
+        finally:
+            session.close()
+
+    registry = HTTPSessionRegistry(pool_maxsize=args.concurrency)
+
+    def shared_session(i):
+        return registry.request("POST", url, auth=("user", "pw"), json={"i": i}).status_code
+
+    try:
+        results = [
+            _run("per-call-session", per_call_session, args.requests, args.concurrency),
+            _run("session-registry", shared_session, args.requests, args.concurrency)
+        ]
+        results[1]["registry"] = {key: value for key, value in registry.get_stats().items() if key != "sessions"}
+    finally:
+        registry.close_all()
+        server.shutdown()
+        server.server_close()
+
+    report = {
+        "config": vars(args),
+        "results": results,
+        "speedup": round(results[1]["throughput_rps"] / results[0]["throughput_rps"], 2)
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
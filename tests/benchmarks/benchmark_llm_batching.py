@@ -0,0 +1,112 @@
+"""
+LLM 마이크로 배칭 벤치마크
+
+로컬 스텁 서버를 대상으로 짧은 분류형 프롬프트를 동시에 호출하여
+단건 호출과 마이크로 배칭 호출의 처리량과 지연 시간을 비교합니다.
+
+실행:
+    python tests/benchmarks/benchmark_llm_batching.py --requests 200 --concurrency 32
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Callable
+
+import requests
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.llm_batcher import MicroBatcher
+from tests.benchmarks.stub_llm_server import StubLLMServer, StubLLMConfig
+
+
+def _payload(i: int) -> Dict[str, Any]:
+    """라우팅 결정과 비슷한 짧은 분류형 프롬프트"""
+    return {
+        "model": "stub-model",
+        "messages": [{"role": "user", "content": f"다음 쿼리를 처리할 에이전트 이름만 반환하세요: 요청 {i}"}],
+        "max_tokens": 8,
+        "temperature": 0.0
+    }
+
+
+def _run(label: str, call: Callable[[Dict[str, Any]], Dict[str, Any]], total: int, concurrency: int) -> Dict[str, Any]:
+    """동시 호출 실행 후 지연 시간 통계 반환"""
+    latencies: List[float] = []
+
+    def one(i: int):
+        start = time.perf_counter()
+        result = call(_payload(i))
+        latencies.append(time.perf_counter() - start)
+        return result
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(one, range(total)))
+    elapsed = time.perf_counter() - started
+
+    errors = sum(1 for r in results if "error" in r)
+    latencies.sort()
+    return {
+        "mode": label,
+        "requests": total,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 1),
+        "latency_p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "latency_p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 마이크로 배칭 벤치마크")
+    parser.add_argument("--requests", type=int, default=200, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 호출 수")
+    parser.add_argument("--batch-size", type=int, default=8, help="최대 배치 크기")
+    parser.add_argument("--wait-ms", type=float, default=5, help="배치 수집 대기 시간 (밀리초)")
+    parser.add_argument("--latency-ms", type=float, default=20, help="스텁 서버 호출당 지연")
+    parser.add_argument("--slots", type=int, default=2, help="스텁 서버 동시 추론 슬롯 수")
+    args = parser.parse_args()
+
+    config = StubLLMConfig(call_latency_ms=args.latency_ms, inference_slots=args.slots)
+
+    with StubLLMServer(config=config) as server:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=args.concurrency)
+        session.mount("http://", adapter)
+
+        def single(payload):
+            return session.post(server.endpoint, json=payload, timeout=30).json()
+
+        def send_batch(payloads):
+            if len(payloads) == 1:
+                return [single(payloads[0])]
+            response = session.post(server.endpoint + "/batch", json={"requests": payloads}, timeout=30)
+            return response.json()["responses"]
+
+        unbatched = _run("unbatched", single, args.requests, args.concurrency)
+
+        batcher = MicroBatcher(send_batch, max_batch_size=args.batch_size, max_wait_ms=args.wait_ms,
+                               max_inflight=args.slots, name="bench")
+        try:
+            batched = _run("micro-batched", lambda p: batcher.submit(p, timeout=30), args.requests, args.concurrency)
+            batched["batcher"] = batcher.get_stats()
+        finally:
+            batcher.close()
+
+    report = {
+        "config": vars(args),
+        "results": [unbatched, batched],
+        "speedup": round(batched["throughput_rps"] / unbatched["throughput_rps"], 2)
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
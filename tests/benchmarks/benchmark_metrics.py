@@ -0,0 +1,71 @@
+"""
+메트릭 기록 비용 벤치마크
+
+Histogram.observe()와 Counter.inc() 호출 한 번의 비용을 스레드 수별로 측정합니다.
+스트라이프 수 1(락 하나)과 기본 스트라이프 수를 비교해 동시 기록 시 락 경합 효과를 확인합니다.
+
+실행:
+    python tests/benchmarks/benchmark_metrics.py --threads 1 4 8 --ops 200000
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.metrics import Histogram, Counter, DEFAULT_STRIPES
+
+
+def _measure(metric, threads: int, ops: int) -> float:
+    """스레드 수만큼 동시에 기록했을 때 호출당 평균 시간 (나노초, 벽시계 기준)"""
+    per_thread = ops // threads
+    barrier = threading.Barrier(threads + 1)
+
+    if isinstance(metric, Histogram):
+        def work():
+            barrier.wait()
+            for index in range(per_thread):
+                metric.observe((index % 100) / 1000, "GET", "/query", "200")
+    else:
+        def work():
+            barrier.wait()
+            for _ in range(per_thread):
+                metric.inc("GET", "/query", "200")
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return round((time.perf_counter() - start) / (per_thread * threads) * 1e9, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="메트릭 기록 비용 벤치마크")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 8], help="동시 기록 스레드 수")
+    parser.add_argument("--ops", type=int, default=200000, help="측정별 총 기록 횟수")
+    args = parser.parse_args()
+
+    labels = ["method", "route", "status"]
+    results = []
+    for threads in args.threads:
+        for stripes in (1, DEFAULT_STRIPES):
+            results.append({
+                "threads": threads,
+                "stripes": stripes,
+                "histogram_observe_ns": _measure(Histogram("bench_seconds", "", labels, stripes=stripes), threads, args.ops),
+                "counter_inc_ns": _measure(Counter("bench_total", "", labels, stripes=stripes), threads, args.ops)
+            })
+
+    print(json.dumps({"ops": args.ops, "results": results}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
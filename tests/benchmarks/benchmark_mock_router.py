@@ -0,0 +1,101 @@
+"""
+Mock 엔드포인트 라우팅 벤치마크
+
+스키마 엔드포인트 수를 늘려 가며 두 가지 방식의 요청당 매칭 시간을 비교합니다.
+- linear: 항목별 정규식을 순서대로 검사 (기존 방식)
+- router: MockEndpointRouter (고정 경로 딕셔너리 + 메서드별 결합 정규식)
+
+실행:
+    python tests/benchmarks/benchmark_mock_router.py --endpoints 50 200 1000 --lookups 20000
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.mock_router import MockEndpointRouter
+
+
+def _build_schema(count: int) -> list:
+    """고정 경로와 파라미터 경로가 섞인 가상 스키마 생성"""
+    endpoints = []
+    for index in range(count):
+        resource = f"resource{index}"
+        if index % 3 == 0:
+            endpoint = f"/rest/api/2/{resource}"
+        elif index % 3 == 1:
+            endpoint = f"/rest/api/2/{resource}/{{key}}"
+        else:
+            endpoint = f"/rest/api/2/{resource}/{{key}}/children"
+        endpoints.append({"endpoint": endpoint, "method": "GET" if index % 4 else "POST",
+                          "response": {"index": index}})
+    return endpoints
+
+
+def _request_path(entry: dict) -> str:
+    """스키마 항목에 맞는 요청 경로 생성"""
+    return entry["endpoint"].replace("{key}", "AI-101")
+
+
+def _linear_match(table: list, method: str, path: str):
+    """기존 방식: 항목별 정규식 순차 검사"""
+    for entry_method, pattern, entry in table:
+        if entry_method == method and pattern.match(path):
+            return entry.get("response", {})
+    return None
+
+
+def _measure(match, requests: list) -> float:
+    """요청당 평균 매칭 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for method, path in requests:
+        match(method, path)
+    return round((time.perf_counter() - start) / len(requests) * 1e6, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock 엔드포인트 라우팅 벤치마크")
+    parser.add_argument("--endpoints", type=int, nargs="+", default=[50, 200, 1000], help="스키마 엔드포인트 수")
+    parser.add_argument("--lookups", type=int, default=20000, help="측정할 요청 수")
+    parser.add_argument("--seed", type=int, default=7, help="요청 순서 난수 시드")
+    args = parser.parse_args()
+
+    results = []
+    for count in args.endpoints:
+        endpoints = _build_schema(count)
+        rng = random.Random(args.seed)
+        requests = [(entry["method"], _request_path(entry))
+                    for entry in (rng.choice(endpoints) for _ in range(args.lookups))]
+
+        table = [
+            (entry["method"],
+             re.compile("^" + re.escape(entry["endpoint"]).replace(r"\{key\}", "[^/]+") + "/?$"),
+             entry)
+            for entry in endpoints
+        ]
+        start = time.perf_counter()
+        router = MockEndpointRouter(endpoints)
+        compile_ms = round((time.perf_counter() - start) * 1000, 2)
+
+        linear_us = _measure(lambda method, path: _linear_match(table, method, path), requests)
+        router_us = _measure(router.find_response, requests)
+        results.append({
+            "endpoints": count,
+            "linear_us": linear_us,
+            "router_us": router_us,
+            "speedup": round(linear_us / router_us, 1) if router_us else None,
+            "router_compile_ms": compile_ms
+        })
+
+    print(json.dumps({"config": vars(args), "results": results}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
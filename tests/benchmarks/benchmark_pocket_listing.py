@@ -0,0 +1,105 @@
+"""
+Pocket 객체 목록 조회 벤치마크
+
+버킷 객체 수를 늘려 가며 두 가지 방식의 목록 조회 시간을 비교합니다.
+- linear: 모든 키를 훑으며 접두사 필터 (기존 방식)
+- index: ObjectIndex.list_page (정렬 키 bisect, max_keys에서 중단, 구분자 폴더 건너뛰기)
+
+실행:
+    python tests/benchmarks/benchmark_pocket_listing.py --objects 10000 100000 1000000 --queries 200
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.agents.pocket_object_index import ObjectIndex
+
+
+def _build(count: int, seed: int) -> tuple:
+    """tenant/날짜/파일 구조의 가상 객체 생성 (기존 dict, 인덱스)"""
+    rng = random.Random(seed)
+    objects = {}
+    for number in range(count):
+        key = f"tenant-{rng.randrange(100):03d}/2024-{rng.randrange(1, 13):02d}/{number:08d}.json"
+        objects[key] = {"size": rng.randrange(1, 1 << 20), "last_modified": "2024-01-01T00:00:00",
+                        "etag": f"{number:x}", "storage_class": "STANDARD"}
+    index = ObjectIndex()
+    index.put_many(objects)
+    return objects, index
+
+
+def _linear(objects: dict, prefix: str, delimiter: str, max_keys: int) -> int:
+    """기존 방식: 전체 키를 훑어 접두사 필터 후 정렬, 구분자 묶기"""
+    matched = sorted(key for key in objects if key.startswith(prefix))
+    items, seen = [], set()
+    for key in matched:
+        found = key.find(delimiter, len(prefix)) if delimiter else -1
+        if found >= 0:
+            common_prefix = key[:found + 1]
+            if common_prefix in seen:
+                continue
+            seen.add(common_prefix)
+            items.append(common_prefix)
+        else:
+            items.append(key)
+        if len(items) >= max_keys:
+            break
+    return len(items)
+
+
+def _measure(function, queries: list) -> float:
+    """쿼리당 평균 시간 (밀리초)"""
+    start = time.perf_counter()
+    for query in queries:
+        function(*query)
+    return round((time.perf_counter() - start) / len(queries) * 1000, 4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pocket 객체 목록 조회 벤치마크")
+    parser.add_argument("--objects", type=int, nargs="+", default=[10000, 100000, 1000000], help="버킷 객체 수")
+    parser.add_argument("--queries", type=int, default=200, help="측정할 목록 조회 수")
+    parser.add_argument("--max-keys", type=int, default=100, help="조회당 최대 항목 수")
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    args = parser.parse_args()
+
+    results = []
+    for count in args.objects:
+        start = time.perf_counter()
+        objects, index = _build(count, args.seed)
+        build_sec = round(time.perf_counter() - start, 2)
+
+        rng = random.Random(args.seed)
+        queries = []
+        for number in range(args.queries):
+            tenant = f"tenant-{rng.randrange(100):03d}/"
+            if number % 3 == 0:
+                queries.append(("", "/", args.max_keys))  # 최상위 폴더 목록
+            elif number % 3 == 1:
+                queries.append((tenant, "/", args.max_keys))  # tenant 아래 월별 폴더
+            else:
+                queries.append((f"{tenant}2024-{rng.randrange(1, 13):02d}/", "", args.max_keys))  # 파일 목록
+
+        # 느린 기존 방식은 일부 쿼리만 측정
+        linear_ms = _measure(lambda p, d, m: _linear(objects, p, d, m), queries[:max(3, args.queries // 20)])
+        index_ms = _measure(lambda p, d, m: index.list_page(p, d, m), queries)
+        results.append({
+            "objects": count,
+            "build_sec": build_sec,
+            "linear_ms": linear_ms,
+            "index_ms": index_ms,
+            "speedup": round(linear_ms / index_ms, 1) if index_ms else None
+        })
+
+    print(json.dumps({"max_keys": args.max_keys, "results": results}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
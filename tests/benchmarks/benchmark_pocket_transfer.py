@@ -0,0 +1,87 @@
+"""
+Pocket 대용량 전송 벤치마크
+
+S3 호환 스텁 서버(요청당 지연 주입)에 같은 파일을 업로드/다운로드하며 병렬 파트 수별 처리량을 비교합니다.
+- workers=1: 파트를 하나씩 순차 전송 (기존 단일 스트림과 같은 조건)
+- workers=N: 멀티파트 업로드 / Range 다운로드 병렬 실행
+
+실행:
+    python tests/benchmarks/benchmark_pocket_transfer.py --size-mb 64 --part-mb 4 --workers 1 4 8 --latency-ms 20
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.agents.pocket_transfer import PocketTransferClient
+from tests.benchmarks.stub_s3_server import StubS3Server, StubS3Config
+
+
+def _md5(path: str) -> str:
+    md5 = hashlib.md5()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            md5.update(block)
+    return md5.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pocket 대용량 전송 벤치마크")
+    parser.add_argument("--size-mb", type=int, default=64, help="전송할 파일 크기 (MB)")
+    parser.add_argument("--part-mb", type=int, default=4, help="파트 크기 (MB)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8], help="비교할 병렬 파트 수")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="스텁 서버 요청당 지연 (밀리초)")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        source = os.path.join(directory, "artifact.bin")
+        with open(source, "wb") as f:
+            for _ in range(args.size_mb):
+                f.write(os.urandom(1024 * 1024))
+        source_md5 = _md5(source)
+        size = os.path.getsize(source)
+
+        results = []
+        with StubS3Server(config=StubS3Config(latency_ms=args.latency_ms)) as server:
+            for workers in args.workers:
+                client = PocketTransferClient(server.url, part_size=args.part_mb * 1024 * 1024,
+                                              max_workers=workers, state_dir=None)
+                key = f"bench/artifact-{workers}.bin"
+
+                start = time.perf_counter()
+                upload = client.upload_file("bench", key, source)
+                upload_sec = time.perf_counter() - start
+
+                target = os.path.join(directory, f"download-{workers}.bin")
+                start = time.perf_counter()
+                download = client.download_file("bench", key, target)
+                download_sec = time.perf_counter() - start
+
+                results.append({
+                    "workers": workers,
+                    "upload_sec": round(upload_sec, 3),
+                    "upload_mb_s": round(size / upload_sec / 1e6, 1),
+                    "download_sec": round(download_sec, 3),
+                    "download_mb_s": round(size / download_sec / 1e6, 1),
+                    "parts": upload.get("parts"),
+                    "intact": "error" not in download and _md5(target) == source_md5
+                })
+                os.remove(target)
+
+        print(json.dumps({"size_mb": args.size_mb, "part_mb": args.part_mb, "latency_ms": args.latency_ms,
+                          "results": results}, ensure_ascii=False, indent=2))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
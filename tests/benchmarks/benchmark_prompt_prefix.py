@@ -0,0 +1,115 @@
+"""
+프롬프트 접두사 재사용 벤치마크
+
+스키마가 포함된 DB 에이전트형 프롬프트를 두 가지 방식으로 보내 첫 토큰 지연(TTFT)을 비교합니다.
+- monolithic: 쿼리가 프롬프트 중간에 들어간 단일 사용자 메시지 (기존 방식)
+- prefix-suffix: PromptTemplate으로 고정 접두부(시스템)와 쿼리 접미부(사용자)를 분리
+
+스텁 서버는 프리필 비용과 메시지 단위 접두사 캐시를 흉내냅니다.
+
+실행:
+    python tests/benchmarks/benchmark_prompt_prefix.py --requests 30 --tables 40
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+from typing import Dict, Any, List
+
+import requests
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.prompt_templates import PromptTemplate, apply_cache_hints
+from src.core.token_budget import estimate_tokens
+from tests.benchmarks.stub_llm_server import StubLLMServer, StubLLMConfig
+
+INSTRUCTIONS = """SWDP 데이터베이스 전문가로서 SWDP 관련 데이터베이스 쿼리를 도와드립니다.
+SQL 쿼리가 필요한 경우 ```sql 코드 ``` 형식으로 쿼리를 작성하고 코드의 목적과 로직을 설명하세요."""
+
+TEMPLATE = PromptTemplate(
+    name="bench.db",
+    prefix=INSTRUCTIONS + "\n\n$schema_info",
+    suffix="질문: $query"
+)
+
+
+def _schema(tables: int) -> str:
+    """합성 스키마 텍스트 생성"""
+    lines = ["## SWDP 데이터베이스 스키마", ""]
+    for t in range(tables):
+        lines.append(f"### 테이블: table_{t}")
+        lines.append("컬럼:")
+        for c in range(12):
+            lines.append(f"- column_{c} (VARCHAR(255)) NOT NULL: 테이블 {t}의 컬럼 {c} 설명")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _monolithic(schema: str, query: str) -> List[Dict[str, Any]]:
+    """쿼리가 중간에 들어간 기존 단일 메시지 프롬프트"""
+    prompt = f"{INSTRUCTIONS.splitlines()[0]}\n\n{schema}\n\n질문: {query}\n\n{INSTRUCTIONS.splitlines()[1]}"
+    return [{"role": "user", "content": prompt}]
+
+
+def _ttft(endpoint: str, messages: List[Dict[str, Any]]) -> float:
+    """스트리밍 요청의 첫 콘텐츠 청크까지 걸린 시간 측정"""
+    start = time.perf_counter()
+    with requests.post(endpoint, json={"messages": messages, "stream": True}, stream=True, timeout=30) as response:
+        for line in response.iter_lines():
+            if line and line.startswith(b"data: ") and b'"content"' in line:
+                return time.perf_counter() - start
+    return time.perf_counter() - start
+
+
+def _run(label: str, endpoint: str, build, total: int) -> Dict[str, Any]:
+    """요청을 순차 실행하고 TTFT 통계 반환"""
+    samples = sorted(_ttft(endpoint, build(i)) for i in range(total))
+    return {
+        "mode": label,
+        "requests": total,
+        "ttft_p50_ms": round(statistics.median(samples) * 1000, 1),
+        "ttft_p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)] * 1000, 1),
+        "ttft_mean_ms": round(statistics.mean(samples) * 1000, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프롬프트 접두사 재사용 벤치마크")
+    parser.add_argument("--requests", type=int, default=30, help="모드별 요청 수")
+    parser.add_argument("--tables", type=int, default=40, help="합성 스키마 테이블 수")
+    parser.add_argument("--prefill-ms", type=float, default=40, help="1000토큰당 프리필 지연")
+    args = parser.parse_args()
+
+    schema = _schema(args.tables)
+    queries = [f"최근 {i}일 동안 실패한 빌드 목록을 보여줘" for i in range(args.requests)]
+
+    def monolithic(i):
+        return _monolithic(schema, queries[i])
+
+    def prefix_suffix(i):
+        return apply_cache_hints(TEMPLATE.build_messages(schema_info=schema, query=queries[i]), supported=False)
+
+    results = []
+    for label, build in (("monolithic", monolithic), ("prefix-suffix", prefix_suffix)):
+        config = StubLLMConfig(call_latency_ms=5, prefill_ms_per_1k_tokens=args.prefill_ms, prefix_cache_size=256)
+        with StubLLMServer(config=config) as server:
+            result = _run(label, server.endpoint, build, args.requests)
+            result["cached_token_ratio"] = round(config.stats["cached_tokens"] / max(1, config.stats["prompt_tokens"]), 3)
+            results.append(result)
+
+    report = {
+        "config": vars(args),
+        "schema_tokens": estimate_tokens(schema),
+        "results": results,
+        "ttft_p50_speedup": round(results[0]["ttft_p50_ms"] / results[1]["ttft_p50_ms"], 2)
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
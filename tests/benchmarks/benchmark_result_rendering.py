@@ -0,0 +1,101 @@
+"""
+쿼리 결과 렌더링 벤치마크
+
+큰 SELECT 결과를 기존 방식(행/셀마다 문자열 +=)과 src.utils.sql_utils 렌더러로 포맷팅하여
+처리 시간과 최대 메모리 사용량, 응답 크기를 비교합니다.
+
+실행:
+    python tests/benchmarks/benchmark_result_rendering.py --rows 50000 --columns 8
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+from typing import Dict, Any, List
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.utils.sql_utils import format_query_result
+
+
+def _legacy_table(result: List[Dict[str, Any]]) -> str:
+    """기존 format_query_result의 마크다운 표 생성"""
+    columns = result[0].keys()
+    response = "## 쿼리 결과\n\n"
+    response += "| " + " | ".join(columns) + " |\n"
+    response += "| " + " | ".join(["---"] * len(columns)) + " |\n"
+    for row in result:
+        values = []
+        for col in columns:
+            value = row.get(col, "")
+            if not isinstance(value, str):
+                value = "NULL" if value is None else str(value)
+            values.append(value.replace("|", "\\|"))
+        response += "| " + " | ".join(values) + " |\n"
+    response += f"\n총 {len(result)}개의 행이 반환되었습니다.\n\n"
+    return response
+
+
+def _rows(count: int, columns: int) -> List[Dict[str, Any]]:
+    """문자열/정수/NULL이 섞인 합성 결과 행 생성"""
+    rows = []
+    for i in range(count):
+        row = {}
+        for c in range(columns):
+            if c % 3 == 0:
+                row[f"col_{c}"] = i * c
+            elif c % 3 == 1:
+                row[f"col_{c}"] = f"build-{i}-{c}"
+            else:
+                row[f"col_{c}"] = None if i % 7 == 0 else f"status|{i % 5}"
+        rows.append(row)
+    return rows
+
+
+def _measure(label: str, render) -> Dict[str, Any]:
+    """처리 시간(메모리 추적 없이)과 최대 메모리 사용량 측정"""
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        output = render()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    render()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "mode": label,
+        "elapsed_ms": round(min(timings) * 1000, 1),
+        "peak_kib": peak // 1024,
+        "output_chars": len(output)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="쿼리 결과 렌더링 벤치마크")
+    parser.add_argument("--rows", type=int, default=50000, help="결과 행 수")
+    parser.add_argument("--columns", type=int, default=8, help="결과 컬럼 수")
+    parser.add_argument("--max-rows", type=int, default=500, help="행 제한 모드의 최대 출력 행 수")
+    args = parser.parse_args()
+
+    rows = _rows(args.rows, args.columns)
+    sql = "SELECT * FROM builds"
+
+    results = [
+        _measure("legacy-markdown", lambda: _legacy_table(rows)),
+        _measure("markdown", lambda: format_query_result(rows, sql, "", "SWDP DB", max_rows=0)),
+        _measure(f"markdown-limit-{args.max_rows}", lambda: format_query_result(rows, sql, "", "SWDP DB", max_rows=args.max_rows)),
+        _measure("csv", lambda: format_query_result(rows, sql, "", "SWDP DB", output_format="csv", max_rows=0)),
+        _measure("json-columnar", lambda: format_query_result(rows, sql, "", "SWDP DB", output_format="json", max_rows=0))
+    ]
+    print(json.dumps({"config": vars(args), "results": results}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
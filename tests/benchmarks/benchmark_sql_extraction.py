@@ -0,0 +1,152 @@
+"""
+LLM 응답 파싱 벤치마크
+
+큰 LLM 응답(여러 코드 블록, 긴 설명, 함수 호출 JSON)을 대상으로
+기존 파싱 방식과 단일 스캐너(src.utils.sql_utils)의 처리 시간을 비교합니다.
+
+DB 에이전트 한 번의 실행에서 일어나는 파싱을 그대로 재현합니다.
+- 함수 호출 추출 -> SQL 쿼리 추출 -> 결과 포맷팅용 분석 텍스트 추출
+
+실행:
+    python tests/benchmarks/benchmark_sql_extraction.py --responses 200 --blocks 20
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from typing import Dict, Any, List, Optional
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.utils.sql_utils import extract_sql_query, extract_function_call, scan_llm_response
+
+
+def _legacy_extract_sql_query(text: str) -> Optional[str]:
+    """기존 extract_sql_query (패턴을 호출마다 컴파일하고 최대 세 번 스캔)"""
+    match = re.compile(r"```sql\s*(.*?)\s*```", re.DOTALL).search(text)
+    if match:
+        return match.group(1).strip()
+
+    match = re.compile(r"```\s*(.*?)\s*```", re.DOTALL).search(text)
+    if match:
+        return match.group(1).strip()
+
+    for line in text.split('\n'):
+        for keyword in ["SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "ALTER", "DROP"]:
+            if line.strip().upper().startswith(keyword):
+                return line.strip()
+    return None
+
+
+def _legacy_analysis(text: str) -> str:
+    """기존 format_query_result의 분석 텍스트 추출 (findall + rfind)"""
+    sql_blocks = re.findall(r"```sql.*?```", text, re.DOTALL)
+    if sql_blocks:
+        end = text.rfind(sql_blocks[-1]) + len(sql_blocks[-1])
+        if end < len(text):
+            return text[end:].strip()
+    return ""
+
+
+def _legacy_function_call(text: str) -> Optional[Dict[str, Any]]:
+    """기존 SWDPDBAgent._extract_function_call (지연 매칭 정규식 + json.loads)"""
+    try:
+        match = re.search(r'\{[\s\S]*?"function"[\s\S]*?\}', text)
+        if match:
+            function_call = json.loads(match.group(0))
+            if "function" in function_call and "parameters" in function_call:
+                return function_call
+        return None
+    except Exception:
+        return None
+
+
+def _fenced_response(seed: int, blocks: int, filler: int) -> str:
+    """여러 코드 블록과 긴 설명, 함수 호출이 섞인 응답"""
+    paragraph = f"응답 {seed}: 빌드 이력과 테스트 결과를 기준으로 조회합니다. " * filler
+    parts = [paragraph]
+    for b in range(blocks):
+        parts.append(f"```python\nrows = fetch({seed}, {b})\nprint(len(rows))\n```")
+        parts.append(paragraph)
+    parts.append(f"```sql\nSELECT id, status FROM builds WHERE project_id = {seed} ORDER BY id DESC;\n```")
+    parts.append(paragraph)
+    parts.append(f'{{"function": "get_build_status", "parameters": {{"build_id": "B-{seed}"}}}}')
+    parts.append("위 쿼리는 최근 빌드 상태를 보여줍니다.")
+    return "\n\n".join(parts)
+
+
+def _plain_response(seed: int, blocks: int, filler: int) -> str:
+    """코드 블록 없이 설명 문장 끝에 SQL 라인만 있는 응답 (키워드 라인 폴백 경로)"""
+    lines = [f"응답 {seed}-{i}: 빌드 이력과 테스트 결과를 기준으로 조회합니다." for i in range(blocks * filler)]
+    lines.append(f"SELECT id FROM builds WHERE project_id = {seed};")
+    return "\n".join(lines)
+
+
+def _json_response(seed: int, blocks: int, filler: int) -> str:
+    """함수 호출 없이 JSON 데이터가 길게 붙은 응답 (함수 호출 탐색 경로)"""
+    rows = [{"id": f"{seed}-{i}", "status": "FAILED", "meta": {"step": i}} for i in range(blocks * filler)]
+    return f"조회 결과를 요약합니다.\n\n{json.dumps(rows, ensure_ascii=False)}\n\n```sql\nSELECT id FROM builds;\n```\n끝"
+
+
+SHAPES = {"fenced": _fenced_response, "plain": _plain_response, "json": _json_response}
+
+
+def _time(label: str, run, texts: List[str]) -> Dict[str, Any]:
+    """응답 목록 전체 파싱 시간 측정"""
+    start = time.perf_counter()
+    for text in texts:
+        run(text)
+    elapsed = time.perf_counter() - start
+    return {
+        "mode": label,
+        "responses": len(texts),
+        "elapsed_ms": round(elapsed * 1000, 2),
+        "per_response_us": round(elapsed / len(texts) * 1e6, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 응답 파싱 벤치마크")
+    parser.add_argument("--responses", type=int, default=200, help="합성 응답 수")
+    parser.add_argument("--blocks", type=int, default=20, help="응답당 비 SQL 코드 블록 수")
+    parser.add_argument("--filler", type=int, default=20, help="설명 문단 반복 횟수")
+    args = parser.parse_args()
+
+    def legacy(text):
+        return _legacy_function_call(text), _legacy_extract_sql_query(text), _legacy_analysis(text)
+
+    def scanner(text):
+        return extract_function_call(text), extract_sql_query(text), scan_llm_response(text)["analysis"]
+
+    shapes = []
+    for shape, build in SHAPES.items():
+        # 스캐너 캐시 적중을 피하기 위해 응답마다 내용이 다름
+        texts = [build(i, args.blocks, args.filler) for i in range(args.responses)]
+
+        # 기존 방식은 중첩 parameters가 있는 함수 호출 JSON을 파싱하지 못함
+        sample = texts[0]
+        agreement = {
+            "function_call": _legacy_function_call(sample) == extract_function_call(sample),
+            "sql_query": _legacy_extract_sql_query(sample) == extract_sql_query(sample),
+            "analysis": _legacy_analysis(sample) == scan_llm_response(sample)["analysis"]
+        }
+
+        results = [_time("legacy", legacy, texts), _time("scanner", scanner, texts)]
+        shapes.append({
+            "shape": shape,
+            "response_chars": len(sample),
+            "agreement": agreement,
+            "results": results,
+            "speedup": round(results[0]["elapsed_ms"] / results[1]["elapsed_ms"], 2)
+        })
+
+    report = {"config": vars(args), "shapes": shapes}
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
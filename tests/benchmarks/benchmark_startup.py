@@ -0,0 +1,152 @@
+"""
+API 서버 시작 시간 벤치마크
+
+새 인터프리터에서 대상 모듈을 `python -X importtime`으로 임포트하여 전체 임포트 시간과 모듈별 내역을 측정합니다.
+- 임포트 시간 (반복 측정 중앙값)
+- 누적 시간 상위 모듈, 최상위 패키지별 자체 시간 합계
+- 무거운 모듈(sqlalchemy, langgraph, sentence-transformers, 에이전트 모듈)이 시작 시점에 로드되는지 여부
+--compare-ref를 지정하면 해당 git 리비전의 트리를 임시 디렉토리에 풀어 같은 조건으로 비교합니다.
+
+실행:
+    python tests/benchmarks/benchmark_startup.py --modules src.core.router main --repeat 5 --top 15
+    python tests/benchmarks/benchmark_startup.py --modules src.core.router --compare-ref HEAD~1
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import tarfile
+import argparse
+import tempfile
+import subprocess
+import statistics
+from typing import Dict, Any, List
+
+# 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(ROOT_DIR)
+
+HEAVY_MODULES = [
+    "sqlalchemy", "langgraph", "sentence_transformers", "chromadb",
+    "src.agents.swdp_db_agent", "src.agents.swdp_rpc_api", "src.agents.document_management_agent",
+    "src.agents.agent_manager", "src.agents.orchestrator"
+]
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+START_MARKER = "-- benchmark import start --"
+
+
+def parse_import_times(stderr: str) -> List[Dict[str, Any]]:
+    """-X importtime 출력을 (모듈, 자체/누적 시간, 깊이) 목록으로 변환 (인터프리터 시작 시 임포트 제외)"""
+    lines = stderr.splitlines()
+    if START_MARKER in lines:
+        lines = lines[lines.index(START_MARKER) + 1:]
+    entries = []
+    for line in lines:
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            entries.append({
+                "module": match.group(4),
+                "self_ms": int(match.group(1)) / 1000,
+                "cumulative_ms": int(match.group(2)) / 1000,
+                "depth": (len(match.group(3)) - 1) // 2
+            })
+    return entries
+
+
+def measure_import(module: str, cwd: str) -> Dict[str, Any]:
+    """새 인터프리터에서 모듈 하나를 임포트하고 시간 측정"""
+    code = (
+        "import sys, time\n"
+        f"sys.stderr.write({START_MARKER!r} + '\\n')\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print((time.perf_counter() - start) * 1000)\n"
+        f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))\n"
+    )
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=cwd, env=env,
+                             capture_output=True, text=True)
+    entries = parse_import_times(process.stderr)
+    result = {"entries": entries}
+
+    if process.returncode != 0:
+        errors = [line for line in process.stderr.splitlines()
+                  if line and line != START_MARKER and not line.startswith("import time:")]
+        result["error"] = errors[-1] if errors else f"exit {process.returncode}"
+        return result
+
+    wall_ms, heavy = (process.stdout.strip().splitlines() + ["", ""])[:2]
+    result["wall_ms"] = float(wall_ms)
+    result["heavy_loaded"] = [name for name in heavy.split(",") if name]
+    return result
+
+
+def summarize(module: str, cwd: str, repeat: int, top: int) -> Dict[str, Any]:
+    """반복 측정 후 중앙값과 마지막 측정의 모듈별 내역 요약"""
+    runs = [measure_import(module, cwd) for _ in range(repeat)]
+    last = runs[-1]
+    if "error" in last:
+        return {"module": module, "error": last["error"], "imported_modules": len(last["entries"])}
+
+    entries = last["entries"]
+    by_package: Dict[str, float] = {}
+    for entry in entries:
+        package = entry["module"].split(".")[0]
+        by_package[package] = by_package.get(package, 0.0) + entry["self_ms"]
+
+    return {
+        "module": module,
+        "wall_ms": round(statistics.median(run["wall_ms"] for run in runs), 1),
+        "imported_modules": len(entries),
+        "heavy_loaded": last["heavy_loaded"],
+        "top_cumulative": [
+            {"module": entry["module"], "cumulative_ms": round(entry["cumulative_ms"], 1),
+             "self_ms": round(entry["self_ms"], 1)}
+            for entry in sorted(entries, key=lambda item: item["cumulative_ms"], reverse=True)[:top]
+        ],
+        "by_package_self_ms": {
+            package: round(total, 1)
+            for package, total in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+        }
+    }
+
+
+def export_ref(ref: str, directory: str) -> str:
+    """git 리비전의 트리를 임시 디렉토리에 풀기"""
+    archive = os.path.join(directory, "tree.tar")
+    with open(archive, "wb") as f:
+        subprocess.run(["git", "archive", ref], cwd=ROOT_DIR, stdout=f, check=True)
+    target = os.path.join(directory, "tree")
+    with tarfile.open(archive) as tar:
+        tar.extractall(target)
+    return target
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 서버 시작 시간 벤치마크")
+    parser.add_argument("--modules", nargs="+", default=["src.core.router", "main"], help="임포트할 모듈")
+    parser.add_argument("--repeat", type=int, default=5, help="모듈별 반복 측정 횟수")
+    parser.add_argument("--top", type=int, default=15, help="내역에 표시할 상위 항목 수")
+    parser.add_argument("--compare-ref", default=None, help="비교할 git 리비전 (예: HEAD~1)")
+    args = parser.parse_args()
+
+    report = {"python": sys.version.split()[0], "repeat": args.repeat,
+              "current": [summarize(module, ROOT_DIR, args.repeat, args.top) for module in args.modules]}
+
+    if args.compare_ref:
+        directory = tempfile.mkdtemp()
+        try:
+            tree = export_ref(args.compare_ref, directory)
+            report["compare_ref"] = args.compare_ref
+            report["baseline"] = [summarize(module, tree, args.repeat, args.top) for module in args.modules]
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
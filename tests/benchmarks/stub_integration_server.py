@@ -0,0 +1,164 @@
+"""
+외부 연동 API 스텁 서버
+
+src/schema/*.json 형식의 Mock 스키마(api_endpoints 목록)를 HTTP로 제공하는 로컬 스텁 서버입니다.
+스키마 파일 이름이 서비스 경로 접두사가 됩니다. (예: jira.json -> /jira/rest/api/2/issue/AI-101)
+응답 지연과 일시적 오류(503)를 주입하여 비동기 클라이언트의 동시성/재시도 동작을 오프라인으로 검증할 수 있습니다.
+
+스키마 항목 형식:
+    {"endpoint": "/rest/api/2/issue/{issueKey}", "method": "GET", "response": {...}}
+"""
+
+import os
+import sys
+import json
+import glob
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.mock_router import MockEndpointRouter
+
+# 기본 스키마 디렉토리
+DEFAULT_SCHEMA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "src", "schema"
+)
+
+
+class StubIntegrationConfig:
+    """스텁 서버 동작 설정"""
+
+    def __init__(self, latency_ms: float = 0.0, fail_first: int = 0, fail_status: int = 503,
+                 retry_after: Optional[float] = None):
+        """
+        스텁 서버 설정 초기화
+
+        Args:
+            latency_ms: 요청당 응답 지연
+            fail_first: 처음 N개의 요청을 오류로 응답
+            fail_status: 주입할 오류 상태 코드
+            retry_after: 오류 응답에 붙일 Retry-After 헤더 값 (초)
+        """
+        self.latency = latency_ms / 1000.0
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.retry_after = retry_after
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "failures": 0, "in_flight": 0, "max_in_flight": 0}
+        self.paths: List[Tuple[str, str]] = []
+
+
+class StubIntegrationHandler(BaseHTTPRequestHandler):
+    """스텁 서버 요청 처리기"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    config: StubIntegrationConfig = None
+    routes: Dict[str, MockEndpointRouter] = {}
+
+    def log_message(self, format, *args):
+        """요청 로그 출력 생략"""
+        pass
+
+    def _send_json(self, status_code: int, body: Any, headers: Optional[Dict[str, str]] = None):
+        """JSON 응답 전송"""
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self):
+        """모든 메서드 공통 처리"""
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+
+        config = self.config
+        with config.lock:
+            config.stats["requests"] += 1
+            config.stats["in_flight"] += 1
+            config.stats["max_in_flight"] = max(config.stats["max_in_flight"], config.stats["in_flight"])
+            failing = config.stats["requests"] <= config.fail_first
+            if failing:
+                config.stats["failures"] += 1
+            config.paths.append((self.command, self.path))
+
+        try:
+            if config.latency:
+                time.sleep(config.latency)
+
+            if failing:
+                headers = {"Retry-After": str(config.retry_after)} if config.retry_after is not None else None
+                self._send_json(config.fail_status, {"error": "일시적 오류 (주입)"}, headers)
+                return
+
+            path = urlsplit(self.path).path
+            service, _, service_path = path.lstrip("/").partition("/")
+            router = self.routes.get(service)
+            response = router.find_response(self.command, "/" + service_path) if router else None
+            if response is not None:
+                self._send_json(200, response)
+                return
+
+            self._send_json(404, {"error": f"엔드포인트 찾을 수 없음: {path} ({self.command})"})
+        finally:
+            with config.lock:
+                config.stats["in_flight"] -= 1
+
+    do_GET = _handle
+    do_POST = _handle
+    do_PUT = _handle
+    do_DELETE = _handle
+
+
+class StubIntegrationServer:
+    """백그라운드 스레드에서 실행되는 외부 연동 API 스텁 서버"""
+
+    def __init__(self, schemas: Optional[Dict[str, Dict[str, Any]]] = None, schema_dir: str = DEFAULT_SCHEMA_DIR,
+                 host: str = "127.0.0.1", port: int = 0, config: Optional[StubIntegrationConfig] = None):
+        """
+        스텁 서버 초기화
+
+        Args:
+            schemas: {서비스 이름: 스키마} (지정하면 schema_dir의 같은 이름 파일보다 우선)
+            schema_dir: Mock 스키마 JSON 디렉토리 (없으면 무시)
+            host: 바인딩 호스트
+            port: 바인딩 포트 (0이면 임의 포트)
+            config: 스텁 서버 동작 설정
+        """
+        loaded: Dict[str, Dict[str, Any]] = {}
+        for path in sorted(glob.glob(os.path.join(schema_dir, "*.json"))):
+            with open(path, "r", encoding="utf-8") as f:
+                loaded[os.path.splitext(os.path.basename(path))[0]] = json.load(f)
+        loaded.update(schemas or {})
+
+        routes = {service: MockEndpointRouter.from_schema(schema) for service, schema in loaded.items()}
+
+        self.config = config or StubIntegrationConfig()
+        self.services = sorted(routes.keys())
+        handler = type("BoundStubIntegrationHandler", (StubIntegrationHandler,),
+                       {"config": self.config, "routes": routes})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, service: str) -> str:
+        """서비스 기본 URL (예: http://127.0.0.1:port/jira)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/{service}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
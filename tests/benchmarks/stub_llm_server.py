@@ -0,0 +1,298 @@
+"""
+OpenAI 호환 LLM 스텁 서버
+
+벤치마크용 로컬 스텁 서버입니다. 실제 추론 대신 설정된 지연 시간만큼 대기한 뒤 고정 응답을 반환합니다.
+동시 추론 슬롯 수를 제한하여 GPU 서버처럼 요청이 많을수록 대기 시간이 늘어나는 상황을 흉내냅니다.
+프리필 비용과 메시지 단위 접두사(KV) 캐시를 흉내내어, 앞부분 메시지가 이전 요청과 같으면 첫 토큰 지연이 줄어듭니다.
+엔드투엔드 벤치마크용으로 지연 편차(무작위), 첫 토큰 지연(TTFT), 토큰 생성 속도, 응답 길이, 오류 주입을 설정할 수 있으며
+seed를 지정하면 같은 순서의 무작위 값이 재현됩니다.
+
+지원 엔드포인트:
+- POST /chat/completions          단건 호출
+- POST /chat/completions/batch    배치 호출 ({"requests": [...]} -> {"responses": [...]})
+"""
+
+import json
+import time
+import uuid
+import random
+import hashlib
+import threading
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, List, Optional
+
+
+class StubLLMConfig:
+    """스텁 서버 동작 설정"""
+
+    def __init__(self, call_latency_ms: float = 20.0, per_item_latency_ms: float = 2.0,
+                 inference_slots: int = 2, prefill_ms_per_1k_tokens: float = 0.0,
+                 prefix_cache_size: int = 0, stream_chunks: int = 8, chunk_interval_ms: float = 5.0,
+                 latency_jitter_ms: float = 0.0, ttft_ms: float = 0.0, tokens_per_second: float = 0.0,
+                 completion_tokens: int = 0, error_rate: float = 0.0, error_status: int = 503,
+                 seed: Optional[int] = None):
+        """
+        스텁 서버 설정 초기화
+
+        Args:
+            call_latency_ms: 호출당 고정 추론 지연 (배치 여부와 무관)
+            per_item_latency_ms: 배치 내 요청 1건당 추가 지연
+            inference_slots: 동시에 처리 가능한 추론 수
+            prefill_ms_per_1k_tokens: 캐시되지 않은 프롬프트 1000토큰당 프리필 지연
+            prefix_cache_size: 접두사 캐시 항목 수 (0이면 캐시 비활성화)
+            stream_chunks: 스트리밍 응답 청크 수
+            chunk_interval_ms: 스트리밍 청크 간 간격 (tokens_per_second를 지정하면 무시)
+            latency_jitter_ms: 호출마다 0~지정값 사이에서 무작위로 더하는 지연
+            ttft_ms: 추론 슬롯을 나온 뒤 첫 토큰까지 추가 지연
+            tokens_per_second: 토큰 생성 속도 (0이면 생성 시간 없음)
+            completion_tokens: 응답 토큰 수 (0이면 짧은 고정 응답)
+            error_rate: 오류로 응답할 확률 (0~1)
+            error_status: 주입할 오류 상태 코드
+            seed: 무작위 지연/오류 주입 시드 (None이면 매번 다름)
+        """
+        self.call_latency = call_latency_ms / 1000.0
+        self.per_item_latency = per_item_latency_ms / 1000.0
+        self.prefill_per_token = prefill_ms_per_1k_tokens / 1000.0 / 1000.0
+        self.prefix_cache_size = prefix_cache_size
+        self.stream_chunks = max(1, stream_chunks)
+        self.chunk_interval = chunk_interval_ms / 1000.0
+        self.latency_jitter = latency_jitter_ms / 1000.0
+        self.ttft = ttft_ms / 1000.0
+        self.tokens_per_second = tokens_per_second
+        self.completion_tokens = completion_tokens
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.slots = threading.Semaphore(max(1, inference_slots))
+        self.stats_lock = threading.Lock()
+        self.stats = {"calls": 0, "batch_calls": 0, "items": 0, "prompt_tokens": 0, "cached_tokens": 0, "errors": 0}
+        self._prefix_cache: "OrderedDict[str, bool]" = OrderedDict()
+        self._random = random.Random(seed)
+
+    def jitter(self) -> float:
+        """호출마다 더하는 무작위 지연 (초)"""
+        if not self.latency_jitter:
+            return 0.0
+        with self.stats_lock:
+            return self._random.uniform(0.0, self.latency_jitter)
+
+    def should_fail(self) -> bool:
+        """이번 호출을 오류로 응답할지 여부 (error_rate 확률)"""
+        if not self.error_rate:
+            return False
+        with self.stats_lock:
+            failing = self._random.random() < self.error_rate
+            if failing:
+                self.stats["errors"] += 1
+        return failing
+
+    def decode_delay(self, tokens: int) -> float:
+        """토큰 생성 속도에 따른 생성 시간 (초)"""
+        return tokens / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+    def prefill_delay(self, messages: List[Dict[str, Any]]) -> float:
+        """
+        캐시되지 않은 프롬프트 토큰 수에 비례하는 프리필 지연 계산
+
+        앞에서부터 메시지 단위 누적 해시가 캐시에 있으면 해당 메시지 토큰은 프리필 비용에서 제외합니다.
+        """
+        digest = hashlib.sha256()
+        prompt_tokens = 0
+        cached_tokens = 0
+        still_cached = True
+        keys = []
+
+        for message in messages:
+            content = message.get("content", "")
+            if not isinstance(content, str):
+                content = json.dumps(content, ensure_ascii=False)
+            digest.update(f"{message.get('role')}:{content}\x00".encode("utf-8"))
+            key = digest.hexdigest()
+            keys.append(key)
+
+            tokens = _estimate_tokens(content)
+            prompt_tokens += tokens
+
+            with self.stats_lock:
+                hit = still_cached and key in self._prefix_cache
+            if hit:
+                cached_tokens += tokens
+            else:
+                still_cached = False
+
+        with self.stats_lock:
+            self.stats["prompt_tokens"] += prompt_tokens
+            self.stats["cached_tokens"] += cached_tokens
+            if self.prefix_cache_size:
+                for key in keys:
+                    self._prefix_cache[key] = True
+                    self._prefix_cache.move_to_end(key)
+                while len(self._prefix_cache) > self.prefix_cache_size:
+                    self._prefix_cache.popitem(last=False)
+
+        return (prompt_tokens - cached_tokens) * self.prefill_per_token
+
+
+def _estimate_tokens(text: str) -> int:
+    """ASCII 4자당 1토큰, 비 ASCII 1자당 1토큰으로 추정"""
+    ascii_count = len(text.encode("ascii", "ignore"))
+    return ascii_count // 4 + (len(text) - ascii_count)
+
+
+def _completion(payload: Dict[str, Any], completion_tokens: int = 0) -> Dict[str, Any]:
+    """chat/completions 형식의 고정 응답 생성 (completion_tokens를 지정하면 그 길이로 채움)"""
+    messages = payload.get("messages", [])
+    last = messages[-1].get("content", "") if messages else ""
+    content = f"stub: {last[:32]}"
+    if completion_tokens > 0:
+        content = "tok " * completion_tokens
+    prompt_tokens = sum(_estimate_tokens(str(m.get("content", ""))) + 4 for m in messages)
+    completion_tokens = completion_tokens or len(content) // 4 + 1
+
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": payload.get("model", "stub-model"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop"
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+    }
+
+
+class StubLLMHandler(BaseHTTPRequestHandler):
+    """스텁 서버 요청 처리기"""
+
+    config: StubLLMConfig = None
+
+    def log_message(self, format, *args):
+        """요청 로그 출력 생략"""
+        pass
+
+    def _send_json(self, status_code: int, body: Dict[str, Any]):
+        """JSON 응답 전송"""
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, completion: Dict[str, Any]):
+        """SSE 형식 스트리밍 응답 전송 (첫 청크는 프리필과 ttft 직후 전송)"""
+        content = completion["choices"][0]["message"]["content"]
+        size = max(1, -(-len(content) // self.config.stream_chunks))
+        pieces = [content[i:i + size] for i in range(0, len(content), size)] or [""]
+        if self.config.tokens_per_second > 0:
+            interval = self.config.decode_delay(completion["usage"]["completion_tokens"]) / len(pieces)
+        else:
+            interval = self.config.chunk_interval
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        self.close_connection = True
+        try:
+            if self.config.ttft:
+                time.sleep(self.config.ttft)
+            for index, piece in enumerate(pieces):
+                if index:
+                    time.sleep(interval)
+                chunk = {
+                    "id": completion["id"],
+                    "object": "chat.completion.chunk",
+                    "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]
+                }
+                self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+
+            final = {"id": completion["id"], "object": "chat.completion.chunk", "choices": [], "usage": completion["usage"]}
+            self.wfile.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 첫 토큰만 받고 연결을 끊은 경우 (TTFT 측정 등)
+            pass
+
+    def do_POST(self):
+        """POST 요청 처리"""
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        path = self.path.rstrip("/")
+        config = self.config
+
+        if path.endswith("/chat/completions") or path.endswith("/chat/completions/batch"):
+            if config.should_fail():
+                self._send_json(config.error_status, {"error": {"message": "일시적 오류 (주입)", "type": "stub_error"}})
+                return
+
+        if path.endswith("/chat/completions/batch"):
+            items = body.get("requests", [])
+            prefill = sum(config.prefill_delay(item.get("messages", [])) for item in items)
+            with config.slots:
+                time.sleep(config.call_latency + config.per_item_latency * len(items) + prefill + config.jitter())
+            time.sleep(config.ttft + config.decode_delay(config.completion_tokens))
+            with config.stats_lock:
+                config.stats["calls"] += 1
+                config.stats["batch_calls"] += 1
+                config.stats["items"] += len(items)
+            self._send_json(200, {"responses": [_completion(item, config.completion_tokens) for item in items]})
+
+        elif path.endswith("/chat/completions"):
+            prefill = config.prefill_delay(body.get("messages", []))
+            with config.slots:
+                time.sleep(config.call_latency + config.per_item_latency + prefill + config.jitter())
+            with config.stats_lock:
+                config.stats["calls"] += 1
+                config.stats["items"] += 1
+
+            completion = _completion(body, config.completion_tokens)
+            if body.get("stream"):
+                self._send_stream(completion)
+            else:
+                time.sleep(config.ttft + config.decode_delay(completion["usage"]["completion_tokens"]))
+                self._send_json(200, completion)
+
+        else:
+            self._send_json(404, {"error": f"알 수 없는 경로: {self.path}"})
+
+
+class StubLLMServer:
+    """백그라운드 스레드에서 실행되는 스텁 서버"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, config: Optional[StubLLMConfig] = None):
+        """
+        스텁 서버 초기화
+
+        Args:
+            host: 바인딩 호스트
+            port: 바인딩 포트 (0이면 임의 포트)
+            config: 스텁 서버 동작 설정
+        """
+        self.config = config or StubLLMConfig()
+        handler = type("BoundStubLLMHandler", (StubLLMHandler,), {"config": self.config})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def endpoint(self) -> str:
+        """chat/completions 엔드포인트 URL"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/chat/completions"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,129 @@
+"""
+OTLP 추적 수집기 스텁 서버
+
+OTLP/HTTP(JSON) 형식의 추적 내보내기(POST /v1/traces)를 받아 메모리에 보관하는 로컬 스텁 서버입니다.
+tracing 설정의 exporter를 "otlp"로 두고 otlp_endpoint를 이 서버로 지정하면, 실제 수집기 없이
+요청별 스팬 구조를 확인할 수 있습니다.
+
+실행:
+    python tests/benchmarks/stub_otlp_collector.py --port 4318
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, List
+
+
+class StubOTLPHandler(BaseHTTPRequestHandler):
+    """OTLP 수집 요청 처리기"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    collector: "StubOTLPCollector" = None
+
+    def log_message(self, format, *args):
+        """요청 로그 출력 생략"""
+        pass
+
+    def _send_json(self, status_code: int, body: Any):
+        """JSON 응답 전송"""
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        """추적 수집 (/v1/traces)"""
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        if self.path.rstrip("/") != "/v1/traces":
+            self._send_json(404, {"error": f"지원하지 않는 경로: {self.path}"})
+            return
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "JSON 형식 오류"})
+            return
+        self.collector.add(payload)
+        self._send_json(200, {"partialSuccess": {}})
+
+
+class StubOTLPCollector:
+    """백그라운드 스레드에서 실행되는 OTLP 수집기 스텁"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        수집기 초기화
+
+        Args:
+            host: 바인딩 호스트
+            port: 바인딩 포트 (0이면 임의 포트)
+        """
+        self.lock = threading.Lock()
+        self.payloads: List[Dict[str, Any]] = []
+        handler = type("BoundStubOTLPHandler", (StubOTLPHandler,), {"collector": self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def endpoint(self) -> str:
+        """수집 URL (예: http://127.0.0.1:port/v1/traces)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1/traces"
+
+    def add(self, payload: Dict[str, Any]) -> None:
+        """수집한 요청 보관"""
+        with self.lock:
+            self.payloads.append(payload)
+
+    def spans(self) -> List[Dict[str, Any]]:
+        """지금까지 받은 모든 스팬"""
+        with self.lock:
+            payloads = list(self.payloads)
+        return [span
+                for payload in payloads
+                for resource in payload.get("resourceSpans", [])
+                for scope in resource.get("scopeSpans", [])
+                for span in scope.get("spans", [])]
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OTLP 추적 수집기 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인딩 호스트")
+    parser.add_argument("--port", type=int, default=4318, help="바인딩 포트")
+    args = parser.parse_args()
+
+    with StubOTLPCollector(args.host, args.port) as collector:
+        print(f"OTLP 수집기 스텁 실행: {collector.endpoint}")
+        reported = 0
+        try:
+            while True:
+                time.sleep(1)
+                spans = collector.spans()
+                for span in spans[reported:]:
+                    duration_ms = (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e6
+                    print(json.dumps({"trace_id": span["traceId"], "name": span["name"],
+                                      "duration_ms": round(duration_ms, 3)}, ensure_ascii=False))
+                reported = len(spans)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
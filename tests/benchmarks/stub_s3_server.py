@@ -0,0 +1,310 @@
+"""
+S3 호환 스텁 서버
+
+Pocket 전송 클라이언트를 오프라인으로 검증하기 위한 메모리 기반 S3 호환 서버입니다. (경로 방식: /{bucket}/{key})
+
+지원 API:
+- PUT/GET/HEAD/DELETE 객체 (GET은 Range: bytes=a-b 부분 응답 지원, PUT은 Content-MD5 검증)
+- 멀티파트 업로드: POST ?uploads / PUT ?partNumber&uploadId / POST ?uploadId (완료) / DELETE ?uploadId (취소)
+- ListObjectsV2: GET /{bucket}?list-type=2&prefix=&delimiter=&max-keys=&continuation-token=
+
+응답 지연과 특정 파트 업로드 실패를 주입해 병렬 전송/재개 동작을 검증할 수 있습니다.
+"""
+
+import os
+import re
+import sys
+import time
+import uuid
+import base64
+import hashlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit, parse_qs, unquote
+from xml.sax.saxutils import escape
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.agents.pocket_object_index import ObjectIndex
+from src.agents.pocket_transfer import multipart_etag
+
+
+class StubS3Config:
+    """S3 스텁 서버 동작 설정"""
+
+    def __init__(self, latency_ms: float = 0.0, fail_parts: Optional[Dict[int, int]] = None, fail_status: int = 400):
+        """
+        S3 스텁 서버 설정 초기화
+
+        Args:
+            latency_ms: 요청당 응답 지연
+            fail_parts: {파트 번호: 실패시킬 횟수} (해당 파트 업로드를 지정 횟수만큼 오류로 응답)
+            fail_status: 주입할 오류 상태 코드
+        """
+        self.latency = latency_ms / 1000.0
+        self.fail_parts = dict(fail_parts or {})
+        self.fail_status = fail_status
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "part_uploads": 0, "range_gets": 0, "failures": 0,
+                      "in_flight": 0, "max_in_flight": 0}
+
+
+class StubS3Storage:
+    """버킷/객체/진행 중인 멀티파트 업로드 저장소"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets: Dict[str, ObjectIndex] = {}
+        self.data: Dict[str, Dict[str, bytes]] = {}
+        self.uploads: Dict[str, Dict[str, Any]] = {}
+
+    def put_object(self, bucket: str, key: str, data: bytes, etag: str):
+        with self.lock:
+            index = self.buckets.setdefault(bucket, ObjectIndex())
+            self.data.setdefault(bucket, {})[key] = data
+            index.put(key, {"size": len(data), "last_modified": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()),
+                            "etag": etag, "storage_class": "STANDARD"})
+
+    def get_object(self, bucket: str, key: str) -> Optional[tuple]:
+        """(데이터, 객체 정보) 또는 None"""
+        with self.lock:
+            index = self.buckets.get(bucket)
+            info = index.get(key) if index is not None else None
+            return (self.data[bucket][key], info) if info is not None else None
+
+
+class StubS3Handler(BaseHTTPRequestHandler):
+    """S3 스텁 서버 요청 처리기"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    config: StubS3Config = None
+    storage: StubS3Storage = None
+
+    def log_message(self, format, *args):
+        """요청 로그 출력 생략"""
+        pass
+
+    def _send(self, status_code: int, body: bytes = b"", headers: Optional[Dict[str, str]] = None,
+              content_type: str = "application/xml", length: Optional[int] = None):
+        """응답 전송 (HEAD는 본문 없이 Content-Length만)"""
+        self.send_response(status_code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body) if length is None else length))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD" and body:
+            self.wfile.write(body)
+
+    def _error(self, status_code: int, code: str):
+        self._send(status_code, f"<Error><Code>{code}</Code></Error>".encode("utf-8"))
+
+    def _handle(self):
+        """모든 메서드 공통 처리"""
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+
+        config = self.config
+        with config.lock:
+            config.stats["requests"] += 1
+            config.stats["in_flight"] += 1
+            config.stats["max_in_flight"] = max(config.stats["max_in_flight"], config.stats["in_flight"])
+
+        try:
+            if config.latency:
+                time.sleep(config.latency)
+
+            parts = urlsplit(self.path)
+            query = {name: values[0] for name, values in parse_qs(parts.query, keep_blank_values=True).items()}
+            bucket, _, key = unquote(parts.path).lstrip("/").partition("/")
+
+            if not key:
+                if self.command == "GET":
+                    self._list_objects(bucket, query)
+                elif self.command == "PUT":
+                    with self.storage.lock:
+                        self.storage.buckets.setdefault(bucket, ObjectIndex())
+                        self.storage.data.setdefault(bucket, {})
+                    self._send(200)
+                else:
+                    self._error(405, "MethodNotAllowed")
+            elif "uploads" in query and self.command == "POST":
+                self._create_upload(bucket, key)
+            elif "uploadId" in query:
+                self._multipart(bucket, key, query, body)
+            elif self.command == "PUT":
+                self._put_object(bucket, key, body)
+            elif self.command in ("GET", "HEAD"):
+                self._get_object(bucket, key)
+            elif self.command == "DELETE":
+                with self.storage.lock:
+                    index = self.storage.buckets.get(bucket)
+                    if index is not None and index.delete(key):
+                        del self.storage.data[bucket][key]
+                self._send(204)
+            else:
+                self._error(405, "MethodNotAllowed")
+        finally:
+            with config.lock:
+                config.stats["in_flight"] -= 1
+
+    def _check_md5(self, body: bytes) -> Optional[str]:
+        """Content-MD5 검증 후 MD5 hex 반환 (불일치 시 None)"""
+        digest = hashlib.md5(body).digest()
+        expected = self.headers.get("Content-MD5")
+        if expected and base64.b64decode(expected) != digest:
+            return None
+        return digest.hex()
+
+    def _put_object(self, bucket: str, key: str, body: bytes):
+        etag = self._check_md5(body)
+        if etag is None:
+            self._error(400, "BadDigest")
+            return
+        self.storage.put_object(bucket, key, body, etag)
+        self._send(200, headers={"ETag": f'"{etag}"'})
+
+    def _get_object(self, bucket: str, key: str):
+        found = self.storage.get_object(bucket, key)
+        if found is None:
+            self._error(404, "NoSuchKey")
+            return
+        data, info = found
+        headers = {"ETag": f'"{info["etag"]}"', "Accept-Ranges": "bytes"}
+
+        byte_range = self.headers.get("Range")
+        if byte_range and byte_range.startswith("bytes=") and self.command == "GET":
+            start_text, _, end_text = byte_range[6:].partition("-")
+            start = int(start_text)
+            end = min(int(end_text), len(data) - 1) if end_text else len(data) - 1
+            if start >= len(data) or start > end:
+                self._error(416, "InvalidRange")
+                return
+            with self.config.lock:
+                self.config.stats["range_gets"] += 1
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+            self._send(206, data[start:end + 1], headers, "application/octet-stream")
+            return
+
+        self._send(200, data, headers, "application/octet-stream", length=len(data))
+
+    def _create_upload(self, bucket: str, key: str):
+        upload_id = uuid.uuid4().hex
+        with self.storage.lock:
+            self.storage.uploads[upload_id] = {"bucket": bucket, "key": key, "parts": {}}
+        self._send(200, (f"<InitiateMultipartUploadResult><Bucket>{escape(bucket)}</Bucket><Key>{escape(key)}</Key>"
+                         f"<UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>").encode("utf-8"))
+
+    def _multipart(self, bucket: str, key: str, query: Dict[str, str], body: bytes):
+        upload_id = query["uploadId"]
+        with self.storage.lock:
+            upload = self.storage.uploads.get(upload_id)
+        if upload is None or (upload["bucket"], upload["key"]) != (bucket, key):
+            self._error(404, "NoSuchUpload")
+            return
+
+        if self.command == "PUT" and "partNumber" in query:
+            number = int(query["partNumber"])
+            config = self.config
+            with config.lock:
+                config.stats["part_uploads"] += 1
+                failing = config.fail_parts.get(number, 0) > 0
+                if failing:
+                    config.fail_parts[number] -= 1
+                    config.stats["failures"] += 1
+            if failing:
+                self._error(config.fail_status, "InjectedFailure")
+                return
+            etag = self._check_md5(body)
+            if etag is None:
+                self._error(400, "BadDigest")
+                return
+            with self.storage.lock:
+                upload["parts"][number] = (body, etag)
+            self._send(200, headers={"ETag": f'"{etag}"'})
+        elif self.command == "POST":
+            numbers = [int(number) for number in re.findall(r"<PartNumber>(\d+)</PartNumber>", body.decode("utf-8"))]
+            with self.storage.lock:
+                missing = [number for number in numbers if number not in upload["parts"]]
+                if missing or not numbers:
+                    self._error(400, "InvalidPart")
+                    return
+                chunks = [upload["parts"][number] for number in numbers]
+                del self.storage.uploads[upload_id]
+            etag = multipart_etag([bytes.fromhex(part_etag) for _, part_etag in chunks])
+            self.storage.put_object(bucket, key, b"".join(data for data, _ in chunks), etag)
+            self._send(200, (f"<CompleteMultipartUploadResult><Key>{escape(key)}</Key>"
+                             f"<ETag>\"{etag}\"</ETag></CompleteMultipartUploadResult>").encode("utf-8"))
+        elif self.command == "DELETE":
+            with self.storage.lock:
+                self.storage.uploads.pop(upload_id, None)
+            self._send(204)
+        else:
+            self._error(405, "MethodNotAllowed")
+
+    def _list_objects(self, bucket: str, query: Dict[str, str]):
+        with self.storage.lock:
+            index = self.storage.buckets.get(bucket)
+            if index is None:
+                self._error(404, "NoSuchBucket")
+                return
+            page = index.list_page(query.get("prefix", ""), query.get("delimiter", ""),
+                                   int(query.get("max-keys", 1000)), query.get("continuation-token") or None)
+        if "error" in page:
+            self._error(400, "InvalidArgument")
+            return
+
+        body = [f"<ListBucketResult><Name>{escape(bucket)}</Name><KeyCount>{page['key_count']}</KeyCount>",
+                f"<IsTruncated>{'true' if page['is_truncated'] else 'false'}</IsTruncated>"]
+        for item in page["contents"]:
+            body.append(f"<Contents><Key>{escape(item['key'])}</Key><Size>{item['size']}</Size>"
+                        f"<LastModified>{item['last_modified']}</LastModified><ETag>\"{item['etag']}\"</ETag>"
+                        f"<StorageClass>{item['storage_class']}</StorageClass></Contents>")
+        for common_prefix in page["common_prefixes"]:
+            body.append(f"<CommonPrefixes><Prefix>{escape(common_prefix)}</Prefix></CommonPrefixes>")
+        if page["next_continuation_token"]:
+            body.append(f"<NextContinuationToken>{page['next_continuation_token']}</NextContinuationToken>")
+        body.append("</ListBucketResult>")
+        self._send(200, "".join(body).encode("utf-8"))
+
+    do_GET = _handle
+    do_HEAD = _handle
+    do_PUT = _handle
+    do_POST = _handle
+    do_DELETE = _handle
+
+
+class StubS3Server:
+    """백그라운드 스레드에서 실행되는 S3 호환 스텁 서버"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, config: Optional[StubS3Config] = None):
+        """
+        스텁 서버 초기화
+
+        Args:
+            host: 바인딩 호스트
+            port: 바인딩 포트 (0이면 임의 포트)
+            config: 스텁 서버 동작 설정
+        """
+        self.config = config or StubS3Config()
+        self.storage = StubS3Storage()
+        handler = type("BoundStubS3Handler", (StubS3Handler,), {"config": self.config, "storage": self.storage})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """API 기본 URL (예: http://127.0.0.1:port)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
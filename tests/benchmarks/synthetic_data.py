@@ -0,0 +1,213 @@
+"""
+벤치마크용 합성 데이터 생성기
+
+에이전트 핫 패스 마이크로벤치마크(benchmark_hot_paths.py)가 사용하는 입력을 만듭니다.
+같은 인자와 시드로 만들면 항상 같은 데이터가 나오므로 기준값(baseline)과 비교할 수 있습니다.
+- LLM 응답 텍스트, SELECT 결과 행
+- DB 스키마 (테이블/컬럼/외래 키/샘플 데이터, 에이전트 schema_info 형식)
+- SWDP 스키마 (RPC API가 조회하는 users/projects/build_requests/tr_data 테이블)
+- API 스키마 (Jira Mock 라우터 api_endpoints 형식)
+- 그래프 상태 (LangGraph 노드 간 전달 상태)
+- 문서 디렉토리 (문서 관리 에이전트 컬렉션/마크다운 파일)
+"""
+
+import os
+import random
+from typing import Dict, Any, List, Tuple
+
+COLUMN_TYPES = ["INTEGER", "VARCHAR(255)", "TEXT", "TIMESTAMP", "BOOLEAN", "DECIMAL(10,2)"]
+STATUSES = ["pending", "running", "success", "failed"]
+
+
+def llm_response(blocks: int = 20, paragraph_lines: int = 30, seed: int = 0) -> str:
+    """
+    설명 문단과 SQL 코드 블록이 번갈아 나오는 LLM 응답 생성
+
+    Args:
+        blocks: SQL 코드 블록 수
+        paragraph_lines: 블록 사이 설명 줄 수
+        seed: 무작위 시드
+
+    Returns:
+        LLM 응답 텍스트
+    """
+    rng = random.Random(seed)
+    parts = []
+    for index in range(blocks):
+        parts.append("\n".join(f"{index}-{line}: 빌드 상태와 프로젝트 통계를 분석한 설명입니다. 값 {rng.randint(0, 9999)}"
+                               for line in range(paragraph_lines)))
+        parts.append(f"```sql\nSELECT id, status, created_at\nFROM build_requests\n"
+                     f"WHERE project_id = {rng.randint(1, 500)} AND status = '{rng.choice(STATUSES)}'\n"
+                     f"ORDER BY created_at DESC LIMIT {rng.randint(10, 100)};\n```")
+    parts.append("위 쿼리 결과를 기준으로 실패한 빌드가 많은 프로젝트를 확인하세요.")
+    return "\n\n".join(parts)
+
+
+def result_rows(count: int, columns: int = 8) -> List[Dict[str, Any]]:
+    """
+    정수/문자열/NULL/구분자 문자가 섞인 SELECT 결과 행 생성
+
+    Args:
+        count: 행 수
+        columns: 컬럼 수
+
+    Returns:
+        결과 행 목록
+    """
+    rows = []
+    for i in range(count):
+        row: Dict[str, Any] = {}
+        for c in range(columns):
+            if c % 3 == 0:
+                row[f"col_{c}"] = i * c
+            elif c % 3 == 1:
+                row[f"col_{c}"] = f"build-{i}-{c}"
+            else:
+                row[f"col_{c}"] = None if i % 7 == 0 else f"status|{i % 5}"
+        rows.append(row)
+    return rows
+
+
+def db_schema(tables: int = 500, columns: int = 12, rows: int = 0, seed: int = 0) -> Dict[str, Any]:
+    """
+    에이전트 schema_info 형식의 DB 스키마 생성
+
+    table_NNN 테이블은 id 기본 키를 가지며, 첫 테이블을 제외하면 이전 테이블을 가리키는
+    외래 키 컬럼(table_{NNN-1}_id)을 하나 가집니다. 외래 키 값은 이전 테이블의 id 범위에서 고릅니다.
+
+    Args:
+        tables: 테이블 수
+        columns: 테이블당 컬럼 수 (id, 외래 키 포함)
+        rows: 테이블당 샘플 데이터 행 수
+        seed: 무작위 시드
+
+    Returns:
+        {"tables": [{"name", "columns", "foreign_keys", "sample_data"}, ...]}
+    """
+    rng = random.Random(seed)
+    schema_tables = []
+    for t in range(tables):
+        name = f"table_{t:03d}"
+        parent = f"table_{t - 1:03d}" if t else None
+        table_columns = [{"name": "id", "type": "INTEGER", "primary_key": True, "nullable": False}]
+        if parent:
+            table_columns.append({"name": f"{parent}_id", "type": "INTEGER", "nullable": False})
+        for c in range(columns - len(table_columns)):
+            column = {"name": f"field_{c}", "type": COLUMN_TYPES[c % len(COLUMN_TYPES)], "nullable": c % 2 == 0}
+            if c % 4 == 3:
+                column["default"] = "NULL"
+            table_columns.append(column)
+
+        sample_data = []
+        for r in range(rows):
+            row: Dict[str, Any] = {"id": r + 1}
+            if parent:
+                row[f"{parent}_id"] = rng.randint(1, rows)
+            for column in table_columns[len(row):]:
+                row[column["name"]] = rng.randint(0, 1000) if column["type"] == "INTEGER" else f"v{t}-{r}"
+            sample_data.append(row)
+
+        schema_tables.append({
+            "name": name,
+            "columns": table_columns,
+            "foreign_keys": [{"column": f"{parent}_id", "referenced_table": parent, "referenced_column": "id"}]
+                            if parent else [],
+            "sample_data": sample_data
+        })
+    return {"tables": schema_tables}
+
+
+def swdp_schema(users: int = 2000, projects: int = 500, builds: int = 5000, trs: int = 5000,
+                seed: int = 0) -> Dict[str, Any]:
+    """
+    SWDP RPC API가 조회하는 테이블의 샘플 데이터 생성
+
+    Args:
+        users: 사용자 수 (single_id는 user0001 형식)
+        projects: 프로젝트 수
+        builds: 빌드 요청 수 (build_request_id는 BR-00001 형식)
+        trs: TR 수 (tr_code는 TR-00001 형식)
+        seed: 무작위 시드
+
+    Returns:
+        {"tables": [...]}
+    """
+    rng = random.Random(seed)
+    data = {
+        "users": [{"id": i, "single_id": f"user{i:04d}", "name": f"사용자{i}", "email": f"user{i}@example.com",
+                   "password_hash": f"hash{i}"} for i in range(1, users + 1)],
+        "projects": [{"id": i, "name": f"project-{i}", "status": rng.choice(STATUSES)} for i in range(1, projects + 1)],
+        "user_project_roles": [{"id": i + 1, "user_id": i % users + 1, "project_id": rng.randint(1, projects),
+                                "role": "developer" if i % 5 else "admin"} for i in range(users * 3)],
+        "build_requests": [{"id": i, "build_request_id": f"BR-{i:05d}", "project_id": rng.randint(1, projects),
+                            "status": rng.choice(STATUSES)} for i in range(1, builds + 1)],
+        "tr_data": [{"id": i, "tr_code": f"TR-{i:05d}", "project_id": rng.randint(1, projects),
+                     "status": rng.choice(STATUSES)} for i in range(1, trs + 1)]
+    }
+    return {"tables": [{"name": name, "columns": [{"name": column, "type": "TEXT"} for column in rows[0]],
+                        "sample_data": rows} for name, rows in data.items()]}
+
+
+def api_schema(endpoints: int = 300) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    """
+    고정 경로와 파라미터 경로가 섞인 api_endpoints 스키마와 요청 목록 생성
+
+    Args:
+        endpoints: 엔드포인트 수
+
+    Returns:
+        (스키마, 스키마 항목마다 하나씩 맞는 (메서드, 경로) 요청 목록)
+    """
+    entries, requests = [], []
+    for index in range(endpoints):
+        resource = f"/rest/api/2/resource{index}"
+        endpoint = [resource, resource + "/{key}", resource + "/{key}/comment"][index % 3]
+        method = "POST" if index % 4 == 0 else "GET"
+        entries.append({"endpoint": endpoint, "method": method, "response": {"index": index}})
+        requests.append((method, endpoint.replace("{key}", f"AI-{index}")))
+    return {"api_endpoints": entries}, requests
+
+
+def graph_state(agents: int = 6, content_chars: int = 20000, rows: int = 500) -> Dict[str, Any]:
+    """
+    에이전트 결과가 누적된 LangGraph 그래프 상태 생성
+
+    Args:
+        agents: 결과가 쌓인 에이전트 수
+        content_chars: 에이전트별 응답 본문 길이
+        rows: 에이전트별 결과 데이터 행 수
+
+    Returns:
+        GraphState 형식 딕셔너리
+    """
+    outputs, context = {}, {}
+    for index in range(agents):
+        agent_type = f"agent{index}"
+        content = ("결과 " * (content_chars // 3 + 1))[:content_chars]
+        outputs[agent_type] = {"content": content, "agent_id": f"{agent_type}-id",
+                               "metadata": {"data": result_rows(rows, 6), "sql": "SELECT 1"}}
+        context[agent_type] = content
+    return {"query": "빌드 실패 원인을 찾아 이슈를 만들어주세요", "context": context, "current_agent": "agent0",
+            "agent_outputs": outputs, "next_agent": "agent0", "final_output": None, "error": None}
+
+
+def document_tree(root: str, collections: int = 20, files_per_collection: int = 500) -> int:
+    """
+    문서 관리 에이전트 형식의 문서 디렉토리 생성 ({제목}_{문서 ID 끝 8자리}.md)
+
+    Args:
+        root: 문서 루트 디렉토리 (docs_dir)
+        collections: 컬렉션(하위 디렉토리) 수
+        files_per_collection: 컬렉션별 마크다운 파일 수
+
+    Returns:
+        생성한 파일 수
+    """
+    for c in range(collections):
+        collection_dir = os.path.join(root, f"collection{c:02d}")
+        os.makedirs(collection_dir, exist_ok=True)
+        for f in range(files_per_collection):
+            with open(os.path.join(collection_dir, f"Design_Note_{c}_{f}_{c * 100000 + f:08x}.md"), "w",
+                      encoding="utf-8") as handle:
+                handle.write(f"# Design Note {c}-{f}\n")
+    return collections * files_per_collection
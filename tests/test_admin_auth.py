@@ -0,0 +1,44 @@
+"""
+관리자 요청 인증 테스트
+
+admin 섹션의 토큰 확인, profiling.admin_token 호환, 토큰이 없을 때 로컬 요청만 허용하는지 검증합니다.
+"""
+
+import os
+import sys
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.admin_auth import AdminAuth, get_admin_config
+
+
+class AdminAuthTest(unittest.TestCase):
+    """AdminAuth 테스트"""
+
+    def test_local_only_without_token(self):
+        """토큰을 설정하지 않으면 로컬 요청만 허용하는지 확인"""
+        auth = AdminAuth()
+        self.assertTrue(auth.is_allowed("127.0.0.1"))
+        self.assertTrue(auth.is_allowed("::1"))
+        self.assertFalse(auth.is_allowed("10.0.0.5"))
+
+    def test_token_required(self):
+        """토큰을 설정하면 주소와 관계없이 토큰이 일치해야 하는지 확인"""
+        auth = AdminAuth()
+        auth.configure({"admin": {"token": "secret"}, "profiling": {"enabled": False}})
+        self.assertTrue(auth.is_allowed("10.0.0.5", "secret"))
+        self.assertFalse(auth.is_allowed("127.0.0.1", "wrong"))
+        self.assertFalse(auth.is_allowed("127.0.0.1"))
+        self.assertFalse(auth.is_allowed("127.0.0.1", "비밀"))
+
+    def test_profiling_token_fallback(self):
+        """admin.token이 없으면 profiling.admin_token을 사용하는지 확인"""
+        self.assertEqual(get_admin_config({"profiling": {"admin_token": "old"}})["token"], "old")
+        self.assertEqual(get_admin_config({"admin": {"token": "new"}, "profiling": {"admin_token": "old"}})["token"], "new")
+        self.assertEqual(get_admin_config(None)["token"], "")
+
+
+if __name__ == "__main__":
+    unittest.main()
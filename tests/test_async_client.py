@@ -0,0 +1,143 @@
+"""
+비동기 외부 연동 클라이언트 테스트
+
+스키마 기반 스텁 서버로 동시 호출, 재시도, 동시성 제한, 오류 응답 처리를 검증합니다.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.async_client import AsyncIntegrationClient, gather_calls, run_async
+from tests.benchmarks.stub_integration_server import StubIntegrationServer, StubIntegrationConfig
+
+JIRA_SCHEMA = {
+    "api_endpoints": [
+        {"endpoint": "/rest/api/2/issue/{issueKey}", "method": "GET",
+         "response": {"key": "AI-101", "fields": {"summary": "로그인 오류"}}},
+        {"endpoint": "/rest/api/2/issue/{issueKey}/comment", "method": "GET",
+         "response": {"total": 1, "comments": [{"body": "확인 중"}]}},
+        {"endpoint": "/rest/api/2/issue/*/transitions", "method": "GET",
+         "response": {"transitions": [{"id": "21", "name": "In Progress"}]}},
+        {"endpoint": "/rest/api/2/project", "method": "GET",
+         "response": [{"key": "AI"}, {"key": "SWDP"}]},
+        {"endpoint": "/rest/api/2/issue", "method": "POST",
+         "response": {"key": "AI-102"}}
+    ]
+}
+
+ISSUE_CALLS = {
+    "issue": {"endpoint": "/issue/AI-101"},
+    "comments": {"endpoint": "/issue/AI-101/comment"},
+    "transitions": {"endpoint": "/issue/AI-101/transitions"}
+}
+
+
+def _client(server, **kwargs):
+    """스텁 서버용 Jira 클라이언트 생성"""
+    kwargs.setdefault("backoff_base", 0.01)
+    return AsyncIntegrationClient("jira", server.url("jira") + "/rest/api/2", **kwargs)
+
+
+class AsyncIntegrationClientTest(unittest.TestCase):
+    """AsyncIntegrationClient 테스트"""
+
+    def test_fetch_many_runs_calls_concurrently(self):
+        config = StubIntegrationConfig(latency_ms=150)
+        with StubIntegrationServer(schemas={"jira": JIRA_SCHEMA}, config=config) as server:
+            client = _client(server)
+            start = time.perf_counter()
+            results = asyncio.run(client.fetch_many(ISSUE_CALLS))
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(results["issue"]["fields"]["summary"], "로그인 오류")
+        self.assertEqual(results["comments"]["total"], 1)
+        self.assertEqual(results["transitions"]["transitions"][0]["name"], "In Progress")
+        self.assertEqual(config.stats["max_in_flight"], 3)
+        self.assertLess(elapsed, 0.4)
+
+    def test_list_response_and_missing_endpoint(self):
+        with StubIntegrationServer(schemas={"jira": JIRA_SCHEMA}) as server:
+            client = _client(server)
+            projects = asyncio.run(client.get("/project"))
+            missing = asyncio.run(client.get("/unknown"))
+
+        self.assertEqual([p["key"] for p in projects["items"]], ["AI", "SWDP"])
+        self.assertEqual(missing["status_code"], 404)
+        self.assertIn("error", missing)
+        self.assertEqual(client.get_stats()["retries"], 0)
+
+    def test_retries_transient_errors(self):
+        config = StubIntegrationConfig(fail_first=2, retry_after=0)
+        with StubIntegrationServer(schemas={"jira": JIRA_SCHEMA}, config=config) as server:
+            client = _client(server, max_retries=3)
+            result = asyncio.run(client.get("/issue/AI-101"))
+
+        self.assertEqual(result["key"], "AI-101")
+        stats = client.get_stats()
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["attempts"], 3)
+        self.assertEqual(stats["errors"], 0)
+
+    def test_gives_up_after_max_retries(self):
+        config = StubIntegrationConfig(fail_first=10)
+        with StubIntegrationServer(schemas={"jira": JIRA_SCHEMA}, config=config) as server:
+            client = _client(server, max_retries=1)
+            result = asyncio.run(client.get("/issue/AI-101"))
+
+        self.assertEqual(result["status_code"], 503)
+        self.assertEqual(config.stats["requests"], 2)
+        self.assertEqual(client.get_stats()["errors"], 1)
+
+    def test_post_retried_only_when_requested(self):
+        config = StubIntegrationConfig(fail_first=1, retry_after=0)
+        with StubIntegrationServer(schemas={"jira": JIRA_SCHEMA}, config=config) as server:
+            client = _client(server, max_retries=3)
+            failed = asyncio.run(client.post("/issue", data={"fields": {}}))
+            self.assertEqual(failed["status_code"], 503)
+            self.assertEqual(config.stats["requests"], 1)
+
+            config.fail_first = 2
+            created = asyncio.run(client.post("/issue", data={"fields": {}}, retry=True))
+
+        self.assertEqual(created["key"], "AI-102")
+        self.assertEqual(config.stats["requests"], 3)
+        self.assertEqual(client.get_stats()["retries"], 1)
+
+    def test_concurrency_limit(self):
+        config = StubIntegrationConfig(latency_ms=30)
+        calls = {f"call-{i}": {"endpoint": "/issue/AI-101"} for i in range(8)}
+        with StubIntegrationServer(schemas={"jira": JIRA_SCHEMA}, config=config) as server:
+            client = _client(server, max_concurrency=2)
+            results = asyncio.run(client.fetch_many(calls))
+
+        self.assertTrue(all(r["key"] == "AI-101" for r in results.values()))
+        self.assertLessEqual(config.stats["max_in_flight"], 2)
+        self.assertEqual(client.get_stats()["max_in_flight"], 2)
+
+    def test_run_async_inside_running_loop(self):
+        with StubIntegrationServer(schemas={"jira": JIRA_SCHEMA}) as server:
+            client = _client(server)
+
+            def sync_agent_code():
+                async def call(endpoint, method, data, params):
+                    return await client.request(method, endpoint, data=data, params=params)
+                return run_async(gather_calls(call, ISSUE_CALLS), timeout=10)
+
+            async def handler():
+                # 비동기 핸들러에서 동기 에이전트 코드가 호출되는 상황
+                return sync_agent_code()
+
+            results = asyncio.run(handler())
+
+        self.assertEqual(set(results), {"issue", "comments", "transitions"})
+        self.assertNotIn("error", results["comments"])
+
+
+if __name__ == "__main__":
+    unittest.main()
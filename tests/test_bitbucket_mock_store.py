@@ -0,0 +1,140 @@
+"""
+Bitbucket 모크 데이터 저장소 테스트
+
+PR 상태 색인, 정렬된 브랜치 조회, 커밋 커서 페이지 조회, 시드/합성 데이터 구성을 검증합니다.
+"""
+
+import os
+import sys
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.bitbucket_mock_store import BitbucketMockStore, CommitLog, generate_synthetic_data
+
+
+def _pull_request(pull_request_id, state="OPEN"):
+    return {"id": pull_request_id, "title": f"PR {pull_request_id}", "state": state, "version": 1}
+
+
+class TestRepositoryStore(unittest.TestCase):
+    """저장소 색인 테스트"""
+
+    def setUp(self):
+        self.store = BitbucketMockStore()
+        self.store.add_project({"key": "TEST", "name": "Test"})
+        self.repository = self.store.add_repository("TEST", {"slug": "repo", "name": "Repo"})
+
+    def test_pull_request_state_index(self):
+        """상태 변경 시 상태 색인도 함께 갱신"""
+        for pull_request_id in (1, 2, 3):
+            self.repository.add_pull_request(_pull_request(pull_request_id))
+        self.repository.set_pull_request_state(2, "MERGED")
+
+        self.assertEqual([pr["id"] for pr in self.repository.list_pull_requests("OPEN")["values"]], [1, 3])
+        self.assertEqual([pr["id"] for pr in self.repository.list_pull_requests("MERGED")["values"]], [2])
+        self.assertEqual(self.repository.pull_request_count("ALL"), 3)
+        self.assertEqual(self.repository.get_pull_request(2)["state"], "MERGED")
+        self.assertIsNone(self.repository.set_pull_request_state(99, "MERGED"))
+        self.assertEqual(self.repository.next_pull_request_id(), 100)
+        with self.assertRaises(ValueError):
+            self.repository.add_pull_request(_pull_request(1))
+
+    def test_pull_request_pages(self):
+        """PR 오프셋 페이지"""
+        for pull_request_id in range(1, 8):
+            self.repository.add_pull_request(_pull_request(pull_request_id))
+        page = self.repository.list_pull_requests("OPEN", start=5, limit=5)
+        self.assertEqual([pr["id"] for pr in page["values"]], [6, 7])
+        self.assertTrue(page["isLastPage"])
+        self.assertEqual(self.repository.list_pull_requests("OPEN", limit=5)["nextPageStart"], 5)
+
+    def test_branches_sorted_with_prefix(self):
+        """기본 브랜치 먼저, 나머지는 이름순, 접두사 필터"""
+        for name in ("develop", "feature/b", "master", "bugfix/a", "feature/a"):
+            self.repository.add_branch(name, is_default=(name == "master"))
+
+        names = [branch["displayId"] for branch in self.repository.list_branches()["values"]]
+        self.assertEqual(names, ["master", "bugfix/a", "develop", "feature/a", "feature/b"])
+        names = [branch["displayId"] for branch in self.repository.list_branches("feature/")["values"]]
+        self.assertEqual(names, ["feature/a", "feature/b"])
+        self.assertTrue(self.repository.has_branch("develop"))
+        with self.assertRaises(ValueError):
+            self.repository.add_branch("develop")
+
+
+class TestCommitLog(unittest.TestCase):
+    """커밋 로그 커서 페이지 테스트"""
+
+    def setUp(self):
+        self.log = CommitLog()
+        for index in range(7):
+            self.log.append({"id": f"c{index}"})
+
+    def test_cursor_pages(self):
+        """최신순 페이지와 다음 커서"""
+        first = self.log.page(limit=3)
+        self.assertEqual([commit["id"] for commit in first["values"]], ["c6", "c5", "c4"])
+        self.assertEqual(first["nextCursor"], "c3")
+
+        second = self.log.page(first["nextCursor"], limit=3)
+        self.assertEqual([commit["id"] for commit in second["values"]], ["c3", "c2", "c1"])
+
+        last = self.log.page(second["nextCursor"], limit=3)
+        self.assertEqual([commit["id"] for commit in last["values"]], ["c0"])
+        self.assertTrue(last["isLastPage"])
+        self.assertIsNone(last["nextCursor"])
+        self.assertIn("error", self.log.page("unknown"))
+
+    def test_cursor_stable_after_append(self):
+        """새 커밋이 추가되어도 기존 커서 위치는 그대로"""
+        cursor = self.log.page(limit=3)["nextCursor"]
+        self.log.append({"id": "c7"})
+        self.assertEqual([commit["id"] for commit in self.log.page(cursor, limit=2)["values"]], ["c3", "c2"])
+
+    def test_iter_pages(self):
+        """페이지 순회와 최대 커밋 수 제한"""
+        pages = list(self.log.iter_pages(limit=3, max_commits=5))
+        self.assertEqual([[commit["id"] for commit in page] for page in pages], [["c6", "c5", "c4"], ["c3", "c2"]])
+        self.assertEqual(sum(len(page) for page in self.log.iter_pages(limit=2)), 7)
+
+
+class TestStoreConstruction(unittest.TestCase):
+    """시드/합성 데이터 구성 테스트"""
+
+    def test_from_seed(self):
+        """중첩 딕셔너리 시드 데이터 색인화 (커밋은 최신순 입력)"""
+        store = BitbucketMockStore.from_seed(
+            {"P": {"key": "P", "name": "P"}},
+            {"P": {"r": {"slug": "r", "name": "R"}}},
+            pull_requests={"P": {"r": [_pull_request(5)]}},
+            branches={"P": {"r": [{"displayId": "master", "isDefault": True}], "missing": []}},
+            commits={"P": {"r": [{"id": "new"}, {"id": "old"}]}},
+            files={"P": {"r": {"README.md": "hello"}}}
+        )
+        repository = store.get_repository("P", "r")
+        self.assertEqual(repository.get_pull_request(5)["title"], "PR 5")
+        self.assertEqual(repository.default_branch, "master")
+        self.assertEqual(repository.commits.latest()["id"], "new")
+        self.assertEqual(repository.files["README.md"], "hello")
+        self.assertIsNone(store.get_repository("P", "missing"))
+
+    def test_synthetic_data(self):
+        """합성 데이터 규모와 결정성"""
+        store = generate_synthetic_data(BitbucketMockStore(), project_count=3, repos_per_project=4,
+                                        branches_per_repo=5, pull_requests_per_repo=6, commits_per_repo=7, seed=1)
+        self.assertEqual(store.get_stats(), {"projects": 3, "repositories": 12, "branches": 60,
+                                             "pull_requests": 72, "commits": 84})
+        self.assertEqual(sorted(store.projects), ["SYNAAA", "SYNAAB", "SYNAAC"])
+
+        again = generate_synthetic_data(BitbucketMockStore(), project_count=3, repos_per_project=4,
+                                        branches_per_repo=5, pull_requests_per_repo=6, commits_per_repo=7, seed=1)
+        first = store.get_repository("SYNAAB", "service-0002")
+        second = again.get_repository("SYNAAB", "service-0002")
+        self.assertEqual(first.commits.page(limit=3), second.commits.page(limit=3))
+        self.assertEqual(first.list_branches()["total"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
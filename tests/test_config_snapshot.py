@@ -0,0 +1,194 @@
+"""
+설정 스냅샷 테스트
+
+플레이스홀더 치환과 타입 변환, APE_ 환경 변수 재정의, 스냅샷 불변성,
+다시 로드 시 원자적 교체와 실패 시 이전 스냅샷 유지, 파일 변경 감시를 검증합니다.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.config_snapshot import (
+    ConfigStore, ConfigSection, resolve_placeholders, parse_env_overrides, parse_env_value
+)
+
+
+class ConfigHelpersTest(unittest.TestCase):
+    """설정 변환 함수 테스트"""
+
+    def test_resolve_placeholders(self):
+        """전체 플레이스홀더는 타입 변환되고 부분 치환은 문자열로 남는지 확인"""
+        environ = {"PORT": "8080", "DEBUG": "true", "HOST": "10.0.0.1"}
+        settings = {"api": {"port": "${PORT}", "url": "http://${HOST}:${PORT}", "debug": "${DEBUG}"},
+                    "keys": ["${MISSING}", "${TIMEOUT:30}", 3]}
+        resolved = resolve_placeholders(settings, environ)
+        self.assertEqual(resolved["api"], {"port": 8080, "url": "http://10.0.0.1:8080", "debug": True})
+        self.assertEqual(resolved["keys"], ["", 30, 3])
+        self.assertEqual(settings["api"]["port"], "${PORT}")
+        # 플레이스홀더의 "1"/"0"은 부울, APE_ 재정의 값의 "1"/"0"은 정수
+        self.assertEqual(resolve_placeholders({"a": "${ON}", "b": "${OFF}"}, {"ON": "1", "OFF": "0"}),
+                         {"a": True, "b": False})
+        self.assertEqual(parse_env_value("1"), 1)
+
+    def test_parse_env_overrides(self):
+        """APE_ 접두사 환경 변수가 중첩 설정으로 변환되는지 확인"""
+        overrides = parse_env_overrides({"APE_API__PORT": "9000", "APE_DEBUG": "false",
+                                         "APE_MODELS__LIST": "[1, 2]", "OTHER": "x"})
+        self.assertEqual(overrides, {"api": {"port": 9000}, "debug": False, "models": {"list": [1, 2]}})
+        self.assertEqual(parse_env_value("1.5"), 1.5)
+        self.assertEqual(parse_env_value("text"), "text")
+
+
+class ConfigStoreTest(unittest.TestCase):
+    """ConfigStore 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.settings_path = os.path.join(self.temp_dir, "settings.json")
+        self.env_path = os.path.join(self.temp_dir, ".env")
+        self._write_settings({"api": {"port": "${API_PORT}"}, "llm": {"defaultModel": "a", "models": ["a", "b"]}})
+        self._write_env("API_PORT=8001\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_settings(self, settings):
+        with open(self.settings_path, "w", encoding="utf-8") as f:
+            json.dump(settings, f)
+
+    def _write_env(self, content: str):
+        with open(self.env_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def _store(self, environ=None) -> ConfigStore:
+        return ConfigStore(self.settings_path, self.env_path, environ={} if environ is None else environ)
+
+    def test_snapshot_is_immutable(self):
+        """스냅샷이 속성/키 접근을 지원하고 수정할 수 없는지 확인"""
+        snapshot = self._store().current()
+        self.assertEqual(snapshot["api"]["port"], 8001)
+        self.assertEqual(snapshot.api.port, 8001)
+        self.assertEqual(snapshot.api.host, "localhost")
+        self.assertEqual(snapshot.llm.models, ("a", "b"))
+        self.assertIsInstance(snapshot.llm, ConfigSection)
+        with self.assertRaises(TypeError):
+            snapshot["api"]["port"] = 1
+        with self.assertRaises(AttributeError):
+            snapshot.api = {}
+
+        copied = snapshot.to_dict()
+        copied["api"]["port"] = 1
+        self.assertEqual(snapshot.api.port, 8001)
+        self.assertEqual(copied["llm"]["models"], ["a", "b"])
+
+    def test_reload_swaps_snapshot(self):
+        """다시 로드하면 새 스냅샷으로 교체되고 이전 스냅샷은 그대로인지 확인"""
+        environ = {"APE_LLM__DEFAULTMODEL": "b"}
+        store = self._store(environ)
+        calls = []
+        store.add_listener(lambda snapshot, previous: calls.append((previous.api.port, snapshot.api.port)))
+
+        first = store.current()
+        self.assertIs(store.current(), first)
+        self.assertEqual(first.llm.defaultmodel, "b")
+
+        self._write_env("API_PORT=9001\n")
+        second = store.reload("test")
+        self.assertIs(store.current(), second)
+        self.assertEqual((first.api.port, second.api.port), (8001, 9001))
+        self.assertEqual(second.snapshot_info()["version"], 2)
+        self.assertEqual(second.snapshot_info()["reason"], "test")
+        self.assertEqual(calls, [(8001, 9001)])
+
+    def test_process_env_overrides_dotenv(self):
+        """프로세스 환경 변수가 .env보다 우선하되 load_dotenv가 넣은 값은 .env 변경을 따르는지 확인"""
+        environ = {"API_PORT": "8001"}
+        store = self._store(environ)
+        self.assertEqual(store.current().api.port, 8001)
+
+        self._write_env("API_PORT=8002\n")
+        self.assertEqual(store.reload().api.port, 8002)
+
+        environ["API_PORT"] = "7000"
+        self.assertEqual(store.reload().api.port, 7000)
+
+    def test_failed_reload_keeps_previous(self):
+        """잘못된 설정 파일로 다시 로드하면 이전 스냅샷을 유지하는지 확인"""
+        store = self._store()
+        first = store.current()
+        with open(self.settings_path, "w", encoding="utf-8") as f:
+            f.write("{broken")
+
+        self.assertIs(store.reload("broken"), first)
+        stats = store.get_stats()
+        self.assertEqual(stats["failed_reloads"], 1)
+        self.assertIsNotNone(stats["last_error"])
+        self.assertEqual(stats["snapshot"]["version"], 1)
+
+    def test_watcher_reloads_on_change(self):
+        """설정 파일이 바뀌면 감시 스레드가 다시 로드하는지 확인"""
+        store = self._store()
+        store.current()
+        store.start_watching(interval=0.05)
+        try:
+            time.sleep(0.1)
+            self._write_settings({"api": {"port": 8500}})
+            os.utime(self.settings_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+            deadline = time.time() + 5
+            while store.current().api.port != 8500 and time.time() < deadline:
+                time.sleep(0.05)
+            self.assertEqual(store.current().api.port, 8500)
+            self.assertEqual(store.current().snapshot_info()["reason"], "file_changed")
+            self.assertTrue(store.get_stats()["watching"])
+        finally:
+            store.stop_watching()
+        self.assertFalse(store.get_stats()["watching"])
+
+
+class ConfigEndpointTest(unittest.TestCase):
+    """/admin/config 엔드포인트 테스트"""
+
+    def setUp(self):
+        from src.core.admin_auth import admin_auth
+        admin_auth.configure({"admin": {"token": "secret"}})
+
+    def tearDown(self):
+        from src.core.admin_auth import admin_auth
+        admin_auth.configure()
+
+    def test_requires_admin(self):
+        """설정 조회/다시 로드는 관리자 토큰이 있어야 가능한지 확인"""
+        from fastapi.testclient import TestClient
+        from src.core.router import app
+
+        client = TestClient(app)
+        self.assertEqual(client.get("/admin/config").status_code, 403)
+        self.assertEqual(client.post("/admin/config/reload").status_code, 403)
+        self.assertEqual(client.get("/admin/config", headers={"X-Admin-Token": "secret"}).status_code, 200)
+
+    def test_admin_independent_of_profiling(self):
+        """프로파일링을 꺼도 관리자 API는 관리자 토큰으로 사용할 수 있는지 확인"""
+        from fastapi.testclient import TestClient
+        from src.core.router import app
+        from src.core.profiler import sampling_profiler
+
+        client = TestClient(app)
+        headers = {"X-Admin-Token": "secret"}
+        sampling_profiler.configure({"profiling": {"enabled": False}})
+        try:
+            self.assertEqual(client.get("/admin/config", headers=headers).status_code, 200)
+            self.assertEqual(client.get("/admin/profile?seconds=0.1", headers=headers).status_code, 403)
+        finally:
+            sampling_profiler.configure()
+
+
+if __name__ == "__main__":
+    unittest.main()
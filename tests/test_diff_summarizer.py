@@ -0,0 +1,151 @@
+"""
+대용량 diff/커밋 요약 모듈 테스트
+
+diff 청크 분할(토큰 예산, 파일 헤더 반복)과 map-reduce 요약(병렬 map, 계층 reduce, 오류, 조기 중단)을 검증합니다.
+"""
+
+import os
+import sys
+import time
+import threading
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.token_budget import estimate_tokens
+from src.core.diff_summarizer import iter_token_chunks, split_diff, MapReduceSummarizer
+from src.agents.bitbucket_mock_store import synthetic_diff
+
+
+class SplitDiffTest(unittest.TestCase):
+    """split_diff / iter_token_chunks 테스트"""
+
+    def test_chunks_respect_budget_and_keep_content(self):
+        """모든 청크가 예산 이하이고 변경 줄이 빠지지 않는지 확인"""
+        diff = synthetic_diff("AI/api#1", files=6, hunks_per_file=4, lines_per_hunk=20)
+        chunks = split_diff(diff, max_tokens=300)
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(estimate_tokens(chunk), 300)
+
+        changed = [line for line in diff.splitlines() if line.startswith(("+", "-")) and not line.startswith(("+++", "---"))]
+        joined = "".join(chunks)
+        for line in changed:
+            self.assertIn(line, joined)
+
+    def test_large_file_chunks_repeat_file_header(self):
+        """헝크 단위로 나뉜 파일의 청크마다 파일 헤더가 붙는지 확인"""
+        diff = synthetic_diff("AI/api#2", files=1, hunks_per_file=8, lines_per_hunk=20)
+        chunks = split_diff(diff, max_tokens=250)
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertTrue(chunk.startswith("diff --git "))
+
+    def test_small_diff_is_single_chunk(self):
+        """예산 안의 diff는 한 청크로 유지되는지 확인"""
+        diff = synthetic_diff("AI/api#3", files=2, hunks_per_file=1, lines_per_hunk=3)
+        self.assertEqual(split_diff(diff, max_tokens=3000), [diff])
+        self.assertEqual(split_diff("", max_tokens=3000), [])
+
+    def test_iter_token_chunks_streams_from_generator(self):
+        """제너레이터 입력에서도 청크가 차는 즉시 넘겨주는지 확인"""
+        consumed = []
+
+        def lines():
+            for i in range(100):
+                consumed.append(i)
+                yield f"- commit{i:03d} 변경 사항 설명\n"
+
+        chunks = iter_token_chunks(lines(), max_tokens=50)
+        first = next(chunks)
+        self.assertLess(len(consumed), 100)
+        self.assertLessEqual(estimate_tokens(first), 50)
+        self.assertEqual(sum(chunk.count("\n") for chunk in [first, *chunks]), 100)
+
+
+class MapReduceSummarizerTest(unittest.TestCase):
+    """MapReduceSummarizer 테스트"""
+
+    def test_parallel_map_and_final_summary(self):
+        """청크를 병렬 요약하고 청크 순서대로 최종 요약에 넘기는지 확인"""
+        active, peak = [0], [0]
+        lock = threading.Lock()
+        reduce_inputs = []
+
+        def summarize(text, stage):
+            if stage == "reduce":
+                reduce_inputs.append(text)
+                return "최종"
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return f"요약:{text}"
+
+        summarizer = MapReduceSummarizer(summarize, max_workers=4, reduce_tokens=3000)
+        events = list(summarizer.iter_summaries(f"c{i}" for i in range(8)))
+
+        partials = [event for event in events if event["type"] == "partial"]
+        self.assertEqual(len(partials), 8)
+        self.assertEqual(events[-1], {"type": "final", "summary": "최종", "chunks": 8, "failed": 0})
+        self.assertGreater(peak[0], 1)
+        self.assertEqual(reduce_inputs[0], "\n".join(f"요약:c{i}" for i in range(8)))
+
+    def test_failed_chunks_are_reported(self):
+        """실패한 청크는 오류 이벤트로 알리고 나머지로 최종 요약하는지 확인"""
+        def summarize(text, stage):
+            if text == "bad":
+                raise RuntimeError("LLM 오류")
+            if text == "empty":
+                return {"error": "응답 없음"}
+            return "최종" if stage == "reduce" else text
+
+        summarizer = MapReduceSummarizer(summarize, max_workers=2)
+        events = list(summarizer.iter_summaries(["a", "bad", "b", "empty"]))
+
+        errors = {event["index"]: event["error"] for event in events if event["type"] == "error"}
+        self.assertEqual(errors, {1: "LLM 오류", 3: "응답 없음"})
+        self.assertEqual(events[-1]["failed"], 2)
+        self.assertEqual(summarizer.get_stats()["failed"], 2)
+
+        all_failed = MapReduceSummarizer(lambda text, stage: {"error": "x"}).summarize_all(["a", "b"])
+        self.assertIn("error", all_failed)
+
+    def test_hierarchical_reduce(self):
+        """부분 요약이 예산을 넘으면 묶음별로 다시 요약하는지 확인"""
+        def summarize(text, stage):
+            return "r" * 40 if stage == "reduce" else "m" * 200
+
+        summarizer = MapReduceSummarizer(summarize, max_workers=4, reduce_tokens=150)
+        final = summarizer.summarize_all([str(i) for i in range(12)])
+
+        self.assertEqual(final["summary"], "r" * 40)
+        stats = summarizer.get_stats()
+        self.assertGreaterEqual(stats["reduce_levels"], 1)
+        self.assertGreater(stats["reduce_calls"], 1)
+
+    def test_early_stop_cancels_pending_chunks(self):
+        """순회를 중단하면 남은 청크를 요약하지 않는지 확인"""
+        calls = []
+
+        def summarize(text, stage):
+            calls.append(text)
+            time.sleep(0.02)
+            return text
+
+        summarizer = MapReduceSummarizer(summarize, max_workers=1)
+        events = summarizer.iter_summaries(str(i) for i in range(50))
+        next(event for event in events if event["type"] == "partial")
+        events.close()
+        time.sleep(0.1)
+
+        self.assertLess(len(calls), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
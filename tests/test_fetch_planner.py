@@ -0,0 +1,112 @@
+"""
+API 호출 실행 계획 테스트
+
+의존 순서, fan-out, 동시성 제한, 선행 단계 실패 전파, 계획 검증을 가짜 호출 함수로 검증합니다.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.fetch_planner import FetchPlan
+
+
+class _FakeJira:
+    """지연 시간을 흉내내는 가짜 Jira API 호출 함수"""
+
+    def __init__(self, latency: float = 0.05):
+        self.latency = latency
+        self.calls = []
+
+    async def __call__(self, endpoint, method, data, params):
+        self.calls.append((time.perf_counter(), endpoint))
+        await asyncio.sleep(self.latency)
+        if endpoint == "/issue/AI-101":
+            return {"key": "AI-101", "fields": {
+                "subtasks": [{"key": "AI-102"}, {"key": "AI-103"}],
+                "assignee": {"name": "hong"}
+            }}
+        if endpoint.startswith("/issue/") and endpoint.count("/") == 2:
+            return {"key": endpoint.split("/")[-1], "fields": {"summary": f"{endpoint} 요약"}}
+        if endpoint == "/broken":
+            return {"error": "API 오류: 500"}
+        return {"endpoint": endpoint, "params": params}
+
+
+class FetchPlanTest(unittest.TestCase):
+    """FetchPlan 테스트"""
+
+    def test_independent_steps_run_concurrently_and_dependents_fan_out(self):
+        fake = _FakeJira(latency=0.05)
+        plan = FetchPlan(max_concurrency=8)
+        plan.add("issue", "/issue/AI-101")
+        plan.add("comments", "/issue/AI-101/comment")
+        plan.add("related", depends_on=["issue"], build=lambda done: {
+            subtask["key"]: {"endpoint": f"/issue/{subtask['key']}"}
+            for subtask in done["issue"]["fields"]["subtasks"]
+        })
+        plan.add("assignee", depends_on=["issue"], build=lambda done: {
+            "endpoint": "/user", "params": {"username": done["issue"]["fields"]["assignee"]["name"]}
+        })
+
+        start = time.perf_counter()
+        results = asyncio.run(plan.execute(fake))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(set(results["related"]), {"AI-102", "AI-103"})
+        self.assertEqual(results["related"]["AI-103"]["key"], "AI-103")
+        self.assertEqual(results["assignee"]["params"], {"username": "hong"})
+        self.assertEqual(results["comments"]["endpoint"], "/issue/AI-101/comment")
+        # 두 단계 깊이 -> 약 2 * latency
+        self.assertLess(elapsed, 0.18)
+        self.assertEqual(plan.get_stats()["calls"], 5)
+
+    def test_concurrency_cap(self):
+        fake = _FakeJira(latency=0.02)
+        plan = FetchPlan(max_concurrency=3)
+        for i in range(10):
+            plan.add(f"issue-{i}", f"/issue/AI-{i}")
+
+        results = asyncio.run(plan.execute(fake))
+
+        self.assertEqual(len(results), 10)
+        self.assertEqual(plan.get_stats()["max_in_flight"], 3)
+
+    def test_failed_dependency_and_skipped_build(self):
+        fake = _FakeJira(latency=0)
+        plan = FetchPlan()
+        plan.add("broken", "/broken")
+        plan.add("after_broken", depends_on=["broken"], build=lambda done: {"endpoint": "/never"})
+        plan.add("issue", "/issue/AI-9")
+        plan.add("optional", depends_on=["issue"], build=lambda done: None)
+
+        results = asyncio.run(plan.execute(fake))
+
+        self.assertIn("선행 단계 실패", results["after_broken"]["error"])
+        self.assertEqual(results["optional"], {})
+        self.assertNotIn("/never", [endpoint for _, endpoint in fake.calls])
+        stats = plan.get_stats()
+        self.assertEqual((stats["failed"], stats["skipped"]), (1, 1))
+
+    def test_invalid_plans(self):
+        plan = FetchPlan()
+        plan.add("a", depends_on=["b"], build=lambda done: None)
+        plan.add("b", depends_on=["a"], build=lambda done: None)
+        with self.assertRaises(ValueError):
+            asyncio.run(plan.execute(_FakeJira()))
+
+        plan = FetchPlan().add("a", depends_on=["missing"], build=lambda done: None)
+        with self.assertRaises(ValueError):
+            asyncio.run(plan.execute(_FakeJira()))
+
+        with self.assertRaises(ValueError):
+            FetchPlan().add("a", "/x").add("a", "/y")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+핫 패스 마이크로벤치마크 테스트
+
+합성 데이터 생성기의 재현성/형식과 기준값 비교(회귀 판정), 기준값 저장을 검증합니다.
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.mock_router import MockEndpointRouter
+from tests.benchmarks import synthetic_data
+from tests.benchmarks.benchmark_hot_paths import (
+    compare, run_case, load_baseline, save_baseline, calibrate, GATE_FAILURES
+)
+
+
+class SyntheticDataTest(unittest.TestCase):
+    """합성 데이터 생성기 테스트"""
+
+    def test_db_schema(self):
+        """같은 시드로 같은 스키마가 만들어지고, 외래 키 값이 참조 테이블 id 범위 안인지 확인"""
+        schema = synthetic_data.db_schema(tables=3, columns=5, rows=20, seed=1)
+        self.assertEqual(schema, synthetic_data.db_schema(tables=3, columns=5, rows=20, seed=1))
+
+        child = schema["tables"][2]
+        self.assertEqual(len(child["columns"]), 5)
+        self.assertEqual(child["foreign_keys"], [{"column": "table_001_id", "referenced_table": "table_001",
+                                                  "referenced_column": "id"}])
+        self.assertTrue(all(1 <= row["table_001_id"] <= 20 for row in child["sample_data"]))
+        self.assertEqual(schema["tables"][0]["foreign_keys"], [])
+
+    def test_api_schema_requests_match(self):
+        """생성한 요청마다 해당 스키마 항목의 응답이 매칭되는지 확인"""
+        schema, requests = synthetic_data.api_schema(30)
+        router = MockEndpointRouter.from_schema(schema)
+        self.assertEqual([router.find_response(method, path)["index"] for method, path in requests], list(range(30)))
+
+    def test_document_tree(self):
+        """컬렉션별 문서 파일 생성 확인"""
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(synthetic_data.document_tree(directory, collections=2, files_per_collection=3), 6)
+            self.assertEqual(sorted(os.listdir(directory)), ["collection00", "collection01"])
+            self.assertTrue(all(name.endswith(".md") for name in os.listdir(os.path.join(directory, "collection01"))))
+
+
+class BaselineTest(unittest.TestCase):
+    """기준값 비교 및 저장 테스트"""
+
+    def test_compare(self):
+        """기준값 대비 비율에 따른 ok/regression 판정과 기준값 없음/데이터 크기 변경 표시 확인"""
+        result = {"params": {"rows": 100}, "min_ms": 12.0}
+        baseline = {"params": {"rows": 100}, "min_ms": 10.0}
+
+        self.assertEqual(compare(result, baseline, 0.25), {"status": "ok", "baseline_ms": 10.0, "ratio": 1.2})
+        self.assertEqual(compare(result, baseline, 0.1)["status"], "regression")
+        self.assertEqual(compare(result, None, 0.25)["status"], "new")
+        self.assertEqual(compare(result, {"params": {"rows": 10}, "min_ms": 1.0}, 0.25)["status"], "params_changed")
+        # 데이터 크기가 바뀌면 비교할 수 없으므로 실패, 기준값이 아직 없는 항목은 통과
+        self.assertIn("params_changed", GATE_FAILURES)
+        self.assertNotIn("new", GATE_FAILURES)
+
+    def test_compare_with_calibration(self):
+        """보정 루프 시간 비율로 기준값을 환산해 비교하는지 확인"""
+        result = {"params": {"rows": 100}, "min_ms": 24.0}
+        baseline = {"params": {"rows": 100}, "min_ms": 10.0, "calibration_ms": 5.0}
+
+        # 현재 머신이 두 배 느리면 기준값도 두 배로 환산
+        self.assertEqual(compare(result, baseline, 0.25, calibration_ms=10.0),
+                         {"status": "ok", "baseline_ms": 20.0, "ratio": 1.2})
+        self.assertEqual(compare(result, baseline, 0.25)["status"], "regression")
+        self.assertEqual(compare(result, {"params": {"rows": 100}, "min_ms": 20.0}, 0.25, 99.0)["ratio"], 1.2)
+
+    def test_run_and_save_baseline(self):
+        """측정한 항목만 기준값에 반영되고 측정하지 못한 항목의 기존 기준값은 유지되는지 확인"""
+        args = argparse.Namespace(blocks=2, rounds=2, min_round_time=0.001)
+        result = run_case("sql_extract", args)
+        self.assertEqual(result["params"], {"blocks": 2})
+        self.assertGreater(result["min_ms"], 0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baselines", "hot_paths.json")
+            self.assertEqual(load_baseline(path), {"cases": {}})
+
+            existing = {"cases": {"schema_info": {"params": {"tables": 500}, "min_ms": 5.0, "median_ms": 6.0}}}
+            calibration_ms = calibrate(rounds=2, min_round_time=0.001)
+            save_baseline(path, existing, [result, {"case": "list_documents", "status": "skipped", "error": "x"}],
+                          calibration_ms)
+            cases = load_baseline(path)["cases"]
+
+        self.assertGreater(calibration_ms, 0)
+        self.assertEqual(sorted(cases), ["schema_info", "sql_extract"])
+        self.assertEqual(cases["sql_extract"]["min_ms"], result["min_ms"])
+        self.assertEqual(cases["sql_extract"]["calibration_ms"], calibration_ms)
+        self.assertEqual(cases["schema_info"]["min_ms"], 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+자연어 → JQL 캐시 테스트
+
+쿼리 정규화, 날짜 표현 파라미터화, JQL 검증, LRU 제거, 통계, 파일 영속화를 검증합니다.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.jql_cache import JQLCache, normalize_query, validate_jql, is_cacheable
+
+# 2024-05-15 (수요일)
+WEDNESDAY = date(2024, 5, 15)
+NEXT_WEEK = date(2024, 5, 22)
+
+
+class NormalizeQueryTest(unittest.TestCase):
+    """normalize_query 테스트"""
+
+    def test_whitespace_casing_and_punctuation(self):
+        first, _ = normalize_query("  AI 프로젝트의   Open 버그 목록?  ")
+        second, _ = normalize_query("ai 프로젝트의 open 버그 목록")
+        self.assertEqual(first, second)
+
+    def test_date_phrases_become_tokens_and_parameters(self):
+        key, params = normalize_query("이번 주에 생성된 버그", WEDNESDAY)
+        self.assertEqual(key, "<this_week>에 생성된 버그")
+        self.assertEqual(params, {"this_week_start": "2024-05-13", "this_week_end": "2024-05-20"})
+
+        key, params = normalize_query("Bugs created LAST MONTH", WEDNESDAY)
+        self.assertEqual(key, "bugs created <last_month>")
+        self.assertEqual(params["last_month_start"], "2024-04-01")
+
+    def test_validate_jql(self):
+        self.assertTrue(validate_jql('project = AI AND status != Done ORDER BY priority DESC'))
+        self.assertTrue(validate_jql('project in (AI, SWDP)'))
+        self.assertFalse(validate_jql('project = "AI'))
+        self.assertFalse(validate_jql('project in (AI, SWDP'))
+        self.assertFalse(validate_jql('죄송합니다. JQL을 만들 수 없습니다'))
+
+
+class JQLCacheTest(unittest.TestCase):
+    """JQLCache 테스트"""
+
+    def test_hit_after_store_with_normalized_query(self):
+        cache = JQLCache(path=None)
+        self.assertIsNone(cache.lookup("AI 프로젝트 열린 버그"))
+        self.assertTrue(cache.store("AI 프로젝트 열린 버그", 'project = AI AND type = Bug AND status != Done'))
+
+        self.assertEqual(cache.lookup("ai  프로젝트 열린 버그!"), 'project = AI AND type = Bug AND status != Done')
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_relative_dates_are_resolved_at_lookup_time(self):
+        cache = JQLCache(path=None)
+        cache.store("이번 주 생성된 이슈", 'created >= "2024-05-13" AND created < "2024-05-20"', today=WEDNESDAY)
+
+        self.assertEqual(cache.lookup("이번주 생성된 이슈", today=NEXT_WEEK),
+                         'created >= "2024-05-20" AND created < "2024-05-27"')
+
+    def test_rejects_invalid_or_unparameterized_dates(self):
+        cache = JQLCache(path=None)
+        self.assertFalse(cache.store("어제 버그", 'project = "AI'))
+        # "어제" 질문인데 어제 날짜가 아닌 고정 날짜가 들어 있음
+        self.assertFalse(cache.store("어제 버그", 'created >= "2024-01-01"', today=WEDNESDAY))
+        # 상대 날짜 함수는 그대로 저장 가능
+        self.assertTrue(cache.store("어제 버그", 'created >= startOfDay(-1)', today=WEDNESDAY))
+        self.assertEqual(cache.get_stats()["rejected"], 2)
+
+    def test_relative_time_queries_are_not_cached(self):
+        """파라미터화할 수 없는 상대 시간 표현이 있는 쿼리는 저장/조회하지 않는지 확인"""
+        cache = JQLCache(path=None)
+        for query in ["지난 3일 동안 생성된 버그", "최근 업데이트된 이슈", "2일 전 생성된 이슈", "이번 스프린트 이슈",
+                      "다음 주 마감 이슈", "Issues created in the last 7 days", "bugs in this sprint"]:
+            self.assertFalse(is_cacheable(normalize_query(query, WEDNESDAY)[0]), query)
+            self.assertFalse(cache.store(query, 'created >= -3d', today=WEDNESDAY), query)
+            self.assertIsNone(cache.lookup(query, today=WEDNESDAY), query)
+
+        self.assertTrue(is_cacheable(normalize_query("지난주 생성된 버그", WEDNESDAY)[0]))
+        self.assertEqual(cache.get_stats()["entries"], 0)
+
+    def test_lru_eviction(self):
+        cache = JQLCache(max_entries=2, path=None)
+        cache.store("질문 1", "project = A")
+        cache.store("질문 2", "project = B")
+        cache.lookup("질문 1")
+        cache.store("질문 3", "project = C")
+
+        self.assertIsNone(cache.lookup("질문 2"))
+        self.assertEqual(cache.lookup("질문 1"), "project = A")
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+        self.assertEqual([entry["key"] for entry in cache.list_entries()], ["질문 1", "질문 3"])
+
+    def test_invalidate_and_purge(self):
+        cache = JQLCache(path=None)
+        cache.store("질문 1", "project = A")
+        cache.store("질문 2", "project = B")
+
+        self.assertTrue(cache.invalidate("질문 1"))
+        self.assertEqual(cache.purge("없는 키"), 0)
+        self.assertEqual(cache.purge(), 1)
+        self.assertEqual(cache.get_stats()["entries"], 0)
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache", "jql_cache.json")
+            JQLCache(path=path).store("AI 열린 이슈", "project = AI AND status = Open")
+
+            reloaded = JQLCache(path=path)
+            self.assertEqual(reloaded.lookup("AI 열린 이슈"), "project = AI AND status = Open")
+
+
+
+class JQLCacheEndpointTest(unittest.TestCase):
+    """/admin/jql-cache 엔드포인트 테스트"""
+
+    def setUp(self):
+        from src.core.admin_auth import admin_auth
+        admin_auth.configure({"admin": {"token": "secret"}})
+
+    def tearDown(self):
+        from src.core.admin_auth import admin_auth
+        admin_auth.configure()
+
+    def test_requires_admin(self):
+        """캐시 조회/삭제는 관리자 토큰이 있어야 가능한지 확인"""
+        from fastapi.testclient import TestClient
+        from src.core.router import app
+
+        client = TestClient(app)
+        headers = {"X-Admin-Token": "secret"}
+        self.assertEqual(client.get("/admin/jql-cache").status_code, 403)
+        self.assertEqual(client.delete("/admin/jql-cache", params={"key": "없는 키"}).status_code, 403)
+        self.assertEqual(client.get("/admin/jql-cache", headers=headers).status_code, 200)
+        self.assertEqual(client.delete("/admin/jql-cache", params={"key": "없는 키"}, headers=headers).status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+LLM 마이크로 배처 테스트
+
+요청 수집, 배치 전송, 응답 역다중화 및 오류 전파를 검증합니다.
+"""
+
+import os
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.llm_batcher import MicroBatcher, BatcherClosedError
+
+
+class MicroBatcherTest(unittest.TestCase):
+    """마이크로 배처 테스트 케이스"""
+
+    def setUp(self):
+        """배치 기록 초기화"""
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def _echo(self, payloads):
+        """요청을 그대로 되돌려주는 배치 전송 함수"""
+        with self.lock:
+            self.batches.append(list(payloads))
+        return [{"echo": p} for p in payloads]
+
+    def test_demultiplex_in_order(self):
+        """동시 요청이 배치로 묶이고 각자의 응답을 받는지 테스트"""
+        batcher = MicroBatcher(self._echo, max_batch_size=4, max_wait_ms=50)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(lambda i: batcher.submit(i, timeout=5), range(8)))
+        finally:
+            batcher.close()
+
+        self.assertEqual(results, [{"echo": i} for i in range(8)])
+        self.assertTrue(all(len(batch) <= 4 for batch in self.batches))
+        self.assertLess(len(self.batches), 8)
+
+        stats = batcher.get_stats()
+        self.assertEqual(stats["requests"], 8)
+        self.assertEqual(stats["batches"], len(self.batches))
+
+    def test_single_request_flushes_after_wait(self):
+        """단일 요청도 대기 시간 후 전송되는지 테스트"""
+        batcher = MicroBatcher(self._echo, max_batch_size=8, max_wait_ms=1)
+        try:
+            self.assertEqual(batcher.submit("a", timeout=5), {"echo": "a"})
+        finally:
+            batcher.close()
+        self.assertEqual(self.batches, [["a"]])
+
+    def test_error_propagates_to_all_requests(self):
+        """배치 전송 오류가 해당 배치의 모든 요청에 전달되는지 테스트"""
+        def fail(payloads):
+            raise ConnectionError("배치 서버 연결 실패")
+
+        batcher = MicroBatcher(fail, max_batch_size=2, max_wait_ms=20)
+        try:
+            futures = [batcher.submit_async(i) for i in range(2)]
+            for future in futures:
+                with self.assertRaises(ConnectionError):
+                    future.result(timeout=5)
+        finally:
+            batcher.close()
+        self.assertEqual(batcher.get_stats()["errors"], 1)
+
+    def test_response_count_mismatch(self):
+        """응답 수가 요청 수와 다르면 오류 처리되는지 테스트"""
+        batcher = MicroBatcher(lambda payloads: [], max_batch_size=1, max_wait_ms=0)
+        try:
+            with self.assertRaises(ValueError):
+                batcher.submit("a", timeout=5)
+        finally:
+            batcher.close()
+
+    def test_timed_out_request_is_not_sent(self):
+        """응답 대기 시간이 지난 요청은 취소되어 배치로 전송되지 않는지 테스트"""
+        release = threading.Event()
+
+        def slow(payloads):
+            release.wait(5)
+            return self._echo(payloads)
+
+        batcher = MicroBatcher(slow, max_batch_size=1, max_wait_ms=0, max_inflight=1)
+        try:
+            first = batcher.submit_async("a")
+            with self.assertRaises(FutureTimeoutError):
+                batcher.submit("b", timeout=0.05)
+            release.set()
+            self.assertEqual(first.result(timeout=5), {"echo": "a"})
+        finally:
+            batcher.close()
+        self.assertEqual(self.batches, [["a"]])
+        self.assertEqual(batcher.get_stats()["cancelled"], 1)
+
+    def test_submit_after_close(self):
+        """종료된 배처에 요청하면 오류가 발생하는지 테스트"""
+        batcher = MicroBatcher(self._echo)
+        batcher.close()
+        with self.assertRaises(BatcherClosedError):
+            batcher.submit("a")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Prometheus 형식 메트릭 테스트
+
+스트라이프 카운터/히스토그램 집계, 텍스트 출력 형식, 수집 함수 병합,
+DB 엔진 계측, HTTP 미들웨어 기록을 검증합니다.
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.metrics import MetricsRegistry, MetricFamily, Histogram, cache_families, instrument_engine, metrics
+from src.core.requests_config import HTTPSessionRegistry, http_pool_families
+from tests.benchmarks.stub_llm_server import StubLLMServer, StubLLMConfig
+
+
+class StripedMetricsTest(unittest.TestCase):
+    """스트라이프 메트릭 테스트"""
+
+    def test_concurrent_updates_are_not_lost(self):
+        """여러 스레드가 동시에 기록해도 합계가 맞는지 확인"""
+        registry = MetricsRegistry()
+        counter = registry.counter("test_total", "테스트", ["kind"])
+        histogram = registry.histogram("test_seconds", "테스트", ["kind"], buckets=[0.1, 1.0])
+
+        def work():
+            for index in range(1000):
+                counter.inc("a")
+                histogram.observe(0.05 if index % 2 else 0.5, "a")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(counter.collect(), {("a",): 8000.0})
+        cumulative, total, count = histogram.collect()[("a",)]
+        self.assertEqual(cumulative, [4000, 8000, 8000])
+        self.assertEqual(count, 8000)
+        self.assertAlmostEqual(total, 4000 * 0.55)
+
+    def test_render_text_format(self):
+        """히스토그램 누적 버킷, 합계, 개수와 레이블 이스케이프 출력 확인"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("req_seconds", "요청 시간", ["route"], buckets=[0.5, 1])
+        histogram.observe(0.2, '/a"b')
+        histogram.observe(2, '/a"b')
+        gauge = registry.gauge("in_flight", "처리 중")
+        with gauge.track():
+            text = registry.render()
+
+        self.assertIn("# TYPE req_seconds histogram", text)
+        self.assertIn('req_seconds_bucket{route="/a\\"b",le="0.5"} 1', text)
+        self.assertIn('req_seconds_bucket{route="/a\\"b",le="1"} 1', text)
+        self.assertIn('req_seconds_bucket{route="/a\\"b",le="+Inf"} 2', text)
+        self.assertIn('req_seconds_count{route="/a\\"b"} 2', text)
+        self.assertIn("in_flight 1", text)
+        self.assertEqual(gauge.collect(), {(): 0.0})
+        self.assertIs(registry.histogram("req_seconds", "요청 시간", ["route"]), histogram)
+        with self.assertRaises(ValueError):
+            histogram.observe(1.0)
+
+    def test_collectors_are_merged_by_name(self):
+        """같은 이름을 내는 수집 함수는 한 메트릭으로 합치고 실패한 수집 함수는 건너뛰는지 확인"""
+        registry = MetricsRegistry()
+        registry.add_collector("a", lambda: cache_families("a", 3, 1))
+        registry.add_collector("b", lambda: cache_families("b", 0, 0))
+        registry.add_collector("broken", lambda: 1 / 0)
+        registry.add_collector("queue", lambda: [MetricFamily("depth", "gauge", "깊이", [({"queue": "q"}, 2)])])
+
+        text = registry.render()
+        self.assertEqual(text.count("# TYPE ape_cache_hit_ratio gauge"), 1)
+        self.assertIn('ape_cache_hit_ratio{cache="a"} 0.75', text)
+        self.assertIn('ape_cache_hit_ratio{cache="b"} 0', text)
+        self.assertIn('depth{queue="q"} 2', text)
+
+
+class InstrumentationTest(unittest.TestCase):
+    """계측 지점 테스트"""
+
+    def test_instrument_engine(self):
+        """DB 쿼리 시간/오류와 연결 풀 상태가 기록되는지 확인"""
+        from sqlalchemy import create_engine, text
+        from sqlalchemy.pool import QueuePool
+
+        engine = instrument_engine(create_engine("sqlite://", poolclass=QueuePool), "test-db")
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with self.assertRaises(Exception):
+                conn.execute(text("SELECT * FROM missing_table"))
+
+        from src.core.metrics import db_query_seconds, db_query_errors
+        self.assertGreaterEqual(db_query_seconds.collect()[("test-db",)][2], 2)
+        self.assertGreaterEqual(db_query_errors.collect()[("test-db",)], 1)
+        self.assertIn('ape_db_pool_connections{engine="test-db",state="checkedout"} 0', metrics.render())
+
+    def test_http_pool_usage(self):
+        """요청이 끝난 연결은 사용 중에서 빠지고 풀 사용률이 0인지 확인"""
+        with StubLLMServer(config=StubLLMConfig(call_latency_ms=0)) as server:
+            registry = HTTPSessionRegistry(pool_maxsize=4)
+            response = registry.request("POST", server.endpoint, pool="model:a", json={"messages": []})
+            self.assertEqual(response.status_code, 200)
+
+            usage = registry.get_pool_usage()
+            self.assertEqual([(item["pool"], item["in_use"], item["maxsize"]) for item in usage], [("model:a", 0, 4)])
+            families = {family.name: family for family in http_pool_families(registry, "test")}
+            labels, value = families["ape_http_pool_utilization"].samples[0]
+            self.assertEqual((labels["pool"], value), ("model:a", 0.0))
+
+    def test_http_middleware_uses_route_template(self):
+        """HTTP 미들웨어가 라우트 템플릿 기준으로 처리 시간을 기록하는지 확인"""
+        from fastapi.testclient import TestClient
+        from src.core.router import app
+
+        # 시작 이벤트(워밍업)는 실행하지 않음
+        client = TestClient(app)
+        client.get("/live")
+        client.get("/no-such-path")
+        response = client.get("/metrics")
+
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertIn('ape_http_request_duration_seconds_count{method="GET",route="/live",status="200"}', response.text)
+        self.assertIn('route="unmatched",status="404"', response.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Mock API 엔드포인트 라우터 테스트
+
+고정 경로, 경로 파라미터 캡처, 와일드카드, 메서드 구분, 우선순위, path_params 변형 선택을 검증합니다.
+"""
+
+import os
+import sys
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.mock_router import MockEndpointRouter
+
+SCHEMA = {
+    "api_endpoints": [
+        {"endpoint": "/search", "method": "GET", "response": {"issues": []}},
+        {"endpoint": "/issue", "method": "POST", "response": {"key": "AI-200"}},
+        {"endpoint": "/issue/{issueKey}", "method": "GET", "path_params": {"issueKey": "AI-101"},
+         "response": {"key": "AI-101"}},
+        {"endpoint": "/issue/{issueKey}", "method": "GET", "path_params": {"issueKey": "AI-102"},
+         "response": {"key": "AI-102"}},
+        {"endpoint": "/issue/{issueKey}/comment", "method": "GET", "response": {"comments": []}},
+        {"endpoint": "/project/*/versions", "method": "GET", "response": {"versions": []}},
+        {"endpoint": "/attachment/*", "method": "GET", "response": {"content": "file"}},
+        {"endpoint": "/user/{name}", "method": "GET", "response": {"first": True}},
+        {"endpoint": "/user/*", "method": "GET", "response": {"first": False}}
+    ]
+}
+
+
+class TestMockEndpointRouter(unittest.TestCase):
+    """MockEndpointRouter 테스트"""
+
+    def setUp(self):
+        self.router = MockEndpointRouter.from_schema(SCHEMA)
+
+    def test_static_lookup(self):
+        """고정 경로 조회 및 쿼리 문자열/끝 슬래시 무시"""
+        self.assertEqual(self.router.find_response("GET", "/search"), {"issues": []})
+        self.assertEqual(self.router.find_response("get", "/search/?jql=project%3DAI"), {"issues": []})
+        self.assertEqual(self.router.size, len(SCHEMA["api_endpoints"]))
+
+    def test_path_param_capture(self):
+        """경로 파라미터 캡처"""
+        entry, params = self.router.match("GET", "/issue/AI-7/comment")
+        self.assertEqual(entry["response"], {"comments": []})
+        self.assertEqual(params, {"issueKey": "AI-7"})
+
+    def test_path_params_variant(self):
+        """같은 패턴의 항목 중 path_params가 일치하는 항목 선택 (없으면 첫 항목)"""
+        self.assertEqual(self.router.find_response("GET", "/issue/AI-102"), {"key": "AI-102"})
+        self.assertEqual(self.router.find_response("GET", "/issue/AI-101"), {"key": "AI-101"})
+        self.assertEqual(self.router.find_response("GET", "/issue/AI-999"), {"key": "AI-101"})
+
+    def test_wildcards(self):
+        """중간 *는 한 세그먼트, 끝 *는 나머지 경로 전체"""
+        self.assertEqual(self.router.find_response("GET", "/project/AI/versions"), {"versions": []})
+        self.assertIsNone(self.router.find_response("GET", "/project/AI/x/versions"))
+        self.assertEqual(self.router.find_response("GET", "/attachment/10/file.txt"), {"content": "file"})
+
+    def test_method_and_missing(self):
+        """메서드가 다르거나 경로가 없으면 None"""
+        self.assertEqual(self.router.find_response("POST", "/issue"), {"key": "AI-200"})
+        self.assertIsNone(self.router.find_response("GET", "/issue"))
+        self.assertIsNone(self.router.find_response("DELETE", "/issue/AI-101"))
+        self.assertIsNone(self.router.find_response("GET", "/unknown"))
+        self.assertIsNone(MockEndpointRouter.from_schema(None).match("GET", "/search"))
+
+    def test_first_entry_wins(self):
+        """여러 패턴이 맞으면 스키마에 먼저 나온 항목 우선"""
+        self.assertEqual(self.router.find_response("GET", "/user/kim"), {"first": True})
+
+    def test_response_is_copied(self):
+        """반환된 응답을 수정해도 스키마와 다음 요청의 응답은 그대로인지 확인"""
+        response = self.router.find_response("GET", "/issue/AI-101")
+        response["key"] = "AI-999"
+        self.router.find_response("GET", "/search")["issues"].append({"key": "AI-1"})
+
+        self.assertEqual(self.router.find_response("GET", "/issue/AI-101"), {"key": "AI-101"})
+        self.assertEqual(self.router.find_response("GET", "/search"), {"issues": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
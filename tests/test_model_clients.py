@@ -0,0 +1,191 @@
+"""
+모델 클라이언트 레지스트리 테스트
+
+모델별 불변 클라이언트 생성과 교체, 모델별 연결 풀 분리,
+요청 모델 컨텍스트(use_model, bind_model)가 스트리밍과 작업 스레드까지 전달되는지 검증합니다.
+"""
+
+import os
+import sys
+import threading
+import contextvars
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.requests_config import HTTPSessionRegistry
+from src.core.diff_summarizer import MapReduceSummarizer
+from src.core.model_clients import (
+    ModelClientRegistry, make_model_client, use_model, bind_model, get_requested_model, model_session_registry
+)
+from tests.benchmarks.stub_llm_server import StubLLMServer, StubLLMConfig
+
+
+class ModelClientRegistryTest(unittest.TestCase):
+    """ModelClientRegistry 테스트"""
+
+    def test_make_model_client(self):
+        """프로바이더별 SSL 검증 여부, 풀 이름, Mock 여부가 설정에서 정해지는지 확인"""
+        openrouter = make_model_client("or", {"provider": "openrouter", "id": "a/b", "endpoint": "https://x", "apiKey": "k"})
+        internal = make_model_client("in", {"provider": "internal", "endpoint": "http://y", "apiKey": "mock_key"})
+        self.assertEqual((openrouter.model_id, openrouter.verify_ssl, openrouter.pool), ("a/b", True, "model:or"))
+        self.assertFalse(openrouter.is_mock)
+        self.assertEqual((internal.verify_ssl, internal.is_mock), (False, True))
+        self.assertTrue(make_model_client("none", None).is_mock)
+
+    def test_build_swaps_clients_and_closes_removed_pools(self):
+        """다시 만들면 클라이언트 목록이 통째로 교체되고 빠진 모델의 연결 풀이 닫히는지 확인"""
+        http = HTTPSessionRegistry()
+        registry = ModelClientRegistry(http)
+        registry.build({
+            "a": {"endpoint": "http://127.0.0.1:9/v1", "apiKey": "key-a"},
+            "b": {"endpoint": "http://127.0.0.1:9/v1", "apiKey": "key-b"},
+            "mock": {"endpoint": "http://127.0.0.1:9/v1", "apiKey": "mock_key"}
+        })
+        first = registry.get("a")
+        self.assertEqual(sorted(registry.keys()), ["a", "b", "mock"])
+        self.assertEqual(sorted(item["pool"] for item in http.get_stats()["sessions"]), ["model:a", "model:b"])
+
+        registry.build({"a": {"endpoint": "http://127.0.0.1:9/v1", "apiKey": "key-a2"}})
+        self.assertIsNot(registry.get("a"), first)
+        self.assertEqual(first.config["apiKey"], "key-a")
+        self.assertIsNone(registry.get("b"))
+        self.assertNotIn("b", registry)
+        self.assertEqual([item["pool"] for item in http.get_stats()["sessions"]], ["model:a"])
+
+        stats = registry.get_stats()
+        self.assertEqual((stats["builds"], stats["misses"]), (2, 1))
+
+    def test_lookup_stats_under_concurrency(self):
+        """여러 스레드가 동시에 조회해도 조회/미스 수가 빠지지 않는지 확인"""
+        registry = ModelClientRegistry(HTTPSessionRegistry())
+        registry.build({"a": {"apiKey": "mock_key"}})
+
+        def lookup():
+            for i in range(2000):
+                registry.get("a" if i % 2 else "missing")
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = registry.get_stats()
+        self.assertEqual((stats["lookups"], stats["misses"]), (16000, 8000))
+
+    def test_retired_pool_closes_after_last_lease(self):
+        """교체된 연결 풀은 빌려 간 요청이 모두 반납된 뒤에 닫히고, 새 엔드포인트의 연결 풀은 유지되는지 확인"""
+        http = HTTPSessionRegistry()
+        registry = ModelClientRegistry(http)
+        registry.build({"a": {"endpoint": "http://127.0.0.1:9/v1", "apiKey": "key"}})
+        old = registry.get("a")
+
+        with registry.lease(old):
+            with registry.lease(old):
+                registry.build({"a": {"endpoint": "http://127.0.0.1:10/v1", "apiKey": "key"}})
+                self.assertEqual(registry.get_stats()["draining"], 1)
+            # 아직 요청 하나가 스트리밍 중
+            self.assertEqual(len(http.get_stats()["sessions"]), 2)
+
+        sessions = http.get_stats()["sessions"]
+        self.assertEqual([(item["base_url"], item["pool"]) for item in sessions], [("http://127.0.0.1:10", "model:a")])
+        stats = registry.get_stats()
+        self.assertEqual((stats["leased"], stats["draining"], stats["pools_closed"]), (0, 0, 1))
+
+    def test_build_between_lookup_and_lease(self):
+        """조회한 뒤 빌리기 전에 레지스트리가 교체되면 요청이 다시 만든 연결 풀도 반납할 때 닫히는지 확인"""
+        with StubLLMServer(config=StubLLMConfig(call_latency_ms=0)) as server:
+            http = HTTPSessionRegistry()
+            registry = ModelClientRegistry(http)
+            registry.build({"a": {"endpoint": server.endpoint, "apiKey": "key"}})
+            old = registry.get("a")
+            registry.build({"a": {"endpoint": "http://127.0.0.1:9/v1", "apiKey": "key"}})
+            self.assertEqual([item["base_url"] for item in http.get_stats()["sessions"]], ["http://127.0.0.1:9"])
+
+            with registry.lease(old) as client:
+                response = client.request("POST", server.endpoint, json={"messages": [{"role": "user", "content": "hi"}]})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(http.get_stats()["sessions"]), 2)
+                self.assertEqual(registry.get_stats()["draining"], 1)
+
+            self.assertEqual([item["base_url"] for item in http.get_stats()["sessions"]], ["http://127.0.0.1:9"])
+            self.assertEqual(registry.get_stats()["draining"], 0)
+
+    def test_llm_posts_are_not_retried(self):
+        """모델 연결 풀은 503 응답을 받아도 과금되는 POST를 다시 보내지 않는지 확인"""
+        config = StubLLMConfig(call_latency_ms=0, error_rate=1.0)
+        with StubLLMServer(config=config) as server:
+            client = make_model_client("a", {"endpoint": server.endpoint, "apiKey": "key"})
+            response = client.request("POST", server.endpoint, json={"messages": [{"role": "user", "content": "hi"}]})
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(config.stats["errors"], 1)
+        self.assertEqual(model_session_registry.max_retries, 0)
+        model_session_registry.close_pool("model:a")
+
+    def test_models_use_independent_pools(self):
+        """같은 서버를 쓰는 두 모델이 각자의 연결 풀에서 연결을 재사용하는지 확인"""
+        with StubLLMServer(config=StubLLMConfig(call_latency_ms=0)) as server:
+            http = HTTPSessionRegistry()
+            registry = ModelClientRegistry(http)
+            registry.build({key: {"endpoint": server.endpoint, "apiKey": "key"} for key in ["a", "b"]})
+
+            for key in ["a", "b", "a", "b"]:
+                response = registry.get(key).request("POST", server.endpoint,
+                                                     json={"messages": [{"role": "user", "content": key}]})
+                self.assertEqual(response.status_code, 200)
+
+            sessions = {item["pool"]: item for item in http.get_stats()["sessions"]}
+            self.assertEqual(set(sessions), {"model:a", "model:b"})
+            for item in sessions.values():
+                self.assertEqual((item["requests"], item["connections_opened"], item["connections_reused"]), (2, 1, 1))
+
+
+class RequestModelContextTest(unittest.TestCase):
+    """요청 모델 컨텍스트 테스트"""
+
+    def test_use_model_is_scoped(self):
+        """use_model 블록 안에서만 요청 모델이 보이는지 확인"""
+        self.assertIsNone(get_requested_model())
+        with use_model("a"):
+            self.assertEqual(get_requested_model(), "a")
+            with use_model("b"):
+                self.assertEqual(get_requested_model(), "b")
+            self.assertEqual(get_requested_model(), "a")
+        self.assertIsNone(get_requested_model())
+
+    def test_bind_model_survives_fresh_contexts(self):
+        """스트리밍 제너레이터를 매번 새 컨텍스트에서 진행해도 요청 모델이 유지되는지 확인"""
+        def stream():
+            for _ in range(3):
+                yield get_requested_model()
+
+        iterator = bind_model(stream(), "b")
+        seen = []
+        for _ in range(3):
+            # StreamingResponse가 스레드 풀에서 next()를 호출하는 상황
+            seen.append(contextvars.Context().run(next, iterator))
+        self.assertEqual(seen, ["b", "b", "b"])
+        self.assertIsNone(get_requested_model())
+        self.assertEqual(list(bind_model(stream(), None)), [None, None, None])
+
+    def test_map_reduce_workers_see_request_model(self):
+        """map/reduce 작업 스레드에서도 요청 모델이 보이는지 확인"""
+        seen = []
+
+        def summarize(text: str, stage: str) -> str:
+            seen.append((stage, get_requested_model()))
+            return text[:5]
+
+        summarizer = MapReduceSummarizer(summarize, max_workers=2, reduce_tokens=2)
+        with use_model("b"):
+            events = list(summarizer.iter_summaries(["alpha chunk", "beta chunk", "gamma chunk"]))
+
+        self.assertEqual(events[-1]["type"], "final")
+        self.assertTrue(seen)
+        self.assertEqual({model for _, model in seen}, {"b"})
+        self.assertIn("reduce", {stage for stage, _ in seen})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+페이지 단위 조회 반복자 테스트
+
+가짜 검색 API로 페이지 경계, 최대 결과 수, 다음 페이지 선조회, 오류 처리를 검증합니다.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.pagination import iter_offset_pages, iter_cursor_pages
+
+
+class _FakeSearch:
+    """startAt/maxResults를 흉내내는 가짜 검색 API"""
+
+    def __init__(self, total: int, latency: float = 0.0, server_max: int = 1000, fail_at: int = None):
+        self.total = total
+        self.latency = latency
+        self.server_max = server_max
+        self.fail_at = fail_at
+        self.requests = []
+
+    async def __call__(self, start_at, max_results):
+        self.requests.append((start_at, max_results))
+        await asyncio.sleep(self.latency)
+        if start_at == self.fail_at:
+            return {"error": "API 오류: 500"}
+        end = min(self.total, start_at + min(max_results, self.server_max))
+        return {"total": self.total, "issues": [{"key": f"AI-{i}"} for i in range(start_at, end)]}
+
+
+class IterOffsetPagesTest(unittest.TestCase):
+    """iter_offset_pages 테스트"""
+
+    def test_reads_all_pages(self):
+        fake = _FakeSearch(total=23)
+        pages = list(iter_offset_pages(fake, "issues", page_size=10))
+
+        keys = [item["key"] for page in pages for item in page["items"]]
+        self.assertEqual(keys, [f"AI-{i}" for i in range(23)])
+        self.assertEqual([page["start_at"] for page in pages], [0, 10, 20])
+        self.assertEqual(len(fake.requests), 3)
+
+    def test_limit_requests_only_needed_items(self):
+        fake = _FakeSearch(total=500)
+        pages = list(iter_offset_pages(fake, "issues", limit=25, page_size=10))
+
+        self.assertEqual(sum(len(page["items"]) for page in pages), 25)
+        self.assertEqual(fake.requests, [(0, 10), (10, 10), (20, 5)])
+        self.assertEqual(pages[-1]["total"], 500)
+
+    def test_short_server_pages_advance_by_returned_count(self):
+        fake = _FakeSearch(total=12, server_max=5)
+        pages = list(iter_offset_pages(fake, "issues", page_size=50))
+
+        self.assertEqual([page["start_at"] for page in pages], [0, 5, 10])
+
+    def test_prefetch_overlaps_rendering(self):
+        def consume(prefetch):
+            fake = _FakeSearch(total=40, latency=0.05)
+            start = time.perf_counter()
+            for _ in iter_offset_pages(fake, "issues", page_size=10, prefetch=prefetch):
+                time.sleep(0.05)  # 페이지 렌더링
+            return time.perf_counter() - start
+
+        sequential = consume(False)
+        prefetched = consume(True)
+        self.assertLess(prefetched, sequential * 0.8)
+
+    def test_error_stops_iteration(self):
+        fake = _FakeSearch(total=30, fail_at=10)
+        pages = list(iter_offset_pages(fake, "issues", page_size=10))
+
+        self.assertEqual(len(pages), 2)
+        self.assertEqual(pages[1]["error"], "API 오류: 500")
+
+    def test_empty_result(self):
+        pages = list(iter_offset_pages(_FakeSearch(total=0), "issues"))
+        self.assertEqual(pages, [{"start_at": 0, "items": [], "total": 0}])
+
+
+
+class _FakeCommits:
+    """nextCursor를 돌려주는 가짜 커밋 API (커서는 다음 커밋 번호)"""
+
+    def __init__(self, total: int, fail_cursor=None):
+        self.total = total
+        self.fail_cursor = fail_cursor
+        self.requests = []
+
+    async def __call__(self, cursor, limit):
+        self.requests.append((cursor, limit))
+        if cursor is not None and cursor == self.fail_cursor:
+            return {"error": "API 오류: 500"}
+        start = cursor or 0
+        end = min(self.total, start + limit)
+        return {"values": list(range(start, end)), "nextCursor": end if end < self.total else None}
+
+
+class IterCursorPagesTest(unittest.TestCase):
+    """iter_cursor_pages 테스트"""
+
+    def test_follows_cursor(self):
+        fake = _FakeCommits(total=7)
+        pages = list(iter_cursor_pages(fake, page_size=3))
+
+        self.assertEqual([page["items"] for page in pages], [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual([page["cursor"] for page in pages], [None, 3, 6])
+        self.assertEqual([page["offset"] for page in pages], [0, 3, 6])
+
+    def test_limit_and_error(self):
+        fake = _FakeCommits(total=100)
+        pages = list(iter_cursor_pages(fake, limit=5, page_size=3))
+        self.assertEqual(fake.requests, [(None, 3), (3, 2)])
+        self.assertEqual(sum(len(page["items"]) for page in pages), 5)
+
+        pages = list(iter_cursor_pages(_FakeCommits(total=100, fail_cursor=3), page_size=3))
+        self.assertEqual(pages[-1], {"error": "API 오류: 500", "cursor": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Pocket 객체 목록 인덱스 테스트
+
+정렬 키 인덱스의 접두사/구분자 목록, 연속 토큰 페이지 순회, 버킷 목록, 실제 API 응답 변환을 검증합니다.
+"""
+
+import os
+import sys
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.pocket_object_index import ObjectIndex, PocketMockStore, parse_list_objects_response
+
+
+def _build_index() -> ObjectIndex:
+    """폴더 구조가 있는 테스트 인덱스"""
+    index = ObjectIndex()
+    keys = ["readme.md", "logs/2024/01.log", "logs/2024/02.log", "logs/2025/01.log", "logs/latest.log",
+            "reports/q1.pdf", "reports/q2.pdf", "reports-archive/2023.zip", "z.txt"]
+    for size, key in enumerate(keys, 1):
+        index.put(key, {"size": size, "last_modified": "2024-01-01T00:00:00", "etag": key, "storage_class": "STANDARD"})
+    return index
+
+
+def _collect(index: ObjectIndex, **kwargs) -> tuple:
+    """연속 토큰으로 끝까지 순회한 (객체 키, 공통 접두사, 페이지 수)"""
+    keys, prefixes, pages, token = [], [], 0, None
+    while True:
+        page = index.list_page(continuation_token=token, **kwargs)
+        pages += 1
+        keys.extend(item["key"] for item in page["contents"])
+        prefixes.extend(page["common_prefixes"])
+        token = page["next_continuation_token"]
+        if not page["is_truncated"]:
+            return keys, prefixes, pages
+
+
+class ObjectIndexTest(unittest.TestCase):
+    """ObjectIndex 테스트"""
+
+    def test_prefix_listing_is_sorted_and_bounded(self):
+        """접두사 목록이 정렬 순서이고 다른 접두사 키를 포함하지 않는지 확인"""
+        index = _build_index()
+        page = index.list_page(prefix="reports/")
+
+        self.assertEqual([item["key"] for item in page["contents"]], ["reports/q1.pdf", "reports/q2.pdf"])
+        self.assertFalse(page["is_truncated"])
+        self.assertIsNone(page["next_continuation_token"])
+
+    def test_delimiter_groups_common_prefixes(self):
+        """구분자 목록에서 하위 키가 공통 접두사 하나로 묶이는지 확인"""
+        index = _build_index()
+
+        root = index.list_page(delimiter="/")
+        self.assertEqual(root["common_prefixes"], ["logs/", "reports-archive/", "reports/"])
+        self.assertEqual([item["key"] for item in root["contents"]], ["readme.md", "z.txt"])
+
+        logs = index.list_page(prefix="logs/", delimiter="/")
+        self.assertEqual(logs["common_prefixes"], ["logs/2024/", "logs/2025/"])
+        self.assertEqual([item["key"] for item in logs["contents"]], ["logs/latest.log"])
+
+    def test_continuation_token_pages_cover_everything_once(self):
+        """max_keys 단위 페이지를 이어 붙이면 전체 목록과 같은지 확인 (공통 접두사 경계 포함)"""
+        index = _build_index()
+
+        keys, prefixes, pages = _collect(index, max_keys=2)
+        self.assertEqual(keys, [item["key"] for item in index.list_page(max_keys=100)["contents"]])
+        self.assertEqual(len(keys), 9)
+        self.assertEqual(pages, 5)
+
+        keys, prefixes, pages = _collect(index, delimiter="/", max_keys=1)
+        self.assertEqual(prefixes, ["logs/", "reports-archive/", "reports/"])
+        self.assertEqual(keys, ["readme.md", "z.txt"])
+        self.assertEqual(pages, 5)
+
+    def test_put_delete_and_invalid_token(self):
+        """객체 추가/교체/삭제가 인덱스와 크기 합계에 반영되고 잘못된 토큰은 오류인지 확인"""
+        index = ObjectIndex()
+        index.put("b", {"size": 10})
+        index.put("a", {"size": 5})
+        index.put("b", {"size": 20})
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.total_size, 25)
+
+        self.assertTrue(index.delete("a"))
+        self.assertFalse(index.delete("a"))
+        self.assertEqual([item["key"] for item in index.list_page()["contents"]], ["b"])
+        self.assertIn("error", index.list_page(continuation_token="not-a-token!"))
+
+        index.put_many({"c": {"size": 1}, "b": {"size": 2}, "0": {"size": 3}})
+        self.assertEqual([item["key"] for item in index.list_page()["contents"]], ["0", "b", "c"])
+        self.assertEqual(index.total_size, 6)
+
+    def test_bucket_listing_pages(self):
+        """버킷 목록이 이름순으로 페이지 단위 조회되는지 확인"""
+        store = PocketMockStore.from_seed({
+            name: {"creation_date": "2024-01-01", "region": "ap-northeast-2", "objects": {"a": {"size": 1}}}
+            for name in ["gamma", "alpha", "beta", "delta"]
+        })
+
+        first = store.list_buckets(max_buckets=3)
+        self.assertEqual([bucket["name"] for bucket in first["buckets"]], ["alpha", "beta", "delta"])
+        self.assertTrue(first["is_truncated"])
+        second = store.list_buckets(max_buckets=3, continuation_token=first["next_continuation_token"])
+        self.assertEqual([bucket["name"] for bucket in second["buckets"]], ["gamma"])
+        self.assertEqual(second["buckets"][0]["object_count"], 1)
+
+        self.assertTrue(store.remove_bucket("beta"))
+        self.assertEqual(store.get_stats(), {"buckets": 3, "objects": 3})
+
+
+class ParseListObjectsResponseTest(unittest.TestCase):
+    """실제 ListObjectsV2 응답 변환 테스트"""
+
+    def test_xml_response(self):
+        """S3 XML 응답(네임스페이스 포함) 변환 확인"""
+        xml = """<?xml version="1.0" encoding="UTF-8"?>
+<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <IsTruncated>true</IsTruncated>
+  <Contents><Key>logs/a.log</Key><Size>12</Size><LastModified>2024-01-01T00:00:00Z</LastModified>
+    <ETag>"abc"</ETag><StorageClass>STANDARD</StorageClass></Contents>
+  <CommonPrefixes><Prefix>logs/2024/</Prefix></CommonPrefixes>
+  <NextContinuationToken>token-1</NextContinuationToken>
+</ListBucketResult>"""
+        page = parse_list_objects_response({"text": xml})
+
+        self.assertEqual(page["contents"][0]["key"], "logs/a.log")
+        self.assertEqual(page["contents"][0]["size"], 12)
+        self.assertEqual(page["contents"][0]["etag"], "abc")
+        self.assertEqual(page["common_prefixes"], ["logs/2024/"])
+        self.assertEqual(page["next_continuation_token"], "token-1")
+
+    def test_json_response_and_error(self):
+        """JSON 응답 변환과 오류 전달 확인"""
+        page = parse_list_objects_response({
+            "Contents": [{"Key": "a", "Size": 1}], "IsTruncated": False, "NextContinuationToken": "ignored"
+        })
+        self.assertEqual(page["key_count"], 1)
+        self.assertIsNone(page["next_continuation_token"])
+        self.assertEqual(parse_list_objects_response({"error": "API 오류: 403"}), {"error": "API 오류: 403"})
+
+
+if __name__ == "__main__":
+    unittest.main()
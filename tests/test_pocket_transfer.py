@@ -0,0 +1,149 @@
+"""
+Pocket 대용량 전송 테스트
+
+S3 호환 스텁 서버로 병렬 멀티파트 업로드, 중단 후 재개, 체크섬, 범위 병렬 다운로드를 오프라인으로 검증합니다.
+"""
+
+import os
+import sys
+import shutil
+import hashlib
+import tempfile
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.pocket_transfer import PocketTransferClient, multipart_etag, resolve_local_path
+from tests.benchmarks.stub_s3_server import StubS3Server, StubS3Config
+
+PART_SIZE = 64 * 1024
+
+
+class PocketTransferTest(unittest.TestCase):
+    """PocketTransferClient 테스트"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.source = os.path.join(self.directory, "artifact.bin")
+        with open(self.source, "wb") as f:
+            f.write(os.urandom(PART_SIZE * 5 + 1234))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _client(self, server: StubS3Server, **kwargs) -> PocketTransferClient:
+        return PocketTransferClient(server.url, part_size=PART_SIZE, max_workers=4,
+                                    state_dir=os.path.join(self.directory, "state"), **kwargs)
+
+    def _md5(self, path: str) -> str:
+        with open(path, "rb") as f:
+            return hashlib.md5(f.read()).hexdigest()
+
+    def test_multipart_round_trip(self):
+        """병렬 멀티파트 업로드 후 범위 병렬 다운로드한 파일이 원본과 같은지 확인"""
+        with StubS3Server(config=StubS3Config(latency_ms=20)) as server:
+            client = self._client(server)
+            upload = client.upload_file("builds", "release/artifact.bin", self.source)
+
+            self.assertNotIn("error", upload)
+            self.assertEqual(upload["parts"], 6)
+            with open(self.source, "rb") as f:
+                part_md5s = [hashlib.md5(f.read(PART_SIZE)).digest() for _ in range(6)]
+            self.assertEqual(upload["etag"], multipart_etag(part_md5s))
+
+            target = os.path.join(self.directory, "out", "artifact.bin")
+            download = client.download_file("builds", "release/artifact.bin", target)
+
+            self.assertNotIn("error", download)
+            self.assertEqual(download["ranges"], 6)
+            self.assertEqual(self._md5(target), self._md5(self.source))
+            self.assertFalse(os.path.exists(target + ".part"))
+            self.assertGreater(server.config.stats["max_in_flight"], 1)
+            self.assertEqual(os.listdir(os.path.join(self.directory, "state")), [])
+
+    def test_resume_after_failed_part(self):
+        """파트 실패로 중단된 업로드를 다시 실행하면 남은 파트만 전송하는지 확인"""
+        with StubS3Server(config=StubS3Config(fail_parts={4: 1})) as server:
+            client = self._client(server)
+
+            failed = client.upload_file("builds", "artifact.bin", self.source)
+            self.assertIn("error", failed)
+            uploaded_before = server.config.stats["part_uploads"]
+
+            resumed = client.upload_file("builds", "artifact.bin", self.source)
+            self.assertNotIn("error", resumed)
+            self.assertGreater(resumed["resumed_parts"], 0)
+            self.assertEqual(server.config.stats["part_uploads"] - uploaded_before, 6 - resumed["resumed_parts"])
+
+            target = os.path.join(self.directory, "resumed.bin")
+            client.download_file("builds", "artifact.bin", target)
+            self.assertEqual(self._md5(target), self._md5(self.source))
+
+    def test_changed_file_restarts_upload(self):
+        """상태 파일 기록 후 원본 파일이 바뀌면 이전 파트를 재사용하지 않는지 확인"""
+        with StubS3Server(config=StubS3Config(fail_parts={6: 1})) as server:
+            client = self._client(server)
+            self.assertIn("error", client.upload_file("builds", "artifact.bin", self.source))
+
+            with open(self.source, "ab") as f:
+                f.write(b"changed")
+            upload = client.upload_file("builds", "artifact.bin", self.source)
+
+            self.assertNotIn("error", upload)
+            self.assertEqual(upload["resumed_parts"], 0)
+
+    def test_small_file_and_missing_object(self):
+        """작은 파일은 단일 PUT + MD5 검증 다운로드, 없는 객체는 오류인지 확인"""
+        small = os.path.join(self.directory, "small.txt")
+        with open(small, "wb") as f:
+            f.write(b"hello pocket")
+
+        with StubS3Server() as server:
+            client = self._client(server)
+            upload = client.upload_file("builds", "small.txt", small)
+            self.assertEqual(upload["parts"], 1)
+            self.assertEqual(upload["etag"], hashlib.md5(b"hello pocket").hexdigest())
+
+            download = client.download_file("builds", "small.txt", os.path.join(self.directory, "copy.txt"))
+            self.assertTrue(download["verified"])
+
+            self.assertIn("error", client.download_file("builds", "missing", os.path.join(self.directory, "x")))
+            self.assertIn("error", client.upload_file("builds", "x", os.path.join(self.directory, "nope")))
+            self.assertEqual(client.get_stats()["failed"], 1)
+
+
+
+class ResolveLocalPathTest(unittest.TestCase):
+    """resolve_local_path 테스트"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.root = os.path.join(self.directory, "uploads")
+        os.makedirs(os.path.join(self.root, "builds"))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_relative_paths_inside_root(self):
+        """기준 디렉토리 안의 상대 경로는 실제 경로로 변환되는지 확인"""
+        root = os.path.realpath(self.root)
+        self.assertEqual(resolve_local_path("builds/app.zip", self.root), os.path.join(root, "builds", "app.zip"))
+        self.assertEqual(resolve_local_path("./builds", self.root), os.path.join(root, "builds"))
+
+    def test_rejects_absolute_home_and_parent_paths(self):
+        """절대 경로, ~ 경로, .. 세그먼트는 거부되는지 확인"""
+        for path in ["", "/etc/passwd", os.path.join(self.root, "builds", "app.zip"), "~/.ssh/id_rsa",
+                     "../secret.txt", "builds/../../secret.txt", "builds/..", "builds\\..\\..\\secret.txt"]:
+            self.assertIsNone(resolve_local_path(path, self.root), path)
+
+    def test_rejects_symlink_escaping_root(self):
+        """기준 디렉토리 밖을 가리키는 심볼릭 링크는 거부되는지 확인"""
+        outside = os.path.join(self.directory, "outside")
+        os.makedirs(outside)
+        os.symlink(outside, os.path.join(self.root, "link"))
+        self.assertIsNone(resolve_local_path("link/secret.txt", self.root))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+워커 프로파일러 테스트
+
+샘플링 프로파일의 collapsed stack 출력, 동시 실행 거부, 요청 단위 cProfile 요약,
+관리자 접근 확인과 /admin/profile 엔드포인트를 검증합니다.
+"""
+
+import os
+import sys
+import time
+import threading
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.profiler import SamplingProfiler, render_collapsed, get_profiling_config, sampling_profiler
+
+
+def busy_loop(stop: threading.Event) -> None:
+    """CPU를 사용하는 작업 (샘플링 대상)"""
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def fibonacci(n: int) -> int:
+    """재귀 호출 (cProfile 대상)"""
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+
+class SamplingProfilerTest(unittest.TestCase):
+    """SamplingProfiler 테스트"""
+
+    def test_sample_collapsed_stacks(self):
+        """바쁜 스레드의 스택이 스레드 이름부터 collapsed 형식으로 수집되는지 확인"""
+        stop = threading.Event()
+        worker = threading.Thread(target=busy_loop, args=(stop,), name="busy worker")
+        worker.start()
+        try:
+            result = SamplingProfiler().sample(0.2, interval_ms=2)
+        finally:
+            stop.set()
+            worker.join()
+
+        self.assertGreater(result["samples"], 10)
+        busy = {stack: count for stack, count in result["stacks"].items() if stack.startswith("busy_worker;")}
+        self.assertTrue(any("test_profiler:busy_loop" in stack for stack in busy))
+        self.assertGreater(sum(busy.values()), result["samples"] // 2)
+
+        text = render_collapsed(result["stacks"])
+        for line in text.splitlines():
+            stack, count = line.rsplit(" ", 1)
+            self.assertNotIn(" ", stack)
+            self.assertGreater(int(count), 0)
+
+    def test_idle_threads_are_skipped(self):
+        """대기 중인 스레드는 기본적으로 제외되고 idle=True이면 포함되는지 확인"""
+        stop = threading.Event()
+        waiter = threading.Thread(target=stop.wait, name="idle-waiter")
+        waiter.start()
+        try:
+            profiler = SamplingProfiler()
+            active = profiler.sample(0.05, interval_ms=5)
+            with_idle = profiler.sample(0.05, interval_ms=5, include_idle=True)
+        finally:
+            stop.set()
+            waiter.join()
+
+        self.assertFalse(any(stack.startswith("idle-waiter;") for stack in active["stacks"]))
+        self.assertTrue(any(stack.startswith("idle-waiter;") for stack in with_idle["stacks"]))
+
+    def test_concurrent_sample_is_rejected(self):
+        """샘플링이 진행 중이면 두 번째 요청을 거부하는지 확인"""
+        profiler = SamplingProfiler()
+        thread = threading.Thread(target=profiler.sample, args=(0.3,))
+        thread.start()
+        time.sleep(0.05)
+        with self.assertRaises(RuntimeError):
+            profiler.sample(0.1)
+        thread.join()
+        self.assertEqual(profiler.get_stats()["rejected"], 1)
+
+    def test_profile_call_summary(self):
+        """cProfile 요약에 호출 함수와 재귀 호출 수가 담기는지 확인"""
+        profiler = SamplingProfiler()
+        profiler.configure({"profiling": {"top": 5}})
+        result, summary = profiler.profile_call(fibonacci, 15)
+
+        self.assertEqual(result, 610)
+        self.assertLessEqual(len(summary["functions"]), 5)
+        entry = next(item for item in summary["functions"] if item["function"].endswith("(fibonacci)"))
+        self.assertEqual(entry["ncalls"], "1973/1")
+        self.assertGreater(summary["total_calls"], 1973)
+
+    def test_access_check(self):
+        """토큰이 없으면 로컬 요청만, 토큰이 있으면 일치해야, 꺼져 있으면 항상 거부하는지 확인"""
+        profiler = SamplingProfiler()
+        self.assertTrue(profiler.is_allowed("127.0.0.1"))
+        self.assertFalse(profiler.is_allowed("10.0.0.5"))
+
+        profiler.configure({"profiling": {"admin_token": "secret"}})
+        self.assertTrue(profiler.is_allowed("10.0.0.5", "secret"))
+        self.assertFalse(profiler.is_allowed("127.0.0.1", "wrong"))
+
+        profiler.configure({"profiling": {"enabled": "false", "admin_token": "secret"}})
+        self.assertFalse(profiler.is_allowed("127.0.0.1", "secret"))
+        self.assertEqual(get_profiling_config({"profiling": {"interval_ms": 0}})["interval_ms"], 1.0)
+
+
+class ProfileEndpointTest(unittest.TestCase):
+    """/admin/profile 엔드포인트 테스트"""
+
+    def setUp(self):
+        sampling_profiler.configure({"profiling": {"admin_token": "secret", "max_seconds": 1}})
+
+    def tearDown(self):
+        sampling_profiler.configure()
+
+    def test_profile_endpoint(self):
+        """관리자 토큰이 있어야 하고, collapsed/json 형식으로 반환하는지 확인"""
+        from fastapi.testclient import TestClient
+        from src.core.router import app
+
+        client = TestClient(app)
+        self.assertEqual(client.get("/admin/profile?seconds=0.1").status_code, 403)
+
+        headers = {"X-Admin-Token": "secret"}
+        self.assertEqual(client.get("/admin/profile?seconds=5", headers=headers).status_code, 400)
+
+        response = client.get("/admin/profile?seconds=0.1&idle=true", headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertRegex(response.text.splitlines()[0], r"^\S+ \d+$")
+
+        body = client.get("/admin/profile?seconds=0.1&format=json&idle=true", headers=headers).json()
+        self.assertGreater(body["samples"], 0)
+        self.assertTrue(body["stacks"])
+
+
+if __name__ == "__main__":
+    unittest.main()
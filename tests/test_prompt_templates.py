@@ -0,0 +1,84 @@
+"""
+프롬프트 템플릿 레지스트리 테스트
+
+접두부/접미부 분리, 메시지 구성 및 캐시 힌트 변환을 검증합니다.
+"""
+
+import os
+import sys
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.prompt_templates import PromptTemplate, PromptRegistry, apply_cache_hints, CACHE_CONTROL_HINT
+
+
+class PromptTemplateTest(unittest.TestCase):
+    """프롬프트 템플릿 테스트 케이스"""
+
+    def setUp(self):
+        """테스트용 템플릿 생성"""
+        self.template = PromptTemplate(
+            name="test.db",
+            prefix='스키마:\n$schema_info\n함수 호출 형식: {"function": "함수명"}',
+            suffix="질문: $query"
+        )
+
+    def test_prefix_is_stable_across_queries(self):
+        """쿼리가 달라도 접두부 메시지가 동일한지 테스트"""
+        first = self.template.build_messages(schema_info="users(id)", query="사용자 수")
+        second = self.template.build_messages(schema_info="users(id)", query="최근 가입자")
+
+        self.assertEqual(first[0], second[0])
+        self.assertNotEqual(first[1], second[1])
+        self.assertEqual(first[0]["role"], "system")
+        self.assertEqual(first[1], {"role": "user", "content": "질문: 사용자 수"})
+        self.assertIn('{"function": "함수명"}', first[0]["content"])
+        self.assertEqual(first[0]["cache_control"], CACHE_CONTROL_HINT)
+
+    def test_build_messages_without_cache_hint(self):
+        """캐시 힌트 비활성화 테스트"""
+        messages = self.template.build_messages(cache_prefix=False, schema_info="", query="q")
+        self.assertNotIn("cache_control", messages[0])
+
+    def test_render_text(self):
+        """토큰 예산 계산용 단일 텍스트 렌더링 테스트"""
+        text = self.template.render_text(schema_info="S", query="Q")
+        self.assertTrue(text.startswith("스키마:\nS"))
+        self.assertTrue(text.endswith("질문: Q"))
+
+    def test_missing_variable(self):
+        """필수 변수 누락 시 오류 테스트"""
+        with self.assertRaises(KeyError):
+            self.template.render(query="q")
+
+    def test_registry(self):
+        """레지스트리 등록/조회 테스트"""
+        registry = PromptRegistry()
+        registry.register(self.template)
+
+        self.assertIs(registry.get("test.db"), self.template)
+        self.assertEqual([t["name"] for t in registry.list_templates()], ["test.db"])
+        with self.assertRaises(KeyError):
+            registry.get("unknown")
+
+    def test_apply_cache_hints(self):
+        """프로바이더 지원 여부에 따른 캐시 힌트 변환 테스트"""
+        messages = self.template.build_messages(schema_info="S", query="Q")
+
+        stripped = apply_cache_hints(messages, supported=False)
+        self.assertNotIn("cache_control", stripped[0])
+        self.assertEqual(stripped[0]["content"], messages[0]["content"])
+
+        converted = apply_cache_hints(messages, supported=True)
+        self.assertEqual(converted[0]["content"][0]["text"], messages[0]["content"])
+        self.assertEqual(converted[0]["content"][0]["cache_control"], CACHE_CONTROL_HINT)
+        self.assertEqual(converted[1], messages[1])
+
+        plain = [{"role": "user", "content": "hi"}]
+        self.assertIs(apply_cache_hints(plain, supported=True), plain)
+
+
+if __name__ == '__main__':
+    unittest.main()
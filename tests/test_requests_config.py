@@ -0,0 +1,122 @@
+"""
+HTTP 세션 레지스트리 테스트
+
+공유 세션 키 구분, 요청별 헤더 전달, 연결 재사용 통계를 로컬 HTTP 서버로 검증합니다.
+"""
+
+import os
+import sys
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.requests_config import HTTPSessionRegistry, make_api_request, session_registry
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """요청 헤더를 JSON으로 돌려주는 keep-alive 처리기"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        body = json.dumps({
+            "path": self.path,
+            "trace": self.headers.get("X-Trace-Id"),
+            "authorization": self.headers.get("Authorization")
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply
+    do_POST = _reply
+
+
+class HTTPSessionRegistryTest(unittest.TestCase):
+    """HTTP 세션 레지스트리 테스트 케이스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        host, port = cls.server.server_address[:2]
+        cls.base_url = f"http://{host}:{port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.registry = HTTPSessionRegistry(pool_connections=2, pool_maxsize=4)
+
+    def tearDown(self):
+        self.registry.close_all()
+
+    def test_session_key(self):
+        """같은 호스트는 세션을 공유하고 SSL 검증/인증 정보가 다르면 분리되는지 테스트"""
+        first = self.registry.get_session(f"{self.base_url}/a")
+        self.assertIs(first, self.registry.get_session(f"{self.base_url}/b?x=1"))
+        self.assertIsNot(first, self.registry.get_session(self.base_url, verify_ssl=True))
+        self.assertIsNot(first, self.registry.get_session(self.base_url, auth=("user", "pw")))
+
+        stats = self.registry.get_stats()
+        self.assertEqual(stats["sessions_created"], 3)
+        self.assertEqual(stats["session_hits"], 1)
+
+    def test_per_request_headers(self):
+        """요청별 헤더가 세션에 남지 않는지 테스트"""
+        response = self.registry.request("GET", f"{self.base_url}/x", headers={"X-Trace-Id": "t-1"})
+        self.assertEqual(response.json()["trace"], "t-1")
+
+        response = self.registry.request("GET", f"{self.base_url}/x")
+        self.assertIsNone(response.json()["trace"])
+        self.assertNotIn("X-Trace-Id", self.registry.get_session(self.base_url).headers)
+
+    def test_basic_auth(self):
+        """인증 정보가 세션 키와 기본 인증에 반영되는지 테스트"""
+        response = self.registry.request("GET", f"{self.base_url}/x", auth=("user", "pw"))
+        self.assertTrue(response.json()["authorization"].startswith("Basic "))
+        self.assertIsNone(self.registry.request("GET", f"{self.base_url}/x").json()["authorization"])
+
+    def test_connection_reuse(self):
+        """동시 요청에서 연결이 풀 크기 이내로 재사용되는지 테스트"""
+        def call(i):
+            return self.registry.request("POST", f"{self.base_url}/items/{i}", json={"i": i}).status_code
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            codes = list(executor.map(call, range(40)))
+
+        self.assertEqual(codes, [200] * 40)
+        stats = self.registry.get_stats()
+        self.assertEqual(stats["http_requests"], 40)
+        self.assertLessEqual(stats["connections_opened"], 4)
+        self.assertGreaterEqual(stats["connections_reused"], 36)
+        self.assertEqual(stats["sessions"][0]["requests"], 40)
+
+    def test_make_api_request(self):
+        """make_api_request가 공유 세션 레지스트리를 사용하는지 테스트"""
+        before = session_registry.get_stats()["session_hits"]
+        for _ in range(3):
+            result = make_api_request(f"{self.base_url}/api", method="POST", data={"a": 1}, headers={"X-Trace-Id": "m"})
+            self.assertEqual(result["trace"], "m")
+        self.assertGreaterEqual(session_registry.get_stats()["session_hits"] - before, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+사전 직렬화 응답 캐시 테스트
+
+응답 본문 재사용, 무효화 후 재생성, 생성 도중 무효화 시 오래된 본문을 저장하지 않는지 검증합니다.
+"""
+
+import os
+import sys
+import json
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.response_cache import PrecomputedResponses, serialize_json
+
+
+class PrecomputedResponsesTest(unittest.TestCase):
+    """PrecomputedResponses 테스트"""
+
+    def test_body_is_built_once_until_invalidated(self):
+        """무효화 전까지 builder가 한 번만 호출되고 같은 바이트를 반환하는지 확인"""
+        cache = PrecomputedResponses()
+        state = {"model": "a", "builds": 0}
+
+        def build():
+            state["builds"] += 1
+            return {"model": state["model"], "설명": "모델"}
+
+        first = cache.get("health", build)
+        self.assertIs(cache.get("health", build), first)
+        self.assertEqual(json.loads(first), {"model": "a", "설명": "모델"})
+        self.assertEqual(state["builds"], 1)
+
+        state["model"] = "b"
+        cache.invalidate("change_model:b")
+        self.assertEqual(json.loads(cache.get("health", build))["model"], "b")
+        self.assertEqual(state["builds"], 2)
+
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["builds"], stats["invalidations"]), (1, 2, 1))
+        self.assertEqual(stats["cached"], ["health"])
+        self.assertEqual(stats["last_invalidation"]["reason"], "change_model:b")
+
+    def test_invalidation_during_build_is_not_cached(self):
+        """생성 도중 무효화되면 그 결과는 이번 응답에만 쓰고 저장하지 않는지 확인"""
+        cache = PrecomputedResponses()
+        calls = []
+
+        def build():
+            calls.append(1)
+            if len(calls) == 1:
+                cache.invalidate("agent_created:document")
+            return {"version": len(calls)}
+
+        self.assertEqual(json.loads(cache.get("health", build)), {"version": 1})
+        self.assertEqual(json.loads(cache.get("health", build)), {"version": 2})
+        self.assertEqual(json.loads(cache.get("health", build)), {"version": 2})
+        self.assertEqual(len(calls), 2)
+
+    def test_serialize_json_is_compact_utf8(self):
+        """직렬화 결과가 공백 없는 UTF-8 JSON인지 확인"""
+        self.assertEqual(serialize_json({"a": [1, 2], "b": "한글"}), '{"a":[1,2],"b":"한글"}'.encode("utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
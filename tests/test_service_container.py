@@ -0,0 +1,137 @@
+"""
+지연 서비스 컨테이너 테스트
+
+경로 등록 시 임포트 지연, 동시 호출에서 한 번만 생성, 실패 후 재시도, 프록시, 백그라운드 워밍업을 검증합니다.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+import threading
+from collections import OrderedDict
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.service_container import ServiceContainer, import_object
+
+
+class ServiceContainerTest(unittest.TestCase):
+    """ServiceContainer 테스트"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.module_name = f"lazy_service_{os.getpid()}_{id(self)}"
+        with open(os.path.join(self.directory, f"{self.module_name}.py"), "w") as f:
+            f.write("class HeavyService:\n    def ping(self):\n        return 'pong'\n\nshared = {'kind': 'singleton'}\n")
+        sys.path.insert(0, self.directory)
+
+    def tearDown(self):
+        sys.path.remove(self.directory)
+        sys.modules.pop(self.module_name, None)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_register_does_not_import_until_get(self):
+        """경로 등록만으로는 모듈을 임포트하지 않고, 클래스는 생성/객체는 그대로 반환하는지 확인"""
+        container = ServiceContainer()
+        container.register("heavy", f"{self.module_name}:HeavyService")
+        container.register("shared", f"{self.module_name}:shared")
+
+        self.assertNotIn(self.module_name, sys.modules)
+        self.assertFalse(container.is_loaded("heavy"))
+
+        heavy = container.get("heavy")
+        self.assertIn(self.module_name, sys.modules)
+        self.assertEqual(heavy.ping(), "pong")
+        self.assertIs(container.get("heavy"), heavy)
+        self.assertEqual(container.get("shared"), {"kind": "singleton"})
+        self.assertIs(container.get("shared"), sys.modules[self.module_name].shared)
+
+    def test_concurrent_get_creates_once(self):
+        """여러 스레드가 동시에 처음 요청해도 팩토리가 한 번만 실행되는지 확인"""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        container = ServiceContainer()
+        container.register("slow", factory)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(container.get("slow"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+        self.assertIsNotNone(container.get_stats()["services"]["slow"]["load_ms"])
+
+    def test_failure_is_recorded_and_retried(self):
+        """생성 실패는 캐시하지 않고 기록한 뒤 다음 호출에서 다시 시도하는지 확인"""
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("schema unavailable")
+            return "ready"
+
+        container = ServiceContainer()
+        container.register("flaky", flaky)
+
+        with self.assertRaises(RuntimeError):
+            container.get("flaky")
+        self.assertEqual(container.get_stats()["services"]["flaky"]["error"], "schema unavailable")
+        self.assertEqual(container.get("flaky"), "ready")
+        self.assertIsNone(container.get_stats()["services"]["flaky"]["error"])
+        with self.assertRaises(KeyError):
+            container.get("missing")
+
+    def test_proxy_and_reset(self):
+        """프록시는 첫 속성 접근에서 생성하고 reset 후에는 다시 생성하는지 확인"""
+        container = ServiceContainer()
+        container.register("heavy", f"{self.module_name}:HeavyService")
+        proxy = container.proxy("heavy")
+
+        self.assertIn("lazy", repr(proxy))
+        self.assertEqual(proxy.ping(), "pong")
+        first = container.get("heavy")
+
+        container.reset("heavy")
+        self.assertFalse(container.is_loaded("heavy"))
+        self.assertEqual(proxy.ping(), "pong")
+        self.assertIsNot(container.get("heavy"), first)
+
+    def test_background_warm_up_skips_failures(self):
+        """백그라운드 워밍업이 대상 서비스만 생성하고 실패한 서비스는 건너뛰는지 확인"""
+        container = ServiceContainer()
+        container.register("heavy", f"{self.module_name}:HeavyService")
+        container.register("broken", "no_such_module_for_warm_up:Service")
+        container.register("on_demand", OrderedDict, warm_up=False)
+
+        thread = container.warm_up()
+        thread.join(5)
+
+        stats = container.get_stats()
+        self.assertFalse(stats["warming_up"])
+        self.assertTrue(stats["services"]["heavy"]["loaded"])
+        self.assertFalse(stats["services"]["broken"]["loaded"])
+        self.assertIn("no_such_module_for_warm_up", stats["services"]["broken"]["error"])
+        self.assertFalse(stats["services"]["on_demand"]["loaded"])
+        self.assertEqual(stats["loaded"], 1)
+
+    def test_import_object(self):
+        """모듈/속성 경로 해석 확인"""
+        self.assertIs(import_object("collections:OrderedDict"), OrderedDict)
+        self.assertIs(import_object("os.path"), os.path)
+        self.assertIs(import_object("os:path.join"), os.path.join)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+SQL 유틸리티 테스트
+
+LLM 응답 스캐너의 SQL 블록, 분석 텍스트, 함수 호출 추출을 검증합니다.
+"""
+
+import os
+import sys
+import json
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.sql_utils import (
+    extract_sql_query, extract_function_call, scan_llm_response, format_query_result,
+    render_result_rows, normalize_result_format, parse_result_options
+)
+
+
+class SqlUtilsTest(unittest.TestCase):
+    """SQL 유틸리티 테스트 케이스"""
+
+    RESPONSE = (
+        "질문을 분석했습니다.\n"
+        "```python\nprint('무시')\n```\n"
+        "```sql\nSELECT id, name FROM users WHERE id = 1;\n```\n"
+        "첫 번째 쿼리 설명\n"
+        "```SQL\nSELECT COUNT(*) FROM builds;\n```\n"
+        "빌드 수를 집계합니다."
+    )
+
+    def test_sql_block_preferred(self):
+        """SQL 블록이 일반 코드 블록보다 우선하는지 테스트"""
+        self.assertEqual(extract_sql_query(self.RESPONSE), "SELECT id, name FROM users WHERE id = 1;")
+
+    def test_generic_code_block(self):
+        """언어 태그 없는 코드 블록 및 한 줄 블록 추출 테스트"""
+        self.assertEqual(extract_sql_query("```\nSELECT 1\n```"), "SELECT 1")
+        self.assertEqual(extract_sql_query("```sql SELECT 2```"), "SELECT 2")
+
+    def test_crlf_and_tab_after_language_tag(self):
+        """CRLF 줄바꿈, 탭으로 구분된 언어 태그 뒤 SQL 추출 테스트"""
+        self.assertEqual(extract_sql_query("```sql\r\nSELECT 1;```"), "SELECT 1;")
+        self.assertEqual(extract_sql_query("```sql\tSELECT 1;```"), "SELECT 1;")
+        self.assertEqual(extract_sql_query("설명\r\n```sql\r\nSELECT 1\r\nFROM t;\r\n```\r\n"), "SELECT 1\r\nFROM t;")
+        self.assertEqual(extract_sql_query("```SELECT * FROM t```"), "SELECT * FROM t")
+
+    def test_keyword_line_fallback(self):
+        """코드 블록이 없을 때 SQL 키워드 라인 추출 테스트"""
+        text = "다음 쿼리를 실행하세요.\n  select name from users\n끝"
+        self.assertEqual(extract_sql_query(text), "select name from users")
+        self.assertIsNone(extract_sql_query(text, check_sql_keywords=False))
+        self.assertIsNone(extract_sql_query("Selection 결과 없음"))
+
+    def test_analysis_after_last_sql_block(self):
+        """마지막 SQL 블록 이후 분석 텍스트 추출 테스트"""
+        scanned = scan_llm_response(self.RESPONSE)
+        self.assertEqual(len(scanned["sql_blocks"]), 2)
+        self.assertEqual(len(scanned["code_blocks"]), 3)
+        self.assertEqual(scanned["analysis"], "빌드 수를 집계합니다.")
+
+    def test_nested_function_call(self):
+        """중첩 parameters를 가진 함수 호출 JSON 추출 테스트"""
+        text = ('다음 함수를 호출합니다: {"function": "trigger_build", '
+                '"parameters": {"single_id": "user01", "options": {"env": "DEV"}}} 이상입니다.')
+        self.assertEqual(extract_function_call(text), {
+            "function": "trigger_build",
+            "parameters": {"single_id": "user01", "options": {"env": "DEV"}}
+        })
+
+    def test_function_call_in_code_block(self):
+        """코드 블록 안의 함수 호출 JSON 추출 테스트"""
+        text = '```json\n{"function": "get_tr_by_code", "parameters": {"tr_code": "TR-1"}}\n```'
+        self.assertEqual(extract_function_call(text)["function"], "get_tr_by_code")
+
+    def test_invalid_function_call(self):
+        """parameters가 없거나 잘못된 JSON은 무시하는지 테스트"""
+        self.assertIsNone(extract_function_call('{"function": "f"}'))
+        self.assertIsNone(extract_function_call('{"function": "f", "parameters": {'))
+        self.assertIsNone(extract_function_call(""))
+
+    def test_format_query_result_analysis(self):
+        """결과 포맷팅에 분석 텍스트가 포함되는지 테스트"""
+        result = format_query_result([{"count": 3}], "SELECT COUNT(*) FROM builds;", self.RESPONSE, "SWDP DB")
+        self.assertIn("| count |", result)
+        self.assertTrue(result.endswith("## 분석\n\n빌드 수를 집계합니다."))
+
+
+class ResultRenderingTest(unittest.TestCase):
+    """쿼리 결과 렌더링 테스트 케이스"""
+
+    ROWS = [
+        {"id": 1, "name": "build|main", "status": None},
+        {"id": 2, "name": "nightly", "status": "FAILED"},
+        {"id": 3, "name": "release", "status": "SUCCESS"}
+    ]
+
+    def test_markdown_table(self):
+        """마크다운 표 렌더링과 컬럼 너비 요약 테스트"""
+        table, summary = render_result_rows(self.ROWS, "markdown", max_rows=0)
+        lines = table.splitlines()
+        self.assertEqual(lines[0], "| id | name | status |")
+        self.assertEqual(lines[2], "| 1 | build\\|main | NULL |")
+        self.assertEqual(summary["rendered_rows"], 3)
+        self.assertFalse(summary["truncated"])
+        self.assertEqual(summary["column_widths"], {"id": 2, "name": 10, "status": 7})
+
+    def test_row_limit(self):
+        """최대 행 수 제한 테스트"""
+        result = format_query_result(self.ROWS, "SELECT * FROM builds", "", "SWDP DB", max_rows=2)
+        self.assertIn("| 2 | nightly | FAILED |", result)
+        self.assertNotIn("release", result)
+        self.assertIn("총 3개의 행 중 2개만 표시했습니다.", result)
+
+    def test_no_row_limit_by_default(self):
+        """max_rows를 지정하지 않으면 모든 행을 출력하는지 테스트"""
+        rows = [{"id": i} for i in range(1200)]
+        table, summary = render_result_rows(rows, "csv")
+        self.assertEqual(summary["rendered_rows"], 1200)
+        self.assertFalse(summary["truncated"])
+        self.assertEqual(len(table.splitlines()), 1201)
+
+    def test_csv_format(self):
+        """CSV 형식 출력 테스트 (마크다운 없이 결과 표만)"""
+        result = format_query_result(self.ROWS, "SELECT * FROM builds", "", "SWDP DB", output_format="csv")
+        self.assertEqual(result.splitlines(), ["id,name,status", "1,build|main,", "2,nightly,FAILED", "3,release,SUCCESS"])
+        self.assertEqual(format_query_result(5, "DELETE FROM builds", "", "SWDP DB", output_format="csv"), "affected_rows\n5\n")
+
+    def test_json_columnar_format(self):
+        """JSON 컬럼별 배열 출력 테스트"""
+        result = json.loads(format_query_result(self.ROWS, "SELECT * FROM builds", "", "SWDP DB",
+                                                output_format="JSON", max_rows=2))
+        self.assertEqual(result["columns"], ["id", "name", "status"])
+        self.assertEqual(result["data"]["id"], [1, 2])
+        self.assertEqual(result["data"]["status"], [None, "FAILED"])
+        self.assertEqual(result["total_rows"], 3)
+        self.assertTrue(result["truncated"])
+        self.assertEqual(result["sql"], "SELECT * FROM builds")
+
+    def test_unknown_format(self):
+        """알 수 없는 형식은 markdown으로 처리되는지 테스트"""
+        self.assertEqual(normalize_result_format("xml"), "markdown")
+        self.assertEqual(normalize_result_format(None), "markdown")
+        self.assertEqual(normalize_result_format(" CSV "), "csv")
+
+    def test_parse_result_options(self):
+        """결과 옵션은 정수 문자열을 받아들이고 잘못된 타입은 ValueError로 거부하는지 확인"""
+        self.assertEqual(parse_result_options(None, None), ("markdown", None))
+        self.assertEqual(parse_result_options("JSON", "20"), ("json", 20))
+        self.assertEqual(parse_result_options("xml", 0), ("markdown", 0))
+        for result_format, max_rows in [(["csv"], None), ("csv", "many"), ("csv", 2.5), ("csv", True)]:
+            with self.assertRaises(ValueError):
+                parse_result_options(result_format, max_rows)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+LLM 스텁 서버 설정 테스트
+
+벤치마크 하네스가 사용하는 오류 주입(시드 재현), 응답 길이, 첫 토큰 지연, 토큰 생성 속도 설정을 검증합니다.
+"""
+
+import os
+import sys
+import time
+import unittest
+
+import requests
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.benchmarks.stub_llm_server import StubLLMServer, StubLLMConfig
+
+MESSAGES = [{"role": "user", "content": "테스트"}]
+
+
+class StubLLMServerTest(unittest.TestCase):
+    """StubLLMServer 테스트"""
+
+    def _statuses(self, seed: int) -> list:
+        """같은 시드로 20건 호출한 상태 코드 순서"""
+        config = StubLLMConfig(call_latency_ms=0, per_item_latency_ms=0, error_rate=0.3, error_status=429, seed=seed)
+        with StubLLMServer(config=config) as server, requests.Session() as session:
+            return [session.post(server.endpoint, json={"messages": MESSAGES}).status_code for _ in range(20)]
+
+    def test_error_injection_is_reproducible(self):
+        """시드가 같으면 오류 주입 순서가 같고, 주입된 오류는 지정한 상태 코드인지 확인"""
+        first = self._statuses(seed=7)
+        self.assertEqual(first, self._statuses(seed=7))
+        self.assertEqual(set(first), {200, 429})
+
+    def test_ttft_and_token_rate(self):
+        """응답 토큰 수, 첫 청크 지연과 토큰 속도에 따른 전체 생성 시간 확인"""
+        config = StubLLMConfig(call_latency_ms=0, per_item_latency_ms=0, ttft_ms=100, tokens_per_second=200,
+                               completion_tokens=40, stream_chunks=4)
+        with StubLLMServer(config=config) as server:
+            body = requests.post(server.endpoint, json={"messages": MESSAGES}).json()
+            self.assertEqual(body["usage"]["completion_tokens"], 40)
+
+            start = time.perf_counter()
+            with requests.post(server.endpoint, json={"messages": MESSAGES, "stream": True}, stream=True) as response:
+                # 스텁 스트림은 청크 인코딩이 아니므로 첫 바이트를 직접 읽어 첫 청크 시간 측정
+                response.raw.read(1)
+                first_chunk = time.perf_counter() - start
+                response.raw.read()
+            total = time.perf_counter() - start
+
+        self.assertGreaterEqual(first_chunk, 0.1)
+        self.assertLess(first_chunk, 0.18)
+        self.assertGreaterEqual(total, 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
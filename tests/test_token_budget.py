@@ -0,0 +1,139 @@
+"""
+토큰 예산 모듈 테스트
+
+토큰 수 추정, 컨텍스트 축소, 사용량 집계 기능을 검증합니다.
+"""
+
+import os
+import sys
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.token_budget import (
+    estimate_tokens, estimate_messages_tokens, trim_text_to_tokens,
+    fit_messages_to_budget, prompt_token_budget, TokenUsageTracker, TRUNCATION_MARKER, DEFAULT_CONTEXT_WINDOW
+)
+
+
+class TokenBudgetTest(unittest.TestCase):
+    """토큰 예산 테스트 케이스"""
+
+    def test_estimate_tokens(self):
+        """ASCII/한글 혼합 텍스트 토큰 추정 테스트"""
+        self.assertEqual(estimate_tokens(""), 0)
+        self.assertEqual(estimate_tokens(None), 0)
+        self.assertEqual(estimate_tokens("abcd"), 1)
+        self.assertEqual(estimate_tokens("abcde"), 2)
+        self.assertEqual(estimate_tokens("테스트"), 3)
+        self.assertEqual(estimate_tokens("abcd테스트"), 4)
+
+    def test_estimate_messages_tokens(self):
+        """메시지 오버헤드 포함 추정 테스트"""
+        messages = [
+            {"role": "system", "content": "abcd"},
+            {"role": "user", "content": "테스트"}
+        ]
+        self.assertEqual(estimate_messages_tokens(messages), 1 + 3 + 8)
+
+    def test_trim_text_within_budget(self):
+        """예산 이내 텍스트는 그대로 반환"""
+        text = "짧은 텍스트"
+        self.assertEqual(trim_text_to_tokens(text, 100), text)
+
+    def test_trim_text_over_budget(self):
+        """예산 초과 텍스트 축소 테스트"""
+        text = "\n".join(f"테이블{i}: 컬럼 정보" for i in range(200))
+        trimmed = trim_text_to_tokens(text, 100)
+
+        self.assertLessEqual(estimate_tokens(trimmed), 100)
+        self.assertTrue(trimmed.endswith(TRUNCATION_MARKER))
+        self.assertTrue(text.startswith(trimmed[:-len(TRUNCATION_MARKER)]))
+
+    def test_fit_messages_to_budget(self):
+        """가장 긴 메시지부터 축소하는지 테스트"""
+        short = {"role": "system", "content": "시스템 지시"}
+        long = {"role": "user", "content": "검색 결과 " * 500}
+        messages = [short, long]
+
+        fitted = fit_messages_to_budget(messages, 200)
+
+        self.assertLessEqual(estimate_messages_tokens(fitted), 200)
+        self.assertEqual(fitted[0], short)
+        self.assertNotEqual(fitted[1]["content"], long["content"])
+        # 원본 메시지는 변경되지 않아야 함
+        self.assertEqual(long["content"], "검색 결과 " * 500)
+
+    def test_fit_messages_keeps_system_prefix(self):
+        """시스템 메시지가 가장 길어도 자르지 않고 사용자 메시지만 축소하는지 테스트"""
+        system = {"role": "system", "content": "지시와 스키마 " * 1000}
+        user = {"role": "user", "content": "검색 결과 " * 500}
+        budget = estimate_messages_tokens([system]) + 200
+
+        fitted = fit_messages_to_budget([system, user], budget)
+
+        self.assertIs(fitted[0], system)
+        self.assertLessEqual(estimate_messages_tokens(fitted), budget)
+        self.assertTrue(fitted[1]["content"].endswith(TRUNCATION_MARKER))
+
+        # 시스템 메시지만으로 예산을 넘으면 그대로 반환
+        messages = [system, {"role": "user", "content": "질문"}]
+        self.assertIs(fit_messages_to_budget(messages, 100), messages)
+
+    def test_prompt_token_budget(self):
+        """maxPromptTokens 우선, 없으면 컨텍스트 윈도에서 완료 토큰 상한을 뺀 값인지 테스트"""
+        self.assertEqual(prompt_token_budget({"maxPromptTokens": 6000, "maxTokens": 4096}), 6000)
+        self.assertEqual(prompt_token_budget({"contextWindow": 16384, "maxTokens": 4096}), 12288)
+        self.assertEqual(prompt_token_budget({"maxTokens": 4096}), DEFAULT_CONTEXT_WINDOW - 4096)
+
+    def test_fit_messages_within_budget(self):
+        """예산 이내 메시지 목록은 동일 객체 반환"""
+        messages = [{"role": "user", "content": "안녕하세요"}]
+        self.assertIs(fit_messages_to_budget(messages, 100), messages)
+
+    def test_usage_tracker(self):
+        """에이전트/모델/엔드포인트별 집계 테스트"""
+        tracker = TokenUsageTracker()
+        tracker.record("jira", "primary", "http://llm/v1", 10, 5)
+        tracker.record("jira", "korean", "http://llm/v1", 20, 10, estimated=True)
+        tracker.record("router", "primary", "mock", 1, 1, estimated=True)
+        tracker.record_trim()
+
+        summary = tracker.get_summary()
+
+        self.assertEqual(summary["totals"]["requests"], 3)
+        self.assertEqual(summary["totals"]["total_tokens"], 47)
+        self.assertEqual(summary["totals"]["estimated_requests"], 2)
+        self.assertEqual(summary["trimmed_requests"], 1)
+        self.assertEqual(summary["by_agent"]["jira"]["prompt_tokens"], 30)
+        self.assertEqual(summary["by_model"]["primary"]["requests"], 2)
+        self.assertEqual(summary["by_endpoint"]["mock"]["completion_tokens"], 1)
+
+        tracker.reset()
+        self.assertEqual(tracker.get_summary()["totals"]["requests"], 0)
+
+
+class TokenMetricsEndpointTest(unittest.TestCase):
+    """/metrics/tokens 엔드포인트 테스트"""
+
+    def setUp(self):
+        from src.core.admin_auth import admin_auth
+        admin_auth.configure({"admin": {"token": "secret"}})
+
+    def tearDown(self):
+        from src.core.admin_auth import admin_auth
+        admin_auth.configure()
+
+    def test_reset_requires_admin(self):
+        """집계 초기화는 관리자 토큰이 있어야 가능한지 확인"""
+        from fastapi.testclient import TestClient
+        from src.core.router import app
+
+        client = TestClient(app)
+        self.assertEqual(client.delete("/metrics/tokens").status_code, 403)
+        self.assertEqual(client.delete("/metrics/tokens", headers={"X-Admin-Token": "secret"}).status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,224 @@
+"""
+요청 추적 테스트
+
+스팬 부모 관계와 단계별 시간 집계, 스레드 풀/백그라운드 이벤트 루프/스트리밍 제너레이터로의 전파,
+JSONL/OTLP 내보내기, FastAPI 미들웨어의 X-Trace-Id, Server-Timing 헤더를 검증합니다.
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import unittest
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import tracing
+from src.core.tracing import Tracer, server_timing, parse_traceparent, get_tracing_config
+from src.core.async_client import AsyncIntegrationClient, submit_async
+from tests.benchmarks.stub_integration_server import StubIntegrationServer
+from tests.benchmarks.stub_otlp_collector import StubOTLPCollector
+
+JIRA_SCHEMA = {
+    "api_endpoints": [
+        {"endpoint": "/rest/api/2/issue/{issueKey}", "method": "GET",
+         "response": {"key": "AI-101", "fields": {"summary": "로그인 오류"}}}
+    ]
+}
+
+
+def _spans_by_name(trace):
+    """이름별 스팬 목록"""
+    spans = {}
+    for span in trace.spans:
+        spans.setdefault(span.name, []).append(span)
+    return spans
+
+
+class SpanTest(unittest.TestCase):
+    """스팬 기록 및 전파 테스트"""
+
+    def test_nested_spans_and_server_timing(self):
+        """자식 스팬 부모 관계, 단계별 합계, 예외 시 오류 상태 확인"""
+        root = Tracer().start_trace("http.request")
+        with tracing.activate(root):
+            with tracing.span("graph.router"):
+                with tracing.span("llm.generate", "llm.router", model="a") as llm:
+                    time.sleep(0.01)
+            for _ in range(2):
+                with tracing.span("llm.generate", "llm.sql"):
+                    time.sleep(0.005)
+            with self.assertRaises(ValueError):
+                with tracing.span("agent.run", "agent.sql"):
+                    raise ValueError("실패")
+        root.end()
+
+        spans = _spans_by_name(root.trace)
+        self.assertEqual(llm.parent_id, spans["graph.router"][0].span_id)
+        self.assertEqual(spans["graph.router"][0].parent_id, root.span_id)
+        self.assertEqual(spans["agent.run"][0].status, "error")
+
+        durations = root.trace.stage_durations()
+        self.assertEqual(set(durations), {"graph.router", "llm.router", "llm.sql", "agent.sql"})
+        self.assertGreaterEqual(durations["llm.sql"], 10)
+        self.assertGreaterEqual(durations["graph.router"], durations["llm.router"])
+
+        header = server_timing(root.trace, 0.05)
+        self.assertRegex(header, r"^graph\.router;dur=\d+\.\d, llm\.router;dur=\d+\.\d")
+        self.assertTrue(header.endswith("total;dur=50.0"))
+
+    def test_no_trace_is_noop(self):
+        """추적 중이 아니면 스팬을 만들지 않고 헤더도 그대로인지 확인"""
+        with tracing.span("llm.generate") as current:
+            self.assertIsNone(current)
+        self.assertIsNone(tracing.start_span("agent.run"))
+        headers = {"Accept": "application/json"}
+        self.assertIs(tracing.inject_headers(headers), headers)
+
+    def test_traceparent_parse_and_inject(self):
+        """traceparent 파싱과 외부 호출 헤더 전파 확인"""
+        trace_id, span_id = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+        self.assertEqual(parse_traceparent(f"00-{trace_id}-{span_id}-01"), (trace_id, span_id))
+        self.assertIsNone(parse_traceparent("00-xyz-00f067aa0ba902b7-01"))
+        self.assertIsNone(parse_traceparent(f"00-{'0' * 32}-{span_id}-01"))
+
+        root = Tracer().start_trace("http.request", f"00-{trace_id}-{span_id}-01")
+        self.assertEqual(root.trace_id, trace_id)
+        self.assertEqual(root.to_dict()["parent_id"], span_id)
+        with tracing.activate(root):
+            headers = tracing.inject_headers({"Accept": "application/json"})
+        self.assertEqual(headers["traceparent"], f"00-{trace_id}-{root.span_id}-01")
+
+    def test_propagation_to_thread_pool_and_background_loop(self):
+        """copy_context 스레드 풀과 submit_async 백그라운드 루프에서 스팬이 이어지는지 확인"""
+        def summarize():
+            with tracing.span("diff.summary"):
+                pass
+
+        root = Tracer().start_trace("http.request")
+        with StubIntegrationServer(schemas={"jira": JIRA_SCHEMA}) as server:
+            client = AsyncIntegrationClient("jira", server.url("jira") + "/rest/api/2")
+            with tracing.activate(root), ThreadPoolExecutor(max_workers=1) as pool:
+                with tracing.span("agent.run", "agent.jira"):
+                    pool.submit(contextvars.copy_context().run, summarize).result()
+                    result = submit_async(client.get("/issue/AI-101")).result(timeout=5)
+
+        self.assertEqual(result["key"], "AI-101")
+        spans = _spans_by_name(root.trace)
+        integration = spans["integration.request"][0]
+        http = spans["http.request"][0]
+        self.assertEqual(integration.parent_id, spans["agent.run"][0].span_id)
+        self.assertEqual(spans["diff.summary"][0].parent_id, spans["agent.run"][0].span_id)
+        self.assertEqual(http.parent_id, integration.span_id)
+        self.assertEqual(http.attributes["status_code"], 200)
+        self.assertEqual(integration.attributes["client"], "jira")
+
+    def test_trace_stream(self):
+        """스트리밍 스팬이 값마다 현재 스팬이 되고, 끝나거나 중단되면 종료되는지 확인"""
+        root = Tracer().start_trace("http.request")
+
+        def chunks():
+            for index in range(3):
+                with tracing.span("chunk"):
+                    yield str(index)
+
+        with tracing.activate(root):
+            stream = tracing.trace_stream(chunks(), tracing.start_span("llm.generate", "llm.direct"))
+            cancelled = tracing.trace_stream(chunks(), tracing.start_span("agent.run", "agent.jira"))
+        self.assertEqual(list(stream), ["0", "1", "2"])
+        next(cancelled)
+        cancelled.close()
+
+        spans = _spans_by_name(root.trace)
+        llm, agent = spans["llm.generate"][0], spans["agent.run"][0]
+        self.assertIn("first_chunk_ms", llm.attributes)
+        self.assertEqual(agent.status, "cancelled")
+        self.assertEqual([span.parent_id for span in spans["chunk"]].count(llm.span_id), 3)
+
+
+class TraceExportTest(unittest.TestCase):
+    """추적 내보내기 테스트"""
+
+    def test_config_coercion(self):
+        """tracing 섹션 값 변환 확인"""
+        config = get_tracing_config({"tracing": {"enabled": "false", "exporter": "JSONL", "sample_rate": "2"}})
+        self.assertEqual((config["enabled"], config["exporter"], config["sample_rate"]), (False, "jsonl", 1.0))
+
+        tracer = Tracer()
+        tracer.configure({"tracing": {"enabled": False}})
+        self.assertIsNone(tracer.start_trace("http.request"))
+
+    def test_jsonl_export(self):
+        """요청이 끝나면 추적 한 건이 JSONL 한 줄로 기록되는지 확인"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "logs", "traces.jsonl")
+            tracer = Tracer()
+            tracer.configure({"tracing": {"exporter": "jsonl", "path": path}})
+            for _ in range(2):
+                root = tracer.start_trace("http.request", path="/query")
+                with tracing.activate(root), tracing.span("llm.generate", "llm.direct"):
+                    pass
+                tracer.finish_trace(root)
+            self.assertTrue(tracer.flush())
+
+            with open(path, "r", encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual([span["name"] for span in records[0]["spans"]], ["llm.generate", "http.request"])
+        self.assertEqual(records[0]["spans"][1]["attributes"]["path"], "/query")
+        self.assertEqual(tracer.get_stats()["exported"], 2)
+
+    def test_otlp_export_and_sampling(self):
+        """OTLP 수집기로 전송되는 스팬 형식과 샘플링 제외 확인"""
+        with StubOTLPCollector() as collector:
+            tracer = Tracer()
+            tracer.configure({"tracing": {"exporter": "otlp", "otlp_endpoint": collector.endpoint}})
+            root = tracer.start_trace("http.request")
+            with tracing.activate(root), tracing.span("graph.output", step=3):
+                pass
+            tracer.finish_trace(root)
+            self.assertTrue(tracer.flush())
+
+            tracer.configure({"tracing": {"exporter": "otlp", "otlp_endpoint": collector.endpoint,
+                                          "sample_rate": 0}})
+            tracer.finish_trace(tracer.start_trace("http.request"))
+            self.assertTrue(tracer.flush())
+            spans = collector.spans()
+
+        self.assertEqual(len(spans), 2)
+        child, parent = spans
+        self.assertEqual(child["traceId"], root.trace_id)
+        self.assertEqual(child["parentSpanId"], parent["spanId"])
+        attributes = {item["key"]: item["value"] for item in child["attributes"]}
+        self.assertEqual(attributes["ape.stage"], {"stringValue": "graph.output"})
+        self.assertEqual(attributes["step"], {"intValue": "3"})
+        self.assertEqual(tracer.get_stats()["traces"], 2)
+        self.assertEqual(tracer.get_stats()["sampled"], 1)
+
+
+class TraceMiddlewareTest(unittest.TestCase):
+    """FastAPI 추적 미들웨어 테스트"""
+
+    def test_trace_headers(self):
+        """X-Trace-Id, Server-Timing 헤더와 들어온 traceparent 이어받기 확인"""
+        from fastapi.testclient import TestClient
+        from src.core.router import app
+
+        client = TestClient(app)
+        response = client.get("/metrics/traces")
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response.headers["X-Trace-Id"], r"^[0-9a-f]{32}$")
+        self.assertIn("total;dur=", response.headers["Server-Timing"])
+
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        response = client.get("/metrics/traces", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"})
+        self.assertEqual(response.headers["X-Trace-Id"], trace_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
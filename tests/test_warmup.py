@@ -0,0 +1,146 @@
+"""
+시작 워밍업 테스트
+
+워밍업 단계 실행, 준비 상태 전환, 단계 실패 기록, 공유 세션 연결 미리 열기를 검증합니다.
+LLM 서비스와 에이전트 관리자 대신 같은 인터페이스의 테스트용 객체를 서비스 컨테이너에 등록합니다.
+"""
+
+import os
+import sys
+import time
+import unittest
+
+# 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.service_container import ServiceContainer
+from src.core.requests_config import HTTPSessionRegistry
+from src.core.model_clients import make_model_client
+from src.core.warmup import WarmupManager, get_warmup_config
+from tests.benchmarks.stub_llm_server import StubLLMServer, StubLLMConfig
+
+
+class FakeLLMService:
+    """LLMService 인터페이스의 테스트용 객체"""
+
+    def __init__(self, endpoint: str, api_key: str = "test-key"):
+        self.model_config = {"endpoint": endpoint, "apiKey": api_key, "provider": "internal"}
+        self.model_id = "stub-model"
+        self.calls = []
+
+    def is_mock_mode(self) -> bool:
+        return self.model_config["apiKey"].startswith("mock_")
+
+    def get_client(self, model_key=None):
+        return make_model_client("stub", self.model_config)
+
+    def format_user_message(self, content: str):
+        return {"role": "user", "content": content}
+
+    def generate(self, messages, stream=False, agent_type="direct"):
+        self.calls.append(agent_type)
+        return "pong"
+
+
+class FakeAgent:
+    def __init__(self, agent_type: str):
+        self.agent_id = f"{agent_type}-1"
+
+
+class FakeAgentManager:
+    """AgentManager 인터페이스의 테스트용 객체"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.created = []
+
+    def get_or_create_agent(self, agent_type: str):
+        time.sleep(self.delay)
+        if agent_type == "broken":
+            return None
+        self.created.append(agent_type)
+        return FakeAgent(agent_type)
+
+
+class WarmupManagerTest(unittest.TestCase):
+    """WarmupManager 테스트"""
+
+    def _container(self, endpoint: str, manager: FakeAgentManager, api_key: str = "test-key") -> ServiceContainer:
+        container = ServiceContainer()
+        container.register("llm_service", lambda: FakeLLMService(endpoint, api_key))
+        container.register("agent_manager", lambda: manager)
+        return container
+
+    def test_ready_only_after_background_warm_up(self):
+        """백그라운드 워밍업이 끝나기 전에는 준비 상태가 거짓인지 확인"""
+        manager = FakeAgentManager(delay=0.2)
+        warmup = WarmupManager(self._container("http://127.0.0.1:9/v1", manager), HTTPSessionRegistry())
+
+        thread = warmup.start({"warmup": {"connect_http": "false"}})
+        self.assertFalse(warmup.is_ready())
+        self.assertEqual(warmup.get_status()["state"], "running")
+
+        self.assertTrue(warmup.wait_ready(5))
+        thread.join(5)
+        status = warmup.get_status()
+        self.assertEqual(status["state"], "ready")
+        self.assertEqual(manager.created, ["document"])
+        self.assertEqual([item["service"] for item in status["steps"]["services"]["detail"]],
+                         ["llm_service", "agent_manager"])
+        self.assertNotIn("http", status["steps"])
+        self.assertIs(warmup.start(), thread)
+
+    def test_preconnect_and_prime_llm(self):
+        """LLM 엔드포인트 연결을 미리 열고 프라이밍 호출 후 첫 요청이 연결을 재사용하는지 확인"""
+        with StubLLMServer(config=StubLLMConfig(call_latency_ms=0)) as server:
+            registry = HTTPSessionRegistry()
+            container = self._container(server.endpoint, FakeAgentManager())
+            warmup = WarmupManager(container, registry, registry)
+
+            warmup.start({"warmup": {"background": False, "prime_llm": True, "agents": "document,broken"}})
+
+            status = warmup.get_status()
+            self.assertTrue(status["ready"])
+            self.assertEqual(len(status["steps"]["http"]["detail"]), 1)
+            self.assertNotIn("error", status["steps"]["http"])
+            self.assertEqual(container.get("llm_service").calls, ["warmup"])
+            self.assertEqual(status["steps"]["agents"]["error"], "1건 실패")
+
+            client = container.get("llm_service").get_client()
+            response = client.request("POST", server.endpoint, http=registry,
+                                      json={"messages": [{"role": "user", "content": "hi"}]})
+            self.assertEqual(response.status_code, 200)
+            stats = registry.get_stats()
+            self.assertEqual(stats["connections_opened"], 1)
+            self.assertEqual(stats["connections_reused"], 1)
+
+    def test_mock_llm_and_unreachable_session(self):
+        """Mock 모드 LLM은 연결하지 않고, 연결 실패는 기록만 하고 준비 상태가 되는지 확인"""
+        registry = HTTPSessionRegistry(max_retries=0)
+        registry.get_session("http://127.0.0.1:9")
+        container = self._container("http://mock-llm.invalid", FakeAgentManager(), "mock_key")
+        warmup = WarmupManager(container, registry, registry)
+
+        warmup.start({"warmup": {"background": False, "agents": [], "timeout": 1}})
+
+        http_step = warmup.get_status()["steps"]["http"]
+        self.assertTrue(warmup.is_ready())
+        self.assertEqual([item["base_url"] for item in http_step["detail"]], ["http://127.0.0.1:9"])
+        self.assertIn("error", http_step)
+
+    def test_disabled_and_config_coercion(self):
+        """비활성화 시 즉시 준비 상태가 되고 문자열 설정 값이 변환되는지 확인"""
+        warmup = WarmupManager(ServiceContainer(), HTTPSessionRegistry())
+        self.assertIsNone(warmup.start({"warmup": {"enabled": "false"}}))
+        self.assertTrue(warmup.is_ready())
+        self.assertEqual(warmup.get_status()["steps"], {})
+
+        config = get_warmup_config({"warmup": {"services": "a, b", "prime_llm": "yes", "timeout": "2"}})
+        self.assertEqual(config["services"], ["a", "b"])
+        self.assertTrue(config["prime_llm"])
+        self.assertEqual(config["timeout"], 2.0)
+        self.assertEqual(get_warmup_config(None)["agents"], ["document"])
+
+
+if __name__ == "__main__":
+    unittest.main()